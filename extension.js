@@ -43,14 +43,22 @@ function activate(context) {
         const file = editor.document.uri.path;
         const grammalecte = spawn("python3", [
           context.asAbsolutePath("grammalecte-cli.py"),
-          "--json",
+          "--ndjson",
           "--file",
           file,
         ]);
+        // one JSON object per paragraph and per line: a chunk may end in the middle of a line
+        let pending = "";
+        _decorations = {};
+        grammalecte.stdout.setEncoding("utf8");
         grammalecte.stdout.on("data", (data) => {
-          _decorations = {};
-          const json = JSON.parse(data.toString());
-          for (let paragraph of json.data) {
+          const lines = (pending + data).split("\n");
+          pending = lines.pop();
+          for (let line of lines) {
+            if (!line.trim()) {
+              continue;
+            }
+            const paragraph = JSON.parse(line);
             for (let grammarError of paragraph.lGrammarErrors) {
               _transformErrorInDecoration(paragraph.iParagraph, grammarError);
             }
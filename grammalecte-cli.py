@@ -10,6 +10,16 @@ import argparse
 import json
 import itertools
 import re
+import time
+import importlib
+import fnmatch
+import glob
+import hashlib
+import collections
+import concurrent.futures
+import tracemalloc
+import cProfile
+import pstats
 import traceback
 
 import grammalecte
@@ -68,14 +78,19 @@ def readFile (spf):
 
 
 def generateParagraphFromFile (spf, bConcatLines=False):
+    "generator: returns text by tuple of (iParagraph, sParagraph, lLineSet)"
+    yield from generateParagraphFromLines(readFile(spf), bConcatLines)
+
+
+def generateParagraphFromLines (iLines, bConcatLines=False):
     "generator: returns text by tuple of (iParagraph, sParagraph, lLineSet)"
     if not bConcatLines:
-        for iParagraph, sLine in enumerate(readFile(spf), 1):
+        for iParagraph, sLine in enumerate(iLines, 1):
             yield iParagraph, sLine, None
     else:
         lLine = []
         iParagraph = 1
-        for iLine, sLine in enumerate(readFile(spf), 1):
+        for iLine, sLine in enumerate(iLines, 1):
             if sLine.strip():
                 lLine.append((iLine, sLine))
             elif lLine:
@@ -88,6 +103,266 @@ def generateParagraphFromFile (spf, bConcatLines=False):
             yield iParagraph, sText, lLineSet
 
 
+def configureGrammarChecker (oGrammarChecker, xArgs):
+    "set grammar options and ignored rules of <xArgs>"
+    oGrammarChecker.gce.setOptions({"html": True, "latex": True})
+    if xArgs.opt_on:
+        oGrammarChecker.gce.setOptions({ opt:True  for opt in xArgs.opt_on })
+    if xArgs.opt_off:
+        oGrammarChecker.gce.setOptions({ opt:False  for opt in xArgs.opt_off })
+    if xArgs.rule_off:
+        for sRule in xArgs.rule_off:
+            oGrammarChecker.gce.ignoreRule(sRule)
+    if xArgs.result_cache:
+        oGrammarChecker.useResultCache(xArgs.result_cache, xArgs.result_cache_size)
+
+
+def displayCacheStats (dStats):
+    "display numbers of hits and misses of the cache of results (on stderr: stdout may be JSON)"
+    nRequests = dStats["nHits"] + dStats["nMisses"]
+    echo("Result cache: {} hits, {} misses ({:.1%} hits)".format(dStats["nHits"], dStats["nMisses"], dStats["nHits"] / nRequests  if nRequests  else 0), file=sys.stderr)
+
+
+def checkParagraph (oGrammarChecker, oTextFormatter, iParagraph, sText, lLineSet, xArgs, dStats=None):
+    """return the result of the paragraph as written by the file processing (empty if there is nothing to write, except with --textformatteronly)
+       if <dStats>, numbers of paragraphs, characters and errors (per rule in <dStats["dRules"]>) are added to it"""
+    if xArgs.textformatter or xArgs.textformatteronly:
+        sText = oTextFormatter.formatText(sText)
+    if xArgs.textformatteronly:
+        return sText
+    aGrammErrs, aSpellErrs = oGrammarChecker.getParagraphErrors(sText, bContext=xArgs.context, bSpellSugg=xArgs.with_spell_sugg)
+    aGrammErrs = list(aGrammErrs)
+    if dStats is not None:
+        dStats["nParagraphs"] += 1
+        dStats["nChars"] += len(sText)
+        dStats["nGrammarErrors"] += len(aGrammErrs)
+        dStats["nSpellingErrors"] += len(aSpellErrs)
+        for dErr in aGrammErrs:
+            dStats["dRules"][dErr["sRuleId"]] = dStats["dRules"].get(dErr["sRuleId"], 0) + 1
+    if xArgs.json:
+        return oGrammarChecker.formatParagraphErrorsAsJSON(iParagraph, sText, aGrammErrs, aSpellErrs, bEmptyIfNoErrors=xArgs.only_when_errors, \
+                                                           bReturnText=xArgs.textformatter, lLineSet=lLineSet)
+    if xArgs.only_when_errors and not aGrammErrs and not aSpellErrs:
+        return ""
+    sText, _ = txt.generateParagraph(sText, aGrammErrs, aSpellErrs, xArgs.width)
+    return sText
+
+
+def writeResults (oGrammarChecker, iResults, hDst, xArgs, bShowProgress=False):
+    "write results (iParagraph, sResult) of the file processing in <hDst> (console if None), as a JSON document with --json"
+    bComma = False
+    if xArgs.json and not xArgs.ndjson:
+        output('{ "grammalecte": "'+oGrammarChecker.gce.version+'", "lang": "'+oGrammarChecker.gce.lang+'", "data" : [\n', hDst)
+    for i, sText in iResults:
+        if xArgs.textformatteronly:
+            output(sText, hDst)
+            continue
+        if sText:
+            if xArgs.ndjson:
+                # JSON strings contain no end of line: one paragraph per line
+                sText += "\n"
+            elif xArgs.json and bComma:
+                output(",\n", hDst)
+            output(sText, hDst)
+            bComma = True
+        if hDst and bShowProgress:
+            echo("§ %d\r" % i, end="", flush=True)
+    if xArgs.json and not xArgs.ndjson:
+        output("\n]}\n", hDst)
+
+
+#### Worker processes (option --jobs)
+
+_oJobGrammarChecker = None      # inherited from the main process if workers are forked
+_xJobArgs = None
+
+
+def _initJobWorker (xArgs):
+    "initialization of a worker process: grammar checker set as in the main process, warmed up"
+    global _oJobGrammarChecker
+    global _xJobArgs
+    _xJobArgs = xArgs
+    if not _oJobGrammarChecker:
+        _oJobGrammarChecker = grammalecte.GrammarChecker("fr", spfBundle=xArgs.rules_bundle or "")
+        if xArgs.personal_dict:
+            oJSON = loadDictionary(xArgs.personal_dict)
+            if oJSON:
+                _oJobGrammarChecker.getSpellChecker().setPersonalDictionary(oJSON)
+        configureGrammarChecker(_oJobGrammarChecker, xArgs)
+    _oJobGrammarChecker.gce.warmup()
+
+
+def _checkParagraphsInWorker (lParagraph):
+    "check paragraphs [(iParagraph, sText, lLineSet)], returns the list of results"
+    oTextFormatter = _oJobGrammarChecker.getTextFormatter()
+    return [ checkParagraph(_oJobGrammarChecker, oTextFormatter, iParagraph, sText, lLineSet, _xJobArgs)  for iParagraph, sText, lLineSet in lParagraph ]
+
+
+def _checkFileInWorker (spfSrc, spfDst):
+    return checkFile(_oJobGrammarChecker, spfSrc, spfDst, _xJobArgs)
+
+
+def createJobPool (oGrammarChecker, xArgs):
+    "return a pool of <xArgs.jobs> worker processes with a grammar checker set and warmed up as <oGrammarChecker>"
+    global _oJobGrammarChecker
+    # forked workers inherit the grammar checker already warmed up
+    oGrammarChecker.gce.warmup()
+    _oJobGrammarChecker = oGrammarChecker
+    return concurrent.futures.ProcessPoolExecutor(xArgs.jobs, initializer=_initJobWorker, initargs=(xArgs,))
+
+
+def generateParagraphResults (oGrammarChecker, iParagraphs, xArgs):
+    """generator: returns (iParagraph, sResult) for each (iParagraph, sText, lLineSet) of <iParagraphs> (see checkParagraph)
+       with --jobs, paragraphs are checked by batches in worker processes, and results are returned in the same order"""
+    if xArgs.jobs <= 1:
+        oTextFormatter = oGrammarChecker.getTextFormatter()
+        for iParagraph, sText, lLineSet in iParagraphs:
+            yield iParagraph, checkParagraph(oGrammarChecker, oTextFormatter, iParagraph, sText, lLineSet, xArgs)
+        return
+    with createJobPool(oGrammarChecker, xArgs) as xExecutor:
+        # reorder buffer: batches submitted, results read in the same order
+        lPending = collections.deque()
+        try:
+            while True:
+                lParagraph = list(itertools.islice(iParagraphs, 32))
+                if lParagraph:
+                    lPending.append(( [ iParagraph  for iParagraph, _, _ in lParagraph ], xExecutor.submit(_checkParagraphsInWorker, lParagraph) ))
+                while lPending and (len(lPending) >= xArgs.jobs * 4 or not lParagraph):
+                    lIndex, xFuture = lPending.popleft()
+                    yield from zip(lIndex, xFuture.result())
+                if not lParagraph:
+                    break
+        finally:
+            for _, xFuture in lPending:
+                xFuture.cancel()
+
+
+#### Corpus
+
+def getCorpusFiles (lPath, lGlobFilter, spOutput=""):
+    """return the list of files to check, largest first:
+       files found recursively in directories of <lPath> with a name matching one of <lGlobFilter>, other paths are glob patterns.
+       Result files (*.res.txt) and files in the directory of results <spOutput> are excluded"""
+    spOutput = os.path.abspath(spOutput)  if spOutput  else ""
+    def isCorpusFile (spf):
+        if spf.endswith(".res.txt"):
+            return False
+        return not spOutput or os.path.commonpath([spOutput, os.path.abspath(spf)]) != spOutput
+    aFiles = set()
+    for sPath in lPath:
+        if os.path.isdir(sPath):
+            for spDir, _, lFileName in os.walk(sPath):
+                for sFileName in lFileName:
+                    if any( fnmatch.fnmatch(sFileName, sFilter)  for sFilter in lGlobFilter ):
+                        aFiles.add(os.path.join(spDir, sFileName))
+        else:
+            aFiles.update( spf  for spf in glob.glob(sPath, recursive=True)  if os.path.isfile(spf) )
+    return sorted(filter(isCorpusFile, aFiles), key=lambda spf: (-os.path.getsize(spf), spf))
+
+
+def getResultFilePath (spf, spOutput=""):
+    "return the path of the result file of <spf> (as with --file_to_file), in the directory <spOutput> if not empty"
+    spfDst = spf[:spf.rfind(".")]+".res.txt"  if "." in os.path.basename(spf)  else spf+".res.txt"
+    if spOutput:
+        # same tree as files: relative to the current directory, or from the root for files outside of it
+        spfRelative = os.path.relpath(spfDst)
+        if spfRelative.startswith(os.pardir):
+            spfRelative = os.path.splitdrive(os.path.abspath(spfDst))[1].lstrip(os.sep)
+        spfDst = os.path.join(spOutput, spfRelative)
+        os.makedirs(os.path.dirname(spfDst), exist_ok=True)
+    return spfDst
+
+
+def checkFile (oGrammarChecker, spfSrc, spfDst, xArgs):
+    """check the file <spfSrc>, write results in <spfDst> (as with --file_to_file), returns statistics (see checkParagraph)
+       if the file can’t be read or decoded, no result file is left and returns a failure record: { "sFile": …, "sError": … }"""
+    fStart = time.perf_counter()
+    dStats = { "sFile": spfSrc, "sResultFile": spfDst, "nParagraphs": 0, "nChars": 0, "nGrammarErrors": 0, "nSpellingErrors": 0, "dRules": {} }
+    oTextFormatter = oGrammarChecker.getTextFormatter()
+    oCache = oGrammarChecker.oResultCache
+    if oCache:
+        nHits, nMisses = oCache.nHits, oCache.nMisses
+    iResults = ( (i, checkParagraph(oGrammarChecker, oTextFormatter, i, sText, lLineSet, xArgs, dStats))  for i, sText, lLineSet in generateParagraphFromFile(spfSrc, xArgs.concat_lines) )
+    try:
+        with open(spfDst, "w", encoding="utf-8", newline="\n") as hDst:
+            writeResults(oGrammarChecker, iResults, hDst, xArgs)
+    except (OSError, UnicodeDecodeError) as e:
+        # partial result file removed
+        if os.path.isfile(spfDst):
+            os.remove(spfDst)
+        return { "sFile": spfSrc, "sError": "{}: {}".format(type(e).__name__, e) }
+    dStats["fSeconds"] = time.perf_counter() - fStart
+    if oCache:
+        dStats["nCacheHits"] = oCache.nHits - nHits
+        dStats["nCacheMisses"] = oCache.nMisses - nMisses
+    return dStats
+
+
+def checkCorpus (oGrammarChecker, lPath, xArgs):
+    """check files of <lPath> (see getCorpusFiles), largest first, with <xArgs.jobs> worker processes,
+       write results of each file (see getResultFilePath), returns a summary (statistics of all files)"""
+    fStart = time.perf_counter()
+    lFile = getCorpusFiles(lPath, xArgs.glob_filter, xArgs.output_dir)
+    dSummary = { "nFiles": len(lFile), "nParagraphs": 0, "nChars": 0, "nGrammarErrors": 0, "nSpellingErrors": 0, "dRules": {}, "lFiles": [], "lFailedFiles": [] }
+
+    if xArgs.result_cache:
+        dSummary["nCacheHits"] = dSummary["nCacheMisses"] = 0
+
+    def addStats (dStats):
+        if "sError" in dStats:
+            dSummary["lFailedFiles"].append(dStats)
+            echo("[{}/{}] {}: # Error. {}".format(len(dSummary["lFiles"]) + len(dSummary["lFailedFiles"]), len(lFile), dStats["sFile"], dStats["sError"]), file=sys.stderr)
+            return
+        for sKey in ("nParagraphs", "nChars", "nGrammarErrors", "nSpellingErrors", "nCacheHits", "nCacheMisses"):
+            if sKey in dSummary:
+                dSummary[sKey] += dStats[sKey]
+        for sRuleId, nCount in dStats["dRules"].items():
+            dSummary["dRules"][sRuleId] = dSummary["dRules"].get(sRuleId, 0) + nCount
+        dSummary["lFiles"].append({ sKey: xValue  for sKey, xValue in dStats.items()  if sKey != "dRules" })
+        if not xArgs.json:
+            echo("[{}/{}] {}: {} grammar errors, {} spelling errors ({:.2f} s)".format(len(dSummary["lFiles"]) + len(dSummary["lFailedFiles"]), len(lFile), dStats["sFile"], \
+                                                                                     dStats["nGrammarErrors"], dStats["nSpellingErrors"], dStats["fSeconds"]))
+
+    if xArgs.jobs <= 1:
+        for spf in lFile:
+            addStats(checkFile(oGrammarChecker, spf, getResultFilePath(spf, xArgs.output_dir), xArgs))
+    else:
+        with createJobPool(oGrammarChecker, xArgs) as xExecutor:
+            dFuture = { xExecutor.submit(_checkFileInWorker, spf, getResultFilePath(spf, xArgs.output_dir)): spf  for spf in lFile }
+            for xFuture in concurrent.futures.as_completed(dFuture):
+                try:
+                    addStats(xFuture.result())
+                except Exception as e:
+                    # the worker failed (crashed, or an unexpected error): other files are still checked
+                    addStats({ "sFile": dFuture[xFuture], "sError": "{}: {}".format(type(e).__name__, e) })
+    dSummary["fSeconds"] = time.perf_counter() - fStart
+    dSummary["nCharsPerSecond"] = round(dSummary["nChars"] / dSummary["fSeconds"])  if dSummary["fSeconds"]  else 0
+    dSummary["dRules"] = dict(sorted(dSummary["dRules"].items(), key=lambda t: (-t[1], t[0])))
+    return dSummary
+
+
+def displayCorpusSummary (dSummary, bJSON=False, nTop=30):
+    "display the summary of the corpus checking (see checkCorpus)"
+    if bJSON:
+        echo(json.dumps(dSummary, ensure_ascii=False))
+        return
+    echo("\nFiles: {nFiles}    Paragraphs: {nParagraphs}    Characters: {nChars}".format(**dSummary))
+    echo("Grammar errors: {nGrammarErrors}    Spelling errors: {nSpellingErrors}".format(**dSummary))
+    echo("Time: {:.2f} s    Throughput: {} characters/s".format(dSummary["fSeconds"], dSummary["nCharsPerSecond"]))
+    if "nCacheHits" in dSummary:
+        displayCacheStats({ "nHits": dSummary["nCacheHits"], "nMisses": dSummary["nCacheMisses"] })
+    if dSummary["lFailedFiles"]:
+        echo("\nFailed files: {}".format(len(dSummary["lFailedFiles"])))
+        for dFailure in dSummary["lFailedFiles"]:
+            echo("    {}: {}".format(dFailure["sFile"], dFailure["sError"]))
+    if dSummary["dRules"]:
+        echo("\nErrors per rule:")
+        for sRuleId, nCount in list(dSummary["dRules"].items())[:nTop]:
+            echo("    {:>8}  {}".format(nCount, sRuleId))
+        if len(dSummary["dRules"]) > nTop:
+            echo("    [{} other rules]".format(len(dSummary["dRules"]) - nTop))
+
+
 def output (sText, hDst=None):
     "write in the console or in a file if <hDst> not null"
     if not hDst:
@@ -130,10 +405,288 @@ def getCommand ():
             return (nError, cAction, vSugg)
 
 
+def _checkDaemonOptions (oGrammarChecker, dOptions):
+    "return <dOptions> if it’s a JSON object of known options with boolean values, else raise ValueError"
+    if not isinstance(dOptions, dict):
+        raise ValueError("# Error. Options: a JSON object is expected.")
+    dKnownOptions = oGrammarChecker.gce.getOptions()
+    for sOpt, bVal in dOptions.items():
+        if sOpt not in dKnownOptions:
+            raise ValueError("# Error. Unknown option: " + sOpt)
+        if not isinstance(bVal, bool):
+            raise ValueError("# Error. Option <" + sOpt + ">: true or false is expected.")
+    return dOptions
+
+
+def _daemonCheck (oGrammarChecker, dRequest, xArgs):
+    "check text of <dRequest>, returns the list of paragraphs (JSON strings), as with options --json --file"
+    dOptions = dict(oGrammarChecker.gce.getOptions(), **_checkDaemonOptions(oGrammarChecker, dRequest["dOptions"]))  if dRequest.get("dOptions")  else None
+    bConcatLines = dRequest.get("bConcatLines", xArgs.concat_lines)
+    fTimeBudget = dRequest.get("fTimeBudget", 0.0)
+    if "fTimeBudget" in dRequest and (isinstance(fTimeBudget, bool) or not isinstance(fTimeBudget, (int, float)) or not 0 < fTimeBudget < float("inf")):
+        raise ValueError("# Error. Time budget: a positive number of seconds is expected.")
+    lParagraph = []
+    for i, sText, lLineSet in generateParagraphFromLines(dRequest.get("sText", "").splitlines(True), bConcatLines):
+        sText = oGrammarChecker.getParagraphErrorsAsJSON(i, sText, dOptions=dOptions, bContext=dRequest.get("bContext", xArgs.context), \
+                                                         bEmptyIfNoErrors=dRequest.get("bOnlyWhenErrors", xArgs.only_when_errors), \
+                                                         bSpellSugg=dRequest.get("bSpellSugg", xArgs.with_spell_sugg), lLineSet=lLineSet, \
+                                                         fTimeBudget=fTimeBudget)
+        if sText:
+            lParagraph.append(sText)
+    return lParagraph
+
+
+def runDaemon (oGrammarChecker, xArgs, hDst):
+    """read requests on stdin (one JSON object per line), write responses on <hDst> (stdout, one JSON object per line)
+       requests: { "sCommand": "check", "sText": "…" [, "dOptions": {…}, "bContext": true, "bSpellSugg": true, "bOnlyWhenErrors": true, "bConcatLines": true, "fTimeBudget": 0.5] }
+                 { "sCommand": "suggest", "sWord": "…" }
+                 { "sCommand": "setOptions", "dOptions": {…} }
+                 { "sCommand": "getOptions" }
+                 { "sCommand": "ignoreRules", "lRules": […] }
+                 { "sCommand": "reactivateRules", "lRules": […] }
+                 { "sCommand": "quit" }
+       the field "xId" of the request, if any, is copied in the response. Errors are returned as { "sError": "…" }"""
+    oSpellChecker = oGrammarChecker.getSpellChecker()
+    for sLine in sys.stdin:
+        if not sLine.strip():
+            continue
+        xId = None
+        bQuit = False
+        try:
+            dRequest = json.loads(sLine)
+            if not isinstance(dRequest, dict):
+                raise ValueError("a request must be a JSON object")
+            xId = dRequest.get("xId")
+            sCommand = dRequest.get("sCommand", "")
+            if sCommand == "check":
+                # paragraphs are already JSON strings
+                sResponse = '{ "xId": ' + json.dumps(xId) + ', "grammalecte": "' + oGrammarChecker.gce.version + '", "lang": "' + oGrammarChecker.gce.lang + '", "data" : [' \
+                            + ", ".join(_daemonCheck(oGrammarChecker, dRequest, xArgs)) + ']}'
+            else:
+                if sCommand == "suggest":
+                    dResponse = { "aSuggestions": [ sSugg  for lSugg in oSpellChecker.suggest(dRequest.get("sWord", ""))  for sSugg in lSugg ] }
+                elif sCommand == "setOptions":
+                    oGrammarChecker.gce.setOptions(_checkDaemonOptions(oGrammarChecker, dRequest.get("dOptions", {})))
+                    dResponse = { "dOptions": oGrammarChecker.gce.getOptions() }
+                elif sCommand == "getOptions":
+                    dResponse = { "dOptions": oGrammarChecker.gce.getOptions() }
+                elif sCommand == "ignoreRules":
+                    for sRule in dRequest.get("lRules", []):
+                        oGrammarChecker.gce.ignoreRule(sRule)
+                    dResponse = { "bDone": True }
+                elif sCommand == "reactivateRules":
+                    for sRule in dRequest.get("lRules", []):
+                        oGrammarChecker.gce.reactivateRule(sRule)
+                    dResponse = { "bDone": True }
+                elif sCommand == "quit":
+                    dResponse = { "bDone": True }
+                    bQuit = True
+                else:
+                    dResponse = { "sError": "unknown command: " + str(sCommand) }
+                dResponse["xId"] = xId
+                sResponse = json.dumps(dResponse, ensure_ascii=False)
+        except Exception as e:
+            sResponse = json.dumps({ "sError": str(e), "xId": xId }, ensure_ascii=False)
+        echo(sResponse, file=hDst, flush=True)
+        if bQuit:
+            break
+
+
+def _hashParagraph (sText):
+    return hashlib.blake2b(sText.encode("utf-8"), digest_size=16).digest()
+
+
+def watchFile (oGrammarChecker, spf, xArgs):
+    """check the file <spf> each time it is modified (modification time or size polled every <xArgs.poll_interval> seconds)
+       errors are kept by hash of paragraphs: only new or modified paragraphs are checked.
+       Paragraphs whose text or position changed are written (without errors too, except with --only_when_errors in text mode),
+       then paragraphs which don’t exist anymore, then a status line:
+       with --json, one JSON object per line: paragraphs (as with --ndjson), { "iParagraph": …, "bRemoved": true } for each paragraph removed,
+       then { "nParagraphs": …, "nChecked": …, "fSeconds": … }"""
+    dErrors = {}            # {hash of paragraph: (grammar errors, spelling errors)}
+    dPrevious = {}          # {iParagraph: (hash of paragraph, lLineSet)} of the previous version
+    tPreviousStat = None
+    try:
+        while True:
+            try:
+                xStat = os.stat(spf)
+                tStat = (xStat.st_mtime_ns, xStat.st_size)
+            except OSError:
+                tStat = None
+            if tStat and tStat != tPreviousStat:
+                fStart = time.perf_counter()
+                try:
+                    with open(spf, "r", encoding="utf-8") as hSrc:
+                        lParagraph = list(generateParagraphFromLines(hSrc.readlines(), xArgs.concat_lines))
+                except (OSError, UnicodeDecodeError):
+                    # file removed or being written: it will be read again at the next poll
+                    time.sleep(xArgs.poll_interval)
+                    continue
+                tPreviousStat = tStat
+                dNewErrors = {}
+                dCurrent = {}
+                lChanged = []
+                nChecked = 0
+                for iParagraph, sText, lLineSet in lParagraph:
+                    byHash = _hashParagraph(sText)
+                    if byHash not in dNewErrors:
+                        if byHash in dErrors:
+                            dNewErrors[byHash] = dErrors[byHash]
+                        else:
+                            aGrammErrs, aSpellErrs = oGrammarChecker.getParagraphErrors(sText, bContext=xArgs.context, bSpellSugg=xArgs.with_spell_sugg)
+                            dNewErrors[byHash] = (list(aGrammErrs), aSpellErrs)
+                            nChecked += 1
+                    dCurrent[iParagraph] = (byHash, lLineSet)
+                    if dPrevious.get(iParagraph) != dCurrent[iParagraph]:
+                        lChanged.append((iParagraph, sText, lLineSet, byHash))
+                lRemoved = sorted( iParagraph  for iParagraph in dPrevious  if iParagraph not in dCurrent )
+                dErrors = dNewErrors
+                dPrevious = dCurrent
+                fSeconds = time.perf_counter() - fStart
+                for iParagraph, sText, lLineSet, byHash in lChanged:
+                    # errors are copied: positions are converted for concatenated lines
+                    aGrammErrs, aSpellErrs = ( [ dict(dErr)  for dErr in lErrs ]  for lErrs in dErrors[byHash] )
+                    if xArgs.json:
+                        echo(oGrammarChecker.formatParagraphErrorsAsJSON(iParagraph, sText, aGrammErrs, aSpellErrs, lLineSet=lLineSet))
+                    elif aGrammErrs or aSpellErrs or not xArgs.only_when_errors:
+                        echo("§ {}\n{}".format(iParagraph, txt.generateParagraph(sText, aGrammErrs, aSpellErrs, xArgs.width)[0]))
+                for iParagraph in lRemoved:
+                    if xArgs.json:
+                        echo(json.dumps({ "iParagraph": iParagraph, "bRemoved": True }))
+                    else:
+                        echo("§ {} removed\n".format(iParagraph))
+                if xArgs.json:
+                    echo(json.dumps({ "nParagraphs": len(lParagraph), "nChecked": nChecked, "fSeconds": round(fSeconds, 4) }), flush=True)
+                else:
+                    echo("# {}: {} paragraphs, {} checked in {:.1f} ms".format(spf, len(lParagraph), nChecked, fSeconds * 1000), flush=True)
+            time.sleep(xArgs.poll_interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _purgeModules ():
+    "forget all grammalecte modules, so that the next imports are done as in a cold start"
+    for sModuleName in list(sys.modules):
+        if sModuleName == "grammalecte" or sModuleName.startswith("grammalecte."):
+            del sys.modules[sModuleName]
+    re.purge()
+
+
+def _compileRegexRules ():
+    gc_rules = importlib.import_module("grammalecte.fr.gc_rules")
+    for sOption, lRuleGroup in itertools.chain(gc_rules.lParagraphRules, gc_rules.lSentenceRules):
+        if sOption != "@@@@":
+            for aRule in lRuleGroup:
+                try:
+                    re.compile(aRule[0])
+                except (IndexError, re.error):
+                    pass
+
+
+def _loadGraphRules ():
+    if importlib.import_module("grammalecte.fr.gc_rules_snapshot").load():
+        return "gc_rules_graph (snapshot)"
+    importlib.import_module("grammalecte.fr.gc_rules_graph")
+    return "gc_rules_graph (module import)"
+
+
+def _runStartupPhases (bTraceMemory):
+    "run startup phases from a cold state, return a list of tuples (phase name, time, memory delta)"
+    _purgeModules()
+    dState = {}
+    lPhase = [
+        ("import grammalecte",          lambda: importlib.import_module("grammalecte")),
+        ("import graphspell",           lambda: importlib.import_module("grammalecte.graphspell.spellchecker")),
+        # the package <grammalecte.fr> imports gc_engine, which imports gc_functions
+        ("import gc_engine/gc_functions", lambda: importlib.import_module("grammalecte.fr")),
+        ("dictionary decode",           lambda: dState.setdefault("oSpellChecker", sys.modules["grammalecte.graphspell.spellchecker"].SpellChecker("fr"))),
+        ("tokenizer regex compile",     lambda: dState["oSpellChecker"].getTokenizer()),
+        ("gc_rules regex compile",      _compileRegexRules),
+        ("gc_rules_graph",              _loadGraphRules),
+    ]
+    lResult = []
+    for sPhase, fnPhase in lPhase:
+        nMemStart = tracemalloc.get_traced_memory()[0]  if bTraceMemory  else 0
+        fStart = time.perf_counter()
+        xRes = fnPhase()
+        fEnd = time.perf_counter()
+        nMemEnd = tracemalloc.get_traced_memory()[0]  if bTraceMemory  else 0
+        lResult.append((xRes  if isinstance(xRes, str)  else sPhase, fEnd - fStart, nMemEnd - nMemStart))
+    return lResult
+
+
+def _getSourceName (spf, spPackage):
+    "return path of <spf> relative to the package folder <spPackage>, or None if <spf> is not a source file of the package"
+    if spf.startswith("<") or not spf.startswith(spPackage + os.sep):
+        # frozen modules (<frozen importlib._bootstrap>), strings compiled, stdlib, this script
+        return None
+    return os.path.relpath(spf, spPackage).replace(os.sep, "/")
+
+
+def _getTopModulesByTime (oProfile, spPackage, nTop):
+    "return grammalecte source files sorted by cumulative time: time of calls entering each file from outside (callees included)"
+    dTime = collections.Counter()
+    for (spf, _, _), (_, _, _, _, dCaller) in pstats.Stats(oProfile).stats.items():
+        sModule = _getSourceName(spf, spPackage)
+        if sModule:
+            # calls from the same file are already counted in the time of their caller
+            dTime[sModule] += sum( fCumTime  for (spfCaller, _, _), (_, _, _, fCumTime) in dCaller.items()  if spfCaller != spf )
+    return [ { "sModule": sModule, "fTime": round(fTime, 6) }  for sModule, fTime in dTime.most_common(nTop) ]
+
+
+def _getTopModulesByMemory (oSnapshot, spPackage, nTop):
+    "return grammalecte source files sorted by memory allocated by their code (callees included)"
+    dSize = collections.Counter()
+    dCount = collections.Counter()
+    for oStat in oSnapshot.statistics("traceback"):
+        # frames are sorted from the oldest to the most recent: allocations go to the most recent frame of the package
+        for oFrame in reversed(oStat.traceback):
+            sModule = _getSourceName(oFrame.filename, spPackage)
+            if sModule:
+                dSize[sModule] += oStat.size
+                dCount[sModule] += oStat.count
+                break
+    return [ { "sModule": sModule, "nSize": nSize, "nCount": dCount[sModule] }  for sModule, nSize in dSize.most_common(nTop) ]
+
+
+def profileStartup (bJSON=False, nTop=10):
+    "display time and memory delta of each phase of a cold start, and grammalecte modules costing most time and memory"
+    spPackage = os.path.dirname(os.path.abspath(grammalecte.__file__))
+    # timing without profiler nor tracemalloc, which slow down calls and allocations a lot
+    lTime = _runStartupPhases(False)
+    # time by module
+    oProfile = cProfile.Profile()
+    oProfile.runcall(_runStartupPhases, False)
+    lTopModulesByTime = _getTopModulesByTime(oProfile, spPackage, nTop)
+    # memory (deep tracebacks, to find the grammalecte module beneath frames of importlib and of the standard library)
+    tracemalloc.start(25)
+    lMemory = _runStartupPhases(True)
+    oSnapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    lTopModules = _getTopModulesByMemory(oSnapshot, spPackage, nTop)
+    lPhase = [ { "sPhase": sPhase, "fTime": round(fTime, 6), "nMemory": nMemory }  for (sPhase, fTime, _), (_, _, nMemory) in zip(lTime, lMemory) ]
+    if bJSON:
+        echo(json.dumps({ "lPhases": lPhase, "lTopModules": lTopModules, "lTopModulesByTime": lTopModulesByTime }, ensure_ascii=False))
+        return
+    echo("Cold start profile")
+    echo("  {:<32} {:>12} {:>14}".format("Phase", "Time (ms)", "Memory (KB)"))
+    for dPhase in lPhase:
+        echo("  {:<32} {:>12.1f} {:>14,}".format(dPhase["sPhase"], dPhase["fTime"] * 1000, dPhase["nMemory"] // 1024))
+    echo("  {:<32} {:>12.1f} {:>14,}".format("Total", sum(d["fTime"] for d in lPhase) * 1000, sum(d["nMemory"] for d in lPhase) // 1024))
+    echo("\nTop modules by cumulative time (under profiler; imports done by a module are included in its time)")
+    echo("  {:<40} {:>12}".format("Module", "Time (ms)"))
+    for dModule in lTopModulesByTime:
+        echo("  {:<40} {:>12.1f}".format(dModule["sModule"], dModule["fTime"] * 1000))
+    echo("\nTop allocating modules (memory still allocated at the end of startup)")
+    echo("  {:<40} {:>14} {:>10}".format("Module", "Memory (KB)", "Blocks"))
+    for dModule in lTopModules:
+        echo("  {:<40} {:>14,} {:>10,}".format(dModule["sModule"], dModule["nSize"] // 1024, dModule["nCount"]))
+
+
 def main ():
     "launch the CLI (command line interface)"
-    if sys.version_info < (3, 5):
-        print("Python 3.5+ required")
+    if sys.version_info < (3, 9):
+        print("Python 3.9+ required")
         return
 
     xParser = argparse.ArgumentParser()
@@ -142,6 +695,7 @@ def main ():
     xParser.add_argument("-iff", "--interactive_file_to_file", help="parse file (UTF-8 required!) and create a result file (*.res.txt)", type=str)
     xParser.add_argument("-owe", "--only_when_errors", help="display results only when there are errors", action="store_true")
     xParser.add_argument("-j", "--json", help="generate list of errors in JSON (only with option --file or --file_to_file)", action="store_true")
+    xParser.add_argument("-nd", "--ndjson", help="generate errors in JSON, one object per paragraph and per line, written as soon as checked (only with option --file or --file_to_file)", action="store_true")
     xParser.add_argument("-cl", "--concat_lines", help="concatenate lines not separated by an empty paragraph (only with option --file or --file_to_file)", action="store_true")
     xParser.add_argument("-tf", "--textformatter", help="auto-format text according to typographical rules (not with option --concat_lines)", action="store_true")
     xParser.add_argument("-tfo", "--textformatteronly", help="auto-format text and disable grammar checking (only with option --file or --file_to_file)", action="store_true")
@@ -156,9 +710,33 @@ def main ():
     xParser.add_argument("-off", "--opt_off", nargs="+", help="deactivate options")
     xParser.add_argument("-roff", "--rule_off", nargs="+", help="deactivate rules")
     xParser.add_argument("-d", "--debug", help="debugging mode (only in interactive mode)", action="store_true")
+    xParser.add_argument("-rb", "--rules_bundle", help="load rules from a bundle pruned for a set of options (see grammalecte/fr/gc_rules_bundle.py)", type=str)
+    xParser.add_argument("-dm", "--daemon", help="daemon mode: read JSON requests on stdin and write JSON responses on stdout, one per line", action="store_true")
+    xParser.add_argument("-cp", "--corpus", nargs="+", help="parse files of directories (recursively) or matching glob patterns, largest first, and create a result file for each one (*.res.txt), then display a summary", type=str)
+    xParser.add_argument("-gf", "--glob_filter", nargs="+", help="names of files to parse in directories given to --corpus (default: *.txt)", type=str, default=["*.txt"])
+    xParser.add_argument("-od", "--output_dir", help="write result files of --corpus in this directory (same tree as files), instead of next to each file", type=str, default="")
+    xParser.add_argument("-wa", "--watch", help="parse file (UTF-8 required!) and parse it again each time it is modified (only modified paragraphs)", type=str)
+    xParser.add_argument("-pi", "--poll_interval", help="seconds between checks of modifications of the file of option --watch (default: 0.5)", type=float, default=0.5)
+    xParser.add_argument("-rc", "--result_cache", help="store results of paragraphs in this cache (sqlite database): paragraphs unchanged since a previous run are not checked again", type=str)
+    xParser.add_argument("-rcs", "--result_cache_size", help="maximum number of entries of the cache of results (default: 200000)", type=int, default=200000)
+    xParser.add_argument("-jb", "--jobs", help="number of worker processes checking paragraphs or files (only with option --file, --file_to_file or --corpus; default: 1)", type=int, default=1)
+    xParser.add_argument("-ps", "--profile_startup", help="display time and memory of each phase of a cold start, and grammalecte modules costing most (as JSON with option --json)", action="store_true")
     xArgs = xParser.parse_args()
+    if xArgs.ndjson:
+        xArgs.json = True
+
+    if xArgs.profile_startup:
+        profileStartup(xArgs.json)
+        exit()
+
+    if xArgs.daemon:
+        # stdout is reserved for responses: file descriptor 1 is redirected to stderr,
+        # so that diagnostics (of the engine or of this script) can’t be mixed with responses
+        sys.stdout.flush()
+        hDaemonDst = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding=sys.stdout.encoding)
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
 
-    oGrammarChecker = grammalecte.GrammarChecker("fr")
+    oGrammarChecker = grammalecte.GrammarChecker("fr", bWarmup=xArgs.daemon, spfBundle=xArgs.rules_bundle or "")
     oSpellChecker = oGrammarChecker.getSpellChecker()
     oTextFormatter = oGrammarChecker.getTextFormatter()
     if xArgs.personal_dict:
@@ -166,7 +744,7 @@ def main ():
         if oJSON:
             oSpellChecker.setPersonalDictionary(oJSON)
 
-    if not xArgs.json:
+    if not xArgs.json and not xArgs.daemon:
         echo("Python v" + sys.version)
         echo("Grammalecte v{}".format(oGrammarChecker.gce.version))
 
@@ -189,51 +767,30 @@ def main ():
         exit()
 
     # disable options
-    if not xArgs.json:
+    if not xArgs.json and not xArgs.daemon:
         xArgs.context = False
     if xArgs.concat_lines:
         xArgs.textformatter = False
 
-    # grammar options
-    oGrammarChecker.gce.setOptions({"html": True, "latex": True})
-    if xArgs.opt_on:
-        oGrammarChecker.gce.setOptions({ opt:True  for opt in xArgs.opt_on })
-    if xArgs.opt_off:
-        oGrammarChecker.gce.setOptions({ opt:False  for opt in xArgs.opt_off })
-
-    # disable grammar rules
-    if xArgs.rule_off:
-        for sRule in xArgs.rule_off:
-            oGrammarChecker.gce.ignoreRule(sRule)
+    # grammar options and disabled grammar rules
+    configureGrammarChecker(oGrammarChecker, xArgs)
 
 
-    if xArgs.file or xArgs.file_to_file:
+    if xArgs.daemon:
+        runDaemon(oGrammarChecker, xArgs, hDaemonDst)
+    elif xArgs.file or xArgs.file_to_file:
         # file processing
         sFile = xArgs.file or xArgs.file_to_file
         hDst = open(sFile[:sFile.rfind(".")]+".res.txt", "w", encoding="utf-8", newline="\n")  if xArgs.file_to_file or sys.platform == "win32"  else None
-        bComma = False
-        if xArgs.json:
-            output('{ "grammalecte": "'+oGrammarChecker.gce.version+'", "lang": "'+oGrammarChecker.gce.lang+'", "data" : [\n', hDst)
-        for i, sText, lLineSet in generateParagraphFromFile(sFile, xArgs.concat_lines):
-            if xArgs.textformatter or xArgs.textformatteronly:
-                sText = oTextFormatter.formatText(sText)
-            if xArgs.textformatteronly:
-                output(sText, hDst)
-                continue
-            if xArgs.json:
-                sText = oGrammarChecker.getParagraphErrorsAsJSON(i, sText, bContext=xArgs.context, bEmptyIfNoErrors=xArgs.only_when_errors, \
-                                                                bSpellSugg=xArgs.with_spell_sugg, bReturnText=xArgs.textformatter, lLineSet=lLineSet)
-            else:
-                sText, _ = oGrammarChecker.getParagraphWithErrors(sText, bEmptyIfNoErrors=xArgs.only_when_errors, bSpellSugg=xArgs.with_spell_sugg, nWidth=xArgs.width)
-            if sText:
-                if xArgs.json and bComma:
-                    output(",\n", hDst)
-                output(sText, hDst)
-                bComma = True
-            if hDst:
-                echo("§ %d\r" % i, end="", flush=True)
-        if xArgs.json:
-            output("\n]}\n", hDst)
+        writeResults(oGrammarChecker, generateParagraphResults(oGrammarChecker, generateParagraphFromFile(sFile, xArgs.concat_lines), xArgs), hDst, xArgs, True)
+        if oGrammarChecker.oResultCache and xArgs.jobs <= 1:
+            displayCacheStats(oGrammarChecker.oResultCache.getStats())
+    elif xArgs.watch:
+        # file processing each time the file is modified
+        watchFile(oGrammarChecker, xArgs.watch, xArgs)
+    elif xArgs.corpus:
+        # corpus processing: a result file for each file, and a summary
+        displayCorpusSummary(checkCorpus(oGrammarChecker, xArgs.corpus, xArgs), xArgs.json)
     elif xArgs.interactive_file_to_file:
         # file processing: interactive mode
         sFile = xArgs.interactive_file_to_file
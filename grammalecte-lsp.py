@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+
+"""
+GRAMMALECTE LANGUAGE SERVER
+Language Server Protocol over stdio: diagnostics for grammar and spelling errors
+
+Each line of a document is checked as a paragraph (as with grammalecte-cli.py --file).
+Results are cached by line content: when the document changes, only new or modified lines are checked.
+Settings (workspace/didChangeConfiguration): { "grammalecte": { "options": { option: bool } } }
+"""
+
+import sys
+import os
+import re
+import json
+import argparse
+import traceback
+
+import grammalecte
+
+
+# https://microsoft.github.io/language-server-protocol/specifications/specification-current/
+_SEVERITY_WARNING = 2
+_SEVERITY_INFORMATION = 3
+_ERROR_METHOD_NOT_FOUND = -32601
+_ERROR_INTERNAL = -32603
+
+_zEndOfLine = re.compile("\r\n|\r|\n")
+
+
+#### Positions: LSP counts characters in UTF-16 code units
+
+def _isBMP (sLine):
+    return len(sLine.encode("utf-16-le")) == len(sLine) * 2
+
+
+def toUTF16 (sLine, nPos):
+    "return the position <nPos> (index in <sLine>) as a number of UTF-16 code units"
+    if _isBMP(sLine):
+        return nPos
+    return len(sLine[:nPos].encode("utf-16-le")) // 2
+
+
+def fromUTF16 (sLine, nPos):
+    "return the position <nPos> (number of UTF-16 code units) as an index in <sLine>"
+    if _isBMP(sLine):
+        return min(nPos, len(sLine))
+    nUnits = 0
+    for i, c in enumerate(sLine):
+        if nUnits >= nPos:
+            return i
+        nUnits += 2  if ord(c) > 0xFFFF  else 1
+    return len(sLine)
+
+
+#### Documents
+
+class Document:
+    "text document opened by the client: lines and errors of each line"
+
+    def __init__ (self, sUri, nVersion, sText):
+        self.sUri = sUri
+        self.nVersion = nVersion
+        self.lLines = _zEndOfLine.split(sText)
+        self.dErrors = {}           # {line: (list of grammar errors, list of spelling errors)}
+
+    def setText (self, sText):
+        "replace the whole text"
+        self.lLines = _zEndOfLine.split(sText)
+
+    def applyChange (self, dRange, sText):
+        "replace the text within <dRange> (LSP range) by <sText>"
+        iStartLine = min(dRange["start"]["line"], len(self.lLines) - 1)
+        iEndLine = min(dRange["end"]["line"], len(self.lLines) - 1)
+        sStartLine = self.lLines[iStartLine]
+        sEndLine = self.lLines[iEndLine]
+        sNew = sStartLine[:fromUTF16(sStartLine, dRange["start"]["character"])] + sText + sEndLine[fromUTF16(sEndLine, dRange["end"]["character"]):]
+        self.lLines[iStartLine:iEndLine+1] = _zEndOfLine.split(sNew)
+
+    def check (self, oGrammarChecker, dOptions):
+        "check lines not checked yet, forget errors of lines which don’t exist anymore. Returns the number of lines checked"
+        dErrors = {}
+        nChecked = 0
+        for sLine in self.lLines:
+            if sLine in dErrors:
+                continue
+            if sLine in self.dErrors:
+                dErrors[sLine] = self.dErrors[sLine]
+            elif sLine.strip():
+                aGrammErrs, aSpellErrs = oGrammarChecker.getParagraphErrors(sLine, dOptions=dOptions, bSpellSugg=True)
+                dErrors[sLine] = (list(aGrammErrs), aSpellErrs)
+                nChecked += 1
+        self.dErrors = dErrors
+        return nChecked
+
+    def getDiagnostics (self):
+        "return the list of LSP diagnostics of the document"
+        lDiagnostics = []
+        for iLine, sLine in enumerate(self.lLines):
+            if sLine not in self.dErrors:
+                continue
+            aGrammErrs, aSpellErrs = self.dErrors[sLine]
+            for dErr in aGrammErrs:
+                sMessage = dErr["sMessage"]
+                if dErr.get("aSuggestions"):
+                    sMessage += "\nSuggestions : " + " | ".join(dErr["aSuggestions"])
+                lDiagnostics.append(self._createDiagnostic(sLine, iLine, dErr, _SEVERITY_WARNING, dErr["sRuleId"], sMessage))
+            for dErr in aSpellErrs:
+                sMessage = "Mot inconnu : " + dErr["sValue"]
+                if dErr.get("aSuggestions"):
+                    sMessage += "\nSuggestions : " + " | ".join(dErr["aSuggestions"])
+                lDiagnostics.append(self._createDiagnostic(sLine, iLine, dErr, _SEVERITY_INFORMATION, dErr["sType"], sMessage))
+        return lDiagnostics
+
+    def _createDiagnostic (self, sLine, iLine, dErr, nSeverity, sCode, sMessage):
+        return {
+            "range": {
+                "start": { "line": iLine, "character": toUTF16(sLine, dErr["nStart"]) },
+                "end": { "line": iLine, "character": toUTF16(sLine, dErr["nEnd"]) }
+            },
+            "severity": nSeverity,
+            "code": sCode,
+            "source": "Grammalecte",
+            "message": sMessage,
+            "data": { "aSuggestions": dErr.get("aSuggestions", []) }
+        }
+
+
+#### Server
+
+class LanguageServer:
+    "Language server: reads messages on <hSrc>, writes messages on <hDst> (binary streams)"
+
+    def __init__ (self, oGrammarChecker, hSrc, hDst):
+        self.oGrammarChecker = oGrammarChecker
+        self.hSrc = hSrc
+        self.hDst = hDst
+        self.dDocuments = {}        # {uri: Document}
+        self.dOptions = None        # options overriding the options of the grammar checker
+        self.bShutdown = False
+        self.dHandlers = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/didOpen": self.didOpen,
+            "textDocument/didChange": self.didChange,
+            "textDocument/didClose": self.didClose,
+            "workspace/didChangeConfiguration": self.didChangeConfiguration,
+        }
+
+    def readMessage (self):
+        "return the next message (dictionary) or None at the end of the stream"
+        nLength = None
+        while True:
+            byLine = self.hSrc.readline()
+            if not byLine:
+                return None
+            byLine = byLine.strip()
+            if not byLine:
+                break
+            sName, _, sValue = byLine.decode("ascii").partition(":")
+            if sName.strip().lower() == "content-length":
+                nLength = int(sValue.strip())
+        if nLength is None:
+            return {}
+        return json.loads(self.hSrc.read(nLength).decode("utf-8"))
+
+    def sendMessage (self, dMessage):
+        "write <dMessage> (JSON-RPC message)"
+        dMessage["jsonrpc"] = "2.0"
+        byBody = json.dumps(dMessage, ensure_ascii=False).encode("utf-8")
+        self.hDst.write(b"Content-Length: " + str(len(byBody)).encode("ascii") + b"\r\n\r\n" + byBody)
+        self.hDst.flush()
+
+    def sendNotification (self, sMethod, dParams):
+        "send a notification to the client"
+        self.sendMessage({ "method": sMethod, "params": dParams })
+
+    def run (self):
+        "process messages until the exit notification or the end of the stream. Returns the exit code"
+        while True:
+            dMessage = self.readMessage()
+            if dMessage is None:
+                return 1
+            sMethod = dMessage.get("method", "")
+            if sMethod == "exit":
+                return 0  if self.bShutdown  else 1
+            if sMethod in self.dHandlers:
+                try:
+                    xResult = self.dHandlers[sMethod](dMessage.get("params", {}))
+                    if "id" in dMessage:
+                        self.sendMessage({ "id": dMessage["id"], "result": xResult })
+                except Exception as e:
+                    traceback.print_exc()
+                    if "id" in dMessage:
+                        self.sendMessage({ "id": dMessage["id"], "error": { "code": _ERROR_INTERNAL, "message": str(e) } })
+            elif "id" in dMessage and sMethod:
+                self.sendMessage({ "id": dMessage["id"], "error": { "code": _ERROR_METHOD_NOT_FOUND, "message": "Method not found: " + sMethod } })
+
+    def publishDiagnostics (self, oDocument):
+        "check modified lines of <oDocument> and publish its diagnostics"
+        oDocument.check(self.oGrammarChecker, self.dOptions)
+        self.sendNotification("textDocument/publishDiagnostics", { "uri": oDocument.sUri, "version": oDocument.nVersion, "diagnostics": oDocument.getDiagnostics() })
+
+    # handlers
+
+    def initialize (self, dParams):
+        "handshake: returns capabilities of the server"
+        dOptions = (dParams.get("initializationOptions") or {}).get("options")
+        if isinstance(dOptions, dict):
+            self._setOptions(dOptions)
+        return {
+            "capabilities": {
+                "textDocumentSync": { "openClose": True, "change": 2 }     # incremental
+            },
+            "serverInfo": { "name": "Grammalecte", "version": self.oGrammarChecker.gce.version }
+        }
+
+    def shutdown (self, dParams):
+        "the client asks to stop"
+        self.bShutdown = True
+        return None
+
+    def didOpen (self, dParams):
+        "document opened: check all lines"
+        dDoc = dParams["textDocument"]
+        oDocument = Document(dDoc["uri"], dDoc.get("version"), dDoc["text"])
+        self.dDocuments[oDocument.sUri] = oDocument
+        self.publishDiagnostics(oDocument)
+
+    def didChange (self, dParams):
+        "document modified: check new or modified lines"
+        dDoc = dParams["textDocument"]
+        oDocument = self.dDocuments.get(dDoc["uri"])
+        if not oDocument:
+            return
+        oDocument.nVersion = dDoc.get("version")
+        for dChange in dParams["contentChanges"]:
+            if "range" in dChange:
+                oDocument.applyChange(dChange["range"], dChange["text"])
+            else:
+                oDocument.setText(dChange["text"])
+        self.publishDiagnostics(oDocument)
+
+    def didClose (self, dParams):
+        "document closed: forget it and clear its diagnostics"
+        sUri = dParams["textDocument"]["uri"]
+        if self.dDocuments.pop(sUri, None):
+            self.sendNotification("textDocument/publishDiagnostics", { "uri": sUri, "diagnostics": [] })
+
+    def didChangeConfiguration (self, dParams):
+        "new settings: options modified, all documents are checked again"
+        dOptions = ((dParams.get("settings") or {}).get("grammalecte") or {}).get("options")
+        if isinstance(dOptions, dict):
+            self._setOptions(dOptions)
+            for oDocument in self.dDocuments.values():
+                oDocument.dErrors.clear()
+                self.publishDiagnostics(oDocument)
+
+    def _setOptions (self, dOptions):
+        dCurrentOptions = self.oGrammarChecker.gce.getOptions()
+        self.dOptions = dict(dCurrentOptions, **{ sOpt: bool(bVal)  for sOpt, bVal in dOptions.items()  if sOpt in dCurrentOptions })
+
+
+def main ():
+    "launch the language server on stdio"
+    xParser = argparse.ArgumentParser(description="Grammalecte language server (Language Server Protocol over stdio)")
+    xParser.add_argument("-on", "--opt_on", nargs="+", help="activate options")
+    xParser.add_argument("-off", "--opt_off", nargs="+", help="deactivate options")
+    xParser.add_argument("-roff", "--rule_off", nargs="+", help="deactivate rules")
+    xParser.add_argument("-rb", "--rules_bundle", help="load rules from a bundle pruned for a set of options (see grammalecte/fr/gc_rules_bundle.py)", type=str)
+    xArgs = xParser.parse_args()
+
+    # stdout is reserved for the protocol: file descriptor 1 is redirected to stderr,
+    # so that nothing else (warnings of the engine, prints…) can be written between messages
+    sys.stdout.flush()
+    hProtocolDst = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    oGrammarChecker = grammalecte.GrammarChecker("fr", bWarmup=True, spfBundle=xArgs.rules_bundle or "")
+    oGrammarChecker.gce.setOptions({"html": True, "latex": True})
+    if xArgs.opt_on:
+        oGrammarChecker.gce.setOptions({ sOpt: True  for sOpt in xArgs.opt_on })
+    if xArgs.opt_off:
+        oGrammarChecker.gce.setOptions({ sOpt: False  for sOpt in xArgs.opt_off })
+    if xArgs.rule_off:
+        for sRule in xArgs.rule_off:
+            oGrammarChecker.gce.ignoreRule(sRule)
+
+    oServer = LanguageServer(oGrammarChecker, sys.stdin.buffer, hProtocolDst)
+    sys.exit(oServer.run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+"""
+GRAMMALECTE SERVER
+HTTP server (bottle) with pre-forked workers
+"""
+
+import os
+import time
+import signal
+import json
+import argparse
+import traceback
+from wsgiref.simple_server import make_server
+
+from grammalecte.bottle import Bottle, request, response, abort
+
+import grammalecte
+import grammalecte.text as txt
+from grammalecte.graphspell.echo import echo
+
+
+_HELP = """
+Endpoints:
+    GET  /health                        status of the worker
+    POST /gc_text                       grammar and spelling checking
+                                            text:       text to check (required)
+                                            options:    JSON object of options (true or false) overriding the options of the server
+                                            context:    "true" to get errors with context
+                                            spell_sugg: "true" to get suggestions for spelling errors
+                                            time_budget: seconds allowed for each paragraph, a positive number (default: --time_budget)
+                                                        a paragraph not entirely checked in time gets "bTruncated": true
+    GET  /suggest/<token>               spelling suggestions for <token>
+    POST /suggest                       spelling suggestions
+                                            token:      word to check
+    GET  /options                       options of the server and their labels
+    POST /options                       options of the server overridden by the field <options> (JSON object)
+                                        (workers don’t share any state: options must be sent with each request)
+"""
+
+
+app = Bottle()
+oGrammarChecker = None
+oSpellChecker = None
+fDefaultTimeBudget = 0.0
+
+
+def _isTrue (sValue):
+    return sValue in ("true", "True", "1", "on")
+
+
+def _getOptionsOverrides ():
+    "return the options of the field <options> of the current request (only known options)"
+    sOptions = request.forms.getunicode("options", "")
+    if not sOptions:
+        return {}
+    try:
+        dOptions = json.loads(sOptions)
+    except ValueError:
+        abort(400, "# Error. Options: not a valid JSON string.")
+    if not isinstance(dOptions, dict):
+        abort(400, "# Error. Options: a JSON object is expected.")
+    if not all(isinstance(bVal, bool)  for bVal in dOptions.values()):
+        abort(400, "# Error. Options: values must be true or false.")
+    dServerOptions = oGrammarChecker.gce.getOptions()
+    return { sOpt: bVal  for sOpt, bVal in dOptions.items()  if sOpt in dServerOptions }
+
+
+@app.get("/health")
+def health ():
+    "status of the worker"
+    return { "sStatus": "ok", "grammalecte": oGrammarChecker.gce.version, "lang": oGrammarChecker.gce.lang, "nPid": os.getpid() }
+
+
+@app.post("/gc_text")
+def gcText ():
+    "grammar and spelling checking of the field <text>"
+    sText = request.forms.getunicode("text", None)
+    if sText is None:
+        abort(400, "# Error. No text to check.")
+    dOverrides = _getOptionsOverrides()
+    dOptions = dict(oGrammarChecker.gce.getOptions(), **dOverrides)  if dOverrides  else None
+    bContext = _isTrue(request.forms.get("context", ""))
+    bSpellSugg = _isTrue(request.forms.get("spell_sugg", ""))
+    fTimeBudget = fDefaultTimeBudget
+    if "time_budget" in request.forms:
+        try:
+            fTimeBudget = float(request.forms.get("time_budget"))
+        except ValueError:
+            fTimeBudget = 0.0
+        if not 0 < fTimeBudget < float("inf"):
+            abort(400, "# Error. Time budget: a positive number of seconds is expected.")
+    lParagraph = []
+    for i, sParagraph in enumerate(txt.getParagraph(sText), 1):
+        sResult = oGrammarChecker.getParagraphErrorsAsJSON(i, sParagraph, dOptions=dOptions, bContext=bContext, bEmptyIfNoErrors=True, bSpellSugg=bSpellSugg, fTimeBudget=fTimeBudget)
+        if sResult:
+            lParagraph.append(sResult)
+    # paragraphs are already JSON strings
+    response.content_type = "application/json; charset=UTF-8"
+    return '{ "grammalecte": "' + oGrammarChecker.gce.version + '", "lang": "' + oGrammarChecker.gce.lang + '", "data" : [' + ", ".join(lParagraph) + ']}'
+
+
+def _suggest (sToken):
+    return { "sToken": sToken, "aSuggestions": [ sSugg  for lSugg in oSpellChecker.suggest(sToken)  for sSugg in lSugg ] }
+
+
+@app.get("/suggest/<sToken>")
+def suggestGet (sToken):
+    "spelling suggestions for <sToken>"
+    return _suggest(sToken)
+
+
+@app.post("/suggest")
+def suggestPost ():
+    "spelling suggestions for the field <token>"
+    sToken = request.forms.getunicode("token", "")
+    if not sToken:
+        abort(400, "# Error. No token.")
+    return _suggest(sToken)
+
+
+@app.get("/options")
+def getOptions ():
+    "options of the server and their labels"
+    return { "dOptions": oGrammarChecker.gce.getOptions(), "dLabels": oGrammarChecker.gce.getOptionsLabels("fr") }
+
+
+@app.post("/options")
+def setOptions ():
+    "options of the server overridden by the field <options>: what would be used for a request with these options"
+    return { "dOptions": dict(oGrammarChecker.gce.getOptions(), **_getOptionsOverrides()) }
+
+
+#### Workers
+
+def _serveForever (oServer):
+    try:
+        oServer.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def _raiseSystemExit (nSignal, xFrame):
+    raise SystemExit(0)
+
+
+def runPreforkedServer (xApp, sHost, nPort, nWorkers):
+    """listen on <sHost>:<nPort> and serve <xApp> with <nWorkers> worker processes sharing the listening socket
+       the engine must be loaded before: workers inherit it. A worker which dies is replaced."""
+    oServer = make_server(sHost, nPort, xApp)
+    echo("Grammalecte server: http://{}:{}/ ({} worker(s))".format(sHost, nPort, max(nWorkers, 1)))
+    if nWorkers <= 1 or not hasattr(os, "fork"):
+        _serveForever(oServer)
+        return
+    dWorker = {}        # {pid: worker number}
+
+    def startWorker (iWorker):
+        nPid = os.fork()
+        if nPid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            nExitCode = 0
+            try:
+                _serveForever(oServer)
+            except:
+                traceback.print_exc()
+                nExitCode = 1
+            os._exit(nExitCode)
+        dWorker[nPid] = iWorker
+
+    for iWorker in range(nWorkers):
+        startWorker(iWorker)
+    signal.signal(signal.SIGTERM, _raiseSystemExit)
+    try:
+        while True:
+            nPid, _ = os.wait()
+            if nPid in dWorker:
+                iWorker = dWorker.pop(nPid)
+                echo("# Worker {} (pid {}) ended. Restart.".format(iWorker, nPid))
+                time.sleep(0.5)
+                startWorker(iWorker)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for nPid in dWorker:
+            try:
+                os.kill(nPid, signal.SIGTERM)
+            except OSError:
+                pass
+        for nPid in dWorker:
+            try:
+                os.waitpid(nPid, 0)
+            except OSError:
+                pass
+        oServer.server_close()
+
+
+def main ():
+    "launch the server"
+    global oGrammarChecker
+    global oSpellChecker
+    global fDefaultTimeBudget
+
+    xParser = argparse.ArgumentParser(description="Grammalecte HTTP server", epilog=_HELP, formatter_class=argparse.RawDescriptionHelpFormatter)
+    xParser.add_argument("-ht", "--host", help="host (default: localhost)", type=str, default="localhost")
+    xParser.add_argument("-p", "--port", help="port (default: 8080)", type=int, default=8080)
+    xParser.add_argument("-w", "--workers", help="number of worker processes (default: 4)", type=int, default=4)
+    xParser.add_argument("-on", "--opt_on", nargs="+", help="activate options")
+    xParser.add_argument("-off", "--opt_off", nargs="+", help="deactivate options")
+    xParser.add_argument("-roff", "--rule_off", nargs="+", help="deactivate rules")
+    xParser.add_argument("-pdi", "--personal_dict", help="load personnal dictionary (JSON file)", type=str)
+    xParser.add_argument("-rb", "--rules_bundle", help="load rules from a bundle pruned for a set of options (see grammalecte/fr/gc_rules_bundle.py)", type=str)
+    xParser.add_argument("-tb", "--time_budget", help="default time allowed for each paragraph, in seconds (default: 0, no limit)", type=float, default=0.0)
+    xArgs = xParser.parse_args()
+    if not 0 <= xArgs.time_budget < float("inf"):
+        xParser.error("argument -tb/--time_budget: a positive number of seconds is expected (0: no limit)")
+    fDefaultTimeBudget = xArgs.time_budget
+
+    # dictionaries and rules are loaded once, before workers are forked
+    oGrammarChecker = grammalecte.GrammarChecker("fr", "Server", spfBundle=xArgs.rules_bundle or "")
+    oSpellChecker = oGrammarChecker.getSpellChecker()
+    if xArgs.personal_dict:
+        try:
+            with open(xArgs.personal_dict, "r", encoding="utf-8") as hSrc:
+                oSpellChecker.setPersonalDictionary(json.load(hSrc))
+        except (OSError, ValueError):
+            traceback.print_exc()
+    if xArgs.opt_on:
+        oGrammarChecker.gce.setOptions({ sOpt: True  for sOpt in xArgs.opt_on })
+    if xArgs.opt_off:
+        oGrammarChecker.gce.setOptions({ sOpt: False  for sOpt in xArgs.opt_off })
+    if xArgs.rule_off:
+        for sRule in xArgs.rule_off:
+            oGrammarChecker.gce.ignoreRule(sRule)
+    oGrammarChecker.gce.warmup()
+
+    runPreforkedServer(app, xArgs.host, xArgs.port, xArgs.workers)
+
+
+if __name__ == '__main__':
+    main()
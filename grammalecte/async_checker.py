@@ -0,0 +1,92 @@
+"""
+Grammalecte, grammar checker: asyncio interface
+
+Paragraphs are checked in an executor (threads or processes), so that the event loop is never blocked.
+Results are yielded in the order of paragraphs, with a limited number of paragraphs being checked at the same time.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+
+from . import text
+from .grammar_checker import GrammarChecker, getParagraphErrorsInWorker
+
+
+__all__ = [ "AsyncGrammarChecker" ]
+
+
+class AsyncGrammarChecker:
+    """asyncio interface for GrammarChecker
+       <bProcessPool>: check paragraphs in <nWorkers> processes (each one loads the grammar checker), else in threads
+       <nMaxInFlight>: maximum number of paragraphs being checked at the same time by a call"""
+
+    def __init__ (self, oGrammarChecker=None, sLangCode="fr", sContext="Python", bProcessPool=False, nWorkers=None, nMaxInFlight=8):
+        self.oGrammarChecker = oGrammarChecker or GrammarChecker(sLangCode, sContext)
+        self.nMaxInFlight = max(nMaxInFlight, 1)
+        self.bProcessPool = bProcessPool
+        if bProcessPool:
+            self.xExecutor = self.oGrammarChecker.createWorkerPool(nWorkers)
+        else:
+            self.xExecutor = concurrent.futures.ThreadPoolExecutor(nWorkers, thread_name_prefix="grammalecte")
+        self.dDocumentTasks = {}        # {document id: task checking the last version of the document}
+
+    def close (self, bWait=True):
+        "stop the executor"
+        self.xExecutor.shutdown(wait=bWait, cancel_futures=True)
+
+    async def __aenter__ (self):
+        return self
+
+    async def __aexit__ (self, *args):
+        self.close()
+
+    def _submit (self, xLoop, sParagraph, dOptions, bContext, bSpellSugg):
+        fCheck = getParagraphErrorsInWorker  if self.bProcessPool  else self.oGrammarChecker.getParagraphErrors
+        return xLoop.run_in_executor(self.xExecutor, fCheck, sParagraph, dOptions, bContext, bSpellSugg)
+
+    async def _getPendingResult (self, lPending):
+        iParagraph, xFuture = lPending.popleft()
+        aGrammErrs, aSpellErrs = await xFuture
+        return { "iParagraph": iParagraph, "lGrammarErrors": list(aGrammErrs), "lSpellingErrors": aSpellErrs }
+
+    async def checkParagraphs (self, sText, dOptions=None, bContext=False, bSpellSugg=False, bEmptyIfNoErrors=False):
+        """async generator: yields results of paragraphs of <sText> in order: { "iParagraph": …, "lGrammarErrors": […], "lSpellingErrors": […] }
+           <dOptions>: options overriding the options of the grammar checker
+           if the generator is closed or cancelled, paragraphs not yet checked are cancelled"""
+        xLoop = asyncio.get_running_loop()
+        if dOptions:
+            dOptions = dict(self.oGrammarChecker.gce.getOptions(), **dOptions)
+        lPending = collections.deque()
+        try:
+            for iParagraph, sParagraph in enumerate(text.getParagraph(sText), 1):
+                lPending.append((iParagraph, self._submit(xLoop, sParagraph, dOptions, bContext, bSpellSugg)))
+                if len(lPending) >= self.nMaxInFlight:
+                    dParagraph = await self._getPendingResult(lPending)
+                    if not bEmptyIfNoErrors or dParagraph["lGrammarErrors"] or dParagraph["lSpellingErrors"]:
+                        yield dParagraph
+            while lPending:
+                dParagraph = await self._getPendingResult(lPending)
+                if not bEmptyIfNoErrors or dParagraph["lGrammarErrors"] or dParagraph["lSpellingErrors"]:
+                    yield dParagraph
+        finally:
+            for _, xFuture in lPending:
+                xFuture.cancel()
+
+    async def checkText (self, sText, dOptions=None, bContext=False, bSpellSugg=False, bEmptyIfNoErrors=False):
+        "returns the list of results of paragraphs of <sText> (see checkParagraphs)"
+        return [ dParagraph  async for dParagraph in self.checkParagraphs(sText, dOptions, bContext, bSpellSugg, bEmptyIfNoErrors) ]
+
+    async def checkDocument (self, sDocumentId, sText, dOptions=None, bContext=False, bSpellSugg=False, bEmptyIfNoErrors=False):
+        """check <sText>, last version of the document <sDocumentId> (see checkText)
+           the check of a previous version of the same document, if still running, is cancelled: its caller gets asyncio.CancelledError"""
+        xPreviousTask = self.dDocumentTasks.get(sDocumentId)
+        if xPreviousTask and not xPreviousTask.done():
+            xPreviousTask.cancel()
+        xTask = asyncio.ensure_future(self.checkText(sText, dOptions, bContext, bSpellSugg, bEmptyIfNoErrors))
+        self.dDocumentTasks[sDocumentId] = xTask
+        try:
+            return await xTask
+        finally:
+            if self.dDocumentTasks.get(sDocumentId) is xTask:
+                del self.dDocumentTasks[sDocumentId]
@@ -0,0 +1,80 @@
+"""
+Grammalecte - Compact storage of generated data tables
+
+Generated data modules (conj_data, mfsp_data, phonet_data) are huge Python literals:
+dictionaries of strings with boxed integers or lists as values.
+They are loaded only when a function needs them, then converted into read-only tables:
+- keys are sorted in a tuple and searched by bisection,
+- integer values are stored in arrays,
+- other values are interned (equal values share the same object).
+"""
+
+import sys
+import importlib
+from array import array
+from bisect import bisect_left
+
+
+def loadDataModule (sModuleName):
+    "return variables of the generated data module <sModuleName> as a dictionary, without keeping the module in memory"
+    sFullName = __package__ + "." + sModuleName
+    bAlreadyImported = sFullName in sys.modules
+    xModule = importlib.import_module(sFullName)
+    dData = { sName: xValue  for sName, xValue in vars(xModule).items()  if not sName.startswith("_") }
+    if not bAlreadyImported:
+        # we forget the module, so that the original literals are freed once converted
+        del sys.modules[sFullName]
+        xPackage = sys.modules[__package__]
+        if getattr(xPackage, sModuleName, None) is xModule:
+            delattr(xPackage, sModuleName)
+    return dData
+
+
+def intern (xValue, dInterned):
+    "return <xValue> as an immutable object (lists become tuples, strings are interned), shared with equal values already in <dInterned>"
+    if isinstance(xValue, str):
+        return sys.intern(xValue)
+    if isinstance(xValue, (list, tuple)):
+        xValue = tuple( intern(x, dInterned)  for x in xValue )
+    return dInterned.setdefault(xValue, xValue)
+
+
+class SortedMap:
+    "read-only mapping with string keys: keys sorted in a tuple (bisect lookup), values in an array (integers) or interned"
+
+    __slots__ = ("_tKey", "_xValue")
+
+    def __init__ (self, dData, sTypecode=""):
+        self._tKey = tuple(sorted( sys.intern(sKey)  for sKey in dData ))
+        if sTypecode:
+            self._xValue = array(sTypecode, [ dData[sKey]  for sKey in self._tKey ])
+        else:
+            dInterned = {}
+            self._xValue = tuple( intern(dData[sKey], dInterned)  for sKey in self._tKey )
+
+    def index (self, sKey):
+        "return the position of <sKey> or -1 if not found"
+        i = bisect_left(self._tKey, sKey)
+        if i < len(self._tKey) and self._tKey[i] == sKey:
+            return i
+        return -1
+
+    def __contains__ (self, sKey):
+        return self.index(sKey) >= 0
+
+    def __getitem__ (self, sKey):
+        i = self.index(sKey)
+        if i < 0:
+            raise KeyError(sKey)
+        return self._xValue[i]
+
+    def get (self, sKey, xDefault=None):
+        "return the value of <sKey> if found, else <xDefault>"
+        i = self.index(sKey)
+        return self._xValue[i]  if i >= 0  else xDefault
+
+    def __len__ (self):
+        return len(self._tKey)
+
+    def __iter__ (self):
+        return iter(self._tKey)
@@ -7,11 +7,7 @@ Grammalecte - Conjugueur
 import re
 import traceback
 
-from .conj_data import lVtyp as _lVtyp
-from .conj_data import lTags as _lTags
-from .conj_data import dPatternConj as _dPatternConj
-from .conj_data import dVerb as _dVerb
-from .conj_data import dVerbNames as _dVerbNames
+from . import compact_data
 
 
 _zStartVoy = re.compile("^[aeéiouœê]")
@@ -30,15 +26,41 @@ _dGroup = { "0": "auxiliaire", "1": "1ᵉʳ groupe", "2": "2ᵉ groupe", "3": "3
 
 _dTenseIdx = { ":P": 0, ":Q": 1, ":Ip": 2, ":Iq": 3, ":Is": 4, ":If": 5, ":K": 6, ":Sp": 7, ":Sq": 8, ":E": 9 }
 
+# data loaded on first use (see _loadData)
+_lVtyp = None
+_lTags = None
+_dPatternConj = None
+_dVerb = None           # {verb: (index in _lVtyp, index in _lTags)}
+_dVerbNames = None
+
+
+def _loadData ():
+    "load conjugation data from <conj_data> and store it in compact tables"
+    global _lVtyp
+    global _lTags
+    global _dPatternConj
+    global _dVerb
+    global _dVerbNames
+    dData = compact_data.loadDataModule("conj_data")
+    _lVtyp = tuple(dData["lVtyp"])
+    _lTags = tuple(dData["lTags"])
+    _dPatternConj = dData["dPatternConj"]
+    _dVerbNames = compact_data.SortedMap(dData["dVerbNames"])
+    _dVerb = compact_data.SortedMap(dData["dVerb"])
+
 
 
 def isVerb (sVerb):
     "return True if it’s a existing verb"
+    if _dVerb is None:
+        _loadData()
     return sVerb in _dVerb
 
 
 def getConj (sVerb, sTense, sWho):
     "returns conjugation (can be an empty string)"
+    if _dVerb is None:
+        _loadData()
     if sVerb not in _dVerb:
         return None
     if sTense == ":Y":
@@ -48,6 +70,8 @@ def getConj (sVerb, sTense, sWho):
 
 def hasConj (sVerb, sTense, sWho):
     "returns False if no conjugation (also if empty) else True"
+    if _dVerb is None:
+        _loadData()
     if sVerb not in _dVerb:
         return False
     if sTense == ":Y" or _dPatternConj[sTense][_lTags[_dVerb[sVerb][1]][_dTenseIdx[sTense]]].get(sWho, False):
@@ -57,6 +81,8 @@ def hasConj (sVerb, sTense, sWho):
 
 def getVtyp (sVerb):
     "returns raw informations about sVerb"
+    if _dVerb is None:
+        _loadData()
     if sVerb not in _dVerb:
         return None
     return _lVtyp[_dVerb[sVerb][0]]
@@ -64,6 +90,8 @@ def getVtyp (sVerb):
 
 def getNamesFrom (sVerb):
     "returns a list of names derivating from <sVerb>"
+    if _dVerb is None:
+        _loadData()
     if sVerb in _dVerbNames:
         # there are names derivated from the verb
         return list(_dVerbNames[sVerb])
@@ -84,6 +112,8 @@ def getNamesFrom (sVerb):
 
 def getConjSimilInfiV1 (sInfi):
     "returns verbal forms phonetically similar to infinitive form (for verb in group 1)"
+    if _dVerb is None:
+        _loadData()
     if sInfi not in _dVerb:
         return []
     aSugg = []
@@ -107,6 +137,8 @@ def getConjSimilInfiV1 (sInfi):
 
 def _getTags (sVerb):
     "returns tuple of tags (usable with functions _getConjWithTags and _hasConjWithTags)"
+    if _dVerb is None:
+        _loadData()
     if sVerb not in _dVerb:
         return None
     return _lTags[_dVerb[sVerb][1]]
@@ -4,6 +4,8 @@ Grammalecte - Compiled regular expressions
 
 import re
 
+from . import morph_mask as mm
+
 #### Lemme
 Lemma = re.compile(r"^>(\w[\w-]*)")
 
@@ -80,9 +82,31 @@ NPe = re.compile(":(?:M[12P]|T):e")
 
 #### FONCTIONS
 
+# Morphologies are tested with masks of features (see morph_mask): same results as the searches of the regexes above.
+
+_nN = mm.getFeature(":N")
+_nA = mm.getFeature(":A")
+_nG = mm.getFeature(":G")
+_nInv = mm.getFeature(":i")
+_nSg = mm.getFeature(":s")
+_nPl = mm.getFeature(":p")
+_nEpi = mm.getFeature(":e")
+_nMas = mm.getFeature(":m")
+_nFem = mm.getFeature(":f")
+_nNA = mm.getMaskOfRegex(NA.pattern)
+_nAD = mm.getMaskOfRegex(AD.pattern)
+_nVconj = mm.getMaskOfRegex(Vconj.pattern)
+_nVconj123 = mm.getMaskOfRegex(Vconj123.pattern)
+_nNVconj = mm.getMaskOfRegex(NVconj.pattern)
+_nNnotA = mm.getMaskOfRegex(NnotA.pattern)
+_nPNnotA = mm.getMaskOfRegex(PNnotA.pattern)
+_nNP = mm.getMaskOfRegex(NP.pattern)
+_nNPm = mm.getMaskOfRegex(NPm.pattern)
+_nNPf = mm.getMaskOfRegex(NPf.pattern)
+
 def getLemmaOfMorph (s):
     "return lemma in morphology <s>"
-    return Lemma.search(s).group(1)
+    return mm.getLemma(s)  or  Lemma.search(s).group(1)
 
 def agreement (l1, l2):
     "returns True if agreement in gender and number is possible between morphologies <l1> and <l2>"
@@ -102,11 +126,9 @@ def getGenderNumber (lMorph):
     "returns tuple (gender, number) of word: (':m', ':f', ':e' or empty string) and (':s', ':p', ':i' or empty string)"
     sGender = ""
     sNumber = ""
-    for sMorph in lMorph:
-        m = GenderNumber.search(sMorph)
-        if m:
-            sGenderx = m.group(0)[0:2]
-            sNumberx = m.group(0)[2:4]
+    for nMask in mm.getMasks(lMorph):
+        sGenderx, sNumberx = mm.getGenderNumber(nMask)
+        if sGenderx:
             if not sGender:
                 sGender = sGenderx
             elif sGender != sGenderx:
@@ -125,123 +147,119 @@ def getGenderNumber (lMorph):
 
 def isNom (lMorph):
     "returns True if all morphologies are “nom”"
-    return all(":N" in s  for s in lMorph)
+    return all(nMask & _nN  for nMask in mm.getMasks(lMorph))
 
 def isNomNotAdj (lMorph):
     "returns True if all morphologies are “nom”, but not “adjectif”"
-    return all(NnotA.search(s)  for s in lMorph)
+    return all(nMask & _nNnotA  for nMask in mm.getMasks(lMorph))
 
 def isAdj (lMorph):
     "returns True if all morphologies are “adjectif”"
-    return all(":A" in s  for s in lMorph)
+    return all(nMask & _nA  for nMask in mm.getMasks(lMorph))
 
 def isNomAdj (lMorph):
     "returns True if all morphologies are “nom” or “adjectif”"
-    return all(NA.search(s)  for s in lMorph)
+    return all(nMask & _nNA  for nMask in mm.getMasks(lMorph))
 
 def isNomVconj (lMorph):
     "returns True if all morphologies are “nom” or “verbe conjugué”"
-    return all(NVconj.search(s)  for s in lMorph)
+    return all(nMask & _nNVconj  for nMask in mm.getMasks(lMorph))
 
 def isInv (lMorph):
     "returns True if all morphologies are “invariable”"
-    return all(":i" in s  for s in lMorph)
+    return all(nMask & _nInv  for nMask in mm.getMasks(lMorph))
 
 def isSg (lMorph):
     "returns True if all morphologies are “singulier”"
-    return all(":s" in s  for s in lMorph)
+    return all(nMask & _nSg  for nMask in mm.getMasks(lMorph))
 
 def isPl (lMorph):
     "returns True if all morphologies are “pluriel”"
-    return all(":p" in s  for s in lMorph)
+    return all(nMask & _nPl  for nMask in mm.getMasks(lMorph))
 
 def isEpi (lMorph):
     "returns True if all morphologies are “épicène”"
-    return all(":e" in s  for s in lMorph)
+    return all(nMask & _nEpi  for nMask in mm.getMasks(lMorph))
 
 def isMas (lMorph):
     "returns True if all morphologies are “masculin”"
-    return all(":m" in s  for s in lMorph)
+    return all(nMask & _nMas  for nMask in mm.getMasks(lMorph))
 
 def isFem (lMorph):
     "returns True if all morphologies are “féminin”"
-    return all(":f" in s  for s in lMorph)
+    return all(nMask & _nFem  for nMask in mm.getMasks(lMorph))
 
 
 ## mbXXX = MAYBE XXX
 
 def mbNom (lMorph):
     "returns True if one morphology is “nom”"
-    return any(":N" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nN)
 
 def mbAdj (lMorph):
     "returns True if one morphology is “adjectif”"
-    return any(":A" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nA)
 
 def mbAdjNb (lMorph):
     "returns True if one morphology is “adjectif” or “nombre”"
-    return any(AD.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nAD)
 
 def mbNomAdj (lMorph):
     "returns True if one morphology is “nom” or “adjectif”"
-    return any(NA.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nNA)
 
 def mbNomNotAdj (lMorph):
     "returns True if one morphology is “nom”, but not “adjectif”"
-    bResult = False
-    for s in lMorph:
-        if ":A" in s:
-            return False
-        if ":N" in s:
-            bResult = True
-    return bResult
+    nUnion = mm.getUnion(lMorph)
+    return not nUnion & _nA and bool(nUnion & _nN)
 
 def mbPpasNomNotAdj (lMorph):
     "returns True if one morphology is “nom” or “participe passé”, but not “adjectif”"
-    return any(PNnotA.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nPNnotA)
 
 def mbVconj (lMorph):
     "returns True if one morphology is “nom” or “verbe conjugué”"
-    return any(Vconj.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nVconj)
 
 def mbVconj123 (lMorph):
     "returns True if one morphology is “nom” or “verbe conjugué” (but not “avoir” or “être”)"
-    return any(Vconj123.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nVconj123)
 
 def mbMG (lMorph):
     "returns True if one morphology is “mot grammatical”"
-    return any(":G" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nG)
 
 def mbInv (lMorph):
     "returns True if one morphology is “invariable”"
-    return any(":i" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nInv)
 
 def mbSg (lMorph):
     "returns True if one morphology is “singulier”"
-    return any(":s" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nSg)
 
 def mbPl (lMorph):
     "returns True if one morphology is “pluriel”"
-    return any(":p" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nPl)
 
 def mbEpi (lMorph):
     "returns True if one morphology is “épicène”"
-    return any(":e" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nEpi)
 
 def mbMas (lMorph):
     "returns True if one morphology is “masculin”"
-    return any(":m" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nMas)
 
 def mbFem (lMorph):
     "returns True if one morphology is “féminin”"
-    return any(":f" in s  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nFem)
 
 def mbNpr (lMorph):
     "returns True if one morphology is “nom propre” or “titre de civilité”"
-    return any(NP.search(s)  for s in lMorph)
+    return bool(mm.getUnion(lMorph) & _nNP)
 
 def mbNprMasNotFem (lMorph):
     "returns True if one morphology is “nom propre masculin” but not “féminin”"
-    if any(NPf.search(s)  for s in lMorph):
+    nUnion = mm.getUnion(lMorph)
+    if nUnion & _nNPf:
         return False
-    return any(NPm.search(s)  for s in lMorph)
+    return bool(nUnion & _nNPm)
@@ -4,18 +4,24 @@ Grammar checker engine
 """
 
 import re
+import sys
+import time
 import traceback
+import threading
+import importlib
 #import unicodedata
 from itertools import chain
 
 from ..graphspell.spellchecker import SpellChecker
 from ..graphspell.echo import echo
+from ..graphspell import patterns
 
 from .. import text
 
 from . import gc_functions
 from . import gc_options
 from . import phonet
+from . import morph_mask
 
 try:
     # LibreOffice / OpenOffice
@@ -29,9 +35,10 @@ except ImportError:
 
 
 __all__ = [ "lang", "locales", "pkg", "name", "version", "author", \
-            "load", "parse", "getSpellChecker", \
+            "load", "warmup", "waitForWarmup", "parse", "parseWithBudget", "getSpellChecker", \
             "setOption", "setOptions", "getOptions", "getDefaultOptions", "getOptionsLabels", "resetOptions", "displayOptions", \
-            "ignoreRule", "resetIgnoreRules", "reactivateRule", "listRules", "displayRules", "setWriterUnderliningStyle" ]
+            "ignoreRule", "resetIgnoreRules", "reactivateRule", "getIgnoredRules", "listRules", "displayRules", "getLoadedGraphs", "getPatternsStats", "setWriterUnderliningStyle", \
+            "GrammarEngine" ]
 
 __version__ = "2.1.1"
 
@@ -45,7 +52,9 @@ author = "Olivier R."
 
 # Modules
 _rules = None                               # module gc_rules
-_rules_graph = None                         # module gc_rules_graph
+_rules_graph = None                         # module gc_rules_graph (or its snapshot)
+_oBundle = None                             # rules bundle pruned for a set of options (replaces gc_rules and gc_rules_graph)
+_dGraph = {}                                # graphs materialized on demand: {graph name: graph}
 
 # Tools
 _oSpellChecker = None
@@ -55,6 +64,10 @@ _oTokenizer = None
 _sAppContext = ""                           # what software is running
 _aIgnoredRules = set()
 
+# Loading
+_oRulesLock = threading.Lock()              # rules are loaded once, even if a background warm-up is running
+_oWarmupThread = None
+
 # Writer underlining style
 _dOptionsColors = None
 _bMulticolor = True
@@ -63,20 +76,85 @@ _nUnderliningStyle = 0
 
 #### Initialization
 
-def load (sContext="Python", sColorType="aRGB"):
-    "initialization of the grammar checker"
+def load (sContext="Python", sColorType="aRGB", bWarmup=False, spfBundle=""):
+    """initialization of the grammar checker (if <bWarmup>, the engine is warmed up in a background thread)
+       if <spfBundle>, rules are loaded from this bundle (see gc_rules_bundle.py), and options are set as in the bundle"""
     global _oSpellChecker
     global _sAppContext
     global _dOptionsColors
     global _oTokenizer
     try:
         _sAppContext = sContext
-        _oSpellChecker = SpellChecker("fr", "fr-allvars.json", "", "")
+        _oSpellChecker = SpellChecker("fr", "fr-allvars.bdic", "", "")
         _oSpellChecker.activateStorage()
         _oTokenizer = _oSpellChecker.getTokenizer()
+        if _oBundle:
+            # functions removed by the previous bundle are needed again
+            importlib.reload(gc_functions)
+            _unloadRules()
         gc_functions.load(sContext, _oSpellChecker)
         gc_options.load(sContext)
         _dOptionsColors = gc_options.getOptionsColors(sContext, sColorType)
+        if spfBundle:
+            _loadBundle(spfBundle)
+        if bWarmup:
+            warmup(True)
+    except:
+        traceback.print_exc()
+
+
+# frequent French words, to fill the cache of morphologies when warming up
+_lFrequentWords = [
+    "le", "la", "les", "l’", "un", "une", "des", "du", "de", "d’", "au", "aux", "ce", "cet", "cette", "ces",
+    "mon", "ma", "mes", "ton", "ta", "tes", "son", "sa", "ses", "notre", "nos", "votre", "vos", "leur", "leurs",
+    "je", "j’", "tu", "il", "elle", "on", "nous", "vous", "ils", "elles", "me", "m’", "te", "t’", "se", "s’",
+    "lui", "moi", "toi", "eux", "y", "en", "qui", "que", "qu’", "quoi", "dont", "où", "ne", "n’", "pas", "plus",
+    "et", "ou", "mais", "donc", "or", "ni", "car", "si", "comme", "quand", "lorsque", "puisque", "parce",
+    "à", "dans", "par", "pour", "sur", "avec", "sans", "sous", "entre", "vers", "chez", "après", "avant", "depuis",
+    "pendant", "contre", "selon", "très", "bien", "aussi", "encore", "toujours", "jamais", "déjà", "alors", "puis",
+    "ici", "là", "tout", "tous", "toute", "toutes", "même", "autre", "autres", "peu", "beaucoup", "trop", "moins",
+    "est", "être", "suis", "es", "sommes", "êtes", "sont", "était", "été", "sera", "serait", "soit",
+    "avoir", "ai", "as", "a", "avons", "avez", "ont", "avait", "eu", "aura", "aurait",
+    "faire", "fait", "font", "faisait", "dire", "dit", "aller", "va", "vont", "allait", "pouvoir", "peut", "peuvent",
+    "voir", "vu", "vouloir", "veut", "savoir", "sait", "falloir", "faut", "devoir", "doit", "prendre", "pris",
+    "venir", "vient", "mettre", "mis", "donner", "donné", "passer", "trouver", "parler", "aimer", "penser",
+    "homme", "femme", "enfant", "jour", "temps", "an", "année", "fois", "chose", "monde", "vie", "main", "pays",
+    "grand", "grande", "petit", "petite", "nouveau", "nouvelle", "premier", "première", "bon", "bonne", "seul",
+]
+
+
+def warmup (bBackground=False):
+    "compile rules, materialize graphs of active options, fill the cache of morphologies (in a background thread if <bBackground>)"
+    global _oWarmupThread
+    if bBackground:
+        if not _oWarmupThread or not _oWarmupThread.is_alive():
+            _oWarmupThread = threading.Thread(target=_warmup, name="grammalecte-warmup", daemon=True)
+            _oWarmupThread.start()
+        return
+    _warmup()
+
+
+def waitForWarmup (fTimeout=None):
+    "wait for the end of the background warm-up (if any). Returns False if it’s still running after <fTimeout> seconds"
+    if _oWarmupThread:
+        _oWarmupThread.join(fTimeout)
+        return not _oWarmupThread.is_alive()
+    return True
+
+
+def _warmup ():
+    try:
+        _getRules(True)
+        for sOption, lRuleGroup in _getRules(False):
+            if sOption == "@@@@":
+                for sGraphName, _ in lRuleGroup:
+                    if gc_options.dOptions.get(sGraphName, True):
+                        _getGraph(sGraphName)
+        for sWord in _lFrequentWords:
+            _oSpellChecker.getMorph(sWord)
+            _oSpellChecker.getLemma(sWord)
+        # a short text to go through the whole parsing process
+        parse("Les enfants de la voisine sont partis à l’école avec leurs amis.")
     except:
         traceback.print_exc()
 
@@ -100,22 +178,167 @@ def _getRules (bParagraph):
     return _rules.lParagraphRules
 
 
+def _loadBundle (spfBundle):
+    "use rules of the bundle <spfBundle> and set options and ignored rules as in the bundle"
+    global _oBundle
+    from . import gc_rules_bundle
+    oBundle = gc_rules_bundle.load(spfBundle)
+    if not oBundle:
+        echo("# Warning. Rules bundle missing or stale: <" + spfBundle + ">. All rules are used.", file=sys.stderr)
+        return
+    _unloadRules()
+    _oBundle = oBundle
+    gc_options.setOptions(oBundle.dOptions)
+    _aIgnoredRules.update(oBundle.lIgnoredRules)
+    gc_rules_bundle.pruneFunctions(gc_functions, oBundle.lFunctions)
+
+
+def _unloadRules ():
+    global _rules
+    global _rules_graph
+    global _oBundle
+    with _oRulesLock:
+        _rules = None
+        _rules_graph = None
+        _oBundle = None
+        _dGraph.clear()
+
+
 def _loadRules ():
-    from . import gc_rules
-    from . import gc_rules_graph
     global _rules
     global _rules_graph
-    _rules = gc_rules
-    _rules_graph = gc_rules_graph
-    # compile rules regex
-    for sOption, lRuleGroup in chain(_rules.lParagraphRules, _rules.lSentenceRules):
-        if sOption != "@@@@":
-            for aRule in lRuleGroup:
-                try:
-                    aRule[0] = re.compile(aRule[0])
-                except (IndexError, re.error):
-                    echo("Bad regular expression in # " + str(aRule[2]))
-                    aRule[0] = "(?i)<Grammalecte>"
+    with _oRulesLock:
+        if _rules:
+            # already loaded by another thread
+            return
+        if _oBundle:
+            gc_rules = _rules_graph = _oBundle
+        else:
+            from . import gc_rules
+            from . import gc_rules_snapshot
+            # graph rules: the snapshot is much faster to load than the module, which is used only if the snapshot is missing or stale
+            _rules_graph = gc_rules_snapshot.load()
+            if not _rules_graph:
+                from . import gc_rules_graph
+                _rules_graph = gc_rules_graph
+        _dGraph.clear()
+        # compile rules regex
+        for sOption, lRuleGroup in chain(gc_rules.lParagraphRules, gc_rules.lSentenceRules):
+            if sOption != "@@@@":
+                for aRule in lRuleGroup:
+                    try:
+                        aRule[0] = re.compile(aRule[0])
+                    except (IndexError, re.error):
+                        echo("Bad regular expression in # " + str(aRule[2]), file=sys.stderr)
+                        aRule[0] = "(?i)<Grammalecte>"
+        # patterns of conditions and disambiguators (strings given to morph(), g_morph(), select()…)
+        patterns.preload(_getFunctionsConstants())
+        # rules are available only when all regexes are compiled
+        _rules = gc_rules
+
+
+def _getFunctionsConstants ():
+    "return the string constants of functions generated from the rules (patterns, but also messages, values…)"
+    from .gc_rules_bundle import isGeneratedFunction
+    return { sConst  for sName, xObj in vars(gc_functions).items()  if isGeneratedFunction(sName) and hasattr(xObj, "__code__") \
+                     for sConst in xObj.__code__.co_consts  if isinstance(sConst, str) }
+
+
+def getPatternsStats ():
+    "return the numbers of patterns of morphologies compiled: preloaded with the rules or on demand (misses)"
+    return patterns.getStats()
+
+
+def _getGraph (sGraphName):
+    "return the graph <sGraphName>, materialized at first use"
+    # the graph may be evicted meanwhile by another thread: we return the object we got
+    dGraph = _dGraph.get(sGraphName)
+    if dGraph is None:
+        if hasattr(_rules_graph, "loadGraph"):
+            dGraph = _rules_graph.loadGraph(sGraphName)
+        else:
+            # the graph of the module is left untouched (the rules bundle builder reads it)
+            dGraph = dict(_rules_graph.dAllGraph[sGraphName])
+        _compileGraph(dGraph)
+        _dGraph[sGraphName] = dGraph
+    return dGraph
+
+
+def _compileRegex (sRegex):
+    try:
+        return re.compile(sRegex)
+    except re.error:
+        echo("Bad regular expression in graph: " + sRegex, file=sys.stderr)
+        return re.compile("(?!)")
+
+
+def _compileRegexArc (sRegex, iNext):
+    "return the regex arc <sRegex> as a tuple (sRegex, zPattern, zNegPattern, bAll, iNext): anti-pattern split and patterns compiled"
+    if "¬" not in sRegex:
+        return (sRegex, _compileRegex(sRegex), None, False, iNext)
+    sPattern, sNegPattern = sRegex.split("¬", 1)
+    zPattern = _compileRegex(sPattern)  if sPattern  else None
+    if sNegPattern == "*":
+        # all morphologies must match with <sPattern>
+        return (sRegex, zPattern, None, True, iNext)
+    return (sRegex, zPattern, _compileRegex(sNegPattern)  if sNegPattern  else None, False, iNext)
+
+
+def _compileMorphArc (sArc, iNext, bRegex):
+    """return the morph arc <sArc> (regex if <bRegex>, else substring) as a tuple (sArc, xPattern, xNegPattern, bAll, iNext, nMask, nNegMask):
+       if patterns can be expressed as masks of features (see morph_mask), <nMask> and <nNegMask> are these masks (0: no pattern),
+       else <nMask> and <nNegMask> are None, and <xPattern> and <xNegPattern> are the compiled regexes or the substrings"""
+    sPattern, sNegPattern = sArc.split("¬", 1)  if "¬" in sArc  else (sArc, "")
+    bAll = sNegPattern == "*"
+    if bAll:
+        sNegPattern = ""
+    getMask = morph_mask.getMaskOfRegex  if bRegex  else morph_mask.getMaskOfSubstring
+    nMask = getMask(sPattern)  if sPattern  else 0
+    nNegMask = getMask(sNegPattern)  if sNegPattern  else 0
+    if nMask is not None and nNegMask is not None:
+        return (sArc, None, None, bAll, iNext, nMask, nNegMask)
+    if bRegex:
+        _, zPattern, zNegPattern, bAll, iNext = _compileRegexArc(sArc, iNext)
+        return (sArc, zPattern, zNegPattern, bAll, iNext, None, None)
+    return (sArc, sPattern, sNegPattern, bAll, iNext, None, None)
+
+
+def _compileGraph (dGraph):
+    "replace in <dGraph> regex and morph arcs {sArc: iNext} by lists of precompiled arcs (nodes are copied, not modified)"
+    for iNode, xNode in dGraph.items():
+        if isinstance(xNode, dict) and ("<re_value>" in xNode or "<morph>" in xNode or "<re_morph>" in xNode):
+            dNode = dict(xNode)
+            if "<re_value>" in dNode:
+                dNode["<re_value>"] = [ _compileRegexArc(sRegex, iNext)  for sRegex, iNext in dNode["<re_value>"].items() ]
+            if "<morph>" in dNode:
+                dNode["<morph>"] = [ _compileMorphArc(sSearch, iNext, False)  for sSearch, iNext in dNode["<morph>"].items() ]
+            if "<re_morph>" in dNode:
+                dNode["<re_morph>"] = [ _compileMorphArc(sRegex, iNext, True)  for sRegex, iNext in dNode["<re_morph>"].items() ]
+            dGraph[iNode] = dNode
+
+
+_aNoRegexValueTokenTypes = frozenset(["INFO", "PUNC", "SIGN"])
+
+
+def _getValuesToMatch (sValue):
+    "return the list of values of a token to search in nodes: the value and its other casings"
+    if sValue[0:2].istitle(): # we test only 2 first chars, to match words such as "Laissez-les", "Crève-cœur".
+        return [sValue, sValue.lower()]
+    if sValue.isupper():
+        return [sValue, sValue.lower(), sValue.capitalize()]
+    return [sValue]
+
+
+def _evictGraphs ():
+    "forget graphs whose option is switched off (they will be materialized again if needed)"
+    for sGraphName in list(_dGraph):
+        if not gc_options.dOptions.get(sGraphName, True):
+            del _dGraph[sGraphName]
+
+
+def getLoadedGraphs ():
+    "return the list of graphs currently materialized"
+    return list(_dGraph)
 
 
 def ignoreRule (sRuleId):
@@ -133,6 +356,11 @@ def reactivateRule (sRuleId):
     _aIgnoredRules.discard(sRuleId)
 
 
+def getIgnoredRules ():
+    "return the list of ignored rules"
+    return sorted(_aIgnoredRules)
+
+
 def listRules (sFilter=None):
     "generator: returns typle (sOption, sLineId, sRuleId)"
     if sFilter:
@@ -166,11 +394,13 @@ def displayRules (sFilter=None):
 def setOption (sOpt, bVal):
     "set option <sOpt> with <bVal> if it exists"
     gc_options.setOption(sOpt, bVal)
+    _evictGraphs()
 
 
 def setOptions (dOpt):
     "update the dictionary of options with <dOpt>"
     gc_options.setOptions(dOpt)
+    _evictGraphs()
 
 
 def getOptions ():
@@ -196,6 +426,7 @@ def displayOptions (sLang="fr"):
 def resetOptions ():
     "set options to default values"
     gc_options.resetOptions()
+    _evictGraphs()
 
 
 def setWriterUnderliningStyle (sStyle="BOLDWAVE", bMulticolor=True):
@@ -225,14 +456,88 @@ def parse (sText, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bF
     return oText.parse(sCountry, bDebug, dOptions, bContext, bFullInfo)
 
 
+def parseWithBudget (sText, fTimeBudget, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bFullInfo=False):
+    """analyses <sText> in <fTimeBudget> seconds at most (see TextParser.parse), returns a tuple (result, bTruncated):
+       the result of parse() with errors found so far, and True if the analysis stopped before the end"""
+    oText = TextParser(sText)
+    xResult = oText.parse(sCountry, bDebug, dOptions, bContext, bFullInfo, fTimeBudget)
+    return xResult, oText.bTruncated
+
+
+#### ENGINE INSTANCES
+
+class GrammarEngine:
+    """Grammar checker with its own options and ignored rules
+       Rules, dictionary and spellchecker (with its cache of morphologies) are shared by all instances and the module functions.
+       Instances don’t modify any global: several instances can parse texts at the same time in different threads.
+       The module must be loaded first (see load())."""
+
+    def __init__ (self, dOptions=None, aIgnoredRules=None):
+        if not _oSpellChecker:
+            raise Exception("# Error. Grammar checker not loaded.")
+        # options and ignored rules are inherited from the module configuration
+        self.dOptions = gc_options.getOptions()
+        if dOptions:
+            self.setOptions(dOptions)
+        self.aIgnoredRules = set(_aIgnoredRules)  if aIgnoredRules is None  else set(aIgnoredRules)
+
+    def setOption (self, sOpt, bVal):
+        "set option <sOpt> with <bVal> if it exists"
+        if sOpt in self.dOptions:
+            self.dOptions[sOpt] = bVal
+
+    def setOptions (self, dOpt):
+        "update the dictionary of options with <dOpt>, only known options are updated"
+        for sKey, bVal in dOpt.items():
+            if sKey in self.dOptions:
+                self.dOptions[sKey] = bVal
+
+    def getOptions (self):
+        "return a copy of options as dictionary"
+        return self.dOptions.copy()
+
+    def resetOptions (self):
+        "set options to default values"
+        self.dOptions = gc_options.getDefaultOptions()
+
+    def ignoreRule (self, sRuleId):
+        "disable rule <sRuleId>"
+        self.aIgnoredRules.add(sRuleId)
+
+    def resetIgnoreRules (self):
+        "clear all ignored rules"
+        self.aIgnoredRules.clear()
+
+    def reactivateRule (self, sRuleId):
+        "(re)activate rule <sRuleId>"
+        self.aIgnoredRules.discard(sRuleId)
+
+    def getSpellChecker (self):
+        "return the spellchecker object"
+        return _oSpellChecker
+
+    def parse (self, sText, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bFullInfo=False):
+        "analyses <sText> and returns an iterable of errors or (with option <bFullInfo>) paragraphs errors and sentences with tokens and errors"
+        oText = TextParser(sText, self.dOptions, self.aIgnoredRules)
+        return oText.parse(sCountry, bDebug, dOptions, bContext, bFullInfo)
+
+    def parseWithBudget (self, sText, fTimeBudget, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bFullInfo=False):
+        "analyses <sText> in <fTimeBudget> seconds at most, returns a tuple (result, bTruncated) (see parseWithBudget)"
+        oText = TextParser(sText, self.dOptions, self.aIgnoredRules)
+        xResult = oText.parse(sCountry, bDebug, dOptions, bContext, bFullInfo, fTimeBudget)
+        return xResult, oText.bTruncated
+
+
 #### TEXT PARSER
 
 class TextParser:
     "Text parser"
 
-    def __init__ (self, sText):
+    def __init__ (self, sText, dEngineOptions=None, aIgnoredRules=None):
         self.sText = sText
         self.sText0 = sText
+        self.dEngineOptions = dEngineOptions  if dEngineOptions is not None  else gc_options.dOptions
+        self.aIgnoredRules = aIgnoredRules  if aIgnoredRules is not None  else _aIgnoredRules
         self.sSentence = ""
         self.sSentence0 = ""
         self.nOffsetWithinParagraph = 0
@@ -243,27 +548,50 @@ class TextParser:
         self.dError = {}            # {position: error}
         self.dSentenceError = {}    # {position: error} (for the current sentence only)
         self.dErrorPriority = {}    # {position: priority of the current error}
+        self.fDeadline = 0.0        # time (perf_counter) when the analysis must stop, 0 if no time limit
+        self.bTruncated = False     # True if the analysis stopped before the end (time budget exhausted)
 
     def __str__ (self):
         s = "===== TEXT =====\n"
         s += "sentence: " + self.sSentence0 + "\n"
         s += "now:      " + self.sSentence  + "\n"
-        for dToken in self.lTokens:
-            s += '#{i}\t{nStart}:{nEnd}\t{sValue}\t{sType}'.format(**dToken)
-            if "lMorph" in dToken:
-                s += "\t" + str(dToken["lMorph"])
-            if "aTags" in dToken:
-                s += "\t" + str(dToken["aTags"])
+        for oToken in self.lTokens:
+            s += '#{0.i}\t{0.nStart}:{0.nEnd}\t{0.sValue}\t{0.sType}'.format(oToken)
+            if oToken.lMorph is not None:
+                s += "\t" + str(oToken.lMorph)
+            if oToken.aTags is not None:
+                s += "\t" + str(oToken.aTags)
             s += "\n"
-        #for nPos, dToken in self.dTokenPos.items():
-        #    s += "{}\t{}\n".format(nPos, dToken)
+        #for nPos, oToken in self.dTokenPos.items():
+        #    s += "{}\t{}\n".format(nPos, oToken)
         return s
 
-    def parse (self, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bFullInfo=False):
-        "analyses <sText> and returns an iterable of errors or (with option <bFullInfo>) paragraphs errors and sentences with tokens and errors"
+    def parse (self, sCountry="FR", bDebug=False, dOptions=None, bContext=False, bFullInfo=False, fTimeBudget=0.0):
+        """analyses <sText> and returns an iterable of errors or (with option <bFullInfo>) paragraphs errors and sentences with tokens and errors
+           with <fTimeBudget> (seconds), the analysis stops at the next sentence, rule group or graph once the time is exhausted:
+           errors found so far are returned, and <self.bTruncated> is True if the analysis stopped before the end"""
         #sText = unicodedata.normalize("NFC", sText)
-        dOpt = dOptions or gc_options.dOptions
-        bShowRuleId = gc_options.dOptions.get('idrule', False)
+        dOpt = dOptions or self.dEngineOptions
+        bShowRuleId = self.dEngineOptions.get('idrule', False)
+        if fTimeBudget:
+            if not 0 < fTimeBudget < float("inf"):
+                raise ValueError("# Error. Time budget: a positive number of seconds is expected.")
+            self.fDeadline = time.perf_counter() + fTimeBudget
+        # options read by rule conditions
+        xToken = gc_functions.setParseOptions(dOpt)
+        try:
+            xResult = self._parse(sCountry, bDebug, dOpt, bShowRuleId, bContext, bFullInfo)
+        finally:
+            gc_functions.resetParseOptions(xToken)
+        return xResult
+
+    def isTimeOver (self):
+        "return True if the time budget is exhausted (the analysis is then truncated)"
+        if self.fDeadline and not self.bTruncated and time.perf_counter() > self.fDeadline:
+            self.bTruncated = True
+        return self.bTruncated
+
+    def _parse (self, sCountry, bDebug, dOpt, bShowRuleId, bContext, bFullInfo):
         # parse paragraph
         try:
             self.parseText(self.sText, self.sText0, True, 0, sCountry, dOpt, bShowRuleId, bDebug, bContext)
@@ -276,24 +604,28 @@ class TextParser:
         # parse sentences
         sText = self._getCleanText()
         for iStart, iEnd in text.getSentenceBoundaries(sText):
+            if self.isTimeOver():
+                break
             if 4 < (iEnd - iStart) < 2000:
                 try:
                     self.sSentence = sText[iStart:iEnd]
                     self.sSentence0 = self.sText0[iStart:iEnd]
                     self.nOffsetWithinParagraph = iStart
                     self.lTokens = list(_oTokenizer.genTokens(self.sSentence, True))
-                    self.dTokenPos = { dToken["nStart"]: dToken  for dToken in self.lTokens  if dToken["sType"] != "INFO" }
+                    self.dTokenPos = { oToken.nStart: oToken  for oToken in self.lTokens  if oToken.sType != "INFO" }
                     if bFullInfo:
                         self.lTokens0 = list(self.lTokens)  # the list of tokens is duplicated, to keep tokens from being deleted when analysis
                     self.parseText(self.sSentence, self.sSentence0, False, iStart, sCountry, dOpt, bShowRuleId, bDebug, bContext)
                     if bFullInfo:
-                        for dToken in self.lTokens0:
+                        # tokens are given as dictionaries, with labels
+                        lTokens = [ oToken.toDict()  for oToken in self.lTokens0 ]
+                        for dToken in lTokens:
                             _oSpellChecker.setLabelsOnToken(dToken)
                         lSentences.append({
                             "nStart": iStart,
                             "nEnd": iEnd,
                             "sSentence": self.sSentence0,
-                            "lTokens": self.lTokens0,
+                            "lTokens": lTokens,
                             "lGrammarErrors": list(self.dSentenceError.values())
                         })
                         self.dSentenceError.clear()
@@ -326,20 +658,22 @@ class TextParser:
         "parse the text with rules"
         bChange = False
         for sOption, lRuleGroup in _getRules(bParagraph):
+            if self.isTimeOver():
+                break
             if sOption == "@@@@":
                 # graph rules
                 if not bParagraph and bChange:
                     self.update(sText, bDebug)
                     bChange = False
                 for sGraphName, sLineId in lRuleGroup:
-                    if sGraphName not in dOptions or dOptions[sGraphName]:
+                    if (sGraphName not in dOptions or dOptions[sGraphName]) and not self.isTimeOver():
                         if bDebug:
                             echo("\n>>>> GRAPH: " + sGraphName + " " + sLineId)
-                        sText = self.parseGraph(_rules_graph.dAllGraph[sGraphName], sCountry, dOptions, bShowRuleId, bDebug, bContext)
+                        sText = self.parseGraph(_getGraph(sGraphName), sCountry, dOptions, bShowRuleId, bDebug, bContext)
             elif not sOption or dOptions.get(sOption, False):
                 # regex rules
                 for zRegex, bUppercase, sLineId, sRuleId, nPriority, lActions in lRuleGroup:
-                    if sRuleId not in _aIgnoredRules:
+                    if sRuleId not in self.aIgnoredRules:
                         for m in zRegex.finditer(sText):
                             bCondMemo = None
                             for sFuncCond, cActionType, sWhat, *eAct in lActions:
@@ -387,60 +721,50 @@ class TextParser:
         "update <sSentence> and retokenize"
         self.sSentence = sSentence
         lNewTokens = list(_oTokenizer.genTokens(sSentence, True))
-        for dToken in lNewTokens:
-            if "lMorph" in self.dTokenPos.get(dToken["nStart"], {}):
-                dToken["lMorph"] = self.dTokenPos[dToken["nStart"]]["lMorph"]
-            if "aTags" in self.dTokenPos.get(dToken["nStart"], {}):
-                dToken["aTags"] = self.dTokenPos[dToken["nStart"]]["aTags"]
+        for oToken in lNewTokens:
+            oPreviousToken = self.dTokenPos.get(oToken.nStart)
+            if oPreviousToken:
+                if oPreviousToken.lMorph is not None:
+                    oToken.lMorph = oPreviousToken.lMorph
+                if oPreviousToken.aTags is not None:
+                    oToken.aTags = oPreviousToken.aTags
         self.lTokens = lNewTokens
-        self.dTokenPos = { dToken["nStart"]: dToken  for dToken in self.lTokens  if dToken["sType"] != "INFO" }
+        self.dTokenPos = { oToken.nStart: oToken  for oToken in self.lTokens  if oToken.sType != "INFO" }
         if bDebug:
             echo("UPDATE:")
             echo(self)
 
-    def _getMatches (self, dGraph, dToken, dNode, bKeep=False):
-        "generator: return matches where <dToken> “values” match <dNode> arcs"
+    def _getMatches (self, dGraph, oToken, dNode, bKeep=False, dTokenMemo=None):
+        """generator: return matches where <oToken> “values” match <dNode> arcs
+           <dTokenMemo>: values of <oToken> computed by previous calls for the same token (the token must not be modified meanwhile)"""
+        if dTokenMemo is None:
+            dTokenMemo = {}
         bTokenFound = False
         # token value
-        if dToken["sValue"] in dNode:
-            yield (" ", dToken["sValue"], dNode[dToken["sValue"]])
-            bTokenFound = True
-        if dToken["sValue"][0:2].istitle(): # we test only 2 first chars, to match words such as "Laissez-les", "Crève-cœur".
-            sValue = dToken["sValue"].lower()
-            if sValue in dNode:
-                yield (" ", sValue, dNode[sValue])
-                bTokenFound = True
-        elif dToken["sValue"].isupper():
-            sValue = dToken["sValue"].lower()
-            if sValue in dNode:
-                yield (" ", sValue, dNode[sValue])
-                bTokenFound = True
-            sValue = dToken["sValue"].capitalize()
+        lValue = dTokenMemo.get("lValue")
+        if lValue is None:
+            lValue = dTokenMemo["lValue"] = _getValuesToMatch(oToken.sValue)
+        for sValue in lValue:
             if sValue in dNode:
                 yield (" ", sValue, dNode[sValue])
                 bTokenFound = True
         # regex value arcs
-        if dToken["sType"] not in frozenset(["INFO", "PUNC", "SIGN"]):
+        if oToken.sType not in _aNoRegexValueTokenTypes:
             if "<re_value>" in dNode:
-                for sRegex in dNode["<re_value>"]:
-                    if "¬" not in sRegex:
-                        # no anti-pattern
-                        if re.search(sRegex, dToken["sValue"]):
-                            yield ("~", sRegex, dNode["<re_value>"][sRegex])
-                            bTokenFound = True
-                    else:
-                        # there is an anti-pattern
-                        sPattern, sNegPattern = sRegex.split("¬", 1)
-                        if sNegPattern and re.search(sNegPattern, dToken["sValue"]):
-                            continue
-                        if not sPattern or re.search(sPattern, dToken["sValue"]):
-                            yield ("~", sRegex, dNode["<re_value>"][sRegex])
-                            bTokenFound = True
+                for sRegex, zPattern, zNegPattern, _, iNext in dNode["<re_value>"]:
+                    if zNegPattern and zNegPattern.search(oToken.sValue):
+                        continue
+                    if not zPattern or zPattern.search(oToken.sValue):
+                        yield ("~", sRegex, iNext)
+                        bTokenFound = True
         # analysable tokens
-        if dToken["sType"][0:4] == "WORD":
+        if oToken.sType[0:4] == "WORD":
             # token lemmas
             if "<lemmas>" in dNode:
-                for sLemma in _oSpellChecker.getLemma(dToken["sValue"]):
+                aLemma = dTokenMemo.get("aLemma")
+                if aLemma is None:
+                    aLemma = dTokenMemo["aLemma"] = _oSpellChecker.getLemma(oToken.sValue)
+                for sLemma in aLemma:
                     if sLemma in dNode["<lemmas>"]:
                         yield (">", sLemma, dNode["<lemmas>"][sLemma])
                         bTokenFound = True
@@ -449,69 +773,77 @@ class TextParser:
                 for sPhonet in dNode["<phonet>"]:
                     if sPhonet.endswith("!"):
                         sPhon = sPhonet[0:-1]
-                        if dToken["sValue"] == sPhon:
+                        if oToken.sValue == sPhon:
                             continue
-                        if dToken["sValue"][0:1].isupper():
-                            if dToken["sValue"].lower() == sPhon:
+                        if oToken.sValue[0:1].isupper():
+                            if oToken.sValue.lower() == sPhon:
                                 continue
-                            if dToken["sValue"].isupper() and dToken["sValue"].capitalize() == sPhon:
+                            if oToken.sValue.isupper() and oToken.sValue.capitalize() == sPhon:
                                 continue
-                    if phonet.isSimilAs(dToken["sValue"], sPhonet.rstrip("!")):
+                    if phonet.isSimilAs(oToken.sValue, sPhonet.rstrip("!")):
                         yield ("#", sPhonet, dNode["<phonet>"][sPhonet])
                         bTokenFound = True
             # morph arcs
-            if "<morph>" in dNode:
-                lMorph = dToken.get("lMorph", _oSpellChecker.getMorph(dToken["sValue"]))
+            if "<morph>" in dNode or "<re_morph>" in dNode:
+                lMorph = dTokenMemo.get("lMorph")
+                if lMorph is None:
+                    lMorph = dTokenMemo["lMorph"] = oToken.lMorph  if oToken.lMorph is not None  else _oSpellChecker.getMorph(oToken.sValue)
                 if lMorph:
-                    for sSearch in dNode["<morph>"]:
-                        if "¬" not in sSearch:
-                            # no anti-pattern
-                            if any(sSearch in sMorph  for sMorph in lMorph):
-                                yield ("$", sSearch, dNode["<morph>"][sSearch])
-                                bTokenFound = True
-                        else:
-                            # there is an anti-pattern
-                            sPattern, sNegPattern = sSearch.split("¬", 1)
-                            if sNegPattern == "*":
-                                # all morphologies must match with <sPattern>
-                                if sPattern:
-                                    if all(sPattern in sMorph  for sMorph in lMorph):
-                                        yield ("$", sSearch, dNode["<morph>"][sSearch])
+                    nUnion = dTokenMemo.get("nUnion")       # features of at least one morphology (for arcs expressed as masks)
+                    if "<morph>" in dNode:
+                        for sSearch, sPattern, sNegPattern, bAll, iNext, nMask, nNegMask in dNode["<morph>"]:
+                            if nMask is not None:
+                                if bAll:
+                                    # all morphologies must have one of the features of <nMask>
+                                    if nMask and all(morph_mask.getMask(sMorph) & nMask  for sMorph in lMorph):
+                                        yield ("$", sSearch, iNext)
+                                        bTokenFound = True
+                                else:
+                                    if nUnion is None:
+                                        nUnion = dTokenMemo["nUnion"] = morph_mask.getUnion(lMorph)
+                                    if not nUnion & nNegMask and (not nMask or nUnion & nMask):
+                                        yield ("$", sSearch, iNext)
                                         bTokenFound = True
+                            elif bAll:
+                                # all morphologies must match with <sPattern>
+                                if sPattern and all(sPattern in sMorph  for sMorph in lMorph):
+                                    yield ("$", sSearch, iNext)
+                                    bTokenFound = True
                             else:
                                 if sNegPattern and any(sNegPattern in sMorph  for sMorph in lMorph):
                                     continue
                                 if not sPattern or any(sPattern in sMorph  for sMorph in lMorph):
-                                    yield ("$", sSearch, dNode["<morph>"][sSearch])
+                                    yield ("$", sSearch, iNext)
                                     bTokenFound = True
-            # regex morph arcs
-            if "<re_morph>" in dNode:
-                lMorph = dToken.get("lMorph", _oSpellChecker.getMorph(dToken["sValue"]))
-                if lMorph:
-                    for sRegex in dNode["<re_morph>"]:
-                        if "¬" not in sRegex:
-                            # no anti-pattern
-                            if any(re.search(sRegex, sMorph)  for sMorph in lMorph):
-                                yield ("@", sRegex, dNode["<re_morph>"][sRegex])
-                                bTokenFound = True
-                        else:
-                            # there is an anti-pattern
-                            sPattern, sNegPattern = sRegex.split("¬", 1)
-                            if sNegPattern == "*":
-                                # all morphologies must match with <sPattern>
-                                if sPattern:
-                                    if all(re.search(sPattern, sMorph)  for sMorph in lMorph):
-                                        yield ("@", sRegex, dNode["<re_morph>"][sRegex])
+                    # regex morph arcs
+                    if "<re_morph>" in dNode:
+                        for sRegex, zPattern, zNegPattern, bAll, iNext, nMask, nNegMask in dNode["<re_morph>"]:
+                            if nMask is not None:
+                                if bAll:
+                                    # all morphologies must have one of the features of <nMask>
+                                    if nMask and all(morph_mask.getMask(sMorph) & nMask  for sMorph in lMorph):
+                                        yield ("@", sRegex, iNext)
                                         bTokenFound = True
+                                else:
+                                    if nUnion is None:
+                                        nUnion = dTokenMemo["nUnion"] = morph_mask.getUnion(lMorph)
+                                    if not nUnion & nNegMask and (not nMask or nUnion & nMask):
+                                        yield ("@", sRegex, iNext)
+                                        bTokenFound = True
+                            elif bAll:
+                                # all morphologies must match with <zPattern>
+                                if zPattern and all(zPattern.search(sMorph)  for sMorph in lMorph):
+                                    yield ("@", sRegex, iNext)
+                                    bTokenFound = True
                             else:
-                                if sNegPattern and any(re.search(sNegPattern, sMorph)  for sMorph in lMorph):
+                                if zNegPattern and any(zNegPattern.search(sMorph)  for sMorph in lMorph):
                                     continue
-                                if not sPattern or any(re.search(sPattern, sMorph)  for sMorph in lMorph):
-                                    yield ("@", sRegex, dNode["<re_morph>"][sRegex])
+                                if not zPattern or any(zPattern.search(sMorph)  for sMorph in lMorph):
+                                    yield ("@", sRegex, iNext)
                                     bTokenFound = True
         # token tags
-        if "aTags" in dToken and "<tags>" in dNode:
-            for sTag in dToken["aTags"]:
+        if oToken.aTags is not None and "<tags>" in dNode:
+            for sTag in oToken.aTags:
                 if sTag in dNode["<tags>"]:
                     yield ("/", sTag, dNode["<tags>"][sTag])
                     bTokenFound = True
@@ -519,11 +851,11 @@ class TextParser:
         if "<meta>" in dNode:
             for sMeta in dNode["<meta>"]:
                 # no regex here, we just search if <dNode["sType"]> exists within <sMeta>
-                if sMeta == "*" or dToken["sType"] == sMeta:
+                if sMeta == "*" or oToken.sType == sMeta:
                     yield ("*", sMeta, dNode["<meta>"][sMeta])
                     bTokenFound = True
                 elif "¬" in sMeta:
-                    if dToken["sType"] not in sMeta:
+                    if oToken.sType not in sMeta:
                         yield ("*", sMeta, dNode["<meta>"][sMeta])
                         bTokenFound = True
         if not bTokenFound and bKeep:
@@ -531,19 +863,21 @@ class TextParser:
         # JUMP
         # Warning! Recursion!
         if "<>" in dNode:
-            yield from self._getMatches(dGraph, dToken, dGraph[dNode["<>"]], bKeep=True)
+            yield from self._getMatches(dGraph, oToken, dGraph[dNode["<>"]], bKeep=True, dTokenMemo=dTokenMemo)
 
     def parseGraph (self, dGraph, sCountry="FR", dOptions=None, bShowRuleId=False, bDebug=False, bContext=False):
         "parse graph with tokens from the text and execute actions encountered"
         lPointer = []
         bTagAndRewrite = False
-        for iToken, dToken in enumerate(self.lTokens):
+        for iToken, oToken in enumerate(self.lTokens):
             if bDebug:
-                echo("TOKEN: " + dToken["sValue"])
+                echo("TOKEN: " + oToken.sValue)
+            # values of the token computed once for all nodes: actions are executed only after the matching of the token
+            dTokenMemo = {}
             # check arcs for each existing pointer
             lNextPointer = []
             for dPointer in lPointer:
-                for cActionType, sMatch, iNode in self._getMatches(dGraph, dToken, dGraph[dPointer["iNode"]]):
+                for cActionType, sMatch, iNode in self._getMatches(dGraph, oToken, dGraph[dPointer["iNode"]], dTokenMemo=dTokenMemo):
                     if cActionType is None:
                         lNextPointer.append(dPointer)
                         continue
@@ -552,7 +886,7 @@ class TextParser:
                     lNextPointer.append({ "iToken1": dPointer["iToken1"], "iNode": iNode })
             lPointer = lNextPointer
             # check arcs of first nodes
-            for cActionType, sMatch, iNode in self._getMatches(dGraph, dToken, dGraph[0]):
+            for cActionType, sMatch, iNode in self._getMatches(dGraph, oToken, dGraph[0], dTokenMemo=dTokenMemo):
                 if cActionType is None:
                     continue
                 if bDebug:
@@ -595,10 +929,10 @@ class TextParser:
                                 # grammar error
                                 iTokenStart, iTokenEnd, cStartLimit, cEndLimit, bCaseSvty, nPriority, sMessage, iURL = eAct
                                 nTokenErrorStart = nTokenOffset + iTokenStart  if iTokenStart > 0  else nLastToken + iTokenStart
-                                if "sImmunity" not in self.lTokens[nTokenErrorStart] or (self.lTokens[nTokenErrorStart]["sImmunity"] != "*" and sOption not in self.lTokens[nTokenErrorStart]["sImmunity"]):
+                                if self.lTokens[nTokenErrorStart].sImmunity is None or (self.lTokens[nTokenErrorStart].sImmunity != "*" and sOption not in self.lTokens[nTokenErrorStart].sImmunity):
                                     nTokenErrorEnd = nTokenOffset + iTokenEnd  if iTokenEnd > 0  else nLastToken + iTokenEnd
-                                    nErrorStart = self.nOffsetWithinParagraph + (self.lTokens[nTokenErrorStart]["nStart"] if cStartLimit == "<"  else self.lTokens[nTokenErrorStart]["nEnd"])
-                                    nErrorEnd = self.nOffsetWithinParagraph + (self.lTokens[nTokenErrorEnd]["nEnd"] if cEndLimit == ">"  else self.lTokens[nTokenErrorEnd]["nStart"])
+                                    nErrorStart = self.nOffsetWithinParagraph + (self.lTokens[nTokenErrorStart].nStart if cStartLimit == "<"  else self.lTokens[nTokenErrorStart].nEnd)
+                                    nErrorEnd = self.nOffsetWithinParagraph + (self.lTokens[nTokenErrorEnd].nEnd if cEndLimit == ">"  else self.lTokens[nTokenErrorEnd].nStart)
                                     if nErrorStart not in self.dError or nPriority > self.dErrorPriority.get(nErrorStart, -1):
                                         self.dError[nErrorStart] = self._createErrorFromTokens(sWhat, nTokenOffset, nLastToken, nTokenErrorStart, nErrorStart, nErrorEnd, sLineId, sRuleId, bCaseSvty, \
                                                                                                sMessage, _rules_graph.dURL.get(iURL, ""), bShowRuleId, sOption, bContext)
@@ -613,12 +947,12 @@ class TextParser:
                                 self._tagAndPrepareTokenForRewriting(sWhat, nTokenStart, nTokenEnd, nTokenOffset, nLastToken, eAct[2], bDebug)
                                 bChange = True
                                 if bDebug:
-                                    echo("    TEXT_PROCESSOR: [{}:{}]  > {}".format(self.lTokens[nTokenStart]["sValue"], self.lTokens[nTokenEnd]["sValue"], sWhat))
+                                    echo("    TEXT_PROCESSOR: [{}:{}]  > {}".format(self.lTokens[nTokenStart].sValue, self.lTokens[nTokenEnd].sValue, sWhat))
                             elif cActionType == "=":
                                 # disambiguation
                                 getattr(gc_functions, sWhat)(self.lTokens, nTokenOffset, nLastToken)
                                 if bDebug:
-                                    echo("    DISAMBIGUATOR: ({})  [{}:{}]".format(sWhat, self.lTokens[nTokenOffset+1]["sValue"], self.lTokens[nLastToken]["sValue"]))
+                                    echo("    DISAMBIGUATOR: ({})  [{}:{}]".format(sWhat, self.lTokens[nTokenOffset+1].sValue, self.lTokens[nLastToken].sValue))
                             elif cActionType == ">":
                                 # we do nothing, this test is just a condition to apply all following actions
                                 if bDebug:
@@ -628,12 +962,12 @@ class TextParser:
                                 nTokenStart = nTokenOffset + eAct[0]  if eAct[0] > 0  else nLastToken + eAct[0]
                                 nTokenEnd = nTokenOffset + eAct[1]  if eAct[1] > 0  else nLastToken + eAct[1]
                                 for i in range(nTokenStart, nTokenEnd+1):
-                                    if "aTags" in self.lTokens[i]:
-                                        self.lTokens[i]["aTags"].update(sWhat.split("|"))
+                                    if self.lTokens[i].aTags is not None:
+                                        self.lTokens[i].aTags.update(sWhat.split("|"))
                                     else:
-                                        self.lTokens[i]["aTags"] = set(sWhat.split("|"))
+                                        self.lTokens[i].aTags = set(sWhat.split("|"))
                                 if bDebug:
-                                    echo("    TAG: {} >  [{}:{}]".format(sWhat, self.lTokens[nTokenStart]["sValue"], self.lTokens[nTokenEnd]["sValue"]))
+                                    echo("    TAG: {} >  [{}:{}]".format(sWhat, self.lTokens[nTokenStart].sValue, self.lTokens[nTokenEnd].sValue))
                                 for sTag in sWhat.split("|"):
                                     if sTag not in self.dTags:
                                         self.dTags[sTag] = [nTokenStart, nTokenEnd]
@@ -648,14 +982,14 @@ class TextParser:
                                 nTokenEnd = nTokenOffset + eAct[1]  if eAct[1] > 0  else nLastToken + eAct[1]
                                 sImmunity = sWhat or "*"
                                 if nTokenEnd - nTokenStart == 0:
-                                    self.lTokens[nTokenStart]["sImmunity"] = sImmunity
-                                    nErrorStart = self.nOffsetWithinParagraph + self.lTokens[nTokenStart]["nStart"]
+                                    self.lTokens[nTokenStart].sImmunity = sImmunity
+                                    nErrorStart = self.nOffsetWithinParagraph + self.lTokens[nTokenStart].nStart
                                     if nErrorStart in self.dError:
                                         del self.dError[nErrorStart]
                                 else:
                                     for i in range(nTokenStart, nTokenEnd+1):
-                                        self.lTokens[i]["sImmunity"] = sImmunity
-                                        nErrorStart = self.nOffsetWithinParagraph + self.lTokens[i]["nStart"]
+                                        self.lTokens[i].sImmunity = sImmunity
+                                        nErrorStart = self.nOffsetWithinParagraph + self.lTokens[i].nStart
                                         if nErrorStart in self.dError:
                                             del self.dError[nErrorStart]
                             else:
@@ -699,7 +1033,7 @@ class TextParser:
             lSugg = []
         else:
             lSugg = self._expand(sSugg, nTokenOffset, nLastToken).split("|")
-        if bCaseSvty and lSugg and self.lTokens[iFirstToken]["sValue"][0:1].isupper():
+        if bCaseSvty and lSugg and self.lTokens[iFirstToken].sValue[0:1].isupper():
             lSugg = list(map(lambda s: s.upper(), lSugg))  if self.sSentence[nStart:nEnd].isupper()  else list(map(lambda s: s[0:1].upper()+s[1:], lSugg))
         # Message
         sMessage = getattr(gc_functions, sMsg[1:])(self.lTokens, nTokenOffset, nLastToken)  if sMsg[0:1] == "="  else self._expand(sMsg, nTokenOffset, nLastToken)
@@ -751,9 +1085,9 @@ class TextParser:
     def _expand (self, sText, nTokenOffset, nLastToken):
         for m in re.finditer(r"\\(-?[0-9]+)", sText):
             if m.group(1)[0:1] == "-":
-                sText = sText.replace(m.group(0), self.lTokens[nLastToken+int(m.group(1))+1]["sValue"])
+                sText = sText.replace(m.group(0), self.lTokens[nLastToken+int(m.group(1))+1].sValue)
             else:
-                sText = sText.replace(m.group(0), self.lTokens[nTokenOffset+int(m.group(1))]["sValue"])
+                sText = sText.replace(m.group(0), self.lTokens[nTokenOffset+int(m.group(1))].sValue)
         return sText
 
     def rewriteText (self, sText, sRepl, iGroup, m, bUppercase):
@@ -780,35 +1114,35 @@ class TextParser:
         if sWhat == "*":
             # purge text
             if nTokenRewriteEnd - nTokenRewriteStart == 0:
-                self.lTokens[nTokenRewriteStart]["bToRemove"] = True
+                self.lTokens[nTokenRewriteStart].bToRemove = True
             else:
                 for i in range(nTokenRewriteStart, nTokenRewriteEnd+1):
-                    self.lTokens[i]["bToRemove"] = True
+                    self.lTokens[i].bToRemove = True
         elif sWhat == "␣":
             # merge tokens
-            self.lTokens[nTokenRewriteStart]["nMergeUntil"] = nTokenRewriteEnd
+            self.lTokens[nTokenRewriteStart].nMergeUntil = nTokenRewriteEnd
         elif sWhat.startswith("␣"):
             sWhat = self._expand(sWhat, nTokenOffset, nLastToken)
-            self.lTokens[nTokenRewriteStart]["nMergeUntil"] = nTokenRewriteEnd
-            self.lTokens[nTokenRewriteStart]["sMergedValue"] = sWhat[1:]
+            self.lTokens[nTokenRewriteStart].nMergeUntil = nTokenRewriteEnd
+            self.lTokens[nTokenRewriteStart].sMergedValue = sWhat[1:]
         elif sWhat == "_":
             # neutralized token
             if nTokenRewriteEnd - nTokenRewriteStart == 0:
-                self.lTokens[nTokenRewriteStart]["sNewValue"] = "_"
+                self.lTokens[nTokenRewriteStart].sNewValue = "_"
             else:
                 for i in range(nTokenRewriteStart, nTokenRewriteEnd+1):
-                    self.lTokens[i]["sNewValue"] = "_"
+                    self.lTokens[i].sNewValue = "_"
         else:
             if sWhat.startswith("="):
                 sWhat = getattr(gc_functions, sWhat[1:])(self.lTokens, nTokenOffset, nLastToken)
             else:
                 sWhat = self._expand(sWhat, nTokenOffset, nLastToken)
-            bUppercase = bCaseSvty and self.lTokens[nTokenRewriteStart]["sValue"][0:1].isupper()
+            bUppercase = bCaseSvty and self.lTokens[nTokenRewriteStart].sValue[0:1].isupper()
             if nTokenRewriteEnd - nTokenRewriteStart == 0:
                 # one token
                 if bUppercase:
                     sWhat = sWhat[0:1].upper() + sWhat[1:]
-                self.lTokens[nTokenRewriteStart]["sNewValue"] = sWhat
+                self.lTokens[nTokenRewriteStart].sNewValue = sWhat
             else:
                 # several tokens
                 lTokenValue = sWhat.split("|")
@@ -818,11 +1152,11 @@ class TextParser:
                     return
                 for i, sValue in zip(range(nTokenRewriteStart, nTokenRewriteEnd+1), lTokenValue):
                     if not sValue or sValue == "*":
-                        self.lTokens[i]["bToRemove"] = True
+                        self.lTokens[i].bToRemove = True
                     else:
                         if bUppercase:
                             sValue = sValue[0:1].upper() + sValue[1:]
-                        self.lTokens[i]["sNewValue"] = sValue
+                        self.lTokens[i].sNewValue = sValue
 
     def rewriteFromTags (self, bDebug=False):
         "rewrite the sentence, modify tokens, purge the token list"
@@ -830,48 +1164,48 @@ class TextParser:
             echo("REWRITE")
         lNewTokens = []
         nMergeUntil = 0
-        dTokenMerger = {}
-        for iToken, dToken in enumerate(self.lTokens):
+        oTokenMerger = None
+        for iToken, oToken in enumerate(self.lTokens):
             bKeepToken = True
-            if dToken["sType"] != "INFO":
+            if oToken.sType != "INFO":
                 if nMergeUntil and iToken <= nMergeUntil:
                     # token to merge
-                    dTokenMerger["sValue"] += " " * (dToken["nStart"] - dTokenMerger["nEnd"]) + dToken["sValue"]
-                    dTokenMerger["nEnd"] = dToken["nEnd"]
+                    oTokenMerger.sValue += " " * (oToken.nStart - oTokenMerger.nEnd) + oToken.sValue
+                    oTokenMerger.nEnd = oToken.nEnd
                     if bDebug:
-                        echo("  MERGED TOKEN: " + dTokenMerger["sValue"])
-                    dToken["bMerged"] = True
+                        echo("  MERGED TOKEN: " + oTokenMerger.sValue)
+                    oToken.bMerged = True
                     bKeepToken = False
-                    if iToken == nMergeUntil and "sMergedValue" in dTokenMerger:
-                        dTokenMerger["sValue"] = dTokenMerger["sMergedValue"]
-                        sSpaceFiller = " " * (dToken["nEnd"] - dTokenMerger["nStart"] - len(dTokenMerger["sMergedValue"]))
-                        self.sSentence = self.sSentence[:dTokenMerger["nStart"]] + dTokenMerger["sMergedValue"] + sSpaceFiller + self.sSentence[dToken["nEnd"]:]
-                if "nMergeUntil" in dToken:
+                    if iToken == nMergeUntil and oTokenMerger.sMergedValue is not None:
+                        oTokenMerger.sValue = oTokenMerger.sMergedValue
+                        sSpaceFiller = " " * (oToken.nEnd - oTokenMerger.nStart - len(oTokenMerger.sMergedValue))
+                        self.sSentence = self.sSentence[:oTokenMerger.nStart] + oTokenMerger.sMergedValue + sSpaceFiller + self.sSentence[oToken.nEnd:]
+                if oToken.nMergeUntil is not None:
                     # first token to be merge with
                     if iToken > nMergeUntil: # this token is not to be merged with a previous token
-                        dTokenMerger = dToken
-                    if dToken["nMergeUntil"] > nMergeUntil:
-                        nMergeUntil = dToken["nMergeUntil"]
-                    del dToken["nMergeUntil"]
-                elif "bToRemove" in dToken:
+                        oTokenMerger = oToken
+                    if oToken.nMergeUntil > nMergeUntil:
+                        nMergeUntil = oToken.nMergeUntil
+                    oToken.nMergeUntil = None
+                elif oToken.bToRemove:
                     # deletion required
                     if bDebug:
-                        echo("  REMOVED: " + dToken["sValue"])
-                    self.sSentence = self.sSentence[:dToken["nStart"]] + " " * (dToken["nEnd"] - dToken["nStart"]) + self.sSentence[dToken["nEnd"]:]
+                        echo("  REMOVED: " + oToken.sValue)
+                    self.sSentence = self.sSentence[:oToken.nStart] + " " * (oToken.nEnd - oToken.nStart) + self.sSentence[oToken.nEnd:]
                     bKeepToken = False
             #
             if bKeepToken:
-                lNewTokens.append(dToken)
-                if "sNewValue" in dToken:
+                lNewTokens.append(oToken)
+                if oToken.sNewValue is not None:
                     # rewrite token and sentence
                     if bDebug:
-                        echo(dToken["sValue"] + " -> " + dToken["sNewValue"])
-                    dToken["sRealValue"] = dToken["sValue"]
-                    dToken["sValue"] = dToken["sNewValue"]
-                    nDiffLen = len(dToken["sRealValue"]) - len(dToken["sNewValue"])
-                    sNewRepl = (dToken["sNewValue"] + " " * nDiffLen)  if nDiffLen >= 0  else dToken["sNewValue"][:len(dToken["sRealValue"])]
-                    self.sSentence = self.sSentence[:dToken["nStart"]] + sNewRepl + self.sSentence[dToken["nEnd"]:]
-                    del dToken["sNewValue"]
+                        echo(oToken.sValue + " -> " + oToken.sNewValue)
+                    oToken.sRealValue = oToken.sValue
+                    oToken.sValue = oToken.sNewValue
+                    nDiffLen = len(oToken.sRealValue) - len(oToken.sNewValue)
+                    sNewRepl = (oToken.sNewValue + " " * nDiffLen)  if nDiffLen >= 0  else oToken.sNewValue[:len(oToken.sRealValue)]
+                    self.sSentence = self.sSentence[:oToken.nStart] + sNewRepl + self.sSentence[oToken.nEnd:]
+                    oToken.sNewValue = None
         if bDebug:
             echo("  TEXT REWRITED: " + self.sSentence)
         self.lTokens.clear()
@@ -6,16 +6,28 @@ Grammar checking functions
 # template: <gc_core/py/lang_core/gc_functions.py>
 # variables generated in <compile_rules.py>
 
+# This file has been edited since it was generated: the template and <compile_rules.py> (not in this repository)
+# must be changed the same way before the next regeneration, or these changes will be lost:
+#   - tokens are Token objects (see graphspell/tokenizer.py), not dictionaries:
+#     generated functions read and write their attributes (lToken[i].sValue, oToken.lMorph), not keys (lToken[i]["sValue"]);
+#   - options of the text being parsed are in a context variable (setParseOptions, resetParseOptions, option);
+#   - look, look_chk1, morph, analyse, g_morph, g_morph0, g_morph2, select, g_select and suggSimil
+#     get compiled regexes from the registry of patterns (see graphspell/patterns.py).
+# TestGeneratedFunctions in <tests_modules.py> fails if generated functions don’t match the Token API.
+
 
 import re
 import traceback
+import contextvars
 
 from . import gc_options
 from ..graphspell.echo import echo
+from ..graphspell.patterns import getPattern
 
 
 _sAppContext = "Python"         # what software is running
 _oSpellChecker = None
+_xParseOptions = contextvars.ContextVar("dParseOptions", default=None)    # options of the text being parsed (each thread has its own)
 
 
 def load (sContext, oSpellChecker):
@@ -28,9 +40,22 @@ def load (sContext, oSpellChecker):
 
 #### common functions
 
+def setParseOptions (dOptions):
+    "set options <dOptions> for the text parsed in the current thread, returns a token to restore the previous options"
+    return _xParseOptions.set(dOptions)
+
+
+def resetParseOptions (xToken):
+    "restore options as they were before setParseOptions() returned <xToken>"
+    _xParseOptions.reset(xToken)
+
+
 def option (sOpt):
-    "return True if option <sOpt> is active"
-    return gc_options.dOptions.get(sOpt, False)
+    "return True if option <sOpt> is active (options of the text being parsed, or global options)"
+    dOptions = _xParseOptions.get()
+    if dOptions is None:
+        dOptions = gc_options.dOptions
+    return dOptions.get(sOpt, False)
 
 
 #### Functions to get text outside pattern scope
@@ -74,16 +99,16 @@ def prevword1 (s, iEnd):
 
 def look (s, sPattern, sNegPattern=None):
     "seek sPattern in s (before/after/fulltext), if sNegPattern not in s"
-    if sNegPattern and re.search(sNegPattern, s):
+    if sNegPattern and getPattern(sNegPattern).search(s):
         return False
-    if re.search(sPattern, s):
+    if getPattern(sPattern).search(s):
         return True
     return False
 
 
 def look_chk1 (dTokenPos, s, nOffset, sPattern, sPatternGroup1, sNegPatternGroup1=""):
     "returns True if s has pattern sPattern and m.group(1) has pattern sPatternGroup1"
-    m = re.search(sPattern, s)
+    m = getPattern(sPattern).search(s)
     if not m:
         return False
     try:
@@ -107,8 +132,8 @@ def info (dTokenPos, tWord):
         echo("> not in dictionary")
         return True
     echo("TOKENS:", dTokenPos)
-    if tWord[0] in dTokenPos and "lMorph" in dTokenPos[tWord[0]]:
-        echo("DA: " + str(dTokenPos[tWord[0]]["lMorph"]))
+    if tWord[0] in dTokenPos and dTokenPos[tWord[0]].lMorph is not None:
+        echo("DA: " + str(dTokenPos[tWord[0]].lMorph))
     echo("FSA: " + str(lMorph))
     return True
 
@@ -117,20 +142,20 @@ def morph (dTokenPos, tWord, sPattern, sNegPattern="", bNoWord=False):
     "analyse a tuple (position, word), returns True if not sNegPattern in word morphologies and sPattern in word morphologies (disambiguation on)"
     if not tWord:
         return bNoWord
-    lMorph = dTokenPos[tWord[0]]["lMorph"]  if tWord[0] in dTokenPos and "lMorph" in dTokenPos[tWord[0]]  else _oSpellChecker.getMorph(tWord[1])
+    lMorph = dTokenPos[tWord[0]].lMorph  if tWord[0] in dTokenPos and dTokenPos[tWord[0]].lMorph is not None  else _oSpellChecker.getMorph(tWord[1])
     if not lMorph:
         return False
     # check negative condition
     if sNegPattern:
         if sNegPattern == "*":
             # all morph must match sPattern
-            zPattern = re.compile(sPattern)
+            zPattern = getPattern(sPattern)
             return all(zPattern.search(sMorph)  for sMorph in lMorph)
-        zNegPattern = re.compile(sNegPattern)
+        zNegPattern = getPattern(sNegPattern)
         if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
             return False
     # search sPattern
-    zPattern = re.compile(sPattern)
+    zPattern = getPattern(sPattern)
     return any(zPattern.search(sMorph)  for sMorph in lMorph)
 
 
@@ -142,41 +167,41 @@ def analyse (sWord, sPattern, sNegPattern=""):
     # check negative condition
     if sNegPattern:
         if sNegPattern == "*":
-            zPattern = re.compile(sPattern)
+            zPattern = getPattern(sPattern)
             return all(zPattern.search(sMorph)  for sMorph in lMorph)
-        zNegPattern = re.compile(sNegPattern)
+        zNegPattern = getPattern(sNegPattern)
         if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
             return False
     # search sPattern
-    zPattern = re.compile(sPattern)
+    zPattern = getPattern(sPattern)
     return any(zPattern.search(sMorph)  for sMorph in lMorph)
 
 
 #### Analyse tokens for graph rules
 
-def g_info (dToken):
+def g_info (oToken):
     "for debugging: retrieve info of word"
-    if not dToken:
+    if not oToken:
         echo("> no token")
         return True
-    lMorph = dToken["lMorph"]  if "lMorph" in dToken  else _oSpellChecker.getMorph(dToken["sValue"])
+    lMorph = oToken.lMorph  if oToken.lMorph is not None  else _oSpellChecker.getMorph(oToken.sValue)
     if not lMorph:
-        echo("> not in dictionary: " + dToken["sValue"])
+        echo("> not in dictionary: " + oToken.sValue)
         return True
-    for sKey, val in dToken.items():
+    for sKey, val in oToken.toDict().items():
         echo(sKey + ":" + str(val))
     return True
 
 
-def g_value (dToken, sValues, nLeft=None, nRight=None):
-    "test if <dToken['sValue']> is in sValues (each value should be separated with |)"
-    sValue = "|"+dToken["sValue"]+"|"  if nLeft is None  else "|"+dToken["sValue"][slice(nLeft, nRight)]+"|"
+def g_value (oToken, sValues, nLeft=None, nRight=None):
+    "test if <oToken.sValue> is in sValues (each value should be separated with |)"
+    sValue = "|"+oToken.sValue+"|"  if nLeft is None  else "|"+oToken.sValue[slice(nLeft, nRight)]+"|"
     if sValue in sValues:
         return True
-    if dToken["sValue"][0:2].istitle(): # we test only 2 first chars, to match words such as "Laissez-les", "Crève-cœur".
+    if oToken.sValue[0:2].istitle(): # we test only 2 first chars, to match words such as "Laissez-les", "Crève-cœur".
         if sValue.lower() in sValues:
             return True
-    elif dToken["sValue"].isupper():
+    elif oToken.sValue.isupper():
         #if sValue.lower() in sValues:
         #    return True
         sValue = "|"+sValue[1:].capitalize()
@@ -188,113 +213,113 @@ def g_value (dToken, sValues, nLeft=None, nRight=None):
     return False
 
 
-def g_morph (dToken, sPattern, sNegPattern="", nLeft=None, nRight=None, bMemorizeMorph=True):
+def g_morph (oToken, sPattern, sNegPattern="", nLeft=None, nRight=None, bMemorizeMorph=True):
     "analyse a token, return True if <sNegPattern> not in morphologies and <sPattern> in morphologies"
-    if "lMorph" in dToken:
-        lMorph = dToken["lMorph"]
+    if oToken.lMorph is not None:
+        lMorph = oToken.lMorph
     else:
         if nLeft is not None:
-            lMorph = _oSpellChecker.getMorph(dToken["sValue"][slice(nLeft, nRight)])
+            lMorph = _oSpellChecker.getMorph(oToken.sValue[slice(nLeft, nRight)])
             if bMemorizeMorph:
-                dToken["lMorph"] = lMorph
+                oToken.lMorph = lMorph
         else:
-            lMorph = _oSpellChecker.getMorph(dToken["sValue"])
+            lMorph = _oSpellChecker.getMorph(oToken.sValue)
     if not lMorph:
         return False
     # check negative condition
     if sNegPattern:
         if sNegPattern == "*":
             # all morph must match sPattern
-            zPattern = re.compile(sPattern)
+            zPattern = getPattern(sPattern)
             return all(zPattern.search(sMorph)  for sMorph in lMorph)
-        zNegPattern = re.compile(sNegPattern)
+        zNegPattern = getPattern(sNegPattern)
         if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
             return False
     # search sPattern
-    zPattern = re.compile(sPattern)
+    zPattern = getPattern(sPattern)
     return any(zPattern.search(sMorph)  for sMorph in lMorph)
 
 
-def g_morph0 (dToken, sPattern, sNegPattern="", nLeft=None, nRight=None, bMemorizeMorph=True):
+def g_morph0 (oToken, sPattern, sNegPattern="", nLeft=None, nRight=None, bMemorizeMorph=True):
     "analyse a token, return True if <sNegPattern> not in morphologies and <sPattern> in morphologies (disambiguation off)"
     if nLeft is not None:
-        lMorph = _oSpellChecker.getMorph(dToken["sValue"][slice(nLeft, nRight)])
+        lMorph = _oSpellChecker.getMorph(oToken.sValue[slice(nLeft, nRight)])
         if bMemorizeMorph:
-            dToken["lMorph"] = lMorph
+            oToken.lMorph = lMorph
     else:
-        lMorph = _oSpellChecker.getMorph(dToken["sValue"])
+        lMorph = _oSpellChecker.getMorph(oToken.sValue)
     if not lMorph:
         return False
     # check negative condition
     if sNegPattern:
         if sNegPattern == "*":
             # all morph must match sPattern
-            zPattern = re.compile(sPattern)
+            zPattern = getPattern(sPattern)
             return all(zPattern.search(sMorph)  for sMorph in lMorph)
-        zNegPattern = re.compile(sNegPattern)
+        zNegPattern = getPattern(sNegPattern)
         if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
             return False
     # search sPattern
-    zPattern = re.compile(sPattern)
+    zPattern = getPattern(sPattern)
     return any(zPattern.search(sMorph)  for sMorph in lMorph)
 
 
-def g_morph2 (dToken1, dToken2, cMerger, sPattern, sNegPattern="", bSetMorph=True):
+def g_morph2 (oToken1, oToken2, cMerger, sPattern, sNegPattern="", bSetMorph=True):
     "merge two token values, return True if <sNegPattern> not in morphologies and <sPattern> in morphologies (disambiguation off)"
-    lMorph = _oSpellChecker.getMorph(dToken1["sValue"] + cMerger + dToken2["sValue"])
+    lMorph = _oSpellChecker.getMorph(oToken1.sValue + cMerger + oToken2.sValue)
     if not lMorph:
         return False
     # check negative condition
     if sNegPattern:
         if sNegPattern == "*":
             # all morph must match sPattern
-            zPattern = re.compile(sPattern)
+            zPattern = getPattern(sPattern)
             bResult = all(zPattern.search(sMorph)  for sMorph in lMorph)
             if bResult and bSetMorph:
-                dToken1["lMorph"] = lMorph
+                oToken1.lMorph = lMorph
             return bResult
-        zNegPattern = re.compile(sNegPattern)
+        zNegPattern = getPattern(sNegPattern)
         if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
             return False
     # search sPattern
-    zPattern = re.compile(sPattern)
+    zPattern = getPattern(sPattern)
     bResult = any(zPattern.search(sMorph)  for sMorph in lMorph)
     if bResult and bSetMorph:
-        dToken1["lMorph"] = lMorph
+        oToken1.lMorph = lMorph
     return bResult
 
 
-def g_tagbefore (dToken, dTags, sTag):
-    "returns True if <sTag> is present on tokens before <dToken>"
+def g_tagbefore (oToken, dTags, sTag):
+    "returns True if <sTag> is present on tokens before <oToken>"
     if sTag not in dTags:
         return False
-    if dToken["i"] > dTags[sTag][0]:
+    if oToken.i > dTags[sTag][0]:
         return True
     return False
 
 
-def g_tagafter (dToken, dTags, sTag):
-    "returns True if <sTag> is present on tokens after <dToken>"
+def g_tagafter (oToken, dTags, sTag):
+    "returns True if <sTag> is present on tokens after <oToken>"
     if sTag not in dTags:
         return False
-    if dToken["i"] < dTags[sTag][1]:
+    if oToken.i < dTags[sTag][1]:
         return True
     return False
 
 
-def g_tag (dToken, sTag):
-    "returns True if <sTag> is present on token <dToken>"
-    return "aTags" in dToken and sTag in dToken["aTags"]
+def g_tag (oToken, sTag):
+    "returns True if <sTag> is present on token <oToken>"
+    return oToken.aTags is not None and sTag in oToken.aTags
 
 
-def g_meta (dToken, sType):
+def g_meta (oToken, sType):
     "returns True if <sType> is equal to the token type"
-    return dToken["sType"] == sType
+    return oToken.sType == sType
 
 
-def g_space (dToken1, dToken2, nMin, nMax=None):
+def g_space (oToken1, oToken2, nMin, nMax=None):
     "checks if spaces between tokens is >= <nMin> and <= <nMax>"
-    nSpace = dToken2["nStart"] - dToken1["nEnd"]
+    nSpace = oToken2.nStart - oToken1.nEnd
     if nSpace < nMin:
         return False
     if nMax is not None and nSpace > nMax:
@@ -325,17 +350,20 @@ def select (dTokenPos, nPos, sWord, sPattern, sNegPattern=""):
     if not lMorph or len(lMorph) == 1:
         return True
     if sPattern:
+        zPattern = getPattern(sPattern)
         if sNegPattern:
-            lSelect = [ sMorph  for sMorph in lMorph  if re.search(sPattern, sMorph) and not re.search(sNegPattern, sMorph) ]
+            zNegPattern = getPattern(sNegPattern)
+            lSelect = [ sMorph  for sMorph in lMorph  if zPattern.search(sMorph) and not zNegPattern.search(sMorph) ]
         else:
-            lSelect = [ sMorph  for sMorph in lMorph  if re.search(sPattern, sMorph) ]
+            lSelect = [ sMorph  for sMorph in lMorph  if zPattern.search(sMorph) ]
     elif sNegPattern:
-        lSelect = [ sMorph  for sMorph in lMorph  if not re.search(sNegPattern, sMorph) ]
+        zNegPattern = getPattern(sNegPattern)
+        lSelect = [ sMorph  for sMorph in lMorph  if not zNegPattern.search(sMorph) ]
     else:
         echo("# Error: missing pattern for disambiguation selection...")
         return True
     if lSelect and len(lSelect) != len(lMorph):
-        dTokenPos[nPos]["lMorph"] = lSelect
+        dTokenPos[nPos].lMorph = lSelect
     return True
 
 
@@ -344,70 +372,73 @@ def define (dTokenPos, nPos, sMorphs):
     if nPos not in dTokenPos:
         echo("Error. There should be a token at this position: ", nPos)
         return True
-    dTokenPos[nPos]["lMorph"] = sMorphs.split("|")
+    dTokenPos[nPos].lMorph = sMorphs.split("|")
     return True
 
 
 #### Disambiguation for graph rules
 
-def g_select (dToken, sPattern, sNegPattern=""):
-    "Disambiguation: select morphologies for <dToken> according to <sPattern>, removing those matching <sNegPattern>; always return True"
-    lMorph = dToken["lMorph"]  if "lMorph" in dToken  else _oSpellChecker.getMorph(dToken["sValue"])
+def g_select (oToken, sPattern, sNegPattern=""):
+    "Disambiguation: select morphologies for <oToken> according to <sPattern>, removing those matching <sNegPattern>; always return True"
+    lMorph = oToken.lMorph  if oToken.lMorph is not None  else _oSpellChecker.getMorph(oToken.sValue)
     if not lMorph or len(lMorph) == 1:
         return True
     if sPattern:
+        zPattern = getPattern(sPattern)
         if sNegPattern:
-            lSelect = [ sMorph  for sMorph in lMorph  if re.search(sPattern, sMorph) and not re.search(sNegPattern, sMorph) ]
+            zNegPattern = getPattern(sNegPattern)
+            lSelect = [ sMorph  for sMorph in lMorph  if zPattern.search(sMorph) and not zNegPattern.search(sMorph) ]
         else:
-            lSelect = [ sMorph  for sMorph in lMorph  if re.search(sPattern, sMorph) ]
+            lSelect = [ sMorph  for sMorph in lMorph  if zPattern.search(sMorph) ]
     elif sNegPattern:
-        lSelect = [ sMorph  for sMorph in lMorph  if not re.search(sNegPattern, sMorph) ]
+        zNegPattern = getPattern(sNegPattern)
+        lSelect = [ sMorph  for sMorph in lMorph  if not zNegPattern.search(sMorph) ]
     else:
         echo("# Error: missing pattern for disambiguation selection...")
         return True
     if lSelect and len(lSelect) != len(lMorph):
-        dToken["lMorph"] = lSelect
-    #echo("DA:", dToken["sValue"], dToken["lMorph"])
+        oToken.lMorph = lSelect
+    #echo("DA:", oToken.sValue, oToken.lMorph)
     return True
 
 
-def g_addmorph (dToken, sNewMorph):
+def g_addmorph (oToken, sNewMorph):
     "Disambiguation: add a morphology to a token"
-    lMorph = dToken["lMorph"]  if "lMorph" in dToken  else _oSpellChecker.getMorph(dToken["sValue"])
+    lMorph = oToken.lMorph  if oToken.lMorph is not None  else _oSpellChecker.getMorph(oToken.sValue)
     lMorph.extend(sNewMorph.split("|"))
-    dToken["lMorph"] = lMorph
+    oToken.lMorph = lMorph
     return True
 
 
-def g_rewrite (dToken, sToReplace, sReplace, bRegEx=False):
+def g_rewrite (oToken, sToReplace, sReplace, bRegEx=False):
     "Disambiguation: rewrite morphologies"
-    lMorph = dToken["lMorph"]  if "lMorph" in dToken  else _oSpellChecker.getMorph(dToken["sValue"])
+    lMorph = oToken.lMorph  if oToken.lMorph is not None  else _oSpellChecker.getMorph(oToken.sValue)
     if bRegEx:
-        dToken["lMorph"] = [ re.sub(sToReplace, sReplace, sMorph)  for sMorph in lMorph ]
+        oToken.lMorph = [ re.sub(sToReplace, sReplace, sMorph)  for sMorph in lMorph ]
     else:
-        dToken["lMorph"] = [ sMorph.replace(sToReplace, sReplace)  for sMorph in lMorph ]
+        oToken.lMorph = [ sMorph.replace(sToReplace, sReplace)  for sMorph in lMorph ]
     return True
 
 
-def g_define (dToken, sMorphs):
-    "Disambiguation: set morphologies of <dToken>, always return True"
-    dToken["lMorph"] = sMorphs.split("|")
-    #echo("DA:", dToken["sValue"], lMorph)
+def g_define (oToken, sMorphs):
+    "Disambiguation: set morphologies of <oToken>, always return True"
+    oToken.lMorph = sMorphs.split("|")
+    #echo("DA:", oToken.sValue, lMorph)
     return True
 
 
-def g_definefrom (dToken, nLeft=None, nRight=None):
-    "Disambiguation: set morphologies of <dToken> with slicing its value with <nLeft> and <nRight>"
+def g_definefrom (oToken, nLeft=None, nRight=None):
+    "Disambiguation: set morphologies of <oToken> with slicing its value with <nLeft> and <nRight>"
     if nLeft is not None:
-        dToken["lMorph"] = _oSpellChecker.getMorph(dToken["sValue"][slice(nLeft, nRight)])
+        oToken.lMorph = _oSpellChecker.getMorph(oToken.sValue[slice(nLeft, nRight)])
     else:
-        dToken["lMorph"] = _oSpellChecker.getMorph(dToken["sValue"])
+        oToken.lMorph = _oSpellChecker.getMorph(oToken.sValue)
     return True
 
 
-def g_setmeta (dToken, sType):
+def g_setmeta (oToken, sType):
     "Disambiguation: change type of token"
-    dToken["sType"] = sType
+    oToken.sType = sType
     return True
 
 
@@ -421,15 +452,15 @@ def g_setmeta (dToken, sType):
 from . import cregex as cr
 
 
-def g_morphVC (dToken, sPattern, sNegPattern=""):
+def g_morphVC (oToken, sPattern, sNegPattern=""):
     "lance la fonction g_morph() sur la première partie d’un verbe composé (ex: vient-il)"
-    nEnd = dToken["sValue"].rfind("-")
-    if dToken["sValue"].count("-") > 1:
-        if "-t-" in dToken["sValue"]:
+    nEnd = oToken.sValue.rfind("-")
+    if oToken.sValue.count("-") > 1:
+        if "-t-" in oToken.sValue:
             nEnd = nEnd - 2
-        elif re.search("-l(?:es?|a)-(?:[mt]oi|nous|leur)$|(?:[nv]ous|lui|leur)-en$", dToken["sValue"]):
-            nEnd = dToken["sValue"][0:nEnd].rfind("-")
-    return g_morph(dToken, sPattern, sNegPattern, 0, nEnd, False)
+        elif re.search("-l(?:es?|a)-(?:[mt]oi|nous|leur)$|(?:[nv]ous|lui|leur)-en$", oToken.sValue):
+            nEnd = oToken.sValue[0:nEnd].rfind("-")
+    return g_morph(oToken, sPattern, sNegPattern, 0, nEnd, False)
 
 
 def apposition (sWord1, sWord2):
@@ -437,12 +468,12 @@ def apposition (sWord1, sWord2):
     return len(sWord2) < 2 or (cr.mbNomNotAdj(_oSpellChecker.getMorph(sWord2)) and cr.mbPpasNomNotAdj(_oSpellChecker.getMorph(sWord1)))
 
 
-def g_agreement (dToken1, dToken2, bNotOnlyNames=True):
-    "check agreement between <dToken1> and <dToken2>"
-    lMorph1 = dToken1["lMorph"]  if "lMorph" in dToken1  else  _oSpellChecker.getMorph(dToken1["sValue"])
+def g_agreement (oToken1, oToken2, bNotOnlyNames=True):
+    "check agreement between <oToken1> and <oToken2>"
+    lMorph1 = oToken1.lMorph  if oToken1.lMorph is not None  else  _oSpellChecker.getMorph(oToken1.sValue)
     if not lMorph1:
         return True
-    lMorph2 = dToken2["lMorph"]  if "lMorph" in dToken2  else  _oSpellChecker.getMorph(dToken2["sValue"])
+    lMorph2 = oToken2.lMorph  if oToken2.lMorph is not None  else  _oSpellChecker.getMorph(oToken2.sValue)
     if not lMorph2:
         return True
     if bNotOnlyNames and not (cr.mbAdj(lMorph2) or cr.mbAdjNb(lMorph1)):
@@ -946,30 +977,30 @@ def suggAgree (sFlexDest, sFlexSrc):
     return ""
 
 
-def g_suggAgree (dTokenDst, dTokenSrc):
-    "returns suggestions for <dTokenDst> that matches agreement with <dTokenSrc>"
-    lMorphSrc = dTokenSrc["lMorph"]  if "lMorph" in dTokenSrc  else  _oSpellChecker.getMorph(dTokenSrc["sValue"])
+def g_suggAgree (oTokenDst, oTokenSrc):
+    "returns suggestions for <oTokenDst> that matches agreement with <oTokenSrc>"
+    lMorphSrc = oTokenSrc.lMorph  if oTokenSrc.lMorph is not None  else  _oSpellChecker.getMorph(oTokenSrc.sValue)
     if not lMorphSrc:
         return ""
     sGender, sNumber = cr.getGenderNumber(lMorphSrc)
     if sGender == ":m":
         if sNumber == ":s":
-            return suggMasSing(dTokenDst["sValue"])
+            return suggMasSing(oTokenDst.sValue)
         if sNumber == ":p":
-            return suggMasPlur(dTokenDst["sValue"])
-        return suggMasSing(dTokenDst["sValue"])
+            return suggMasPlur(oTokenDst.sValue)
+        return suggMasSing(oTokenDst.sValue)
     if sGender == ":f":
         if sNumber == ":s":
-            return suggFemSing(dTokenDst["sValue"])
+            return suggFemSing(oTokenDst.sValue)
         if sNumber == ":p":
-            return suggFemPlur(dTokenDst["sValue"])
-        return suggFemSing(dTokenDst["sValue"])
+            return suggFemPlur(oTokenDst.sValue)
+        return suggFemSing(oTokenDst.sValue)
     if sGender == ":e":
         if sNumber == ":s":
-            return suggSing(dTokenDst["sValue"])
+            return suggSing(oTokenDst.sValue)
         if sNumber == ":p":
-            return suggPlur(dTokenDst["sValue"])
-        return dTokenDst["sValue"]
+            return suggPlur(oTokenDst.sValue)
+        return oTokenDst.sValue
     return ""
 
 
@@ -1060,8 +1091,9 @@ def suggSimil (sWord, sPattern=None, bSubst=False, bVC=False):
             if ":V" in sMorph:
                 sInfi = sMorph[1:sMorph.find("/")]
                 if sPattern:
+                    zPattern = getPattern(sPattern)
                     for sName in conj.getNamesFrom(sInfi):
-                        if any(re.search(sPattern, sMorph2)  for sMorph2 in _oSpellChecker.getMorph(sName)):
+                        if any(zPattern.search(sMorph2)  for sMorph2 in _oSpellChecker.getMorph(sName)):
                             dSugg[sName] = ""
                 else:
                     dSugg.update(dict.fromkeys(conj.getNamesFrom(sInfi), ""))
@@ -1514,7 +1546,7 @@ def _g_cond_g0_12 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g0_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+1], ":[VG]")
 def _g_cond_g0_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 0) and g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 0, 0) and not g_value(lToken[nTokenOffset+1], "|etc|fig|hab|litt|fig|hab|litt|circ|coll|ref|réf|étym|suppl|bibl|bibliogr|cit|vol|déc|nov|oct|janv|juil|avr|sept|pp|") and lToken[nTokenOffset+1]["sValue"].__len__() > 1
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 0) and g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 0, 0) and not g_value(lToken[nTokenOffset+1], "|etc|fig|hab|litt|fig|hab|litt|circ|coll|ref|réf|étym|suppl|bibl|bibliogr|cit|vol|déc|nov|oct|janv|juil|avr|sept|pp|") and lToken[nTokenOffset+1].sValue.__len__() > 1
 def _g_cond_g0_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|appeler|") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_que_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_comme_")
 def _g_cond_g0_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -1530,43 +1562,43 @@ def _g_da_g0_2 (lToken, nTokenOffset, nLastToken):
 def _g_cond_g0_19 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|·|")
 def _g_cond_g0_20 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-2+1]["sValue"].__len__() == 1
+    return lToken[nLastToken-2+1].sValue.__len__() == 1
 def _g_cond_g0_21 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-2+1]["sValue"].__len__() == 1 and lToken[nLastToken-6+1]["sValue"].__len__() == 1
+    return lToken[nLastToken-2+1].sValue.__len__() == 1 and lToken[nLastToken-6+1].sValue.__len__() == 1
 def _g_da_g0_3 (lToken, nTokenOffset, nLastToken):
     return g_definefrom(lToken[nTokenOffset+1], 0, -3) and g_select(lToken[nTokenOffset+1], ":[NA]")
 def _g_cond_g0_22 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].isupper()
+    return lToken[nTokenOffset+1].sValue.isupper()
 def _g_cond_g0_23 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":1[sśŝ]")
 def _g_sugg_g0_1 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":1ś", True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":1ś", True)
 def _g_cond_g0_24 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and not g_morphVC(lToken[nTokenOffset+1], ":V")
 def _g_sugg_g0_2 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":1[sśŝ]", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":1[sśŝ]", False, True)
 def _g_cond_g0_25 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset], "|me|m’|")
 def _g_cond_g0_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":[ISK].*:2s")
 def _g_sugg_g0_3 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":2s", True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":2s", True)
 def _g_sugg_g0_4 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":2s", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":2s", False, True)
 def _g_cond_g0_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset], "|te|t’|")
 def _g_cond_g0_28 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":3p", ":3s")
 def _g_sugg_g0_5 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":3s", True) + "|" + lToken[nTokenOffset+1]["sValue"]+"s"
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":3s", True) + "|" + lToken[nTokenOffset+1].sValue+"s"
 def _g_cond_g0_29 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":V", ":3s")
 def _g_sugg_g0_6 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":3s", True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":3s", True)
 def _g_cond_g0_30 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":", ":V|>(?:t|voilà)/")
 def _g_sugg_g0_7 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":3s", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":3s", False, True)
 def _g_cond_g0_31 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset], "|se|s’|")
 def _g_cond_g0_32 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -1578,65 +1610,65 @@ def _g_cond_g0_34 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g0_35 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":", ":V")
 def _g_cond_g0_36 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].endswith("se")
+    return lToken[nTokenOffset+1].sValue.endswith("se")
 def _g_sugg_g0_8 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-2]+"ce"
+    return lToken[nTokenOffset+1].sValue[:-2]+"ce"
 def _g_cond_g0_37 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":3p")
 def _g_sugg_g0_9 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":3p", True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":3p", True)
 def _g_sugg_g0_10 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":3p", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":3p", False, True)
 def _g_cond_g0_38 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not re.search("-[lL](?:es?|a)-[nN]ous$", lToken[nTokenOffset+1]["sValue"])
+    return not re.search("-[lL](?:es?|a)-[nN]ous$", lToken[nTokenOffset+1].sValue)
 def _g_cond_g0_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":(?:1p|E:2[sp])")
 def _g_sugg_g0_11 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":1p", True)+"|"+suggVerbImpe(lToken[nTokenOffset+1]["sValue"], True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":1p", True)+"|"+suggVerbImpe(lToken[nTokenOffset+1].sValue, True)
 def _g_cond_g0_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":", ":V|>(?:chez|malgré)/")
 def _g_sugg_g0_12 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":1p", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":1p", False, True)
 def _g_cond_g0_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not re.search("-[lL](?:es?|a)-[vV]ous$", lToken[nTokenOffset+1]["sValue"])
+    return not re.search("-[lL](?:es?|a)-[vV]ous$", lToken[nTokenOffset+1].sValue)
 def _g_cond_g0_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":2p")
 def _g_sugg_g0_13 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":2p", True)
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":2p", True)
 def _g_cond_g0_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":", ":V|>chez/")
 def _g_sugg_g0_14 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":2p", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":2p", False, True)
 def _g_da_g0_4 (lToken, nTokenOffset, nLastToken):
     return g_define(lToken[nLastToken-1+1], ":VCi1:2p")
 def _g_cond_g0_44 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":E")
 def _g_sugg_g0_15 (lToken, nTokenOffset, nLastToken):
-    return suggVerbImpe(lToken[nTokenOffset+1]["sValue"], True)
+    return suggVerbImpe(lToken[nTokenOffset+1].sValue, True)
 def _g_sugg_g0_16 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":E", False, True)
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":E", False, True)
 def _g_sugg_g0_17 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("-là-", "-la-")
+    return lToken[nTokenOffset+1].sValue.replace("-là-", "-la-")
 def _g_cond_g0_45 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and not g_value(lToken[nTokenOffset], "|se|ce|cet|cette|ces|") and g_morphVC(lToken[nTokenOffset+1], ":", ":V") and not g_value(lToken[nTokenOffset+1], "|par-la|de-la|jusque-la|celui-la|celle-la|ceux-la|celles-la|")
 def _g_sugg_g0_18 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+1]["sValue"], ":E", False, True)+"|"+lToken[nTokenOffset+1]["sValue"][:-3]+" là"
+    return suggSimil(lToken[nTokenOffset+1].sValue, ":E", False, True)+"|"+lToken[nTokenOffset+1].sValue[:-3]+" là"
 def _g_cond_g0_46 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_value(lToken[nTokenOffset], "|se|ce|cet|cette|ces|") and g_morphVC(lToken[nTokenOffset+1], ":[NA]") and not g_value(lToken[nTokenOffset+1], "|par-la|de-la|jusque-la|celui-la|celle-la|ceux-la|celles-la|")
 def _g_sugg_g0_19 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-2]+"là"
+    return lToken[nTokenOffset+1].sValue[:-2]+"là"
 def _g_sugg_g0_20 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]
+    return lToken[nTokenOffset+1].sValue[:-1]
 def _g_cond_g0_47 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V1.*:Ip.*:3s")
 def _g_sugg_g0_21 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("e-y", "es-y").replace("a-y", "as-y")
+    return lToken[nTokenOffset+1].sValue.replace("e-y", "es-y").replace("a-y", "as-y")
 def _g_cond_g0_48 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V", ":(?:E|V1.*:Ip.*:2s)")
 def _g_cond_g0_49 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V1.*:Ip.*:3s", ">aller/")
 def _g_sugg_g0_22 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("e-en", "es-en")
+    return lToken[nTokenOffset+1].sValue.replace("e-en", "es-en")
 def _g_cond_g1_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":1s")
 def _g_da_g1_1 (lToken, nTokenOffset, nLastToken):
@@ -1726,7 +1758,7 @@ def _g_cond_g1_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_da_g1_18 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+2], ":(?:[123][sp]|P|Y)")
 def _g_cond_g1_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and g_morph(lToken[nTokenOffset], ":Cs|<start>")
+    return lToken[nTokenOffset+2].sValue.islower() and g_morph(lToken[nTokenOffset], ":Cs|<start>")
 def _g_da_g1_19 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+2], ":[123][sp]")
 def _g_da_g1_20 (lToken, nTokenOffset, nLastToken):
@@ -1796,7 +1828,7 @@ def _g_da_g1_40 (lToken, nTokenOffset, nLastToken):
 def _g_cond_g1_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:p|>[a-zé-]+ième/")
 def _g_cond_g1_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"][0:1].isupper()
+    return not lToken[nTokenOffset+2].sValue[0:1].isupper()
 def _g_cond_g1_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:[me]:[si]")
 def _g_cond_g1_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -1940,7 +1972,7 @@ def _g_da_g1_69 (lToken, nTokenOffset, nLastToken):
 def _g_da_g1_70 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+4], ":[NA]")
 def _g_cond_g1_82 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper()
+    return not lToken[nTokenOffset+1].sValue.isupper()
 def _g_da_g1_71 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+2], ":[NA]")
 def _g_cond_g1_83 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2040,25 +2072,25 @@ def _g_cond_g1_106 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g1_107 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|un|une|")
 def _g_cond_ocr_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w") and (g_morph(lToken[nTokenOffset+1], ":G", ":M") or g_morph(lToken[nTokenOffset+1], ":[123][sp]", ":[MNA]|>Est/"))
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w") and (g_morph(lToken[nTokenOffset+1], ":G", ":M") or g_morph(lToken[nTokenOffset+1], ":[123][sp]", ":[MNA]|>Est/"))
 def _g_sugg_ocr_1 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].lower()
+    return lToken[nTokenOffset+1].sValue.lower()
 def _g_cond_ocr_2 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w") and not lToken[nTokenOffset+2]["sValue"].isupper()
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w") and not lToken[nTokenOffset+2].sValue.isupper()
 def _g_cond_ocr_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return re.search("^[aâeéèêiîouyh]", lToken[nTokenOffset+2]["sValue"])
+    return re.search("^[aâeéèêiîouyh]", lToken[nTokenOffset+2].sValue)
 def _g_cond_ocr_4 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[   ]$") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\d[   ]+$") and not (lToken[nTokenOffset+1]["sValue"].isupper() and g_value(lToken[nLastToken+1], "|.|<end>|"))
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "[   ]$") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "\\d[   ]+$") and not (lToken[nTokenOffset+1].sValue.isupper() and g_value(lToken[nLastToken+1], "|.|<end>|"))
 def _g_cond_ocr_5 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[   ]$") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\d[   ]+$") and lToken[nTokenOffset+1]["sValue"].islower()
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "[   ]$") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "\\d[   ]+$") and lToken[nTokenOffset+1].sValue.islower()
 def _g_cond_ocr_6 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 0) and not lToken[nTokenOffset+1]["sValue"].isupper() or g_value(lToken[nTokenOffset+1], "|à|")
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 0) and not lToken[nTokenOffset+1].sValue.isupper() or g_value(lToken[nTokenOffset+1], "|à|")
 def _g_cond_ocr_7 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|<start>|—|–|")
 def _g_sugg_ocr_2 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+1].sValue.replace("a", "â").replace("A", "Â")
 def _g_sugg_ocr_3 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("n", "u")
+    return lToken[nTokenOffset+1].sValue.replace("n", "u")
 def _g_cond_ocr_8 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|il|ne|n’|âne|ânesse|")
 def _g_cond_ocr_9 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2076,7 +2108,7 @@ def _g_cond_ocr_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_ocr_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset], "|grand|") and g_value(g_token(lToken, nTokenOffset+1-2), "|au|"))
 def _g_sugg_ocr_4 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("rn", "m").replace("in", "m").replace("RN", "M").replace("IN", "M")
+    return lToken[nTokenOffset+1].sValue.replace("rn", "m").replace("in", "m").replace("RN", "M").replace("IN", "M")
 def _g_cond_ocr_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:m:[si]")
 def _g_cond_ocr_17 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2088,13 +2120,13 @@ def _g_cond_ocr_19 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_ocr_20 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":[RC]|<start>|>[(,]")
 def _g_cond_ocr_21 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[0-9] +$")
+    return not look(sSentence[:lToken[1+nTokenOffset].nStart], "[0-9] +$")
 def _g_cond_ocr_22 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|tu|")
 def _g_sugg_ocr_5 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ess", "ass").replace("ESS", "ASS")
+    return lToken[nTokenOffset+1].sValue.replace("ess", "ass").replace("ESS", "ASS")
 def _g_sugg_ocr_6 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("l", "i").replace("L", "I")
+    return lToken[nTokenOffset+1].sValue.replace("l", "i").replace("L", "I")
 def _g_cond_ocr_23 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|il|elle|on|") and not g_value(g_token(lToken, nTokenOffset+1-2), "|il|elle|on|")
 def _g_cond_ocr_24 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2104,31 +2136,31 @@ def _g_cond_ocr_25 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_ocr_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":N", "*")
 def _g_sugg_ocr_7 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("o", "e")
+    return lToken[nTokenOffset+1].sValue.replace("o", "e")
 def _g_sugg_ocr_8 (lToken, nTokenOffset, nLastToken):
-    return "l’"+lToken[nTokenOffset+1]["sValue"][2:] + "|L’"+lToken[nTokenOffset+1]["sValue"][2:] + "|j’"+lToken[nTokenOffset+1]["sValue"][2:] + "|J’"+lToken[nTokenOffset+1]["sValue"][2:]
+    return "l’"+lToken[nTokenOffset+1].sValue[2:] + "|L’"+lToken[nTokenOffset+1].sValue[2:] + "|j’"+lToken[nTokenOffset+1].sValue[2:] + "|J’"+lToken[nTokenOffset+1].sValue[2:]
 def _g_cond_ocr_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w") and not g_morph(lToken[nTokenOffset+2], ":Y")
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w") and not g_morph(lToken[nTokenOffset+2], ":Y")
 def _g_cond_ocr_28 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w") and not g_morph(lToken[nTokenOffset+1], ">V")
+    return lToken[nTokenOffset+1].sValue.istitle() and look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w") and not g_morph(lToken[nTokenOffset+1], ">V")
 def _g_cond_ocr_29 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return _oSpellChecker.isValid(lToken[nTokenOffset+1]["sValue"]) and _oSpellChecker.isValid(lToken[nTokenOffset+1]["sValue"][1:])
+    return _oSpellChecker.isValid(lToken[nTokenOffset+1].sValue) and _oSpellChecker.isValid(lToken[nTokenOffset+1].sValue[1:])
 def _g_sugg_ocr_9 (lToken, nTokenOffset, nLastToken):
-    return "v"+lToken[nTokenOffset+1]["sValue"][1:] + "|l’"+lToken[nTokenOffset+1]["sValue"][1:]
+    return "v"+lToken[nTokenOffset+1].sValue[1:] + "|l’"+lToken[nTokenOffset+1].sValue[1:]
 def _g_cond_ocr_30 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and _oSpellChecker.isValid(lToken[nTokenOffset+1]["sValue"][1:])
+    return not bCondMemo and _oSpellChecker.isValid(lToken[nTokenOffset+1].sValue[1:])
 def _g_sugg_ocr_10 (lToken, nTokenOffset, nLastToken):
-    return "l’"+lToken[nTokenOffset+1]["sValue"][1:]
+    return "l’"+lToken[nTokenOffset+1].sValue[1:]
 def _g_cond_ocr_31 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and _oSpellChecker.isValid(lToken[nTokenOffset+1]["sValue"])
+    return not bCondMemo and _oSpellChecker.isValid(lToken[nTokenOffset+1].sValue)
 def _g_cond_ocr_32 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w") and not g_morph(lToken[nTokenOffset+1], ">P")
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w") and not g_morph(lToken[nTokenOffset+1], ">P")
 def _g_sugg_ocr_11 (lToken, nTokenOffset, nLastToken):
-    return "l’"+lToken[nTokenOffset+1]["sValue"][1:] + "|p"+lToken[nTokenOffset+1]["sValue"][1:]
+    return "l’"+lToken[nTokenOffset+1].sValue[1:] + "|p"+lToken[nTokenOffset+1].sValue[1:]
 def _g_cond_ocr_33 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:[me]:[si]")
 def _g_sugg_ocr_12 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("é", "e").replace("É", "E")
+    return lToken[nTokenOffset+1].sValue.replace("é", "e").replace("É", "E")
 def _g_cond_ocr_34 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":(?:V0|N.*:m:[si])")
 def _g_cond_ocr_35 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2140,19 +2172,19 @@ def _g_cond_ocr_37 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_ocr_38 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:homme|ce|quel|être)/")
 def _g_sugg_ocr_13 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("â", "a").replace("Â", "A")
+    return lToken[nTokenOffset+1].sValue.replace("â", "a").replace("Â", "A")
 def _g_sugg_ocr_14 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ô", "ê").replace("Ô", "Ê")
+    return lToken[nTokenOffset+1].sValue.replace("ô", "ê").replace("Ô", "Ê")
 def _g_sugg_ocr_15 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("è", "ê").replace("È", "Ê")
+    return lToken[nTokenOffset+1].sValue.replace("è", "ê").replace("È", "Ê")
 def _g_sugg_ocr_16 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("é", "ê").replace("É", "Ê").replace("o", "e").replace("O", "E")
+    return lToken[nTokenOffset+1].sValue.replace("é", "ê").replace("É", "Ê").replace("o", "e").replace("O", "E")
 def _g_cond_ocr_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|tu|ne|n’|")
 def _g_sugg_ocr_17 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("l", "t").replace("L", "T")+"|"+lToken[nTokenOffset+1]["sValue"].replace("l", "i").replace("L", "I")
+    return lToken[nTokenOffset+1].sValue.replace("l", "t").replace("L", "T")+"|"+lToken[nTokenOffset+1].sValue.replace("l", "i").replace("L", "I")
 def _g_sugg_ocr_18 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("u", "n").replace("U", "N")
+    return lToken[nTokenOffset+1].sValue.replace("u", "n").replace("U", "N")
 def _g_cond_ocr_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], "<start>|>,|:(?:R|Os|X)")
 def _g_cond_ocr_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2174,39 +2206,39 @@ def _g_cond_ocr_48 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_ocr_49 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset+1], "|raine|raines|")
 def _g_sugg_ocr_19 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("a", "u").replace("A", "U")+"|"+lToken[nTokenOffset+1]["sValue"].replace("a", "e").replace("A", "E")
+    return lToken[nTokenOffset+1].sValue.replace("a", "u").replace("A", "U")+"|"+lToken[nTokenOffset+1].sValue.replace("a", "e").replace("A", "E")
 def _g_cond_ocr_50 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo
 def _g_sugg_ocr_20 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ain", "uin").replace("AIN", "UIN")
+    return lToken[nTokenOffset+1].sValue.replace("ain", "uin").replace("AIN", "UIN")
 def _g_cond_ocr_51 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|generis|")
 def _g_cond_ocr_52 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|le|ce|mon|ton|son|du|un|")
 def _g_cond_ocr_53 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "\\w")
+    return look(sSentence[:lToken[1+nTokenOffset].nStart], "\\w")
 def _g_cond_ocr_54 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|je|il|elle|on|ne|ça|")
 def _g_sugg_ocr_21 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("a", "o").replace("A", "O")
+    return lToken[nTokenOffset+1].sValue.replace("a", "o").replace("A", "O")
 def _g_sugg_ocr_22 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("n", "u").replace("N", "U")
+    return lToken[nTokenOffset+1].sValue.replace("n", "u").replace("N", "U")
 def _g_cond_ocr_55 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":(?:N.*:f:p|V0e.*:3p)|>(?:tu|ne)/")
 def _g_cond_ocr_56 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|ce|de|du|un|quel|leur|le|")
 def _g_sugg_ocr_23 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("l", "t").replace("L", "T")
+    return lToken[nTokenOffset+1].sValue.replace("l", "t").replace("L", "T")
 def _g_cond_g2_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_tag(lToken[nTokenOffset+2], "_CAP_") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ|ʳᵉ|è?re))", lToken[nTokenOffset+2]["sValue"]) and (g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæhAÂEÉÈÊIÎOÔUÛYŒÆ].*:[si]", ">une?/|:[Gp]|;é") or g_morph(lToken[nTokenOffset+2], ">H.*;É")) and not re.search("^[hH]aute?", lToken[nTokenOffset+2]["sValue"])
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_tag(lToken[nTokenOffset+2], "_CAP_") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ|ʳᵉ|è?re))", lToken[nTokenOffset+2].sValue) and (g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæhAÂEÉÈÊIÎOÔUÛYŒÆ].*:[si]", ">une?/|:[Gp]|;é") or g_morph(lToken[nTokenOffset+2], ">H.*;É")) and not re.search("^[hH]aute?", lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_1 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][0:1]+"’"
+    return lToken[nTokenOffset+1].sValue[0:1]+"’"
 def _g_cond_g2_2 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_tag(lToken[nTokenOffset+2], "_CAP_") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ|ʳᵉ|è?re))", lToken[nTokenOffset+2]["sValue"]) and (g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæhAÂEÉÈÊIÎOÔUÛYŒÆ]", ">une?/|:G|;é") or g_morph(lToken[nTokenOffset+2], ">H.*;É")) and not re.search("^[hH]aute?", lToken[nTokenOffset+2]["sValue"])
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_tag(lToken[nTokenOffset+2], "_CAP_") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ|ʳᵉ|è?re))", lToken[nTokenOffset+2].sValue) and (g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæhAÂEÉÈÊIÎOÔUÛYŒÆ]", ">une?/|:G|;é") or g_morph(lToken[nTokenOffset+2], ">H.*;É")) and not re.search("^[hH]aute?", lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1)
 def _g_cond_g2_4 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V", ":Q|;é") and not re.search("^haute?", lToken[nTokenOffset+2]["sValue"])
+    return not lToken[nTokenOffset+1].sValue.isupper() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V", ":Q|;é") and not re.search("^haute?", lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_5 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":(?:[123][sp]|[NA].*:e)")
 def _g_cond_g2_6 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2214,27 +2246,27 @@ def _g_cond_g2_6 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_7 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:f")
 def _g_sugg_g2_2 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][0:-1]+"e "
+    return lToken[nTokenOffset+1].sValue[0:-1]+"e "
 def _g_cond_g2_8 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ))", lToken[nTokenOffset+2]["sValue"]) and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]", ":G|;é")
+    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not re.search("(?i)^(?:I(?:I|V|X|er|ᵉʳ))", lToken[nTokenOffset+2].sValue) and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]", ":G|;é")
 def _g_cond_g2_9 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morphVC(lToken[nTokenOffset+1], "V1.*:1s") and lToken[nTokenOffset+1]["sValue"].endswith("e-je")
+    return g_morphVC(lToken[nTokenOffset+1], "V1.*:1s") and lToken[nTokenOffset+1].sValue.endswith("e-je")
 def _g_sugg_g2_3 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("e-je", "é-je")+"|"+lToken[nTokenOffset+1]["sValue"].replace("e-je", "è-je")
+    return lToken[nTokenOffset+1].sValue.replace("e-je", "é-je")+"|"+lToken[nTokenOffset+1].sValue.replace("e-je", "è-je")
 def _g_cond_g2_10 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G|;é") and not re.search("(?i)^(?:I(?:I|V|X|i?[eè]?re|ʳᵉ))", lToken[nTokenOffset+2]["sValue"])
+    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G|;é") and not re.search("(?i)^(?:I(?:I|V|X|i?[eè]?re|ʳᵉ))", lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_4 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][0:1]+"on"
+    return lToken[nTokenOffset+1].sValue[0:1]+"on"
 def _g_cond_g2_11 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not lToken[nTokenOffset+1]["sValue"].isupper() and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G|;é") and not re.search("(?i)^(?:I(?:I|V|X|i?[eè]?re|ʳᵉ))", lToken[nTokenOffset+2]["sValue"])
+    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not lToken[nTokenOffset+1].sValue.isupper() and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G|;é") and not re.search("(?i)^(?:I(?:I|V|X|i?[eè]?re|ʳᵉ))", lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_12 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[123][sp]")
 def _g_sugg_g2_5 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][0:1]+"on|ça"
+    return lToken[nTokenOffset+1].sValue[0:1]+"on|ça"
 def _g_cond_g2_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo
 def _g_sugg_g2_6 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-2+1]["sValue"].replace("eau", "el").replace("EAU", "EL")
+    return lToken[nLastToken-2+1].sValue.replace("eau", "el").replace("EAU", "EL")
 def _g_cond_g2_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":[NA].*:[me]:s", ":[123][sp]")
 def _g_cond_g2_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2244,61 +2276,61 @@ def _g_cond_g2_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_17 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return _sAppContext != "Writer"
 def _g_cond_g2_18 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] != "1e" and _sAppContext != "Writer"
+    return lToken[nTokenOffset+1].sValue != "1e" and _sAppContext != "Writer"
 def _g_sugg_g2_7 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]+"ᵉ"
+    return lToken[nTokenOffset+1].sValue[:-1]+"ᵉ"
 def _g_cond_g2_19 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] != "1es" and _sAppContext != "Writer"
+    return lToken[nTokenOffset+1].sValue != "1es" and _sAppContext != "Writer"
 def _g_sugg_g2_8 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-2]+"ᵉˢ"
+    return lToken[nTokenOffset+1].sValue[:-2]+"ᵉˢ"
 def _g_cond_g2_20 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].endswith("s")
+    return lToken[nTokenOffset+1].sValue.endswith("s")
 def _g_sugg_g2_9 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("mes", "").replace("è", "").replace("e", "").replace("i", "") + "ᵉˢ"
+    return lToken[nTokenOffset+1].sValue.replace("mes", "").replace("è", "").replace("e", "").replace("i", "") + "ᵉˢ"
 def _g_sugg_g2_10 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("me", "").replace("è", "").replace("e", "").replace("i", "") + "ᵉ"
+    return lToken[nTokenOffset+1].sValue.replace("me", "").replace("è", "").replace("e", "").replace("i", "") + "ᵉ"
 def _g_cond_g2_21 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return _sAppContext != "Writer" and not option("romain")
 def _g_cond_g2_22 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+1], ":G")
 def _g_cond_g2_23 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].endswith("s") or lToken[nTokenOffset+1]["sValue"].endswith("S")
+    return lToken[nTokenOffset+1].sValue.endswith("s") or lToken[nTokenOffset+1].sValue.endswith("S")
 def _g_sugg_g2_11 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("1", "₁").replace("2", "₂").replace("3", "₃").replace("4", "₄").replace("5", "₅").replace("6", "₆").replace("7", "₇").replace("8", "₈").replace("9", "₉").replace("0", "₀")
+    return lToken[nTokenOffset+1].sValue.replace("1", "₁").replace("2", "₂").replace("3", "₃").replace("4", "₄").replace("5", "₅").replace("6", "₆").replace("7", "₇").replace("8", "₈").replace("9", "₉").replace("0", "₀")
 def _g_cond_g2_24 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].isdigit()
+    return lToken[nTokenOffset+1].sValue.isdigit()
 def _g_da_g2_1 (lToken, nTokenOffset, nLastToken):
     return g_setmeta(lToken[nTokenOffset+1], "DATE")
 def _g_cond_g2_25 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not checkDate(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return not checkDate(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g2_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (lToken[nTokenOffset+1]["sValue"] == "29" and g_value(lToken[nTokenOffset+2], "|février|")) and not checkDate(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return not (lToken[nTokenOffset+1].sValue == "29" and g_value(lToken[nTokenOffset+2], "|février|")) and not checkDate(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_sugg_g2_12 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"][:-1]
+    return lToken[nLastToken-1+1].sValue[:-1]
 def _g_cond_g2_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+6]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+6].sValue)
 def _g_sugg_g2_13 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+6]["sValue"])
+    return getDay(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+6].sValue)
 def _g_cond_g2_28 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+5]["sValue"], lToken[nTokenOffset+7]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+5].sValue, lToken[nTokenOffset+7].sValue)
 def _g_sugg_g2_14 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+5]["sValue"], lToken[nTokenOffset+7]["sValue"])
+    return getDay(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+5].sValue, lToken[nTokenOffset+7].sValue)
 def _g_cond_g2_29 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+6]["sValue"], lToken[nTokenOffset+8]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+6].sValue, lToken[nTokenOffset+8].sValue)
 def _g_sugg_g2_15 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+6]["sValue"], lToken[nTokenOffset+8]["sValue"])
+    return getDay(lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+6].sValue, lToken[nTokenOffset+8].sValue)
 def _g_cond_g2_30 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_sugg_g2_16 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return getDay(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g2_31 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+5]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+5].sValue)
 def _g_sugg_g2_17 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+5]["sValue"])
+    return getDay(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+5].sValue)
 def _g_cond_g2_32 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1]["sValue"], lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+5]["sValue"], lToken[nTokenOffset+6]["sValue"])
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +av(?:ant|) +J(?:C|ésus-Christ)") and not checkDay(lToken[nTokenOffset+1].sValue, lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+5].sValue, lToken[nTokenOffset+6].sValue)
 def _g_sugg_g2_18 (lToken, nTokenOffset, nLastToken):
-    return getDay(lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+5]["sValue"], lToken[nTokenOffset+6]["sValue"])
+    return getDay(lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+5].sValue, lToken[nTokenOffset+6].sValue)
 def _g_cond_g2_33 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NB]", ":V0e") and not g_value(lToken[nLastToken+1], "|où|")
 def _g_cond_g2_34 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2318,7 +2350,7 @@ def _g_cond_g2_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":[WA]", ":N", 6)
 def _g_sugg_g2_19 (lToken, nTokenOffset, nLastToken):
-    return "quasi " + lToken[nTokenOffset+1]["sValue"][6:]
+    return "quasi " + lToken[nTokenOffset+1].sValue[6:]
 def _g_cond_g2_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph2(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], "-", ":")
 def _g_cond_g2_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2330,7 +2362,7 @@ def _g_cond_g2_45 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_46 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D") and g_morph2(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], "-", ":")
 def _g_cond_g2_47 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not(lToken[nTokenOffset+2]["sValue"] == "forme" and g_value(lToken[nLastToken+1], "|de|d’|")) and g_morph(lToken[nTokenOffset], ":D") and g_morph2(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], "-", ":")
+    return not(lToken[nTokenOffset+2].sValue == "forme" and g_value(lToken[nLastToken+1], "|de|d’|")) and g_morph(lToken[nTokenOffset], ":D") and g_morph2(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], "-", ":")
 def _g_da_g2_2 (lToken, nTokenOffset, nLastToken):
     return g_definefrom(lToken[nTokenOffset+1], 7)
 def _g_cond_g2_48 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2342,7 +2374,7 @@ def _g_cond_g2_50 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_51 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:D|V0e)|<start>|>[(,]") and g_morph2(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], "-", ":N")
 def _g_cond_g2_52 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower()
+    return lToken[nTokenOffset+2].sValue.islower()
 def _g_cond_g2_53 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":[WA]")
 def _g_cond_g2_54 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2352,7 +2384,7 @@ def _g_cond_g2_55 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_56 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":G")
 def _g_cond_g2_57 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].endswith("s") or lToken[nTokenOffset+2]["sValue"].endswith("S")
+    return lToken[nTokenOffset+2].sValue.endswith("s") or lToken[nTokenOffset+2].sValue.endswith("S")
 def _g_cond_g2_58 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">arrière/")
 def _g_cond_g2_59 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2392,27 +2424,27 @@ def _g_cond_g2_75 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_76 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":B:.:p")
 def _g_sugg_g2_20 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("-", " ")
+    return lToken[nTokenOffset+1].sValue.replace("-", " ")
 def _g_sugg_g2_21 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("-", " ")
+    return lToken[nTokenOffset+2].sValue.replace("-", " ")
 def _g_cond_g2_77 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken+1], "|centre|aile|") and not look(sSentence[lToken[nLastToken]["nEnd"]:], "équipe")
+    return not g_value(lToken[nLastToken+1], "|centre|aile|") and not look(sSentence[lToken[nLastToken].nEnd:], "équipe")
 def _g_cond_g2_78 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "équipe")
+    return not look(sSentence[lToken[nLastToken].nEnd:], "équipe")
 def _g_cond_g2_79 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[Pp]ar[ -]ci ?,? *$")
+    return not look(sSentence[:lToken[1+nTokenOffset].nStart], "[Pp]ar[ -]ci ?,? *$")
 def _g_cond_g2_80 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":V0", "", 2)
 def _g_sugg_g2_22 (lToken, nTokenOffset, nLastToken):
-    return "y " + lToken[nTokenOffset+1]["sValue"][2:]
+    return "y " + lToken[nTokenOffset+1].sValue[2:]
 def _g_sugg_g2_23 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("-", "")
+    return lToken[nTokenOffset+1].sValue.replace("-", "")
 def _g_cond_g2_81 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|dès|des|")
 def _g_sugg_g2_24 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("’", "-")
+    return lToken[nTokenOffset+1].sValue.replace("’", "-")
 def _g_tp_g2_1 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("’", "-")
+    return lToken[nTokenOffset+1].sValue.replace("’", "-")
 def _g_cond_g2_82 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nLastToken-2+1], lToken[nLastToken-2+2], 1, 1) and g_morph(lToken[nLastToken-2+1], ":V.*:1p", ":[GW]") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1p_")
 def _g_cond_g2_83 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2432,27 +2464,27 @@ def _g_cond_g2_89 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_90 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1)
 def _g_sugg_g2_25 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"]+"’"
+    return lToken[nTokenOffset+2].sValue+"’"
 def _g_cond_g2_91 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+3], "|t’|priori|posteriori|postériori|contrario|capella|fortiori|giorno|a|")
 def _g_cond_g2_92 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+4], "|il|ils|elle|elles|iel|iels|on|ont|")
 def _g_sugg_g2_26 (lToken, nTokenOffset, nLastToken):
-    return "É"+lToken[nTokenOffset+1]["sValue"][1:]
+    return "É"+lToken[nTokenOffset+1].sValue[1:]
 def _g_tp_g2_2 (lToken, nTokenOffset, nLastToken):
-    return "É"+lToken[nTokenOffset+1]["sValue"][1:]
+    return "É"+lToken[nTokenOffset+1].sValue[1:]
 def _g_cond_g2_93 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:[me]")
 def _g_cond_g2_94 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not lToken[nTokenOffset+2]["sValue"].isupper()
+    return not lToken[nTokenOffset+1].sValue.isupper() and not lToken[nTokenOffset+2].sValue.isupper()
 def _g_sugg_g2_27 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[si]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[si]", True)
 def _g_cond_g2_95 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not lToken[nTokenOffset+2]["sValue"].isupper() and not g_value(lToken[nTokenOffset], "|tel|telle|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not lToken[nTokenOffset+2].sValue.isupper() and not g_value(lToken[nTokenOffset], "|tel|telle|")
 def _g_sugg_g2_28 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[pi]", True)
 def _g_cond_g2_96 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not lToken[nTokenOffset+2]["sValue"].isupper() and not g_value(lToken[nTokenOffset], "|tels|telles|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not lToken[nTokenOffset+2].sValue.isupper() and not g_value(lToken[nTokenOffset], "|tels|telles|")
 def _g_cond_g2_97 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|entre|")
 def _g_cond_g2_98 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2460,7 +2492,7 @@ def _g_cond_g2_98 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g2_99 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+3], "|peu|") or not g_value(lToken[nTokenOffset+2], "|sous|")
 def _g_cond_g2_100 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], " en (?:a|aie|aies|ait|eut|eût|aura|aurait|avait)\\b")
+    return not look(sSentence[lToken[nLastToken].nEnd:], " en (?:a|aie|aies|ait|eut|eût|aura|aurait|avait)\\b")
 def _g_cond_g2_101 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|nuit|")
 def _g_cond_g2_102 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2472,81 +2504,81 @@ def _g_cond_g2_104 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_105 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":A.*:[me]:[si]")
 def _g_sugg_g2_29 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nLastToken-1+1]["sValue"], True)
+    return suggPlur(lToken[nLastToken-1+1].sValue, True)
 def _g_sugg_g2_30 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("vrai", "exact")
+    return lToken[nTokenOffset+2].sValue.replace("vrai", "exact")
 def _g_cond_g2_106 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|de|des|du|d’|")
 def _g_sugg_g2_31 (lToken, nTokenOffset, nLastToken):
-    return suggVerbFrom("faire", lToken[nTokenOffset+1]["sValue"])
+    return suggVerbFrom("faire", lToken[nTokenOffset+1].sValue)
 def _g_sugg_g2_32 (lToken, nTokenOffset, nLastToken):
-    return suggVerbFrom("choisir", lToken[nTokenOffset+1]["sValue"])
+    return suggVerbFrom("choisir", lToken[nTokenOffset+1].sValue)
 def _g_cond_g2_107 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_morph(lToken[nLastToken-1+1], ":[PQ]") and g_morph(lToken[nTokenOffset], ":V0.*:1s"))
 def _g_sugg_g2_33 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":1s")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":1s")
 def _g_cond_g2_108 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nLastToken-1+1], "|est|es|")
 def _g_cond_g2_109 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|soussigné|soussignée|leurs|") and not g_tag(lToken[nTokenOffset+1], "eg1mot") and not g_morph(lToken[nTokenOffset], ":1s|>pronom/")
 def _g_cond_g2_110 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1]["sValue"], ":(?:1s|Ov)")
+    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1].sValue, ":(?:1s|Ov)")
 def _g_sugg_g2_34 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":(?:1s|Ov)", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":(?:1s|Ov)", False)
 def _g_sugg_g2_35 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":(?:1s|Ov)", False)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":(?:1s|Ov)", False)
 def _g_cond_g2_111 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":V0")
 def _g_sugg_g2_36 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":2s")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":2s")
 def _g_cond_g2_112 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not g_morph(lToken[nTokenOffset], ":(?:2s|V0)|>(?:pronom|à)/")
 def _g_cond_g2_113 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1]["sValue"], ":(?:2s|Ov)")
+    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1].sValue, ":(?:2s|Ov)")
 def _g_sugg_g2_37 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":(?:2s|Ov)", False)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":(?:2s|Ov)", False)
 def _g_cond_g2_114 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_morph(lToken[nTokenOffset+2], ":[PQ]") and g_morph(lToken[nTokenOffset], ":V0.*:3s"))
 def _g_sugg_g2_38 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+2]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+2].sValue, ":3s")
 def _g_cond_g2_115 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":3p")
 def _g_sugg_g2_39 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":3s")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":3s")
 def _g_cond_g2_116 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":3p")
 def _g_cond_g2_117 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3s") and not g_value(lToken[nTokenOffset], "|t’|") and not g_value(lToken[nLastToken-1+1], "|c’|ce|ou|si|") and not g_tag(lToken[nTokenOffset+1], "eg1mot")
 def _g_cond_g2_118 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1]["sValue"], ":(?:3s|Ov)")
+    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1].sValue, ":(?:3s|Ov)")
 def _g_sugg_g2_40 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":(?:3s|Ov)", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":(?:3s|Ov)", False)
 def _g_cond_g2_119 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3s") and not g_value(lToken[nTokenOffset], "|t’|") and not g_value(lToken[nLastToken-1+1], "|c’|ce|")
 def _g_sugg_g2_41 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":(?:3s|Ov)", False)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":(?:3s|Ov)", False)
 def _g_cond_g2_120 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3s") and not g_value(lToken[nTokenOffset], "|n’|m’|t’|s’|") and not g_value(lToken[nLastToken-1+1], "|c’|ce|si|") and not g_tag(lToken[nTokenOffset+1], "eg1mot")
 def _g_cond_g2_121 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3s") and not g_value(lToken[nTokenOffset], "|n’|m’|t’|s’|") and not g_value(lToken[nLastToken-1+1], "|c’|ce|")
 def _g_cond_g2_122 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ":V.*:3s") and not look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "’$")
+    return not g_morph(lToken[nTokenOffset], ":V.*:3s") and not look(sSentence0[:lToken[1+nTokenOffset].nStart], "’$")
 def _g_cond_g2_123 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[VR]|<start>") and not g_morph(lToken[nLastToken+1], ":(?:3s|Ov)")
 def _g_cond_g2_124 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|il|ils|elle|elles|iel|iels|")
 def _g_sugg_g2_42 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]
+    return lToken[nTokenOffset+1].sValue[:-1]
 def _g_cond_g2_125 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and not g_value(lToken[nTokenOffset+2], "|soit|") and g_morph(lToken[nTokenOffset+2], ":3s") and not (g_tag(lToken[nLastToken-1+1], "eg1mot") and g_morph(lToken[nTokenOffset+2], ">écrire/"))
 def _g_cond_g2_126 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "eg1mot")
 def _g_sugg_g2_43 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":3s", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":3s", False)
 def _g_cond_g2_127 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ">(?:être|devoir|devenir|pouvoir|vouloir|savoir)/:V", ":3s")
 def _g_sugg_g2_44 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s")
 def _g_cond_g2_128 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[YP]") or g_morph(lToken[nTokenOffset+3], ":V", ">(?:être|devoir|devenir|pouvoir|vouloir|savoir)/")
 def _g_cond_g2_129 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2554,37 +2586,37 @@ def _g_cond_g2_129 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_130 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|je|tu|il|elle|on|nous|vous|ils|elles|iel|iels|")
 def _g_sugg_g2_45 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":1p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":1p")
 def _g_sugg_g2_46 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":1p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":1p")
 def _g_sugg_g2_47 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":2p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":2p")
 def _g_sugg_g2_48 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":2p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":2p")
 def _g_cond_g2_131 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_morph(lToken[nTokenOffset+2], ":[PQ]") and g_morph(lToken[nTokenOffset], ":V0.*:3p"))
 def _g_sugg_g2_49 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+2]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+2].sValue, ":3p")
 def _g_cond_g2_132 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":3s")
 def _g_sugg_g2_50 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":3p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":3p")
 def _g_cond_g2_133 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":3s")
 def _g_cond_g2_134 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3p") and not g_value(lToken[nTokenOffset], "|t’|") and not g_tag(lToken[nTokenOffset+1], "eg1mot")
 def _g_cond_g2_135 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1]["sValue"], ":(?:3p|Ov)")
+    return g_morph(lToken[nLastToken-1+1], ":[WX]") and not hasSimil(lToken[nLastToken-1+1].sValue, ":(?:3p|Ov)")
 def _g_sugg_g2_51 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":(?:3p|Ov)", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":(?:3p|Ov)", False)
 def _g_cond_g2_136 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":3p") and not g_value(lToken[nTokenOffset], "|t’|")
 def _g_sugg_g2_52 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":(?:3p|Ov)", False)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":(?:3p|Ov)", False)
 def _g_cond_g2_137 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":1s") and lToken[nLastToken-1+1]["sValue"].endswith("ai")
+    return g_morph(lToken[nLastToken-1+1], ":1s") and lToken[nLastToken-1+1].sValue.endswith("ai")
 def _g_sugg_g2_53 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"]+"t|"+suggVerb(lToken[nLastToken-1+1]["sValue"], ":3s")
+    return lToken[nLastToken-1+1].sValue+"t|"+suggVerb(lToken[nLastToken-1+1].sValue, ":3s")
 def _g_cond_g2_138 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nLastToken-1+1], ":[12]s")
 def _g_cond_g2_139 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2592,29 +2624,29 @@ def _g_cond_g2_139 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_140 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nLastToken-1+1], ":2p")
 def _g_sugg_g2_54 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nLastToken-1+1]["sValue"])
+    return suggVerbInfi(lToken[nLastToken-1+1].sValue)
 def _g_cond_g2_141 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V")
 def _g_sugg_g2_55 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+4]["sValue"], ":(?:[IKE].*[123][sp]|Y)", False)
+    return suggSimil(lToken[nTokenOffset+4].sValue, ":(?:[IKE].*[123][sp]|Y)", False)
 def _g_sugg_g2_56 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[IKE].*[123][sp]|Y)", False)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":(?:[IKE].*[123][sp]|Y)", False)
 def _g_sugg_g2_57 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[IK].*3[sp]|Y)", False)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":(?:[IK].*3[sp]|Y)", False)
 def _g_cond_g2_142 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">pronom/|:R")
 def _g_sugg_g2_58 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":(?:[IKE].*[123][sp]|Y)", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":(?:[IKE].*[123][sp]|Y)", False)
 def _g_sugg_g2_59 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":(?:[IK].*3[sp]|Y)", False)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":(?:[IK].*3[sp]|Y)", False)
 def _g_cond_g2_143 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and g_morph(lToken[nLastToken-1+1], ":1s", ":[GW]")
 def _g_cond_g2_144 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nLastToken-1+1], dTags, "_1s_") and not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nLastToken-1+1], ":1s", ":[GW]")
 def _g_cond_g2_145 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and g_morph(lToken[nTokenOffset+1], ":1s", ":[GWMNAQ]") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and g_morph(lToken[nTokenOffset+1], ":1s", ":[GWMNAQ]") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_sugg_g2_60 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"]+"t|"+suggVerb(lToken[nTokenOffset+1]["sValue"], ":3s")
+    return lToken[nLastToken-1+1].sValue+"t|"+suggVerb(lToken[nTokenOffset+1].sValue, ":3s")
 def _g_cond_g2_146 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nLastToken-1+1], ":2s", ":(?:E|G|W|M|J|3[sp]|1p)")
 def _g_cond_g2_147 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2622,9 +2654,9 @@ def _g_cond_g2_147 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_148 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nLastToken-1+1], dTags, "_2s_") and not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nLastToken-1+1], ":2s", ":(?:E|G|W|M|J|3[sp]|2p|1p)")
 def _g_cond_g2_149 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nTokenOffset+1], ":2s", ":(?:E|G|W|M|J|3[sp]|N|A|Q|1p)") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nTokenOffset+1], ":2s", ":(?:E|G|W|M|J|3[sp]|N|A|Q|1p)") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_sugg_g2_61 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":3s")
 def _g_cond_g2_150 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nLastToken-1+1], ":[12]s", ":(?:E|G|W|M|J|3[sp]|2p|1p)")
 def _g_cond_g2_151 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2632,143 +2664,143 @@ def _g_cond_g2_151 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_152 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nLastToken-1+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nLastToken-1+1], ":[12]s", ":(?:E|G|W|M|J|3[sp]|2p|1p)")
 def _g_cond_g2_153 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w")) and not g_morph(lToken[nTokenOffset], ":[DA].*:p")
+    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w")) and not g_morph(lToken[nTokenOffset], ":[DA].*:p")
 def _g_cond_g2_154 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nTokenOffset+1], ":[12]s", ":(?:E|G|W|M|J|3[sp]|2p|1p|V0e|N|A|Q)") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and g_morph(lToken[nTokenOffset+1], ":[12]s", ":(?:E|G|W|M|J|3[sp]|2p|1p|V0e|N|A|Q)") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_cond_g2_155 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_")
 def _g_cond_g2_156 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w")) and not g_morph(lToken[nTokenOffset], ":(?:R|D.*:p)")
+    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w")) and not g_morph(lToken[nTokenOffset], ":(?:R|D.*:p)")
 def _g_cond_g2_157 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1s_") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2s_") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_cond_g2_158 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+1], ":1p", ":[EGMNAJ]") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1p_") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return g_morph(lToken[nTokenOffset+1], ":1p", ":[EGMNAJ]") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_1p_") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_sugg_g2_62 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+1]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+1].sValue, ":3p")
 def _g_cond_g2_159 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+1], ":2p", ":[EGMNAJ]") and not g_tagbefore(lToken[nTokenOffset+2], dTags, "_2p_") and not (lToken[nTokenOffset+1]["sValue"].istitle() and look(sSentence0[:lToken[1+nTokenOffset]["nStart"]], "\\w"))
+    return g_morph(lToken[nTokenOffset+1], ":2p", ":[EGMNAJ]") and not g_tagbefore(lToken[nTokenOffset+2], dTags, "_2p_") and not (lToken[nTokenOffset+1].sValue.istitle() and look(sSentence0[:lToken[1+nTokenOffset].nStart], "\\w"))
 def _g_cond_g2_160 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":K:1s", ">(?:aimer|vouloir)/")
 def _g_sugg_g2_63 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+4]["sValue"][:-1]
+    return lToken[nTokenOffset+4].sValue[:-1]
 def _g_cond_g2_161 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+5], ":K:1s", ">(?:aimer|vouloir)/")
 def _g_sugg_g2_64 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+5]["sValue"][:-1]
+    return lToken[nTokenOffset+5].sValue[:-1]
 def _g_cond_g2_162 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+6], ":K:1s", ">(?:aimer|vouloir)/")
 def _g_sugg_g2_65 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+6]["sValue"][:-1]
+    return lToken[nTokenOffset+6].sValue[:-1]
 def _g_cond_g2_163 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+7], ":K:1s", ">(?:aimer|vouloir)/")
 def _g_sugg_g2_66 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+7]["sValue"][:-1]
+    return lToken[nTokenOffset+7].sValue[:-1]
 def _g_cond_g2_164 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+2]["sValue"].islower()
+    return not lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+2].sValue.islower()
 def _g_cond_g2_165 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper()
+    return not lToken[nTokenOffset+1].sValue.isupper()
 def _g_cond_g2_166 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+3]["sValue"].islower()
+    return not lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+3].sValue.islower()
 def _g_sugg_g2_67 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[fe]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[fe]:[si]", True)
 def _g_cond_g2_167 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset], "|le|la|les|") and hasSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[fe]:[si]")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset], "|le|la|les|") and hasSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[fe]:[si]")
 def _g_cond_g2_168 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], "V.....[pqx]")
 def _g_cond_g2_169 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset+2], ":V0") and hasSimil(lToken[nTokenOffset+2]["sValue"])
+    return not g_morph(lToken[nTokenOffset+2], ":V0") and hasSimil(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_68 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:s")
 def _g_sugg_g2_69 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA]:[fe]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA]:[fe]:[si]", True)
 def _g_cond_g2_170 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not ( g_morph(lToken[nLastToken-1+1], ":V[023].*:Y") and ( g_morph(lToken[nTokenOffset], ":V0a|>(?:jamais|pas)") or g_tag(lToken[nTokenOffset], "_VCint_") ) )
+    return lToken[nTokenOffset+2].sValue.islower() and not ( g_morph(lToken[nLastToken-1+1], ":V[023].*:Y") and ( g_morph(lToken[nTokenOffset], ":V0a|>(?:jamais|pas)") or g_tag(lToken[nTokenOffset], "_VCint_") ) )
 def _g_sugg_g2_70 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[me]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[me]:[si]", True)
 def _g_cond_g2_171 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset], "|le|la|les|")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset], "|le|la|les|")
 def _g_cond_g2_172 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset+2], "|sortir|")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset+2], "|sortir|")
 def _g_cond_g2_173 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset+2], "|faire|sont|soit|fut|fût|serait|sera|seront|soient|furent|fussent|seraient|peut|pouvait|put|pût|pourrait|pourra|doit|dut|dût|devait|devrait|devra|") and hasSimil(lToken[nTokenOffset+2]["sValue"])
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset+2], "|faire|sont|soit|fut|fût|serait|sera|seront|soient|furent|fussent|seraient|peut|pouvait|put|pût|pourrait|pourra|doit|dut|dût|devait|devrait|devra|") and hasSimil(lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_174 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ">[aâeéèiîouyh]")
 def _g_cond_g2_175 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"].islower()
+    return lToken[nTokenOffset+3].sValue.islower()
 def _g_sugg_g2_71 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[me]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[me]:[si]", True)
 def _g_cond_g2_176 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|dont|l’|d’|sauf|excepté|qu’|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bun à +$") and not g_morph(lToken[nTokenOffset+2], ":V0")
+    return not g_value(lToken[nTokenOffset], "|dont|l’|d’|sauf|excepté|qu’|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bun à +$") and not g_morph(lToken[nTokenOffset+2], ":V0")
 def _g_sugg_g2_72 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NAQ].*:[me]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NAQ].*:[me]:[si]", True)
 def _g_cond_g2_177 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":1p")
 def _g_cond_g2_178 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and hasSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[pi]")
+    return not bCondMemo and hasSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[pi]")
 def _g_cond_g2_179 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":2p")
 def _g_sugg_g2_73 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[me]:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[me]:[pi]", True)
 def _g_cond_g2_180 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset], "|le|la|les|") and hasSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[fe]:[pi]")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset], "|le|la|les|") and hasSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[fe]:[pi]")
 def _g_sugg_g2_74 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[fe]:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[fe]:[pi]", True)
 def _g_cond_g2_181 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset+2], "|soient|soit|sois|puisse|puisses|puissent|")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset+2], "|soient|soit|sois|puisse|puisses|puissent|")
 def _g_sugg_g2_75 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[si]", True)+"|"+suggVerbInfi(lToken[nLastToken-1+1]["sValue"])
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[si]", True)+"|"+suggVerbInfi(lToken[nLastToken-1+1].sValue)
 def _g_sugg_g2_76 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[si]", True)+"|"+suggVerbInfi(lToken[nLastToken-1+1]["sValue"])
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[si]", True)+"|"+suggVerbInfi(lToken[nLastToken-1+1].sValue)
 def _g_sugg_g2_77 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[pi]", True)
 def _g_sugg_g2_78 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[si]", True)
 def _g_cond_g2_182 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|un|")
 def _g_cond_g2_183 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|une|")
 def _g_sugg_g2_79 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[si]", True)
 def _g_cond_g2_184 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].istitle() and not lToken[nTokenOffset+2]["sValue"].isupper() and not g_value(lToken[nTokenOffset+2], "|jure|") and not g_tag(lToken[nTokenOffset+2], "eg1mot")
+    return not lToken[nTokenOffset+2].sValue.istitle() and not lToken[nTokenOffset+2].sValue.isupper() and not g_value(lToken[nTokenOffset+2], "|jure|") and not g_tag(lToken[nTokenOffset+2], "eg1mot")
 def _g_sugg_g2_80 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[NA]", True)+"|"+suggVerbInfi(lToken[nTokenOffset+2]["sValue"])
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[NA]", True)+"|"+suggVerbInfi(lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_185 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+3]["sValue"].istitle() and not lToken[nTokenOffset+3]["sValue"].isupper()
+    return not lToken[nTokenOffset+3].sValue.istitle() and not lToken[nTokenOffset+3].sValue.isupper()
 def _g_cond_g2_186 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 1) and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[me]", ":[YG]") and not lToken[nTokenOffset+3]["sValue"].istitle() and not (g_value(lToken[nTokenOffset+3], "|mal|") and g_morph(lToken[nLastToken+1], ":Y"))
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 1) and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[me]", ":[YG]") and not lToken[nTokenOffset+3].sValue.istitle() and not (g_value(lToken[nTokenOffset+3], "|mal|") and g_morph(lToken[nLastToken+1], ":Y"))
 def _g_cond_g2_187 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[123][sp]")
 def _g_sugg_g2_81 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nTokenOffset+3]["sValue"])
+    return suggVerbInfi(lToken[nTokenOffset+3].sValue)
 def _g_cond_g2_188 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[123][sp]", ":[NAQ]") and not lToken[nTokenOffset+3]["sValue"].istitle()
+    return g_morph(lToken[nTokenOffset+3], ":[123][sp]", ":[NAQ]") and not lToken[nTokenOffset+3].sValue.istitle()
 def _g_cond_g2_189 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":V1.*:(?:Iq|Ip:2p)", ":1p")
 def _g_cond_g2_190 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[NA].*:[fe]:[si])")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":(?:[NA].*:[fe]:[si])")
 def _g_sugg_g2_82 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[NA].*:[fe]:[si])", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":(?:[NA].*:[fe]:[si])", True)
 def _g_cond_g2_191 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+3]["sValue"].istitle() and not g_value(lToken[nTokenOffset], "|plus|moins|")
+    return not lToken[nTokenOffset+3].sValue.istitle() and not g_value(lToken[nTokenOffset], "|plus|moins|")
 def _g_cond_g2_192 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nLastToken-1+1]["sValue"].istitle()
+    return not lToken[nLastToken-1+1].sValue.istitle()
 def _g_sugg_g2_83 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[NA]", True)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[NA]", True)
 def _g_cond_g2_193 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+3]["sValue"].istitle() and not g_value(lToken[nTokenOffset], "|un|")
+    return not lToken[nTokenOffset+3].sValue.istitle() and not g_value(lToken[nTokenOffset], "|un|")
 def _g_cond_g2_194 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+3]["sValue"].istitle() and not g_value(lToken[nTokenOffset], "|une|")
+    return not lToken[nTokenOffset+3].sValue.istitle() and not g_value(lToken[nTokenOffset], "|une|")
 def _g_cond_g2_195 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not (g_tag(lToken[nTokenOffset+1], "eg1mot") and g_value(lToken[nTokenOffset], "|pronom|"))
+    return not lToken[nTokenOffset+1].sValue.isupper() and not (g_tag(lToken[nTokenOffset+1], "eg1mot") and g_value(lToken[nTokenOffset], "|pronom|"))
 def _g_sugg_g2_84 (lToken, nTokenOffset, nLastToken):
-    return "ne "+lToken[nTokenOffset+1]["sValue"][:1]+"’"
+    return "ne "+lToken[nTokenOffset+1].sValue[:1]+"’"
 def _g_cond_g2_196 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+2], "_Maj_")
 def _g_cond_g2_197 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":V[123].*:[123][sp]|>(?:pouvoir|vouloir|falloir)/")
 def _g_sugg_g2_85 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+5]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+5].sValue)
 def _g_cond_g2_198 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA]", ":P")
 def _g_cond_g2_199 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2776,77 +2808,77 @@ def _g_cond_g2_199 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_200 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":3p")
 def _g_sugg_g2_86 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+3]["sValue"], ":P", ":P")
+    return suggVerbTense(lToken[nTokenOffset+3].sValue, ":P", ":P")
 def _g_cond_g2_201 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset+2], "|m’|t’|s’|")
 def _g_sugg_g2_87 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][0:1] + "’en"
+    return lToken[nTokenOffset+2].sValue[0:1] + "’en"
 def _g_cond_g2_202 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+3], ":[NA]")
 def _g_cond_g2_203 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nTokenOffset+3], "|importe|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nTokenOffset+3], "|importe|")
 def _g_cond_g2_204 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|n’|")
 def _g_cond_g2_205 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nTokenOffset], "|l’|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nTokenOffset], "|l’|")
 def _g_sugg_g2_88 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":P", ":P")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":P", ":P")
 def _g_cond_g2_206 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":Q") and not g_morph(lToken[nTokenOffset], ":(?:V0a|R)")
 def _g_sugg_g2_89 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:s")+"|"+suggVerbInfi(lToken[nLastToken-1+1]["sValue"])+"|"+suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":3s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:s")+"|"+suggVerbInfi(lToken[nLastToken-1+1].sValue)+"|"+suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":3s")
 def _g_sugg_g2_90 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:s")+"|"+suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":3s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:s")+"|"+suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":3s")
 def _g_cond_g2_207 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_ceque_") and not g_value(lToken[nTokenOffset], "|ou|")
 def _g_sugg_g2_91 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_208 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].istitle() and not g_morph(lToken[nTokenOffset], ":[NA]:[me]:si")
+    return not lToken[nTokenOffset+2].sValue.istitle() and not g_morph(lToken[nTokenOffset], ":[NA]:[me]:si")
 def _g_cond_g2_209 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+3], ":V.e")
 def _g_cond_g2_210 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:p", ":[si]")
 def _g_sugg_g2_92 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+2]["sValue"])
+    return suggSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_211 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":(?:Y|[123][sp])", ":[AQ]")
 def _g_sugg_g2_93 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":s")
 def _g_cond_g2_212 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:[fp]", ":[me]:[si]")
 def _g_sugg_g2_94 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+2]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_95 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":m:s")
 def _g_cond_g2_213 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:[mp]", ":[fe]:[si]")
 def _g_sugg_g2_96 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+2]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_97 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":f:s")
 def _g_cond_g2_214 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:s", ":[pi]")
 def _g_sugg_g2_98 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggPlur(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_99 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":p")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":p")
 def _g_cond_g2_215 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:[sf]", ":[me]:[pi]")
 def _g_sugg_g2_100 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_101 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":m:p")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":m:p")
 def _g_cond_g2_216 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:[sm]", ":[fe]:[pi]")
 def _g_sugg_g2_102 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g2_103 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":f:p")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":f:p")
 def _g_cond_g2_217 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_ceque_") and not g_morph(lToken[nTokenOffset], ":V[123]")
 def _g_sugg_g2_104 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"])+"|"+suggVerbInfi(lToken[nTokenOffset+2]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue)+"|"+suggVerbInfi(lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_218 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|envie|")
 def _g_cond_g2_219 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2862,21 +2894,21 @@ def _g_cond_g2_223 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_224 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":N", "*") and not(g_morph(lToken[nTokenOffset+2], ":A") and g_morph(lToken[nTokenOffset+3], ":N"))
 def _g_sugg_g2_105 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"])
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue)
 def _g_cond_g2_225 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":N", ":(?:G|V0|Y|W)")
 def _g_cond_g2_226 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "eg1mot") and not g_value(lToken[nLastToken+1], "|moins|plus|mieux|")
 def _g_cond_g2_227 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nLastToken+1], "|côté|coup|pic|peine|marre|peu|plat|propos|valoir|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nLastToken+1], "|côté|coup|pic|peine|marre|peu|plat|propos|valoir|")
 def _g_cond_g2_228 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nLastToken+1], "|côté|coup|pic|peine|marre|peu|plat|propos|valoir|") and not g_morph(lToken[nTokenOffset], ">venir/")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nLastToken+1], "|côté|coup|pic|peine|marre|peu|plat|propos|valoir|") and not g_morph(lToken[nTokenOffset], ">venir/")
 def _g_cond_g2_229 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":(?:3s|R)") and not g_morph(lToken[nLastToken+1], ":Ov|>quo?i/")
 def _g_cond_g2_230 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D")
 def _g_cond_g2_231 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower() and not g_value(lToken[nLastToken-1+1], "|coté|sont|peu|")
+    return lToken[nLastToken-1+1].sValue.islower() and not g_value(lToken[nLastToken-1+1], "|coté|sont|peu|")
 def _g_cond_g2_232 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":(?:V.......[_z][az].*:Q|V1.*:Ip:2p)", ":[MGWNY]")
 def _g_cond_g2_233 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2886,9 +2918,9 @@ def _g_cond_g2_234 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_235 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V(?:2.*:I[pqs]:3s|1.*:I[pq]:[123]s)", "*")
 def _g_cond_g2_236 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower() and not g_value(lToken[nLastToken-1+1], "|sont|peu|") and not g_value(lToken[nTokenOffset+2], "|peu|tout|toute|tous|toutes|")
+    return lToken[nLastToken-1+1].sValue.islower() and not g_value(lToken[nLastToken-1+1], "|sont|peu|") and not g_value(lToken[nTokenOffset+2], "|peu|tout|toute|tous|toutes|")
 def _g_cond_g2_237 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|il|elle|iel|on|n’|m’|t’|l’|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bqu[e’] |n’(?:en|y) +$")
+    return not g_value(lToken[nTokenOffset], "|il|elle|iel|on|n’|m’|t’|l’|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bqu[e’] |n’(?:en|y) +$")
 def _g_cond_g2_238 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":N", ":Ov")
 def _g_cond_g2_239 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2904,11 +2936,11 @@ def _g_cond_g2_243 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_244 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset+1], "|à|") and g_value(lToken[nTokenOffset+2], "|tue-tête|"))
 def _g_cond_g2_245 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|l’|n’|il|elle|on|y|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)n’en +$")
+    return not g_value(lToken[nTokenOffset], "|l’|n’|il|elle|on|y|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)n’en +$")
 def _g_cond_g2_246 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|l’|n’|il|elle|on|y|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)n’en +$") and g_morph(lToken[nTokenOffset], ":N")
+    return not g_value(lToken[nTokenOffset], "|l’|n’|il|elle|on|y|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)n’en +$") and g_morph(lToken[nTokenOffset], ":N")
 def _g_cond_g2_247 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not g_value(lToken[nTokenOffset+3], "|accès|bel|bon|bonne|beau|besoin|charge|confiance|connaissance|conscience|crainte|droit|envie|été|faim|force|garde|grand|grande|hâte|honte|interdiction|intérêt|lieu|mauvaise|marre|peine|peur|raison|rapport|recours|soif|tendance|terre|tort|trait|vent|vocation|") and g_morph(lToken[nTokenOffset+1], ":N", "*")
+    return lToken[nTokenOffset+2].sValue.islower() and not g_value(lToken[nTokenOffset+3], "|accès|bel|bon|bonne|beau|besoin|charge|confiance|connaissance|conscience|crainte|droit|envie|été|faim|force|garde|grand|grande|hâte|honte|interdiction|intérêt|lieu|mauvaise|marre|peine|peur|raison|rapport|recours|soif|tendance|terre|tort|trait|vent|vocation|") and g_morph(lToken[nTokenOffset+1], ":N", "*")
 def _g_cond_g2_248 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ">(?:falloir|aller|pouvoir)/", ">que/")
 def _g_cond_g2_249 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2922,17 +2954,17 @@ def _g_cond_g2_252 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_253 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|les|des|")
 def _g_sugg_g2_106 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("scé", "cé").replace("SCÉ", "CÉ")
+    return lToken[nTokenOffset+2].sValue.replace("scé", "cé").replace("SCÉ", "CÉ")
 def _g_sugg_g2_107 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("cé", "scé").replace("CÉ", "SCÉ")
+    return lToken[nTokenOffset+2].sValue.replace("cé", "scé").replace("CÉ", "SCÉ")
 def _g_sugg_g2_108 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+2].sValue.replace("a", "â").replace("A", "Â")
 def _g_cond_g2_254 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], "<start>|,|:D")
 def _g_sugg_g2_109 (lToken, nTokenOffset, nLastToken):
-    return "à "+ lToken[nTokenOffset+2]["sValue"].replace("on", "es").replace("ON", "ES").replace("otre", "os").replace("OTRE", "OS").replace("eur", "eurs").replace("EUR", "EURS") + " dépens"
+    return "à "+ lToken[nTokenOffset+2].sValue.replace("on", "es").replace("ON", "ES").replace("otre", "os").replace("OTRE", "OS").replace("eur", "eurs").replace("EUR", "EURS") + " dépens"
 def _g_sugg_g2_110 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("é", "ée").replace("É", "ÉE")
+    return lToken[nLastToken-1+1].sValue.replace("é", "ée").replace("É", "ÉE")
 def _g_cond_g2_255 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|du|")
 def _g_cond_g2_256 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2944,9 +2976,9 @@ def _g_cond_g2_257 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_258 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset+2], "|ou|") and g_value(lToken[nLastToken+1], "|son|ses|")) and g_morph(lToken[nTokenOffset+1], ":D")
 def _g_cond_g2_259 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] != "SA"
+    return lToken[nTokenOffset+1].sValue != "SA"
 def _g_cond_g2_260 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|oh|ah|") and not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +et là")
+    return not g_value(lToken[nTokenOffset], "|oh|ah|") and not look(sSentence[lToken[nLastToken].nEnd:], "^ +et là")
 def _g_cond_g2_261 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 0, 0) and not (g_value(lToken[nTokenOffset+2], "|a|") and g_value(lToken[nLastToken+1], "|été|"))
 def _g_cond_g2_262 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -2956,47 +2988,47 @@ def _g_cond_g2_263 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_264 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R")
 def _g_cond_g2_265 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +en +heure")
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +en +heure")
 def _g_sugg_g2_111 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("o", "a").replace("O", "A")
+    return lToken[nTokenOffset+1].sValue.replace("o", "a").replace("O", "A")
 def _g_cond_g2_266 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_tag(lToken[nTokenOffset+1], "eg1mot") and g_value(lToken[nTokenOffset], "|pronom|"))
 def _g_cond_g2_267 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+2], ":[NA]")
 def _g_cond_g2_268 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+2]["sValue"].islower() and not (g_value(lToken[nTokenOffset], "|pour|") and g_value(lToken[nTokenOffset+2], "|faire|"))
+    return not lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+2].sValue.islower() and not (g_value(lToken[nTokenOffset], "|pour|") and g_value(lToken[nTokenOffset+2], "|faire|"))
 def _g_cond_g2_269 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nTokenOffset+2], "|quelques|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nTokenOffset+2], "|quelques|")
 def _g_cond_g2_270 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|que|qu’|")
 def _g_cond_g2_271 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":[NA]")
 def _g_sugg_g2_112 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("œ", "hœ").replace("Œ", "HŒ")
+    return lToken[nTokenOffset+1].sValue.replace("œ", "hœ").replace("Œ", "HŒ")
 def _g_cond_g2_272 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:D.*:[me]:[si]|R)") and not g_value(lToken[nTokenOffset], "|à|")
 def _g_cond_g2_273 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:D.*:[me]:[pi]|R)", ">à/")
 def _g_cond_g2_274 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (lToken[nTokenOffset+3]["sValue"] == "ce" and g_value(lToken[nLastToken+1], "|moment|"))
+    return not (lToken[nTokenOffset+3].sValue == "ce" and g_value(lToken[nLastToken+1], "|moment|"))
 def _g_sugg_g2_113 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("tt", "t").replace("TT", "T")
+    return lToken[nTokenOffset+1].sValue.replace("tt", "t").replace("TT", "T")
 def _g_cond_g2_275 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+1], ":Q|>(?:profiter|bénéficier|nombre|tant|sorte|type)/") and not g_morph(lToken[nLastToken+1], ">(?:financi[eè]re?|pécuni(?:er|aire)|sociaux)s?/")
 def _g_cond_g2_276 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morphVC(lToken[nTokenOffset+1], ">(?:profiter|bénéficier)/") and not g_morph(lToken[nLastToken+1], ">(?:financière|pécuni(?:er|aire)|sociale)/")
 def _g_sugg_g2_114 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("nud", "nu").replace("NUD", "NU")
+    return lToken[nTokenOffset+1].sValue.replace("nud", "nu").replace("NUD", "NU")
 def _g_cond_g2_277 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":(?:D.*:p|B)|>de/")
 def _g_cond_g2_278 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|un|une|les|ces|mes|tes|ses|nos|vos|leurs|quelques|plusieurs|")
 def _g_cond_g2_279 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasSimil(lToken[nTokenOffset+2]["sValue"], ":[NA].*:[pi]")
+    return bCondMemo and hasSimil(lToken[nTokenOffset+2].sValue, ":[NA].*:[pi]")
 def _g_cond_g2_280 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|%|") and not g_morph(lToken[nTokenOffset], ":B|>(?:pourcent|barre|seuil|aucun|plusieurs|certaine?s|une?)/")
 def _g_cond_g2_281 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ":R|>(?:approcher|anniversaire|cap|célébration|commémoration|occasion|passage|programme|terme|classe|délai|échéance|autour|celui|ceux|celle|celles)/") and not g_value(lToken[nLastToken+1], "|de|du|des|d’|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "% +$")
+    return not g_morph(lToken[nTokenOffset], ":R|>(?:approcher|anniversaire|cap|célébration|commémoration|occasion|passage|programme|terme|classe|délai|échéance|autour|celui|ceux|celle|celles)/") and not g_value(lToken[nLastToken+1], "|de|du|des|d’|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "% +$")
 def _g_cond_g2_282 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R|>(?:approcher|cap|passage|programme|terme|classe|autour|celui|ceux|celle|celles|au-delà)/") and not g_value(lToken[nLastToken+1], "|de|du|des|d’|") and not g_value(lToken[nTokenOffset+2], "|35|39|40|48|")
 def _g_cond_g2_283 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3004,13 +3036,13 @@ def _g_cond_g2_283 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_284 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":E")
 def _g_sugg_g2_115 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("que", "c").replace("QUE", "C")
+    return lToken[nTokenOffset+2].sValue.replace("que", "c").replace("QUE", "C")
 def _g_cond_g2_285 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":W", ":D")
 def _g_sugg_g2_116 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("nd", "nt").replace("ND", "NT")
+    return lToken[nTokenOffset+1].sValue.replace("nd", "nt").replace("ND", "NT")
 def _g_sugg_g2_117 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("nd", "nt").replace("ND", "NT")
+    return lToken[nLastToken-1+1].sValue.replace("nd", "nt").replace("ND", "NT")
 def _g_cond_g2_286 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":[NA].*:[fe]:[pi]", ":G")
 def _g_cond_g2_287 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3024,7 +3056,7 @@ def _g_cond_g2_290 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_291 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset+1], "|emballé|") and g_value(lToken[nLastToken-1+1], "|pesé|")) and g_morph(lToken[nTokenOffset], ":C|<start>|>[(,]")
 def _g_cond_g2_292 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], ">(?:être|voyager|surprendre|venir|arriver|partir|aller)/") or look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "-(?:ils?|elles?|on|je|tu|nous|vous|iels?) +$")
+    return g_morph(lToken[nTokenOffset], ">(?:être|voyager|surprendre|venir|arriver|partir|aller)/") or look(sSentence[:lToken[1+nTokenOffset].nStart], "-(?:ils?|elles?|on|je|tu|nous|vous|iels?) +$")
 def _g_cond_g2_293 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset], "|avec|sans|quel|quelle|quels|quelles|cet|votre|notre|mon|leur|l’|d’|")
 def _g_cond_g2_294 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3032,21 +3064,21 @@ def _g_cond_g2_294 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_295 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|n’|") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_2p_")
 def _g_sugg_g2_118 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("aim", "in").replace("AIM", "IN")
+    return lToken[nTokenOffset+1].sValue.replace("aim", "in").replace("AIM", "IN")
 def _g_cond_g2_296 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|il|ils|ne|n’|en|y|leur|lui|nous|vous|me|te|se|m’|t’|s’|la|le|les|qui|<start>|,|")
 def _g_sugg_g2_119 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("f", "ph").replace("F", "PH")
+    return lToken[nTokenOffset+1].sValue.replace("f", "ph").replace("F", "PH")
 def _g_sugg_g2_120 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ph", "f").replace("PH", "F").replace("Ph", "F")
+    return lToken[nTokenOffset+1].sValue.replace("ph", "f").replace("PH", "F").replace("Ph", "F")
 def _g_sugg_g2_121 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("c", "").replace("C", "")
+    return lToken[nTokenOffset+1].sValue.replace("c", "").replace("C", "")
 def _g_sugg_g2_122 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("an", "anc").replace("AN", "ANC")
+    return lToken[nTokenOffset+1].sValue.replace("an", "anc").replace("AN", "ANC")
 def _g_sugg_g2_123 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("au", "o").replace("AU", "O")
+    return lToken[nTokenOffset+1].sValue.replace("au", "o").replace("AU", "O")
 def _g_sugg_g2_124 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("o", "au").replace("O", "AU")
+    return lToken[nTokenOffset+1].sValue.replace("o", "au").replace("O", "AU")
 def _g_cond_g2_297 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":N", "*")
 def _g_cond_g2_298 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3064,7 +3096,7 @@ def _g_cond_g2_303 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_304 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:f:s")
 def _g_sugg_g2_125 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("û", "u").replace("Û", "U")
+    return lToken[nTokenOffset+2].sValue.replace("û", "u").replace("Û", "U")
 def _g_cond_g2_305 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":[123][sp]", ":[GQ]")
 def _g_cond_g2_306 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3072,21 +3104,21 @@ def _g_cond_g2_306 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_307 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+5], ":[123][sp]", ":[GQ]")
 def _g_cond_g2_308 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not lToken[nTokenOffset+2]["sValue"].isupper() and not g_morph(lToken[nTokenOffset], ":E|>le/")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not lToken[nTokenOffset+2].sValue.isupper() and not g_morph(lToken[nTokenOffset], ":E|>le/")
 def _g_sugg_g2_126 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][:-2]+"là"
+    return lToken[nTokenOffset+2].sValue[:-2]+"là"
 def _g_sugg_g2_127 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-2]+"là"
+    return lToken[nTokenOffset+1].sValue[:-2]+"là"
 def _g_cond_g2_309 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":V", ":[NA]", 0, -3)
 def _g_cond_g2_310 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":V...t")
 def _g_sugg_g2_128 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-3]+"-la|" + lToken[nTokenOffset+1]["sValue"][:-3]+" là"
+    return lToken[nTokenOffset+1].sValue[:-3]+"-la|" + lToken[nTokenOffset+1].sValue[:-3]+" là"
 def _g_sugg_g2_129 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-3]+" là"
+    return lToken[nTokenOffset+1].sValue[:-3]+" là"
 def _g_sugg_g2_130 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("la-", "là-").replace("LA-", "LÀ-")
+    return lToken[nTokenOffset+1].sValue.replace("la-", "là-").replace("LA-", "LÀ-")
 def _g_cond_g2_311 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D|<start>|,")
 def _g_cond_g2_312 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3104,13 +3136,13 @@ def _g_cond_g2_317 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_318 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":(?:3p|D)")
 def _g_cond_g2_319 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return (lToken[nTokenOffset+1]["sValue"].islower() or g_value(lToken[nTokenOffset], "|<start>|,|")) and lToken[nTokenOffset+2]["sValue"].islower()
+    return (lToken[nTokenOffset+1].sValue.islower() or g_value(lToken[nTokenOffset], "|<start>|,|")) and lToken[nTokenOffset+2].sValue.islower()
 def _g_cond_g2_320 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:[fe]")
 def _g_sugg_g2_131 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ch", "g").replace("CH", "G")
+    return lToken[nTokenOffset+1].sValue.replace("ch", "g").replace("CH", "G")
 def _g_sugg_g2_132 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+1].sValue.replace("a", "â").replace("A", "Â")
 def _g_cond_g2_321 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|père|")
 def _g_cond_g2_322 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3130,13 +3162,13 @@ def _g_cond_g2_328 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_329 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":Os|<start>|>[(,]")
 def _g_sugg_g2_133 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("o", "au").replace("O", "AU")
+    return lToken[nLastToken-1+1].sValue.replace("o", "au").replace("O", "AU")
 def _g_cond_g2_330 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ">(?:,|en)/|:D.*:e|<start>")
 def _g_sugg_g2_134 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("pé", "pê").replace("Pé", "Pê").replace("PÉ", "PÊ")
+    return lToken[nTokenOffset+3].sValue.replace("pé", "pê").replace("Pé", "Pê").replace("PÉ", "PÊ")
 def _g_sugg_g2_135 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("pé", "pê").replace("Pé", "Pê").replace("PÉ", "PÊ")
+    return lToken[nTokenOffset+1].sValue.replace("pé", "pê").replace("Pé", "Pê").replace("PÉ", "PÊ")
 def _g_cond_g2_331 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":C|<start>")
 def _g_cond_g2_332 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3146,7 +3178,7 @@ def _g_cond_g2_333 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_334 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:très|en|un|de|du)/")
 def _g_sugg_g2_136 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("n", "nt").replace("N", "NT")
+    return lToken[nTokenOffset+1].sValue.replace("n", "nt").replace("N", "NT")
 def _g_cond_g2_335 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":[AQ]")
 def _g_cond_g2_336 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3154,27 +3186,27 @@ def _g_cond_g2_336 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_337 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|la|en|une|") and not g_value(lToken[nLastToken+1], "|position|dance|")
 def _g_sugg_g2_137 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("o", "ô").replace("O", "Ô")
+    return lToken[nTokenOffset+1].sValue.replace("o", "ô").replace("O", "Ô")
 def _g_cond_g2_338 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":[AW]")
 def _g_cond_g2_339 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":Y|<start>")
 def _g_sugg_g2_138 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("om", "au").replace("OM", "AU")
+    return lToken[nTokenOffset+1].sValue.replace("om", "au").replace("OM", "AU")
 def _g_sugg_g2_139 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("au", "om").replace("AU", "OM")
+    return lToken[nTokenOffset+1].sValue.replace("au", "om").replace("AU", "OM")
 def _g_sugg_g2_140 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("t", "g").replace("T", "G")
+    return lToken[nTokenOffset+3].sValue.replace("t", "g").replace("T", "G")
 def _g_cond_g2_340 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A") and g_morph(lToken[nTokenOffset], ":D")
 def _g_sugg_g2_141 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("t", "g").replace("T", "G")
+    return lToken[nTokenOffset+1].sValue.replace("t", "g").replace("T", "G")
 def _g_sugg_g2_142 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("g", "t").replace("G", "T")
+    return lToken[nTokenOffset+1].sValue.replace("g", "t").replace("G", "T")
 def _g_cond_g2_341 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D|<start>|>[(,]")
 def _g_cond_g2_342 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|peu|de|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bau plus $")
+    return not g_value(lToken[nTokenOffset], "|peu|de|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bau plus $")
 def _g_cond_g2_343 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D") and not g_morph(g_token(lToken, nTokenOffset+1-2), ">obtenir/")
 def _g_cond_g2_344 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3182,47 +3214,47 @@ def _g_cond_g2_344 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_345 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:[mp]|<start>|>[(,]")
 def _g_cond_g2_346 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ">(?:arriver|venir|à|revenir|partir|repartir|aller|de)/") and not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +([mts]on|[nv]otre|leur) tour[, ]")
+    return not g_morph(lToken[nTokenOffset], ">(?:arriver|venir|à|revenir|partir|repartir|aller|de)/") and not look(sSentence[lToken[nLastToken].nEnd:], "^ +([mts]on|[nv]otre|leur) tour[, ]")
 def _g_cond_g2_347 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:arriver|venir|à|revenir|partir|repartir|aller|de)/")
 def _g_cond_g2_348 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|à|au|aux|")
 def _g_cond_g2_349 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ ne s(?:ai[st]|u[ts]|avai(?:s|t|ent)|urent) ")
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ ne s(?:ai[st]|u[ts]|avai(?:s|t|ent)|urent) ")
 def _g_cond_g2_350 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+2], ">(?:déduire|penser)/")
 def _g_cond_g2_351 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (g_value(lToken[nTokenOffset+2], "|en|ne|n’|") and g_morph(lToken[nLastToken+1], ":V0e")) and not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ *(?:a|avait|eut|eût|aura|aurait) +(?:pas|) +été")
+    return not (g_value(lToken[nTokenOffset+2], "|en|ne|n’|") and g_morph(lToken[nLastToken+1], ":V0e")) and not look(sSentence[lToken[nLastToken].nEnd:], "^ *(?:a|avait|eut|eût|aura|aurait) +(?:pas|) +été")
 def _g_cond_g2_352 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not (g_morph(lToken[nTokenOffset+2], ">(?:pouvoir|devoir|aller)/") and (g_morph(lToken[nLastToken+1], ":V0e") or g_morph(g_token(lToken, nLastToken+2), ":V0e"))) and not (g_morph(lToken[nTokenOffset+2], ":V0a") and g_value(lToken[nLastToken+1], "|été|"))
+    return lToken[nTokenOffset+2].sValue.islower() and not (g_morph(lToken[nTokenOffset+2], ">(?:pouvoir|devoir|aller)/") and (g_morph(lToken[nLastToken+1], ":V0e") or g_morph(g_token(lToken, nLastToken+2), ":V0e"))) and not (g_morph(lToken[nTokenOffset+2], ":V0a") and g_value(lToken[nLastToken+1], "|été|"))
 def _g_cond_g2_353 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset+2], "|en|ne|") and g_morph(lToken[nLastToken+1], ":V0e"))
 def _g_sugg_g2_143 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("éson", "aison").replace("ÉSON", "AISON")
+    return lToken[nTokenOffset+2].sValue.replace("éson", "aison").replace("ÉSON", "AISON")
 def _g_sugg_g2_144 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("è", "ai").replace("È", "AI")
+    return lToken[nTokenOffset+1].sValue.replace("è", "ai").replace("È", "AI")
 def _g_sugg_g2_145 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("ai", "è").replace("AI", "È")
+    return lToken[nLastToken-1+1].sValue.replace("ai", "è").replace("AI", "È")
 def _g_sugg_g2_146 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ai", "è").replace("AI", "È")
+    return lToken[nTokenOffset+1].sValue.replace("ai", "è").replace("AI", "È")
 def _g_cond_g2_354 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:[me]:[pi]")
 def _g_cond_g2_355 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:R|[123][sp])|<start>")
 def _g_sugg_g2_147 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("cen", "sen").replace("Cen", "Sen").replace("CEN", "SEN")
+    return lToken[nTokenOffset+2].sValue.replace("cen", "sen").replace("Cen", "Sen").replace("CEN", "SEN")
 def _g_cond_g2_356 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":(?:[123]s|Q)")
 def _g_cond_g2_357 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+3], ":(?:[123]p|Y|P)")
 def _g_cond_g2_358 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nTokenOffset], "|ne|il|ils|on|")
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nTokenOffset], "|ne|il|ils|on|")
 def _g_sugg_g2_148 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[AWGT]", True)
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[AWGT]", True)
 def _g_cond_g2_359 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+1]["sValue"].isupper() and not g_value(lToken[nTokenOffset], "|ne|il|ils|on|") and not (g_morph(lToken[nTokenOffset+2], ":V0") and g_morph(lToken[nTokenOffset+3], ":[QY]"))
+    return not lToken[nTokenOffset+1].sValue.isupper() and not g_value(lToken[nTokenOffset], "|ne|il|ils|on|") and not (g_morph(lToken[nTokenOffset+2], ":V0") and g_morph(lToken[nTokenOffset+3], ":[QY]"))
 def _g_cond_g2_360 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-2+1]["sValue"].islower() and g_morph(lToken[nTokenOffset+2], ":M")
+    return lToken[nLastToken-2+1].sValue.islower() and g_morph(lToken[nTokenOffset+2], ":M")
 def _g_cond_g2_361 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]")
 def _g_cond_g2_362 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3230,11 +3262,11 @@ def _g_cond_g2_362 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_363 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":3p")
 def _g_cond_g2_364 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (g_value(lToken[nLastToken-1+1], "|soit|") and look(sSentence[lToken[nLastToken]["nEnd"]:], " soit "))
+    return not (g_value(lToken[nLastToken-1+1], "|soit|") and look(sSentence[lToken[nLastToken].nEnd:], " soit "))
 def _g_cond_g2_365 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken+1], ":[GY]|<end>", ">à/") and not g_value(lToken[nTokenOffset], "|il|on|elle|iel|n’|m’|t’|s’|nous|vous|lui|leur|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)quel(?:s|les?|) qu[’ ]$") and not look(sSentence[lToken[nLastToken]["nEnd"]:], " soit ")
+    return g_morph(lToken[nLastToken+1], ":[GY]|<end>", ">à/") and not g_value(lToken[nTokenOffset], "|il|on|elle|iel|n’|m’|t’|s’|nous|vous|lui|leur|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)quel(?:s|les?|) qu[’ ]$") and not look(sSentence[lToken[nLastToken].nEnd:], " soit ")
 def _g_cond_g2_366 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], " soit ")
+    return not look(sSentence[lToken[nLastToken].nEnd:], " soit ")
 def _g_cond_g2_367 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":[YQ]|>(?:avec|contre|par|pour|sur)/|<start>|>[(,]")
 def _g_cond_g2_368 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3250,9 +3282,9 @@ def _g_cond_g2_372 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_373 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[DA].*:[fe]:[si]")
 def _g_sugg_g2_149 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("u", "û").replace("U", "Û")
+    return lToken[nTokenOffset+1].sValue.replace("u", "û").replace("U", "Û")
 def _g_sugg_g2_150 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("u", "û").replace("U", "Û")
+    return lToken[nTokenOffset+3].sValue.replace("u", "û").replace("U", "Û")
 def _g_cond_g2_374 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_value(lToken[nTokenOffset+2], "|temps|") and g_value(lToken[nTokenOffset], "|temps|"))
 def _g_cond_g2_375 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3260,15 +3292,15 @@ def _g_cond_g2_375 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_376 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|je|tu|il|elle|iel|on|ne|n’|le|la|les|l’|me|m’|te|t’|se|s’|")
 def _g_sugg_g2_151 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("au", "ô").replace("AU", "Ô")
+    return lToken[nTokenOffset+1].sValue.replace("au", "ô").replace("AU", "Ô")
 def _g_sugg_g2_152 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("è", "ê").replace("È", "Ê")
+    return lToken[nTokenOffset+1].sValue.replace("è", "ê").replace("È", "Ê")
 def _g_cond_g2_377 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_morph(lToken[nTokenOffset+2], ">trait/") and g_morph(lToken[nTokenOffset+3], ">(?:facial|vertical|horizontal|oblique|diagonal)/"))
 def _g_cond_g2_378 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:D|A.*:m)")
 def _g_cond_g2_379 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].istitle() and not g_morph(lToken[nTokenOffset], ":(?:O[vs]|X)|>(?:aller|falloir|pouvoir|savoir|vouloir|préférer|faire|penser|imaginer|souhaiter|désirer|espérer|de|à)/")
+    return not lToken[nTokenOffset+2].sValue.istitle() and not g_morph(lToken[nTokenOffset], ":(?:O[vs]|X)|>(?:aller|falloir|pouvoir|savoir|vouloir|préférer|faire|penser|imaginer|souhaiter|désirer|espérer|de|à)/")
 def _g_cond_g2_380 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|part|")
 def _g_cond_g2_381 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3286,79 +3318,79 @@ def _g_cond_g2_386 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_387 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|avenues|")
 def _g_cond_g2_388 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].lower() != lToken[nLastToken-1+1]["sValue"].lower()
+    return lToken[nTokenOffset+1].sValue.lower() != lToken[nLastToken-1+1].sValue.lower()
 def _g_cond_g2_389 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].lower() != lToken[nLastToken-2+1]["sValue"].lower()
+    return lToken[nTokenOffset+1].sValue.lower() != lToken[nLastToken-2+1].sValue.lower()
 def _g_sugg_g2_153 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+3]["sValue"])
+    return suggSing(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g2_154 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][:-1]
+    return lToken[nTokenOffset+2].sValue[:-1]
 def _g_cond_g2_390 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].isupper() and not g_value(lToken[nLastToken+1], "|saint|")
+    return not lToken[nTokenOffset+2].sValue.isupper() and not g_value(lToken[nLastToken+1], "|saint|")
 def _g_sugg_g2_155 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].lower()
+    return lToken[nTokenOffset+2].sValue.lower()
 def _g_cond_g2_391 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].isupper() and not g_value(lToken[nLastToken+1], "|gras|saint|")
+    return not lToken[nTokenOffset+2].sValue.isupper() and not g_value(lToken[nLastToken+1], "|gras|saint|")
 def _g_cond_g2_392 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset+1], ":M1") and not lToken[nTokenOffset+2]["sValue"].isupper()
+    return not g_morph(lToken[nTokenOffset+1], ":M1") and not lToken[nTokenOffset+2].sValue.isupper()
 def _g_cond_g2_393 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].isupper()
+    return not lToken[nTokenOffset+2].sValue.isupper()
 def _g_cond_g2_394 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] == "assemblée"
+    return lToken[nTokenOffset+1].sValue == "assemblée"
 def _g_cond_g2_395 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower() and not g_morph(lToken[nTokenOffset], ":[DA]") and not g_morph(lToken[nLastToken+1], ":A|>(?:d[eu’]|des)/")
+    return lToken[nTokenOffset+1].sValue.islower() and not g_morph(lToken[nTokenOffset], ":[DA]") and not g_morph(lToken[nLastToken+1], ":A|>(?:d[eu’]|des)/")
 def _g_cond_g2_396 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower()
+    return lToken[nLastToken-1+1].sValue.islower()
 def _g_cond_g2_397 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] == "état"
+    return lToken[nTokenOffset+1].sValue == "état"
 def _g_cond_g2_398 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"] == "états"
+    return lToken[nTokenOffset+1].sValue == "états"
 def _g_cond_g2_399 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"] == "état"
+    return lToken[nTokenOffset+3].sValue == "état"
 def _g_cond_g2_400 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"] == "état"
+    return lToken[nTokenOffset+4].sValue == "état"
 def _g_cond_g2_401 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"][0:1] == "é"
+    return lToken[nTokenOffset+1].sValue[0:1] == "é"
 def _g_sugg_g2_156 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("é", "É")
+    return lToken[nTokenOffset+1].sValue.replace("é", "É")
 def _g_cond_g2_402 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower()
+    return lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g2_403 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|<start>|")
 def _g_cond_g2_404 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V0e")
 def _g_cond_g2_405 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].istitle() and g_morph(lToken[nTokenOffset], ":N", ":(?:A|V0e|D|R|B|X)")
+    return lToken[nTokenOffset+1].sValue.istitle() and g_morph(lToken[nTokenOffset], ":N", ":(?:A|V0e|D|R|B|X)")
 def _g_sugg_g2_157 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].lower()
+    return lToken[nTokenOffset+1].sValue.lower()
 def _g_cond_g2_406 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower() and not g_value(lToken[nTokenOffset+1], "|canadienne|canadiennes|malaise|malaises|avare|avares|") and ( g_value(lToken[nTokenOffset], "|certains|certaines|maints|maintes|ce|cet|cette|ces|des|les|nos|vos|leurs|quelques|plusieurs|chaque|une|aux|la|ma|ta|sa|quel|quelle|quels|quelles|") or ( g_value(lToken[nTokenOffset], "|le|") and g_morph(lToken[nTokenOffset+1], ":N.*:[me]:[si]", "#L") ) or ( g_value(lToken[nTokenOffset], "|l’|") and g_morph(lToken[nTokenOffset+1], ":N.*:[si]", "#L") ) or ( g_value(lToken[nTokenOffset], "|de|d’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ">(?:action|armée|assassinat|attente|bataillon|beaucoup|bus|car|centaine|combien|communauté|complot|couple|descendant|dizaine|douzaine|duel|désir|d[eé]sid[eé]rata|enlèvement|émigration|énormément|équipe|exigence|famille|groupe|génération|immigration|invasion|majorité|meurtre|millier|million|moins|multitude|parole|pas|photo|plus|poignée|portrait|pourcentage|proportion|quart|rassemblement|rencontre|reportage|souhait|tant|tellement|tiers|trio|trop|témoignage|vie|viol|volonté|vote)/") ) or ( g_value(lToken[nTokenOffset], "|un|") and not g_value(g_token(lToken, nTokenOffset+1-2), "|dans|numéro|") and not look(sSentence[lToken[nLastToken]["nEnd"]:], "(?:aisé|approximatif|argotique|baragouiné|correct|courant|facile|haché|impeccable|incompréhensible|parfait|prononcé)") ) or ( g_morph(lToken[nTokenOffset], ":B:.:p") and not g_morph(g_token(lToken, nTokenOffset+1-2), ">numéro/") ) )
+    return lToken[nTokenOffset+1].sValue.islower() and not g_value(lToken[nTokenOffset+1], "|canadienne|canadiennes|malaise|malaises|avare|avares|") and ( g_value(lToken[nTokenOffset], "|certains|certaines|maints|maintes|ce|cet|cette|ces|des|les|nos|vos|leurs|quelques|plusieurs|chaque|une|aux|la|ma|ta|sa|quel|quelle|quels|quelles|") or ( g_value(lToken[nTokenOffset], "|le|") and g_morph(lToken[nTokenOffset+1], ":N.*:[me]:[si]", "#L") ) or ( g_value(lToken[nTokenOffset], "|l’|") and g_morph(lToken[nTokenOffset+1], ":N.*:[si]", "#L") ) or ( g_value(lToken[nTokenOffset], "|de|d’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ">(?:action|armée|assassinat|attente|bataillon|beaucoup|bus|car|centaine|combien|communauté|complot|couple|descendant|dizaine|douzaine|duel|désir|d[eé]sid[eé]rata|enlèvement|émigration|énormément|équipe|exigence|famille|groupe|génération|immigration|invasion|majorité|meurtre|millier|million|moins|multitude|parole|pas|photo|plus|poignée|portrait|pourcentage|proportion|quart|rassemblement|rencontre|reportage|souhait|tant|tellement|tiers|trio|trop|témoignage|vie|viol|volonté|vote)/") ) or ( g_value(lToken[nTokenOffset], "|un|") and not g_value(g_token(lToken, nTokenOffset+1-2), "|dans|numéro|") and not look(sSentence[lToken[nLastToken].nEnd:], "(?:aisé|approximatif|argotique|baragouiné|correct|courant|facile|haché|impeccable|incompréhensible|parfait|prononcé)") ) or ( g_morph(lToken[nTokenOffset], ":B:.:p") and not g_morph(g_token(lToken, nTokenOffset+1-2), ">numéro/") ) )
 def _g_sugg_g2_158 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].capitalize()
+    return lToken[nTokenOffset+1].sValue.capitalize()
 def _g_cond_g2_407 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+3]["sValue"].isupper()
+    return not lToken[nTokenOffset+3].sValue.isupper()
 def _g_sugg_g2_159 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].lower()
+    return lToken[nTokenOffset+3].sValue.lower()
 def _g_cond_g2_408 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+2]["sValue"].isupper()) and (lToken[nTokenOffset+1]["sValue"].islower() or not lToken[nTokenOffset+2]["sValue"].islower())
+    return not (lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+2].sValue.isupper()) and (lToken[nTokenOffset+1].sValue.islower() or not lToken[nTokenOffset+2].sValue.islower())
 def _g_sugg_g2_160 (lToken, nTokenOffset, nLastToken):
-    return "Homo " + lToken[nTokenOffset+2]["sValue"].lower()
+    return "Homo " + lToken[nTokenOffset+2].sValue.lower()
 def _g_cond_g2_409 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken+1], "|idaltu|sapiens|") and not (lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+2]["sValue"].isupper()) and (lToken[nTokenOffset+1]["sValue"].islower() or not lToken[nTokenOffset+2]["sValue"].islower())
+    return not g_value(lToken[nLastToken+1], "|idaltu|sapiens|") and not (lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+2].sValue.isupper()) and (lToken[nTokenOffset+1].sValue.islower() or not lToken[nTokenOffset+2].sValue.islower())
 def _g_cond_g2_410 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (lToken[nTokenOffset+1]["sValue"].isupper() and lToken[nTokenOffset+2]["sValue"].isupper() and lToken[nTokenOffset+3]["sValue"].isupper()) and (lToken[nTokenOffset+1]["sValue"].islower() or not lToken[nTokenOffset+2]["sValue"].islower() or not lToken[nTokenOffset+3]["sValue"].islower())
+    return not (lToken[nTokenOffset+1].sValue.isupper() and lToken[nTokenOffset+2].sValue.isupper() and lToken[nTokenOffset+3].sValue.isupper()) and (lToken[nTokenOffset+1].sValue.islower() or not lToken[nTokenOffset+2].sValue.islower() or not lToken[nTokenOffset+3].sValue.islower())
 def _g_sugg_g2_161 (lToken, nTokenOffset, nLastToken):
-    return "Homo " + lToken[nTokenOffset+2]["sValue"].lower() + " " + lToken[nTokenOffset+3]["sValue"].lower()
+    return "Homo " + lToken[nTokenOffset+2].sValue.lower() + " " + lToken[nTokenOffset+3].sValue.lower()
 def _g_sugg_g2_162 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].capitalize()
+    return lToken[nTokenOffset+3].sValue.capitalize()
 def _g_sugg_g2_163 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+4]["sValue"].capitalize()
+    return lToken[nTokenOffset+4].sValue.capitalize()
 def _g_cond_g2_411 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower() and lToken[nTokenOffset+2]["sValue"].islower()
+    return lToken[nTokenOffset+1].sValue.islower() and lToken[nTokenOffset+2].sValue.islower()
 def _g_sugg_g2_164 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].capitalize()
+    return lToken[nLastToken-1+1].sValue.capitalize()
 def _g_cond_g2_412 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower()
+    return lToken[nTokenOffset+1].sValue.islower()
 def _g_cond_g2_413 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":(?:D.*:p|R|C)")
 def _g_cond_g2_414 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3366,41 +3398,41 @@ def _g_cond_g2_414 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_415 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|de|du|avant|après|malgré|")
 def _g_cond_g2_416 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasFemForm(lToken[nTokenOffset+4]["sValue"])
+    return bCondMemo and hasFemForm(lToken[nTokenOffset+4].sValue)
 def _g_sugg_g2_165 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+4]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+4].sValue, True)
 def _g_cond_g2_417 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":", ":(?:R|3[sp]|[12]p|Q)|>(?:[nv]ous|eux)/")
 def _g_cond_g2_418 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasFemForm(lToken[nTokenOffset+3]["sValue"])
+    return bCondMemo and hasFemForm(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g2_166 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+3]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+3].sValue, True)
 def _g_sugg_g2_167 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+4]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+4].sValue, True)
 def _g_sugg_g2_168 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+3]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+3].sValue, True)
 def _g_sugg_g2_169 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+3]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+3].sValue, True)
 def _g_cond_g2_419 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":R", ":D.*:p")
 def _g_sugg_g2_170 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+2]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g2_420 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":R")
 def _g_sugg_g2_171 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+2]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+2].sValue, True)
 def _g_sugg_g2_172 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+3]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+3].sValue, True)
 def _g_cond_g2_421 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:p")
 def _g_sugg_g2_173 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+2]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g2_422 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:p")
 def _g_cond_g2_423 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:f:s")
 def _g_sugg_g2_174 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+2]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g2_424 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:f:s")
 def _g_cond_g2_425 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3414,27 +3446,27 @@ def _g_cond_g2_428 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g2_429 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph0(lToken[nLastToken-1+1], ":V")
 def _g_sugg_g2_175 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+3]["sValue"], ":E", ":2p")
+    return suggVerbTense(lToken[nTokenOffset+3].sValue, ":E", ":2p")
 def _g_sugg_g2_176 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:p")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:p")
 def _g_sugg_g2_177 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:s")
 def _g_sugg_g2_178 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:p")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:p")
 def _g_cond_g2_430 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V[123].*:Iq.*:[32]s")
 def _g_sugg_g2_179 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+3]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+3].sValue)
 def _g_cond_g2_431 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|n’importe|ce|se|") and not g_morph(lToken[nTokenOffset], ":R")
 def _g_sugg_g2_180 (lToken, nTokenOffset, nLastToken):
-    return "l’a " + suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:s") + "|la " + lToken[nTokenOffset+3]["sValue"][:-2] + "ait"
+    return "l’a " + suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:s") + "|la " + lToken[nTokenOffset+3].sValue[:-2] + "ait"
 def _g_cond_g2_432 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-2+1]["sValue"].isdigit() and lToken[nLastToken-2+1]["sValue"] != "1" and lToken[nLastToken-2+1]["sValue"] != "01"
+    return lToken[nLastToken-2+1].sValue.isdigit() and lToken[nLastToken-2+1].sValue != "1" and lToken[nLastToken-2+1].sValue != "01"
 def _g_cond_g2_433 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":A.*:[me]:[pi]")
 def _g_cond_g2_434 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nLastToken+1], ":A.*:[fe]:[pi]") and not (g_value(lToken[nLastToken-1+1], "|année|") and re.search("^[0-9]+$", lToken[nLastToken+1]["sValue"]))
+    return not g_morph(lToken[nLastToken+1], ":A.*:[fe]:[pi]") and not (g_value(lToken[nLastToken-1+1], "|année|") and re.search("^[0-9]+$", lToken[nLastToken+1].sValue))
 def _g_cond_g2_435 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":A.*:[fe]:[pi]")
 def _g_cond_g2_436 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3462,7 +3494,7 @@ def _g_da_g2_8 (lToken, nTokenOffset, nLastToken):
 def _g_cond_g2_442 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":[NA]", ":G", 0, -3)
 def _g_tp_g2_3 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-3]
+    return lToken[nTokenOffset+1].sValue[:-3]
 def _g_da_g2_9 (lToken, nTokenOffset, nLastToken):
     return g_define(lToken[nTokenOffset+1], ":B:e:p")
 def _g_da_g2_10 (lToken, nTokenOffset, nLastToken):
@@ -3536,15 +3568,15 @@ def _g_cond_g2_472 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_da_g2_14 (lToken, nTokenOffset, nLastToken):
     return g_define(lToken[nTokenOffset+1], ":A:e:i")
 def _g_cond_g2_473 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].istitle() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) or re.search("^[MDCLXVI]+$", lToken[nTokenOffset+2]["sValue"])
+    return lToken[nTokenOffset+2].sValue.istitle() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) or re.search("^[MDCLXVI]+$", lToken[nTokenOffset+2].sValue)
 def _g_cond_g2_474 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].istitle()
+    return lToken[nTokenOffset+2].sValue.istitle()
 def _g_cond_g2_475 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"].istitle()
+    return lToken[nTokenOffset+3].sValue.istitle()
 def _g_cond_g2_476 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].istitle() and lToken[nTokenOffset+4]["sValue"].istitle()
+    return lToken[nTokenOffset+2].sValue.istitle() and lToken[nTokenOffset+4].sValue.istitle()
 def _g_cond_g2_477 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"] != "1" and g_morph(lToken[nTokenOffset+1], ":M[12]")
+    return lToken[nTokenOffset+3].sValue != "1" and g_morph(lToken[nTokenOffset+1], ":M[12]")
 def _g_cond_g2_478 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":M[12]") and g_morph(lToken[nTokenOffset+3], ":M[12]")
 def _g_cond_g2_479 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3634,7 +3666,7 @@ def _g_cond_ig12a_12 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTa
 def _g_cond_ig12a_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D") and not g_morph(lToken[nLastToken+1], ":A.*:[fe]:[si]")
 def _g_cond_ig12a_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+1], ":[123]p") or (lToken[nTokenOffset+1]["sValue"] == "fait" and g_value(lToken[nTokenOffset], "|on|"))
+    return g_morph(lToken[nTokenOffset+1], ":[123]p") or (lToken[nTokenOffset+1].sValue == "fait" and g_value(lToken[nTokenOffset], "|on|"))
 def _g_cond_ig12a_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":[123]p")
 def _g_cond_ig12a_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3642,7 +3674,7 @@ def _g_cond_ig12a_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTa
 def _g_cond_ig12b_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":N", ":(?:G|123[sp]|P|A)") and g_morph(lToken[nTokenOffset+4], ":N", ":(?:G|123[sp]|P|A)") and not g_morph(lToken[nLastToken+1], ":[NA]")
 def _g_da_ig12b_1 (lToken, nTokenOffset, nLastToken):
-    return g_define(lToken[nTokenOffset+2], queryNamesPOS(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+4]["sValue"]))
+    return g_define(lToken[nTokenOffset+2], queryNamesPOS(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+4].sValue))
 def _g_cond_ig12b_2 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo
 def _g_cond_ig12b_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3684,7 +3716,7 @@ def _g_cond_ig12b_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTa
 def _g_da_ig12b_7 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+3], "", ":V")
 def _g_cond_ig12b_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], ":O[vs]")
+    return not look(sSentence[:lToken[1+nTokenOffset].nStart], ":O[vs]")
 def _g_da_ig12b_8 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+2], ":A") and g_select(lToken[nTokenOffset+3], "", ":N")
 def _g_da_ig12b_9 (lToken, nTokenOffset, nLastToken):
@@ -3740,61 +3772,61 @@ def _g_da_g3_15 (lToken, nTokenOffset, nLastToken):
 def _g_cond_g3_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+2], ">avoir/")
 def _g_cond_g3_4 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"] != "A" and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_àCOI_") and not g_value(lToken[nLastToken+1], "|été|")
+    return lToken[nLastToken-1+1].sValue != "A" and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_àCOI_") and not g_value(lToken[nLastToken+1], "|été|")
 def _g_cond_g3_5 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_propsub_") and not g_morph(lToken[nTokenOffset+1], ":[YNA]") and not g_value(lToken[nLastToken+1], "|été|")
 def _g_cond_g3_6 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"] != "A" and not g_tag(lToken[nLastToken-1+1], "eg1mot") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_propsub_") and not g_morph(lToken[nLastToken+1], ":Q")
+    return lToken[nLastToken-1+1].sValue != "A" and not g_tag(lToken[nLastToken-1+1], "eg1mot") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_propsub_") and not g_morph(lToken[nLastToken+1], ":Q")
 def _g_cond_g3_7 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|rendez-vous|")
 def _g_cond_g3_8 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]")
 def _g_sugg_g3_1 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("â", "a").replace("Â", "A")
+    return lToken[nTokenOffset+2].sValue.replace("â", "a").replace("Â", "A")
 def _g_sugg_g3_2 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+2].sValue.replace("a", "â").replace("A", "Â")
 def _g_sugg_g3_3 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("oc", "o")
+    return lToken[nTokenOffset+2].sValue.replace("oc", "o")
 def _g_sugg_g3_4 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("oc", "o")
+    return lToken[nTokenOffset+1].sValue.replace("oc", "o")
 def _g_sugg_g3_5 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("ro", "roc")
+    return lToken[nTokenOffset+3].sValue.replace("ro", "roc")
 def _g_cond_g3_9 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">faire")
 def _g_sugg_g3_6 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ai", "è").replace("Ai", "È").replace("AI", "È")
+    return lToken[nTokenOffset+1].sValue.replace("ai", "è").replace("Ai", "È").replace("AI", "È")
 def _g_cond_g3_10 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":Y")
 def _g_sugg_g3_7 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("auspice", "hospice")
+    return lToken[nTokenOffset+3].sValue.replace("auspice", "hospice")
 def _g_sugg_g3_8 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("auspice", "hospice").replace("Auspice", "Hospice")
+    return lToken[nTokenOffset+1].sValue.replace("auspice", "hospice").replace("Auspice", "Hospice")
 def _g_sugg_g3_9 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("âill", "ay").replace("aill", "ay").replace("ÂILL", "AY").replace("AILL", "AY")
+    return lToken[nTokenOffset+1].sValue.replace("âill", "ay").replace("aill", "ay").replace("ÂILL", "AY").replace("AILL", "AY")
 def _g_sugg_g3_10 (lToken, nTokenOffset, nLastToken):
-    return "arrière-"+lToken[nTokenOffset+2]["sValue"].replace("c", "").replace("C", "")
+    return "arrière-"+lToken[nTokenOffset+2].sValue.replace("c", "").replace("C", "")
 def _g_sugg_g3_11 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("c", "").replace("C", "")
+    return lToken[nTokenOffset+1].sValue.replace("c", "").replace("C", "")
 def _g_cond_g3_11 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +des accusés")
+    return not look(sSentence[lToken[nLastToken].nEnd:], "^ +des accusés")
 def _g_sugg_g3_12 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("an", "anc").replace("AN", "ANC")
+    return lToken[nTokenOffset+3].sValue.replace("an", "anc").replace("AN", "ANC")
 def _g_sugg_g3_13 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("an", "anc").replace("AN", "ANC")
+    return lToken[nTokenOffset+1].sValue.replace("an", "anc").replace("AN", "ANC")
 def _g_cond_g3_12 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return (g_morph(lToken[nLastToken+1], ":[AQR]") or g_morph(lToken[nTokenOffset], ":V", ":V.e")) and not g_value(lToken[nLastToken+1], "|que|qu’|sûr|")
 def _g_cond_g3_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_propsub_") and g_morph(lToken[nTokenOffset], ":V")
 def _g_sugg_g3_14 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ite", "itte")
+    return lToken[nTokenOffset+1].sValue.replace("ite", "itte")
 def _g_sugg_g3_15 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("itte", "ite")
+    return lToken[nLastToken-1+1].sValue.replace("itte", "ite")
 def _g_sugg_g3_16 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("itte", "ite")
+    return lToken[nTokenOffset+1].sValue.replace("itte", "ite")
 def _g_sugg_g3_17 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ane", "anne")
+    return lToken[nTokenOffset+1].sValue.replace("ane", "anne")
 def _g_sugg_g3_18 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+4]["sValue"].replace("ane", "anne")
+    return lToken[nTokenOffset+4].sValue.replace("ane", "anne")
 def _g_cond_g3_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+3], "|Cannes|CANNES|")
 def _g_cond_g3_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3806,69 +3838,69 @@ def _g_cond_g3_17 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_18 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A")
 def _g_sugg_g3_19 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("omp", "on").replace("OMP", "ON")
+    return lToken[nTokenOffset+1].sValue.replace("omp", "on").replace("OMP", "ON")
 def _g_sugg_g3_20 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("omt", "ompt").replace("OMT", "OMPT").replace("ont", "ompt").replace("ONT", "OMPT")
+    return lToken[nTokenOffset+1].sValue.replace("omt", "ompt").replace("OMT", "OMPT").replace("ont", "ompt").replace("ONT", "OMPT")
 def _g_cond_g3_19 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|ils|elles|iels|ne|eux|")
 def _g_sugg_g3_21 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("nt", "mp").replace("NT", "MP")
+    return lToken[nTokenOffset+1].sValue.replace("nt", "mp").replace("NT", "MP")
 def _g_cond_g3_20 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:avoir|accorder|donner|laisser|offrir)/")
 def _g_sugg_g3_22 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ô", "o").replace("Ô", "O")
+    return lToken[nTokenOffset+1].sValue.replace("ô", "o").replace("Ô", "O")
 def _g_cond_g3_21 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|l’|un|les|des|ces|")
 def _g_sugg_g3_23 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("sens", "cens").replace("Sens", "Cens").replace("SENS", "CENS")
+    return lToken[nTokenOffset+2].sValue.replace("sens", "cens").replace("Sens", "Cens").replace("SENS", "CENS")
 def _g_sugg_g3_24 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("cens", "sens").replace("Cens", "Sens").replace("CENS", "SENS")
+    return lToken[nTokenOffset+1].sValue.replace("cens", "sens").replace("Cens", "Sens").replace("CENS", "SENS")
 def _g_cond_g3_22 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":[VR]")
 def _g_sugg_g3_25 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("o", "ô").replace("tt", "t")
+    return lToken[nTokenOffset+1].sValue.replace("o", "ô").replace("tt", "t")
 def _g_cond_g3_23 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":Q")
 def _g_sugg_g3_26 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ô", "o").replace("tt", "t")
+    return lToken[nTokenOffset+1].sValue.replace("ô", "o").replace("tt", "t")
 def _g_sugg_g3_27 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ô", "o").replace("t", "tt")
+    return lToken[nTokenOffset+1].sValue.replace("ô", "o").replace("t", "tt")
 def _g_cond_g3_24 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset+2], "|ces|")
 def _g_sugg_g3_28 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("t", "tt").replace("T", "TT")
+    return lToken[nTokenOffset+1].sValue.replace("t", "tt").replace("T", "TT")
 def _g_cond_g3_25 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:f")
 def _g_sugg_g3_29 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("tt", "t").replace("TT", "T")
+    return lToken[nTokenOffset+1].sValue.replace("tt", "t").replace("TT", "T")
 def _g_sugg_g3_30 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ssa", "ça").replace("ss", "c").replace("SSA", "ÇA").replace("SS", "C")
+    return lToken[nTokenOffset+1].sValue.replace("ssa", "ça").replace("ss", "c").replace("SSA", "ÇA").replace("SS", "C")
 def _g_cond_g3_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":Q")
 def _g_sugg_g3_31 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("ssa", "ça").replace("ss", "c").replace("SSA", "ÇA").replace("SS", "C")
+    return lToken[nLastToken-1+1].sValue.replace("ssa", "ça").replace("ss", "c").replace("SSA", "ÇA").replace("SS", "C")
 def _g_sugg_g3_32 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("nud", "nu").replace("NUD", "NU")
+    return lToken[nTokenOffset+1].sValue.replace("nud", "nu").replace("NUD", "NU")
 def _g_sugg_g3_33 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("escell", "écel").replace("essell", "écel").replace("ESCELL", "ÉCEL").replace("ESSELL", "ÉCEL")
+    return lToken[nLastToken-1+1].sValue.replace("escell", "écel").replace("essell", "écel").replace("ESCELL", "ÉCEL").replace("ESSELL", "ÉCEL")
 def _g_sugg_g3_34 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("escell", "écel").replace("essell", "écel").replace("ESCELL", "ÉCEL").replace("ESSELL", "ÉCEL")
+    return lToken[nTokenOffset+1].sValue.replace("escell", "écel").replace("essell", "écel").replace("ESCELL", "ÉCEL").replace("ESSELL", "ÉCEL")
 def _g_cond_g3_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower()
+    return lToken[nTokenOffset+2].sValue.islower()
 def _g_sugg_g3_35 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("imm", "ém").replace("Imm", "Ém")
+    return lToken[nTokenOffset+1].sValue.replace("imm", "ém").replace("Imm", "Ém")
 def _g_cond_g3_28 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D")
 def _g_sugg_g3_36 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("imm", "ém").replace("Imm", "Ém")
+    return lToken[nTokenOffset+2].sValue.replace("imm", "ém").replace("Imm", "Ém")
 def _g_sugg_g3_37 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("émi", "immi").replace("Émi", "Immi")
+    return lToken[nLastToken-1+1].sValue.replace("émi", "immi").replace("Émi", "Immi")
 def _g_sugg_g3_38 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("end", "ind").replace("End", "Ind").replace("END", "IND")
+    return lToken[nTokenOffset+1].sValue.replace("end", "ind").replace("End", "Ind").replace("END", "IND")
 def _g_sugg_g3_39 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("end", "ind").replace("End", "Ind").replace("END", "IND")
+    return lToken[nTokenOffset+3].sValue.replace("end", "ind").replace("End", "Ind").replace("END", "IND")
 def _g_sugg_g3_40 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ind", "end").replace("Ind", "End").replace("IND", "END")
+    return lToken[nTokenOffset+1].sValue.replace("ind", "end").replace("Ind", "End").replace("IND", "END")
 def _g_cond_g3_29 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], "<start>|:C||>[(,]/") and g_morph(lToken[nTokenOffset+2], ":N", ":[AG]")
 def _g_cond_g3_30 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3884,11 +3916,11 @@ def _g_cond_g3_34 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_35 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:abandonner|céder|résister)/") and not g_value(lToken[nLastToken+1], "|de|d’|")
 def _g_cond_g3_36 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[is]", ":G") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[is]", ":G") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1].sValue.islower()
 def _g_cond_g3_37 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":N.*:[is]", ":[GA]") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+3], ":N.*:[is]", ":[GA]") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1].sValue.islower()
 def _g_cond_g3_38 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":M", ":[GA]") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":M", ":[GA]") and g_morph(lToken[nLastToken-2+1], ":[QA]", ":M") and lToken[nLastToken-2+1].sValue.islower()
 def _g_cond_g3_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":N.*:m:[si]", ":(?:[AWG]|V0a)") and g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]")
 def _g_cond_g3_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3900,75 +3932,75 @@ def _g_cond_g3_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:[me]:[sp]")
 def _g_sugg_g3_41 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("î", "i")
+    return lToken[nTokenOffset+2].sValue.replace("î", "i")
 def _g_sugg_g3_42 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("o", "au").replace("O", "AU")
+    return lToken[nTokenOffset+3].sValue.replace("o", "au").replace("O", "AU")
 def _g_cond_g3_44 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ">septique/")
 def _g_sugg_g3_43 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("o", "au").replace("O", "AU")
+    return lToken[nLastToken-1+1].sValue.replace("o", "au").replace("O", "AU")
 def _g_sugg_g3_44 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("n", "nc").replace("N", "NC")
+    return lToken[nLastToken-1+1].sValue.replace("n", "nc").replace("N", "NC")
 def _g_sugg_g3_45 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("and", "ant").replace("AND", "ANT")
+    return lToken[nTokenOffset+1].sValue.replace("and", "ant").replace("AND", "ANT")
 def _g_cond_g3_45 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not (g_value(lToken[nTokenOffset], "|une|") and look(sSentence[lToken[nLastToken]["nEnd"]:], "(?i)^ +pour toute") )
+    return not (g_value(lToken[nTokenOffset], "|une|") and look(sSentence[lToken[nLastToken].nEnd:], "(?i)^ +pour toute") )
 def _g_cond_g3_46 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:(?:f|e:p)")
 def _g_sugg_g3_46 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("iai", "iè").replace("IAI", "IÈ")
+    return lToken[nTokenOffset+1].sValue.replace("iai", "iè").replace("IAI", "IÈ")
 def _g_sugg_g3_47 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("iè", "iai").replace("IÈ", "IAI")
+    return lToken[nTokenOffset+2].sValue.replace("iè", "iai").replace("IÈ", "IAI")
 def _g_sugg_g3_48 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("û", "u").replace("t", "tt").replace("Û", "U").replace("T", "TT")
+    return lToken[nTokenOffset+1].sValue.replace("û", "u").replace("t", "tt").replace("Û", "U").replace("T", "TT")
 def _g_cond_g3_47 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-2+1], "|de|")
 def _g_sugg_g3_49 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("outt", "oût").replace("OUTT", "OÛT")
+    return lToken[nTokenOffset+1].sValue.replace("outt", "oût").replace("OUTT", "OÛT")
 def _g_sugg_g3_50 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("out", "outt").replace("OUT", "OUTT").replace("oût", "outt").replace("OÛT", "OUTT")
+    return lToken[nLastToken-1+1].sValue.replace("out", "outt").replace("OUT", "OUTT").replace("oût", "outt").replace("OÛT", "OUTT")
 def _g_sugg_g3_51 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("outt", "oût").replace("OUTT", "OÛT")
+    return lToken[nLastToken-1+1].sValue.replace("outt", "oût").replace("OUTT", "OÛT")
 def _g_cond_g3_48 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken-1+1], ":1p")
 def _g_cond_g3_49 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken-1+1], ":2p")
 def _g_sugg_g3_52 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("û", "u").replace("Û", "U")
+    return lToken[nTokenOffset+2].sValue.replace("û", "u").replace("Û", "U")
 def _g_sugg_g3_53 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("û", "u").replace("Û", "U")
+    return lToken[nTokenOffset+1].sValue.replace("û", "u").replace("Û", "U")
 def _g_sugg_g3_54 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("u", "û").replace("U", "Û")
+    return lToken[nTokenOffset+1].sValue.replace("u", "û").replace("U", "Û")
 def _g_sugg_g3_55 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][3:]
+    return lToken[nTokenOffset+1].sValue[3:]
 def _g_sugg_g3_56 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].lower().replace("chass", "lâch")
+    return lToken[nTokenOffset+1].sValue.lower().replace("chass", "lâch")
 def _g_cond_g3_50 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 4)
 def _g_sugg_g3_57 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ât", "at").replace("ÂT", "AT")
+    return lToken[nTokenOffset+1].sValue.replace("ât", "at").replace("ÂT", "AT")
 def _g_sugg_g3_58 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("at", "ât").replace("AT", "ÂT")
+    return lToken[nTokenOffset+1].sValue.replace("at", "ât").replace("AT", "ÂT")
 def _g_sugg_g3_59 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("u", "û").replace("U", "Û")
+    return lToken[nLastToken-1+1].sValue.replace("u", "û").replace("U", "Û")
 def _g_cond_g3_51 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D", ">de/")
 def _g_sugg_g3_60 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ens", "ans").replace("ENS", "ANS")
+    return lToken[nTokenOffset+1].sValue.replace("ens", "ans").replace("ENS", "ANS")
 def _g_sugg_g3_61 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ans", "ens").replace("ANS", "ENS")
+    return lToken[nTokenOffset+1].sValue.replace("ans", "ens").replace("ANS", "ENS")
 def _g_sugg_g3_62 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nLastToken-1+1].sValue.replace("a", "â").replace("A", "Â")
 def _g_cond_g3_52 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":V", ":Q") and not g_value(lToken[nTokenOffset], "|se|s’|")
 def _g_cond_g3_53 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-3+1], ":V")
 def _g_sugg_g3_63 (lToken, nTokenOffset, nLastToken):
-    return suggVerbFrom("pécher", lToken[nTokenOffset+1]["sValue"])
+    return suggVerbFrom("pécher", lToken[nTokenOffset+1].sValue)
 def _g_sugg_g3_64 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("êch", "éch").replace("er", "é").replace("ÊCH", "ÉCH").replace("ER", "É")
+    return lToken[nLastToken-1+1].sValue.replace("êch", "éch").replace("er", "é").replace("ÊCH", "ÉCH").replace("ER", "É")
 def _g_sugg_g3_65 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("éch", "êch").replace("èch", "êch").replace("ÉCH", "ÊCH").replace("ÈCH", "ÊCH")
+    return lToken[nTokenOffset+1].sValue.replace("éch", "êch").replace("èch", "êch").replace("ÉCH", "ÊCH").replace("ÈCH", "ÊCH")
 def _g_cond_g3_54 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|je|tu|il|elle|on|ne|n’|") and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 3)
 def _g_cond_g3_55 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3976,11 +4008,11 @@ def _g_cond_g3_55 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_56 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nLastToken-1+1], ":V1..t") and g_morph(lToken[nLastToken+1], ":(?:Ov|[123][sp]|P)|<end>|>(?:,|par)/")
 def _g_sugg_g3_66 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:s")
 def _g_sugg_g3_67 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:s")
 def _g_sugg_g3_68 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":s")
 def _g_cond_g3_57 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA]") and g_morph(lToken[nTokenOffset+4], ":[NA]", ":V0")
 def _g_cond_g3_58 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -3994,59 +4026,59 @@ def _g_cond_g3_61 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_62 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1)
 def _g_sugg_g3_69 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("out", "oot").replace("OUT", "OOT")
+    return lToken[nTokenOffset+1].sValue.replace("out", "oot").replace("OUT", "OOT")
 def _g_sugg_g3_70 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("etr", "ebr").replace("ETR", "EBR").replace("dét", "reb").replace("Dét", "Reb").replace("DÉT", "REB")
+    return lToken[nTokenOffset+1].sValue.replace("etr", "ebr").replace("ETR", "EBR").replace("dét", "reb").replace("Dét", "Reb").replace("DÉT", "REB")
 def _g_sugg_g3_71 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("od", "ôd").replace("OD", "ÔD")
+    return lToken[nTokenOffset+1].sValue.replace("od", "ôd").replace("OD", "ÔD")
 def _g_sugg_g3_72 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ale", "alle").replace("ALE", "ALLE")
+    return lToken[nTokenOffset+1].sValue.replace("ale", "alle").replace("ALE", "ALLE")
 def _g_sugg_g3_73 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("alle", "ale").replace("ALLE", "ALE")
+    return lToken[nTokenOffset+2].sValue.replace("alle", "ale").replace("ALLE", "ALE")
 def _g_cond_g3_63 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":D.*:[me]")
 def _g_sugg_g3_74 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("scep","sep").replace("SCEP","SEP")
+    return lToken[nTokenOffset+2].sValue.replace("scep","sep").replace("SCEP","SEP")
 def _g_cond_g3_64 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">plaie/")
 def _g_sugg_g3_75 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("sep", "scep").replace("SEP", "SCEP")
+    return lToken[nTokenOffset+2].sValue.replace("sep", "scep").replace("SEP", "SCEP")
 def _g_cond_g3_65 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph0(lToken[nTokenOffset+3], ":N.*:[me]:[si]", ":Y")
 def _g_cond_g3_66 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph0(lToken[nTokenOffset+3], ":[NA]", ":[YP]")
 def _g_cond_g3_67 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], " soit ")
+    return not look(sSentence[lToken[nLastToken].nEnd:], " soit ")
 def _g_sugg_g3_76 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("lé", "let").replace("LÉ", "LET")
+    return lToken[nTokenOffset+1].sValue.replace("lé", "let").replace("LÉ", "LET")
 def _g_sugg_g3_77 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("et", "é").replace("ET", "É")
+    return lToken[nLastToken-1+1].sValue.replace("et", "é").replace("ET", "É")
 def _g_sugg_g3_78 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("et", "é").replace("ET", "É")
+    return lToken[nTokenOffset+1].sValue.replace("et", "é").replace("ET", "É")
 def _g_cond_g3_68 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|lourde|lourdes|") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[aA]ccompl|[dD]él[éè]gu")
+    return not g_value(lToken[nTokenOffset], "|lourde|lourdes|") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "[aA]ccompl|[dD]él[éè]gu")
 def _g_sugg_g3_79 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("â", "a").replace("Â", "A")
+    return lToken[nTokenOffset+1].sValue.replace("â", "a").replace("Â", "A")
 def _g_sugg_g3_80 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("âc", "ac").replace("ÂC", "AC")
+    return lToken[nTokenOffset+1].sValue.replace("âc", "ac").replace("ÂC", "AC")
 def _g_sugg_g3_81 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("â", "a").replace("Â", "A")
+    return lToken[nLastToken-1+1].sValue.replace("â", "a").replace("Â", "A")
 def _g_sugg_g3_82 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+1].sValue.replace("a", "â").replace("A", "Â")
 def _g_sugg_g3_83 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ac", "âc").replace("AC", "ÂC")
+    return lToken[nTokenOffset+1].sValue.replace("ac", "âc").replace("AC", "ÂC")
 def _g_sugg_g3_84 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"].replace("a", "â").replace("A", "Â")
+    return lToken[nTokenOffset+3].sValue.replace("a", "â").replace("A", "Â")
 def _g_cond_g3_69 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D", ":R")
 def _g_sugg_g3_85 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("au", "ô").replace("AU", "Ô")
+    return lToken[nTokenOffset+1].sValue.replace("au", "ô").replace("AU", "Ô")
 def _g_cond_g3_70 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nLastToken-1+1], ":[123]s")
 def _g_sugg_g3_86 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("énén", "enim").replace("ÉNÉN", "ENIM")
+    return lToken[nTokenOffset+2].sValue.replace("énén", "enim").replace("ÉNÉN", "ENIM")
 def _g_sugg_g3_87 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("enim", "énén").replace("ENIM", "ÉNÉN")
+    return lToken[nTokenOffset+2].sValue.replace("enim", "énén").replace("ENIM", "ÉNÉN")
 def _g_cond_g3_71 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ">,|<start>|:V", ":D")
 def _g_cond_g3_72 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4072,7 +4104,7 @@ def _g_cond_g3_81 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_82 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*")
 def _g_sugg_g3_88 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+3]["sValue"])
+    return suggSing(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_83 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*") or ( g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":[si]") and g_morph(lToken[nTokenOffset+1], ":[RCY]", ">(?:e[tn]|ou)/") and not (g_morph(lToken[nTokenOffset+1], ":Rv") and g_morph(lToken[nTokenOffset+3], ":Y")) )
 def _g_cond_g3_84 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4080,43 +4112,43 @@ def _g_cond_g3_84 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_85 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|et|ou|de|") and not g_value(lToken[nTokenOffset+2], "|air|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_86 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":m", "*") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", "*") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ( (g_morph(lToken[nTokenOffset+2], ":m", "*") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", "*") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_89 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+3]["sValue"], False)
+    return switchGender(lToken[nTokenOffset+3].sValue, False)
 def _g_cond_g3_87 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasFemForm(lToken[nTokenOffset+2]["sValue"])
+    return bCondMemo and hasFemForm(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g3_90 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+2]["sValue"])
+    return switchGender(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_88 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[si]", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[si]", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_89 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+3], "|air|") and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_90 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+3], ":m", "*") and g_morph(lToken[nTokenOffset+4], ":f", "*")) or (g_morph(lToken[nTokenOffset+3], ":f", "*") and g_morph(lToken[nTokenOffset+4], ":m", "*")) ) and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"]) and not g_morph(lToken[nTokenOffset], ":[NA]")
+    return ( (g_morph(lToken[nTokenOffset+3], ":m", "*") and g_morph(lToken[nTokenOffset+4], ":f", "*")) or (g_morph(lToken[nTokenOffset+3], ":f", "*") and g_morph(lToken[nTokenOffset+4], ":m", "*")) ) and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue) and not g_morph(lToken[nTokenOffset], ":[NA]")
 def _g_sugg_g3_91 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+4]["sValue"], False)
+    return switchGender(lToken[nTokenOffset+4].sValue, False)
 def _g_cond_g3_91 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasFemForm(lToken[nTokenOffset+3]["sValue"])
+    return bCondMemo and hasFemForm(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_92 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+3]["sValue"])
+    return switchGender(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_92 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[si]", "*") and g_morph(lToken[nTokenOffset+4], ":p", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"]) and not g_morph(lToken[nTokenOffset], ":[NA]")
+    return g_morph(lToken[nTokenOffset+3], ":[si]", "*") and g_morph(lToken[nTokenOffset+4], ":p", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue) and not g_morph(lToken[nTokenOffset], ":[NA]")
 def _g_sugg_g3_93 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+4]["sValue"])
+    return suggSing(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_93 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":3[sp]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_sugg_g3_94 (lToken, nTokenOffset, nLastToken):
     return g_suggAgree(lToken[nTokenOffset+5], lToken[nTokenOffset+3])
 def _g_cond_g3_94 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_95 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m:[si]", "*") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:f", "*")
 def _g_sugg_g3_95 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+4]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_96 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", "*") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:m", "*")
 def _g_sugg_g3_96 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+4]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_97 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", "*") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", "*")
 def _g_cond_g3_98 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4124,25 +4156,25 @@ def _g_cond_g3_98 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_g3_99 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[me]:[si]")
 def _g_sugg_g3_97 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+2]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_100 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[me]:[si]")
 def _g_cond_g3_101 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[me]:[si]") and g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[me]:[si]")
 def _g_sugg_g3_98 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+5]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+5].sValue, True)
 def _g_cond_g3_102 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[fe]:[si]")
 def _g_sugg_g3_99 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+2]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g3_103 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[fe]:[si]")
 def _g_sugg_g3_100 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+4]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+4].sValue, True)
 def _g_cond_g3_104 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[fe]:[si]") and g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[fe]:[si]")
 def _g_sugg_g3_101 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+5]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+5].sValue, True)
 def _g_cond_g3_105 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[si]")
 def _g_cond_g3_106 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4150,27 +4182,27 @@ def _g_cond_g3_106 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_107 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo
 def _g_sugg_g3_102 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+4]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+4].sValue, True)
 def _g_cond_g3_108 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:f:[si]", ":A.*:p") and g_morph(lToken[nTokenOffset+4], ":A.*:m:[si]", ":A.*:p")
 def _g_sugg_g3_103 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+2]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+2].sValue, True)
 def _g_sugg_g3_104 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+5]["sValue"])
+    return suggSing(lToken[nTokenOffset+5].sValue)
 def _g_cond_g3_109 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D")
 def _g_cond_g3_110 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":(?:e|m|P|G|W|[123][sp]|Y)")
 def _g_sugg_g3_105 (lToken, nTokenOffset, nLastToken):
-    return suggLesLa(lToken[nTokenOffset+3]["sValue"])
+    return suggLesLa(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_111 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasMasForm(lToken[nTokenOffset+3]["sValue"])
+    return bCondMemo and hasMasForm(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_106 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+3]["sValue"], True)
+    return suggMasSing(lToken[nTokenOffset+3].sValue, True)
 def _g_cond_g3_112 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":(?:[siPGWY]|[123][sp])")
 def _g_sugg_g3_107 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+3]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_113 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":(?:e|m|P|G|W|[123][sp]|Y)") or ( g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":[me]") and g_morph(lToken[nTokenOffset+1], ":[RCY]", ">(?:e[tn]|ou)/") and not (g_morph(lToken[nTokenOffset+1], ":Rv") and g_morph(lToken[nTokenOffset+3], ":Y")) )
 def _g_cond_g3_114 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4182,25 +4214,25 @@ def _g_cond_g3_116 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_117 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and not g_value(lToken[nTokenOffset], "|et|ou|de|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_118 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_119 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":A.*:e:[si]")
 def _g_cond_g3_120 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_121 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D") and not g_morph(lToken[nTokenOffset], ":[NA]") and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_122 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]", ":(?:B|G|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:f", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]", ":(?:B|G|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:f", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_123 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+3], ":A.*:e:[si]")
 def _g_cond_g3_124 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+4]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+4].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_125 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":3[sp]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_sugg_g3_108 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"])
+    return suggMasSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_126 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|et|ou|") and g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[fp]", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return not g_value(lToken[nTokenOffset], "|et|ou|") and g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[fp]", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_127 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[me]:[si]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0|A.*:[me]:[si])|;C")
 def _g_cond_g3_128 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4208,9 +4240,9 @@ def _g_cond_g3_128 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_129 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:e|f|P|G|W|M|[1-3][sp]|Y)")
 def _g_sugg_g3_109 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+3]["sValue"], True)
+    return suggFemSing(lToken[nTokenOffset+3].sValue, True)
 def _g_sugg_g3_110 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+3]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_130 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:e|f|P|G|W|M|[1-3][sp]|Y)") or ( g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":[Mfe]") and g_morph(lToken[nTokenOffset+1], ":[RCY]", ">(?:e[tn]|ou)/") and not (g_morph(lToken[nTokenOffset+1], ":(?:Rv|C)") and g_morph(lToken[nTokenOffset+3], ":Y")) )
 def _g_cond_g3_131 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4220,39 +4252,39 @@ def _g_cond_g3_132 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_133 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and not g_value(lToken[nTokenOffset], "|et|ou|de|d’|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_134 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_135 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":A.*:e:[si]") and not g_value(lToken[nTokenOffset], "|à|")
 def _g_cond_g3_136 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D") and not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/") and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_137 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]", ":(?:B|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:m", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]", ":(?:B|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:m", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_138 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_139 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and g_morph(lToken[nTokenOffset+3], ":A.*:e:[si]") and not hasFemForm(lToken[nTokenOffset+4]["sValue"])
+    return bCondMemo and g_morph(lToken[nTokenOffset+3], ":A.*:e:[si]") and not hasFemForm(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_140 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":3[sp]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_sugg_g3_111 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"])
+    return suggFemSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_141 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset], "|et|ou|") and g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G|P)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[mp]", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return not g_value(lToken[nTokenOffset], "|et|ou|") and g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G|P)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[mp]", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_142 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[fe]:[si]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0|A.*:[fe]:[si])|;C")
 def _g_cond_g3_143 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[fe]:[si]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0)|;C")
 def _g_cond_g3_144 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ((g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:B|e|G|V0|f)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":(?:B|e|G|V0|m)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*"))) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ((g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:B|e|G|V0|f)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":(?:B|e|G|V0|m)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*"))) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_112 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+2]["sValue"], False)
+    return switchGender(lToken[nTokenOffset+2].sValue, False)
 def _g_cond_g3_145 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":(?:G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":(?:G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_146 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:i")
 def _g_cond_g3_147 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ((g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:B|e|G|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":(?:B|e|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:m", "*"))) and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return ((g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:B|e|G|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":(?:B|e|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:m", "*"))) and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_148 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":(?:G|V0)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":(?:G|V0)") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_149 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+3], ":[NA].*:i")
 def _g_sugg_g3_113 (lToken, nTokenOffset, nLastToken):
@@ -4260,39 +4292,39 @@ def _g_sugg_g3_113 (lToken, nTokenOffset, nLastToken):
 def _g_cond_g3_150 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":[GWme]")
 def _g_cond_g3_151 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and hasMasForm(lToken[nTokenOffset+2]["sValue"])
+    return bCondMemo and hasMasForm(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_152 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:p", ":[siGW]")
 def _g_cond_g3_153 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[efGW]")
 def _g_sugg_g3_114 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+2]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_154 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":(?:e|m|G|W|V0|3s|Y)")
 def _g_cond_g3_155 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:f", ":(?:e|m|G|W|V0|3s)")
 def _g_sugg_g3_115 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+3]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+3].sValue, True)
 def _g_cond_g3_156 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:e|f|G|W|V0|3s|P)") and not ( lToken[nTokenOffset+2]["sValue"] == "demi" and g_morph(lToken[nLastToken+1], ":N.*:f", "*") )
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:e|f|G|W|V0|3s|P)") and not ( lToken[nTokenOffset+2].sValue == "demi" and g_morph(lToken[nLastToken+1], ":N.*:f", "*") )
 def _g_cond_g3_157 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:e|f|G|W|V0|3s)")
 def _g_sugg_g3_116 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+3]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+3].sValue, True)
 def _g_cond_g3_158 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|et|ou|d’|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_159 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_160 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/") and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_161 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_162 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_cond_g3_163 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"] != "fois" and g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return lToken[nTokenOffset+2].sValue != "fois" and g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_164 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"] != "fois" and g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return lToken[nTokenOffset+3].sValue != "fois" and g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:p", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_165 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_cond_g3_166 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4304,7 +4336,7 @@ def _g_cond_g3_168 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_169 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ">[bcçdfgjklmnpqrstvwxz].+:[NA].*:m", ":[efGW]")
 def _g_sugg_g3_117 (lToken, nTokenOffset, nLastToken):
-    return suggCeOrCet(lToken[nTokenOffset+2]["sValue"])
+    return suggCeOrCet(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_170 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:s", ":[GWme]")
 def _g_cond_g3_171 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4314,27 +4346,27 @@ def _g_cond_g3_172 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_173 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|et|ou|de|d’|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_174 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[pf]", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[pf]", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_175 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D")
 def _g_cond_g3_176 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ">[bcçdfgjklmnpqrstvwxz].*:[NA].*:f", ":[GWme]")
 def _g_sugg_g3_118 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("on", "a").replace("ON", "A")
+    return lToken[nTokenOffset+1].sValue.replace("on", "a").replace("ON", "A")
 def _g_sugg_g3_119 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+2]["sValue"])
+    return suggSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_177 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:B|G|e|V0|f)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:f", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":(?:B|G|e|V0|f)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:f", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_178 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæ].*:[NAQ].*:f", ":(?:B|G|e|V0|m)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuûyœæ].*:[NAQ].*:f", ":(?:B|G|e|V0|m)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_179 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_180 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:B|G|e|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:f", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:m", ":(?:B|G|e|V0|f)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:f", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_181 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ">[aâeéèêiîoôuûyœæ].*:[NA].*:f", ":(?:B|G|e|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ">[aâeéèêiîoôuûyœæ].*:[NA].*:f", ":(?:B|G|e|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_182 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_183 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[si]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_cond_g3_184 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4342,11 +4374,11 @@ def _g_cond_g3_184 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_185 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ">[aâeéèêiîoôuûyœæh]")
 def _g_cond_g3_186 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_187 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ">[bcçdfgjklmnpqrstvwxz].*:[NA].*:[me]:[si]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[pf]", "*")
 def _g_cond_g3_188 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return re.search("^[aâeéèêiîoôuûyœæ]", lToken[nTokenOffset+2]["sValue"])
+    return re.search("^[aâeéèêiîoôuûyœæ]", lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_189 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m:[si]", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[pf]", "*")
 def _g_cond_g3_190 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4356,21 +4388,21 @@ def _g_cond_g3_191 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_192 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_tag(lToken[nTokenOffset+1], "_CAP_") and g_morph(lToken[nTokenOffset+1], ":N")) and not (g_tag(lToken[nTokenOffset+1], "eg1mot") and g_morph(lToken[nTokenOffset+2], ":V.[ea].:3[sp]"))
 def _g_sugg_g3_120 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]+"on"
+    return lToken[nTokenOffset+1].sValue[:-1]+"on"
 def _g_cond_g3_193 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and not re.search("(?i)^[aâeéèêiîoôuûyœæ]", lToken[nTokenOffset+2]["sValue"]) and hasFemForm(lToken[nTokenOffset+2]["sValue"])
+    return bCondMemo and not re.search("(?i)^[aâeéèêiîoôuûyœæ]", lToken[nTokenOffset+2].sValue) and hasFemForm(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_194 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NAQ].*:[fe]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NAQ].*:[fe]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_195 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NAQ].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NAQ].*:[si]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_196 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[NAQ]|>(?:et|ou)/") and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_197 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[fe]", ":(?:B|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[fe]", ":(?:B|G|V0|m)") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:m", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_198 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"])
+    return g_morph(lToken[nTokenOffset+3], ":[NAQ].*:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:p", ":[GWsi]") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_199 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[pm]", "*") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[si]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[pm]", "*") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_200 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:p", ":[siG]") and not g_value(lToken[nLastToken+1], "|que|qu’|")
 def _g_cond_g3_201 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4382,55 +4414,55 @@ def _g_cond_g3_203 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_204 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_sugg_g3_121 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+3]["sValue"])
+    return suggPlur(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_205 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D") and ( g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") or (g_morph(lToken[nTokenOffset+3], ":[NA].*:s", ":[pi]|>avoir/") and g_morph(lToken[nTokenOffset+1], ":[RC]", ">(?:e[tn]|ou|puis)/") and not (g_morph(lToken[nTokenOffset+1], ":Rv") and g_morph(lToken[nTokenOffset+3], ":Y"))) ) and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]")) and not (g_value(lToken[nTokenOffset+1], "|que|") and g_morph(lToken[nTokenOffset], ">tel/") and g_morph(lToken[nTokenOffset+3], ":3[sp]"))
 def _g_cond_g3_206 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:s", ":[ipYPGW]") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_sugg_g3_122 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+3]["sValue"], True)
+    return switchGender(lToken[nTokenOffset+3].sValue, True)
 def _g_sugg_g3_123 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+2]["sValue"], True)
+    return switchGender(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g3_207 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
 def _g_cond_g3_208 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":D") and not g_morph(lToken[nTokenOffset], ":[NA]") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_sugg_g3_124 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+4]["sValue"], True)
+    return switchGender(lToken[nTokenOffset+4].sValue, True)
 def _g_cond_g3_209 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
 def _g_sugg_g3_125 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+4]["sValue"])
+    return suggPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_210 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":3[sp]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5]) and not (g_value(lToken[nLastToken+1], "|et|") and g_morph(lToken[nLastToken-1+1], "#G") and g_morph(g_token(lToken, nLastToken+2), "#G"))
 def _g_cond_g3_211 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:s", ":(?:[ipGW]|[123][sp])") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_sugg_g3_126 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggPlur(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_212 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:s", ":[ipGW]") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_cond_g3_213 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:f:p", ":[mGW]")
 def _g_sugg_g3_127 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g3_128 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ts", "tes").replace("TS", "TES")
+    return lToken[nTokenOffset+1].sValue.replace("ts", "tes").replace("TS", "TES")
 def _g_cond_g3_214 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:m:p", ":[fGW]")
 def _g_sugg_g3_129 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g3_130 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("tes", "ts").replace("TES", "TS")
+    return lToken[nTokenOffset+1].sValue.replace("tes", "ts").replace("TES", "TS")
 def _g_cond_g3_215 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ">[bcçdfgjklmnpqrstvwxz].*:m", ":f")
 def _g_cond_g3_216 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].endswith("x") or lToken[nTokenOffset+1]["sValue"].endswith("X")
+    return lToken[nTokenOffset+1].sValue.endswith("x") or lToken[nTokenOffset+1].sValue.endswith("X")
 def _g_cond_g3_217 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo
 def _g_cond_g3_218 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":[emGWP]")
 def _g_sugg_g3_131 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+2]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g3_219 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:s", ":(?:[ipGWP]|V0)") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_cond_g3_220 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4438,7 +4470,7 @@ def _g_cond_g3_220 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_221 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[efGWP]")
 def _g_sugg_g3_132 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+2]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+2].sValue, True)
 def _g_cond_g3_222 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:s", ":[ipGWP]") and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":[NA]"))
 def _g_cond_g3_223 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4446,49 +4478,49 @@ def _g_cond_g3_223 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_224 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|et|ou|de|d’|au|aux|") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_cond_g3_225 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A")) and not (g_value(lToken[nTokenOffset+1], "|de|d’|") and g_value(lToken[nTokenOffset], "|un|une|"))
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A")) and not (g_value(lToken[nTokenOffset+1], "|de|d’|") and g_value(lToken[nTokenOffset], "|un|une|"))
 def _g_cond_g3_226 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_cond_g3_227 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
 def _g_sugg_g3_133 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+3]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_228 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/") and not g_morph(lToken[nTokenOffset+3], ">seul/")
 def _g_sugg_g3_134 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+4]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+4].sValue, True)
 def _g_cond_g3_229 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+4]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A")) and not (g_value(lToken[nTokenOffset+1], "|de|d’|") and g_value(lToken[nTokenOffset], "|un|une|"))
+    return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+4].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A")) and not (g_value(lToken[nTokenOffset+1], "|de|d’|") and g_value(lToken[nTokenOffset], "|un|une|"))
 def _g_sugg_g3_135 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+4]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_230 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_sugg_g3_136 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggMasPlur(lToken[nLastToken-1+1].sValue)
 def _g_sugg_g3_137 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+3]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_138 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+4]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+4].sValue, True)
 def _g_sugg_g3_139 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+4]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_231 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[pi]") and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+5])
 def _g_sugg_g3_140 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggFemPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_232 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:et|ou)/|:R") and not g_morph(lToken[nTokenOffset+3], ">(?:seul|minimum|maximum)/")
 def _g_cond_g3_233 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":(?:B|G|V0)") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
 def _g_cond_g3_234 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return (g_morph(lToken[nTokenOffset], ":(?:[VRBXÉ]|Cs)|>comme/|<start>|>[(,]", "*") or g_morph(lToken[nTokenOffset+3], ":N", ":[AQ]")) and not g_morph(lToken[nTokenOffset+3], ">(?:seul|minimum|maximum)/")
 def _g_cond_g3_235 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ( (g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:f", "*")) or (g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:m", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_236 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+3], ":G|>a/") and g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3])
 def _g_da_g3_16 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+3], "", ":V")
 def _g_cond_g3_237 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and not g_morph(lToken[nTokenOffset+2], ":[123][sp]") and lToken[nTokenOffset+4]["sValue"].islower() and not g_morph(lToken[nTokenOffset+4], ">seul/")
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and not g_morph(lToken[nTokenOffset+2], ":[123][sp]") and lToken[nTokenOffset+4].sValue.islower() and not g_morph(lToken[nTokenOffset+4], ">seul/")
 def _g_cond_g3_238 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m:[pi]", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:f", "*")
 def _g_cond_g3_239 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4504,7 +4536,7 @@ def _g_cond_g3_243 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_244 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[me]:[pi]") and g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[me]:[pi]")
 def _g_sugg_g3_141 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+5]["sValue"], True)
+    return suggFemPlur(lToken[nTokenOffset+5].sValue, True)
 def _g_cond_g3_245 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[fe]:[pi]")
 def _g_cond_g3_246 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4512,7 +4544,7 @@ def _g_cond_g3_246 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_247 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":A.*:[fe]:[pi]") and g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[fe]:[pi]")
 def _g_sugg_g3_142 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+5]["sValue"], True)
+    return suggMasPlur(lToken[nTokenOffset+5].sValue, True)
 def _g_cond_g3_248 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":A", ":A.*:[pi]")
 def _g_cond_g3_249 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4520,23 +4552,23 @@ def _g_cond_g3_249 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_250 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:f:[pi]", ":A.*:s") and g_morph(lToken[nTokenOffset+4], ":A.*:m:[pi]", ":A.*:s")
 def _g_sugg_g3_143 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+5]["sValue"])
+    return suggPlur(lToken[nTokenOffset+5].sValue)
 def _g_cond_g3_251 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and not g_morph(lToken[nTokenOffset+2], ":[123][sp]") and lToken[nTokenOffset+4]["sValue"].islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bune? de +$")
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and not g_morph(lToken[nTokenOffset+2], ":[123][sp]") and lToken[nTokenOffset+4].sValue.islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bune? de +$")
 def _g_cond_g3_252 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4]["sValue"].islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bune? de +$") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[fs]", "*")
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4].sValue.islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bune? de +$") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[fs]", "*")
 def _g_cond_g3_253 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[me]:[pi]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0|A.*:[me]:[pi])|;C")
 def _g_cond_g3_254 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[me]:[pi]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0)|;C")
 def _g_cond_g3_255 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4]["sValue"].islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bune? de +$") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[pi]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[ms]", "*")
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4].sValue.islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bune? de +$") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[pi]") and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[pi]", ":(?:[123][sp]|G|P|B)|;C") and g_morph(lToken[nTokenOffset+4], ":[NAQ].*:[ms]", "*")
 def _g_cond_g3_256 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[fe]:[pi]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0|A.*:[fe]:[pi])|;C")
 def _g_cond_g3_257 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":D") and g_morph(lToken[nTokenOffset+2], ":A.*:[fe]:[pi]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0)|;C")
 def _g_cond_g3_258 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4]["sValue"].islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bune? de +$")
+    return g_morph(lToken[nTokenOffset], "<start>|:V", "*") and lToken[nTokenOffset+4].sValue.islower() and not g_morph(lToken[nTokenOffset+4], ">seul/") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bune? de +$")
 def _g_cond_g3_259 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:[pi]", ":(?:G|W|V0)|;C") and g_morph(lToken[nTokenOffset+4], ":A", ":(?:G|W|V0)|;C")
 def _g_cond_g3_260 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4568,7 +4600,7 @@ def _g_cond_g3_272 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_273 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|tels|telles|")
 def _g_sugg_g3_144 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]
+    return lToken[nTokenOffset+1].sValue[:-1]
 def _g_cond_g3_274 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|tel|telle|") and g_morph(lToken[nTokenOffset+4], ":[NA].*:[fe]", ":m")
 def _g_cond_g3_275 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4586,31 +4618,31 @@ def _g_cond_g3_280 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_281 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+5], ":[NA].*:f", ":[me]")
 def _g_cond_g3_282 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"] != "cents"
+    return lToken[nTokenOffset+2].sValue != "cents"
 def _g_cond_g3_283 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":A.*:f")
 def _g_sugg_g3_145 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"], True)
+    return suggMasSing(lToken[nLastToken-1+1].sValue, True)
 def _g_cond_g3_284 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nLastToken-1+1], ":A.*:p")
 def _g_cond_g3_285 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":A.*:m")
 def _g_sugg_g3_146 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"], True)
+    return suggFemSing(lToken[nLastToken-1+1].sValue, True)
 def _g_sugg_g3_147 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nLastToken-1+1]["sValue"], True)
+    return suggMasPlur(lToken[nLastToken-1+1].sValue, True)
 def _g_cond_g3_286 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nLastToken-1+1], ":A.*:s")
 def _g_sugg_g3_148 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nLastToken-1+1]["sValue"], True)
+    return suggFemPlur(lToken[nLastToken-1+1].sValue, True)
 def _g_cond_g3_287 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset+1], "|neuf|mille|") and g_morph(lToken[nTokenOffset+2], ":[NA].*:s", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1]["sValue"])
+    return not g_value(lToken[nTokenOffset+1], "|neuf|mille|") and g_morph(lToken[nTokenOffset+2], ":[NA].*:s", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1].sValue)
 def _g_cond_g3_288 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fs]", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fs]", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1].sValue)
 def _g_cond_g3_289 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:f", ":[me]")
 def _g_cond_g3_290 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[ms]", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[ms]", "*") and not g_morph(lToken[nTokenOffset], ":D.*:s") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^[IVXLDM]+$", lToken[nTokenOffset+1].sValue)
 def _g_cond_g3_291 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]")
 def _g_cond_g3_292 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4620,59 +4652,59 @@ def _g_cond_g3_293 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_294 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_value(lToken[nTokenOffset+2], "|Rois|Corinthiens|Thessaloniciens|") and not (g_value(lToken[nTokenOffset], "|à|") and g_meta(g_token(lToken, nTokenOffset+1-2), "NUM"))
 def _g_cond_g3_295 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_value(lToken[nTokenOffset], "|/|") and not re.search("^0*[01](?:[,.][0-9]+|)$", lToken[nTokenOffset+1]["sValue"]) and g_morph(lToken[nTokenOffset+2], ":[NA].*:s", "*") and not g_morph(lToken[nTokenOffset], ":(?:N|D.*:s)") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|")
+    return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_value(lToken[nTokenOffset], "|/|") and not re.search("^0*[01](?:[,.][0-9]+|)$", lToken[nTokenOffset+1].sValue) and g_morph(lToken[nTokenOffset+2], ":[NA].*:s", "*") and not g_morph(lToken[nTokenOffset], ":(?:N|D.*:s)") and not g_value(lToken[nTokenOffset+2], "|maximum|minimum|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|")
 def _g_cond_g3_296 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset+2], "|maximum|minimum|fois|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^0*[01](?:,[0-9]+|)$", lToken[nTokenOffset+1]["sValue"]) and not g_morph(lToken[nTokenOffset], ">(?:et|ou)/|:(?:N|D.*:[si])") and not g_morph(lToken[nTokenOffset+3], ">(?:seul|maximum|minimum)/|:(?:[BG]|V0)")
+    return not g_value(lToken[nTokenOffset+2], "|maximum|minimum|fois|multiplié|divisé|janvier|février|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|rue|route|ruelle|place|boulevard|avenue|allée|chemin|sentier|square|impasse|cour|quai|chaussée|côte|vendémiaire|brumaire|frimaire|nivôse|pluviôse|ventôse|germinal|floréal|prairial|messidor|thermidor|fructidor|") and not re.search("^0*[01](?:,[0-9]+|)$", lToken[nTokenOffset+1].sValue) and not g_morph(lToken[nTokenOffset], ">(?:et|ou)/|:(?:N|D.*:[si])") and not g_morph(lToken[nTokenOffset+3], ">(?:seul|maximum|minimum)/|:(?:[BG]|V0)")
 def _g_cond_g3_297 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", "*") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", "*") and g_morph(lToken[nTokenOffset+3], ":[NA].*:s", "*") and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not (g_value(lToken[nLastToken+1], "|et|,|") and g_morph(g_token(lToken, nLastToken+2), ":A"))
 def _g_cond_g3_298 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]") and g_morph(lToken[nTokenOffset+5], ":[NA].*:[me]:[si]", ":V0") and not (g_value(lToken[nTokenOffset], "|,|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":[NA]"))
 def _g_sugg_g3_149 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"]) + "|" + suggMasPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggMasSing(lToken[nLastToken-1+1].sValue) + "|" + suggMasPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_299 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:m:[si]") and g_morph(lToken[nTokenOffset+5], ":[NA].*:f:[si]", ":V0") and not (g_value(lToken[nTokenOffset], "|,|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":[NA]"))
 def _g_sugg_g3_150 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"]) + "|" + suggMasPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggFemSing(lToken[nLastToken-1+1].sValue) + "|" + suggMasPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_300 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]") and g_morph(lToken[nTokenOffset+5], ":[NA].*:m:[si]", ":V0") and not (g_value(lToken[nTokenOffset], "|,|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":[NA]"))
 def _g_cond_g3_301 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]") and g_morph(lToken[nTokenOffset+5], ":[NA].*:f:[si]", ":V0") and not (g_value(lToken[nTokenOffset], "|,|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":[NA]"))
 def _g_sugg_g3_151 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"]) + "|" + suggFemPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggFemSing(lToken[nLastToken-1+1].sValue) + "|" + suggFemPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_302 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken-1+1], ">(?:matin|matinée|après-midi|soir|soirée|nuit|jour|journée|semaine|mois|trimestre|semestre|année|décennie|siècle|millénaire)/")
 def _g_cond_g3_303 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nLastToken-1+1], ">(?:matin|matinée|après-midi|soir|soirée|nuit|jour|journée|semaine|mois|trimestre|semestre|année|décennie|siècle|millénaire)/") and not look(sSentence[lToken[nLastToken]["nEnd"]:], " et ")
+    return not g_morph(lToken[nLastToken-1+1], ">(?:matin|matinée|après-midi|soir|soirée|nuit|jour|journée|semaine|mois|trimestre|semestre|année|décennie|siècle|millénaire)/") and not look(sSentence[lToken[nLastToken].nEnd:], " et ")
 def _g_sugg_g3_152 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][:-1]
+    return lToken[nTokenOffset+2].sValue[:-1]
 def _g_cond_g3_304 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":M1.*:m", ":[fe]") and g_morph(lToken[nLastToken-1+1], ":[NA]", ":[me]:[si]")
 def _g_cond_g3_305 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":M1.*:f", ":[me]") and g_morph(lToken[nLastToken-1+1], ":[NA]", ":[fe]:[si]")
 def _g_cond_g3_306 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ((g_morph(lToken[nTokenOffset+2], ":m", "*") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", "*") and g_morph(lToken[nTokenOffset+3], ":m", "*"))) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ((g_morph(lToken[nTokenOffset+2], ":m", "*") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", "*") and g_morph(lToken[nTokenOffset+3], ":m", "*"))) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_307 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ((g_morph(lToken[nTokenOffset+2], ":s", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*")) or (g_morph(lToken[nTokenOffset+2], ":p", "*") and g_morph(lToken[nTokenOffset+3], ":s", "*"))) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ((g_morph(lToken[nTokenOffset+2], ":s", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*")) or (g_morph(lToken[nTokenOffset+2], ":p", "*") and g_morph(lToken[nTokenOffset+3], ":s", "*"))) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_153 (lToken, nTokenOffset, nLastToken):
-    return switchPlural(lToken[nTokenOffset+3]["sValue"])
+    return switchPlural(lToken[nTokenOffset+3].sValue)
 def _g_sugg_g3_154 (lToken, nTokenOffset, nLastToken):
-    return switchPlural(lToken[nTokenOffset+2]["sValue"])
+    return switchPlural(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_308 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":p") and g_morph(lToken[nTokenOffset+3], ":[pi]") and g_morph(lToken[nTokenOffset+4], ":s", ":[pi]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":p") and g_morph(lToken[nTokenOffset+3], ":[pi]") and g_morph(lToken[nTokenOffset+4], ":s", ":[pi]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_sugg_g3_155 (lToken, nTokenOffset, nLastToken):
-    return switchPlural(lToken[nTokenOffset+4]["sValue"])
+    return switchPlural(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_309 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":i") and g_morph(lToken[nTokenOffset+3], ":p")    and g_morph(lToken[nTokenOffset+4], ":s", ":[pi]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":i") and g_morph(lToken[nTokenOffset+3], ":p")    and g_morph(lToken[nTokenOffset+4], ":s", ":[pi]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_310 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":s") and g_morph(lToken[nTokenOffset+3], ":[si]") and g_morph(lToken[nTokenOffset+4], ":p", ":[si]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":s") and g_morph(lToken[nTokenOffset+3], ":[si]") and g_morph(lToken[nTokenOffset+4], ":p", ":[si]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_311 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":i") and g_morph(lToken[nTokenOffset+3], ":s")    and g_morph(lToken[nTokenOffset+4], ":p", ":[si]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":i") and g_morph(lToken[nTokenOffset+3], ":s")    and g_morph(lToken[nTokenOffset+4], ":p", ":[si]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_312 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[me]") and g_morph(lToken[nTokenOffset+4], ":f", ":[me]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":[me]") and g_morph(lToken[nTokenOffset+4], ":f", ":[me]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_sugg_g3_156 (lToken, nTokenOffset, nLastToken):
-    return switchGender(lToken[nTokenOffset+4]["sValue"])
+    return switchGender(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_313 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":[fe]") and g_morph(lToken[nTokenOffset+4], ":m", ":[fe]") and lToken[nTokenOffset+4]["sValue"].islower()
+    return g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":[fe]") and g_morph(lToken[nTokenOffset+4], ":m", ":[fe]") and lToken[nTokenOffset+4].sValue.islower()
 def _g_cond_g3_314 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A", ":G") and g_morph(lToken[nTokenOffset+4], ":A", ":G")
 def _g_cond_g3_315 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4706,105 +4738,105 @@ def _g_sugg_g3_157 (lToken, nTokenOffset, nLastToken):
 def _g_sugg_g3_158 (lToken, nTokenOffset, nLastToken):
     return g_suggAgree(lToken[nTokenOffset+4], lToken[nTokenOffset+2])
 def _g_cond_g3_328 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":p", "*") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ( (g_morph(lToken[nTokenOffset+2], ":p", "*") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", "*") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_329 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_330 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"])
+    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_331 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/")
+    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/")
 def _g_cond_g3_332 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/")
+    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and not g_morph(lToken[nTokenOffset], ":[NA]|>(?:et|ou)/")
 def _g_cond_g3_333 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and g_morph(lToken[nTokenOffset], ":[VRX]|<start>")
+    return ( (g_morph(lToken[nTokenOffset+2], ":m", ":[fe]") and g_morph(lToken[nTokenOffset+3], ":f", "*")) or (g_morph(lToken[nTokenOffset+2], ":f", ":[me]") and g_morph(lToken[nTokenOffset+3], ":m", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and g_morph(lToken[nTokenOffset], ":[VRX]|<start>")
 def _g_cond_g3_334 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2]["sValue"], lToken[nTokenOffset+3]["sValue"]) and g_morph(lToken[nTokenOffset], ":[VRX]|<start>")
+    return ( (g_morph(lToken[nTokenOffset+2], ":p", ":[si]") and g_morph(lToken[nTokenOffset+3], ":s", "*")) or (g_morph(lToken[nTokenOffset+2], ":s", ":[pi]") and g_morph(lToken[nTokenOffset+3], ":p", "*")) ) and not apposition(lToken[nTokenOffset+2].sValue, lToken[nTokenOffset+3].sValue) and g_morph(lToken[nTokenOffset], ":[VRX]|<start>")
 def _g_cond_g3_335 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"].islower()
+    return lToken[nTokenOffset+3].sValue.islower()
 def _g_cond_g3_336 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_337 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], "[NA].*:[me]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], "[NA].*:[me]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_338 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], "[NA].*:m:[si]", ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], "[NA].*:m:[si]", ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_339 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_340 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]:[si]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]:[si]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_341 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:m:[si]", ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G|>[aâeéèêiîoôuh].*:[ef]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:m:[si]", ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_342 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_343 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:m:[si]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:m:[si]", ":[NA].*:f|>[aâeéèêiîoôuh].*:e") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_344 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], "[NA].*:m:[si]", ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:m", ":[fe]") and g_morph(lToken[nLastToken-2+1], "[NA].*:m:[si]", ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_345 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_346 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_347 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_348 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_349 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_350 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_351 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_352 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ">[aâeéèêiîoôuh].*:[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_353 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:f:[si]", ":[me]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:f:[si]", ":[me]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue)
 def _g_sugg_g3_159 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nLastToken-1+1]["sValue"], True)
+    return suggSing(lToken[nLastToken-1+1].sValue, True)
 def _g_cond_g3_354 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":[fp]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":[fp]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_160 (lToken, nTokenOffset, nLastToken):
-    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggMasSing(lToken[nLastToken-1+1]["sValue"])
+    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggMasSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_355 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]", ":[mp]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[fe]:[si]", ":[mp]") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_161 (lToken, nTokenOffset, nLastToken):
-    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggFemSing(lToken[nLastToken-1+1]["sValue"])
+    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggFemSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_356 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":p") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":p") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_162 (lToken, nTokenOffset, nLastToken):
     return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
 def _g_cond_g3_357 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ">[bcçdfgjklmnpqrstvwxz].*:[NA].*:[me]:[si]")
 def _g_sugg_g3_163 (lToken, nTokenOffset, nLastToken):
-    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggMasSing(lToken[nLastToken-1+1]["sValue"], lToken[nTokenOffset+2]["sValue"])
+    return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1]) + "|" + suggMasSing(lToken[nLastToken-1+1].sValue, lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_358 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]")
 def _g_cond_g3_359 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]:[si]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[me]:[si]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_164 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"]) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
+    return suggMasSing(lToken[nLastToken-1+1].sValue) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
 def _g_cond_g3_360 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[fe]:[si]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_165 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"]) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
+    return suggFemSing(lToken[nLastToken-1+1].sValue) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
 def _g_cond_g3_361 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[si]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[si]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_cond_g3_362 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-2+1], ">[bcçdfgjklmnpqrstvwxz].*:[NA].*:[me]:[si]")
 def _g_sugg_g3_166 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"], lToken[nLastToken-2+1]["sValue"]) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
+    return suggMasSing(lToken[nLastToken-1+1].sValue, lToken[nLastToken-2+1].sValue) + "|" + g_suggAgree(lToken[nLastToken-1+1], lToken[nTokenOffset+2])
 def _g_cond_g3_363 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morph(lToken[nLastToken-2+1], ":[NA].*:[si]")
 def _g_cond_g3_364 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not g_agreement(lToken[nLastToken-2+1], lToken[nLastToken-1+1]) and not g_agreement(lToken[nTokenOffset+2], lToken[nLastToken-1+1])
 def _g_sugg_g3_167 (lToken, nTokenOffset, nLastToken):
     return g_suggAgree(lToken[nLastToken-1+1], lToken[nLastToken-2+1])
 def _g_cond_g3_365 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1]["sValue"], lToken[nLastToken-1+1]["sValue"]) and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":A.*:[si]"))
+    return g_morph(lToken[nTokenOffset+2], ":[NA].*:[pi]", ":s") and g_morph(lToken[nLastToken-2+1], ":[NA].*:[pi]") and not apposition(lToken[nLastToken-2+1].sValue, lToken[nLastToken-1+1].sValue) and not (g_value(lToken[nLastToken+1], "|et|ou|") and g_morph(g_token(lToken, nLastToken+2), ":A.*:[si]"))
 def _g_sugg_g3_168 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_366 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+4], "|bâtiment|collège|corps|culte|établissement|groupe|journal|lycée|pays|régiment|vaisseau|village|")
 def _g_sugg_g3_169 (lToken, nTokenOffset, nLastToken):
-    return "leurs " + suggPlur(lToken[nTokenOffset+4]["sValue"])
+    return "leurs " + suggPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_g3_367 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+4], "|armée|cité|compagnie|entreprise|église|fac|nation|université|planète|promotion|religion|unité|ville|")
 def _g_cond_g3_368 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4838,19 +4870,19 @@ def _g_cond_g3_381 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_382 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":N", ":D") and (not g_morph(lToken[nTokenOffset+1], ":[me]:[si]") or g_morph(lToken[nTokenOffset+2], ":[pf]"))
 def _g_sugg_g3_170 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+1]["sValue"]) + " " + suggMasSing(lToken[nTokenOffset+2]["sValue"])
+    return suggSing(lToken[nTokenOffset+1].sValue) + " " + suggMasSing(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g3_171 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+1]["sValue"]) + " " + suggMasSing(lToken[nTokenOffset+2]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+1].sValue) + " " + suggMasSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_383 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":N", ":D") and (not g_morph(lToken[nTokenOffset+1], ":[me]:[si]") or g_morph(lToken[nTokenOffset+2], ":p"))
 def _g_sugg_g3_172 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+1]["sValue"]) + " " + suggSing(lToken[nTokenOffset+2]["sValue"])
+    return suggSing(lToken[nTokenOffset+1].sValue) + " " + suggSing(lToken[nTokenOffset+2].sValue)
 def _g_sugg_g3_173 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+1]["sValue"]) + " " + suggSing(lToken[nTokenOffset+2]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+1].sValue) + " " + suggSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_384 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D")
 def _g_sugg_g3_174 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nLastToken-2+1]["sValue"])
+    return suggPlur(lToken[nLastToken-2+1].sValue)
 def _g_cond_g3_385 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":[NA].*:s")
 def _g_cond_g3_386 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4858,7 +4890,7 @@ def _g_cond_g3_386 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_387 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":B") and not g_morph(lToken[nTokenOffset], ">(?:numéro|page|chapitre|référence|année|test|série)/")
 def _g_sugg_g3_175 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("ingts", "ingt").replace("INGTS", "INGT")
+    return lToken[nTokenOffset+1].sValue.replace("ingts", "ingt").replace("INGTS", "INGT")
 def _g_cond_g3_388 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken+1], ":B:.:p|>une?") and not g_morph(lToken[nTokenOffset], ">(?:numéro|page|chapitre|référence|année|test|série)/")
 def _g_cond_g3_389 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4878,9 +4910,9 @@ def _g_cond_g3_395 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_396 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 3)
 def _g_sugg_g3_176 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][:-2]+"s"
+    return lToken[nTokenOffset+2].sValue[:-2]+"s"
 def _g_cond_g3_397 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:lit|fauteuil|armoire|commode|guéridon|tabouret|chaise)s?\\b") and not g_morph(lToken[nLastToken+1], ">sculpter/")
+    return not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:lit|fauteuil|armoire|commode|guéridon|tabouret|chaise)s?\\b") and not g_morph(lToken[nLastToken+1], ">sculpter/")
 def _g_cond_g3_398 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":D.*:f:s")
 def _g_cond_g3_399 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4896,7 +4928,7 @@ def _g_cond_g3_403 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_404 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset], ":V.*:[123]|>(?:tou(?:te|)s|pas|rien|guère|jamais|toujours|souvent)/", ":[DRB]")
 def _g_cond_g3_405 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower() and g_morph(lToken[nTokenOffset], ":V", ":[DA]") and not g_morph(lToken[nLastToken+1], ":[NA].*:[pi]") and not (g_morph(lToken[nTokenOffset], ">(?:être|sembler|devenir|rester|demeurer|redevenir|para[îi]tre|trouver)/.*:[123]p") and g_morph(lToken[nLastToken+1], ":G|<end>|>[(,]/"))
+    return lToken[nTokenOffset+1].sValue.islower() and g_morph(lToken[nTokenOffset], ":V", ":[DA]") and not g_morph(lToken[nLastToken+1], ":[NA].*:[pi]") and not (g_morph(lToken[nTokenOffset], ">(?:être|sembler|devenir|rester|demeurer|redevenir|para[îi]tre|trouver)/.*:[123]p") and g_morph(lToken[nLastToken+1], ":G|<end>|>[(,]/"))
 def _g_cond_g3_406 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":V0e.*:3p") or g_morph(lToken[nLastToken+1], ":[AQ]")
 def _g_cond_g3_407 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4926,17 +4958,17 @@ def _g_cond_g3_418 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_419 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+2], ":3[sp]")
 def _g_sugg_g3_177 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+2]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+2].sValue, ":3s")
 def _g_cond_g3_420 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+3], ":3[sp]")
 def _g_sugg_g3_178 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s")
 def _g_sugg_g3_179 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p")
 def _g_cond_g3_421 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]") and  g_morph(lToken[nTokenOffset+4], ":Q.*:[me]:[si]", ":3s")
 def _g_sugg_g3_180 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+4]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+4].sValue, ":3s")
 def _g_cond_g3_422 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[si]", ">être/") and  g_morph(lToken[nTokenOffset+4], ":Q.*:[me]:[si]", ":3s")
 def _g_cond_g3_423 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4948,31 +4980,31 @@ def _g_cond_g3_425 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_426 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":3p") and  g_morph(lToken[nTokenOffset+4], ":Q.*:[pi]", ":3s")
 def _g_cond_g3_427 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nLastToken-1+1]["sValue"], ":(?:[123][sp]|P)")
+    return hasSimil(lToken[nLastToken-1+1].sValue, ":(?:[123][sp]|P)")
 def _g_sugg_g3_181 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[123][sp]")
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[123][sp]")
 def _g_cond_g3_428 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+3], ":[NA]", ">plus/|:(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[123][sp])")
+    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+3], ":[NA]", ">plus/|:(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+3].sValue, ":(?:[123][sp])")
 def _g_sugg_g3_182 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[123][sp]")
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[123][sp]")
 def _g_cond_g3_429 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+3], ":[NA]", ":(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+3]["sValue"], ":(?:[123][sp])")
+    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+3], ":[NA]", ":(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+3].sValue, ":(?:[123][sp])")
 def _g_cond_g3_430 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+2], ":[NA]", ":(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+2]["sValue"], ":(?:[123][sp])")
+    return not g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nTokenOffset+2], ":[NA]", ":(?:[123][sp]|P)") and hasSimil(lToken[nTokenOffset+2].sValue, ":(?:[123][sp])")
 def _g_sugg_g3_183 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+2]["sValue"], ":[123][sp]")
+    return suggSimil(lToken[nTokenOffset+2].sValue, ":[123][sp]")
 def _g_cond_g3_431 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">être/")
 def _g_cond_g3_432 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nLastToken-1+1], ":V", ":[YM]" )
+    return lToken[nLastToken-1+1].sValue.islower() and g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nLastToken-1+1], ":V", ":[YM]" )
 def _g_sugg_g3_184 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nLastToken-1+1]["sValue"])
+    return suggVerbInfi(lToken[nLastToken-1+1].sValue)
 def _g_cond_g3_433 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower() and g_morph(lToken[nLastToken-1+1], ":V", ":[NYM]" )
+    return lToken[nLastToken-1+1].sValue.islower() and g_morph(lToken[nLastToken-1+1], ":V", ":[NYM]" )
 def _g_cond_g3_434 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower() and g_morph(lToken[nLastToken-1+1], ":V", ":[YEM]")
+    return lToken[nLastToken-1+1].sValue.islower() and g_morph(lToken[nLastToken-1+1], ":V", ":[YEM]")
 def _g_cond_g3_435 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph0(lToken[nLastToken-1+1], ":V", ":M") and not (lToken[nLastToken-1+1]["sValue"].endswith("ez") and g_value(lToken[nLastToken+1], "|vous|"))
+    return g_morph0(lToken[nLastToken-1+1], ":V", ":M") and not (lToken[nLastToken-1+1].sValue.endswith("ez") and g_value(lToken[nLastToken+1], "|vous|"))
 def _g_cond_g3_436 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V1.*:(?:Q|[123][sp])")
 def _g_cond_g3_437 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -4980,19 +5012,19 @@ def _g_cond_g3_437 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_438 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":V1", ":M")
 def _g_sugg_g3_185 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nTokenOffset+3]["sValue"])
+    return suggVerbInfi(lToken[nTokenOffset+3].sValue)
 def _g_cond_g3_439 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph0(lToken[nLastToken-1+1], ":V1.*:(?:Q|[123][sp])", ":[NM]")
 def _g_cond_g3_440 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ">(?:passer|tenir)/") and g_morph0(lToken[nLastToken-1+1], ":V1.*:(?:Q|[123][sp])", ":[NM]")
 def _g_cond_g3_441 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nLastToken-1+1]["sValue"][0:1].isupper()
+    return not lToken[nLastToken-1+1].sValue[0:1].isupper()
 def _g_cond_g3_442 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"].islower()
+    return lToken[nLastToken-1+1].sValue.islower()
 def _g_cond_g3_443 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"][0:1].isupper() and not g_morph(lToken[nTokenOffset], ">(?:en|passer|qualifier)/") and not g_morph(lToken[nTokenOffset+2], ">(?:fieffer|sacrer)/") and not g_tag(lToken[nTokenOffset], "_rien_") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)(?:quelqu(?:e chose|’une?)|qu’y a-t-il |\\b(?:l(?:es?|a)|nous|vous|me|te|se) trait|personne|points? +$|autant +$|ça +|rien d(?:e |’)|rien(?: +[a-zéèêâîûù]+|) +$)") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_ceque_")
+    return not lToken[nTokenOffset+2].sValue[0:1].isupper() and not g_morph(lToken[nTokenOffset], ">(?:en|passer|qualifier)/") and not g_morph(lToken[nTokenOffset+2], ">(?:fieffer|sacrer)/") and not g_tag(lToken[nTokenOffset], "_rien_") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)(?:quelqu(?:e chose|’une?)|qu’y a-t-il |\\b(?:l(?:es?|a)|nous|vous|me|te|se) trait|personne|points? +$|autant +$|ça +|rien d(?:e |’)|rien(?: +[a-zéèêâîûù]+|) +$)") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_ceque_")
 def _g_sugg_g3_186 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nTokenOffset+2]["sValue"])
+    return suggVerbInfi(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_444 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+1], ":N") and (g_morph0(lToken[nLastToken-1+1], ":V1.*:Q", ":(?:M|Oo)") or g_morph0(lToken[nLastToken-1+1], ":[123][sp]", ":[MNGA]"))
 def _g_cond_g3_445 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5004,7 +5036,7 @@ def _g_cond_g3_447 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_448 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset], "|une|la|cette|ma|ta|sa|notre|votre|leur|quelle|de|d’|") and g_morph0(lToken[nLastToken-1+1], ":(?:Q|2p)", ":M")
 def _g_cond_g3_449 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-1+1], ":(?:Q|2p)", ":M") and not (lToken[nLastToken-1+1]["sValue"].endswith("ez") and g_value(lToken[nLastToken+1], "|vous|"))
+    return g_morph(lToken[nLastToken-1+1], ":(?:Q|2p)", ":M") and not (lToken[nLastToken-1+1].sValue.endswith("ez") and g_value(lToken[nLastToken+1], "|vous|"))
 def _g_cond_g3_450 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V1", ":(?:M|N.*:[me]:[si])")
 def _g_cond_g3_451 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5022,9 +5054,9 @@ def _g_cond_g3_456 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_457 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 3) and g_morph(lToken[nTokenOffset+2], ":Q") and not g_morph(lToken[nTokenOffset], "V0.*:2p")
 def _g_sugg_g3_187 (lToken, nTokenOffset, nLastToken):
-    return suggVerbInfi(lToken[nTokenOffset+2]["sValue"])+"|"+suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":Ip", ":2p")
+    return suggVerbInfi(lToken[nTokenOffset+2].sValue)+"|"+suggVerbTense(lToken[nTokenOffset+2].sValue, ":Ip", ":2p")
 def _g_cond_g3_458 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].islower() and g_morph(lToken[nTokenOffset+2], ":V", ":[123][sp]")
+    return lToken[nTokenOffset+1].sValue.islower() and g_morph(lToken[nTokenOffset+2], ":V", ":[123][sp]")
 def _g_cond_g3_459 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|devoirs|") and g_morph(lToken[nLastToken-1+1], ":V", ":M") and not (g_morph(lToken[nTokenOffset+1], ":N") and g_morph(lToken[nTokenOffset], ":D")) and not (g_value(lToken[nTokenOffset+1], "|devant|") and g_morph(lToken[nLastToken-1+1], ":N"))
 def _g_cond_g3_460 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5098,25 +5130,25 @@ def _g_cond_g3_493 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_g3_494 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+3], lToken[nTokenOffset+3+1], 1, 1)
 def _g_sugg_g3_188 (lToken, nTokenOffset, nLastToken):
-    return "a "+suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":m:s")
+    return "a "+suggVerbPpas(lToken[nTokenOffset+4].sValue, ":m:s")
 def _g_sugg_g3_189 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":m:s")
 def _g_cond_g3_495 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+4], lToken[nTokenOffset+4+1], 1, 1)
 def _g_sugg_g3_190 (lToken, nTokenOffset, nLastToken):
-    return "a "+suggVerbPpas(lToken[nTokenOffset+5]["sValue"], ":m:s")
+    return "a "+suggVerbPpas(lToken[nTokenOffset+5].sValue, ":m:s")
 def _g_sugg_g3_191 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+5]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+5].sValue, ":m:s")
 def _g_cond_g3_496 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+5], lToken[nTokenOffset+5+1], 1, 1)
 def _g_sugg_g3_192 (lToken, nTokenOffset, nLastToken):
-    return "a "+suggVerbPpas(lToken[nTokenOffset+6]["sValue"], ":m:s")
+    return "a "+suggVerbPpas(lToken[nTokenOffset+6].sValue, ":m:s")
 def _g_sugg_g3_193 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+6]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+6].sValue, ":m:s")
 def _g_cond_g3_497 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":V1.*:Y")
 def _g_sugg_g3_194 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue)
 def _g_cond_g3_498 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nTokenOffset+2], "|restent|")
 def _g_cond_g3_499 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5230,19 +5262,19 @@ def _g_cond_gv1_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_gv1_2 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|êtres|")
 def _g_cond_gv1_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].endswith("e") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:[13]s", ":[GMA]") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\belle +(?:ne +|n’|)$")
+    return lToken[nTokenOffset+2].sValue.endswith("e") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:[13]s", ":[GMA]") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\belle +(?:ne +|n’|)$")
 def _g_sugg_gv1_1 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":m:s")
 def _g_cond_gv1_4 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and lToken[nTokenOffset+2]["sValue"].endswith("s") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:2s", ":[GMA]") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\belles +(?:ne +|n’|)$")
+    return not bCondMemo and lToken[nTokenOffset+2].sValue.endswith("s") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:2s", ":[GMA]") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\belles +(?:ne +|n’|)$")
 def _g_sugg_gv1_2 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":m:p")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":m:p")
 def _g_cond_gv1_5 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|avoirs|")
 def _g_cond_gv1_6 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].endswith("e") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:[13]s", ":[GM]|>envie/")
+    return lToken[nTokenOffset+2].sValue.endswith("e") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:[13]s", ":[GM]|>envie/")
 def _g_cond_gv1_7 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and lToken[nTokenOffset+2]["sValue"].endswith("s") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:2s", ":[GM]")
+    return not bCondMemo and lToken[nTokenOffset+2].sValue.endswith("s") and g_morph(lToken[nTokenOffset+2], ":V1.*:Ip.*:2s", ":[GM]")
 def _g_cond_gv1_8 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":G")
 def _g_cond_gv1_9 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5250,63 +5282,63 @@ def _g_cond_gv1_9 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags,
 def _g_cond_gv1_10 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":V.*:3p", ":[GPY]") and not g_value(lToken[nLastToken+1], "|ils|elles|iel|iels|") and ( (g_morph(lToken[nTokenOffset+3], ":V...t_") and g_value(lToken[nLastToken+1], "le|la|l’|un|une|ce|cet|cette|mon|ton|son|ma|ta|sa|leur") and not g_tag(lToken[nLastToken+1], "_enum_")) or g_morph(lToken[nTokenOffset+3], ":V..i__") )
 def _g_sugg_gv1_3 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":1p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":1p")
 def _g_cond_gv1_11 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_value(lToken[nLastToken-1+1], "|somme|")
 def _g_cond_gv1_12 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo
 def _g_sugg_gv1_4 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":1p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":1p")
 def _g_sugg_gv1_5 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":2p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":2p")
 def _g_cond_gv1_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V[123]_.__p_e_", "*") or (g_value(lToken[nLastToken+1], "|<end>|") and not g_value(lToken[nTokenOffset], "|que|qu’|"))
 def _g_sugg_gv1_6 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:s")
 def _g_cond_gv1_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V[123]_.__p_e_", "*") or (g_value(lToken[nLastToken+1], "|<end>|") and not g_morph(lToken[nTokenOffset], ":R|>que/"))
 def _g_sugg_gv1_7 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:s")
 def _g_sugg_gv1_8 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":p")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":p")
 def _g_sugg_gv1_9 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":m:p")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":m:p")
 def _g_sugg_gv1_10 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":f:p")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":f:p")
 def _g_sugg_gv1_11 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"])
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-2+1], ":[123]s")
 def _g_sugg_gv1_12 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-1+1]["sValue"], ":s")
+    return suggVerbPpas(lToken[nLastToken-1+1].sValue, ":s")
 def _g_cond_gv1_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-2+1], ":[123]p")
 def _g_cond_gv1_17 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nLastToken-2+1], ":[123]s") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_que_") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\bon (?:ne |)$")
+    return g_morph(lToken[nLastToken-2+1], ":[123]s") and not g_tagbefore(lToken[nTokenOffset+1], dTags, "_que_") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\bon (?:ne |)$")
 def _g_sugg_gv1_13 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nLastToken-1+1]["sValue"])
+    return suggSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_18 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nLastToken-2+1], ">(?:matin|soir|soirée|nuit|après-midi|jour|année|semaine|mois|seconde|minute|heure|siècle|millénaire|fois)/")
 def _g_sugg_gv1_14 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nLastToken-4+1]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nLastToken-4+1].sValue, ":m:s")
 def _g_cond_gv1_19 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":V0")
 def _g_sugg_gv1_15 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+3]["sValue"])
+    return suggSing(lToken[nTokenOffset+3].sValue)
 def _g_sugg_gv1_16 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+3]["sValue"])
+    return suggPlur(lToken[nTokenOffset+3].sValue)
 def _g_cond_gv1_20 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not lToken[nTokenOffset+2]["sValue"].endswith("ons")
+    return not lToken[nTokenOffset+2].sValue.endswith("ons")
 def _g_cond_gv1_21 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_cond_gv1_22 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V.e")
 def _g_sugg_gv1_17 (lToken, nTokenOffset, nLastToken):
-    return suggSing(lToken[nTokenOffset+2]["sValue"])
+    return suggSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_23 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:être|devenir|redevenir)/")
 def _g_sugg_gv1_18 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":s")
 def _g_cond_gv1_24 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:sembler|rester|demeurer|para[îi]tre)/") and not g_morph(lToken[nTokenOffset+2], ":Y")
 def _g_cond_gv1_25 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5316,7 +5348,7 @@ def _g_cond_gv1_26 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_27 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":(?:[123]s|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_sugg_gv1_19 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nLastToken-1+1]["sValue"])
+    return suggMasSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_28 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":(?:[123]s|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_cond_gv1_29 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5326,7 +5358,7 @@ def _g_cond_gv1_30 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_31 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|question|") and g_morphVC(lToken[nTokenOffset+1], ":V.e.*:[123]s")
 def _g_sugg_gv1_20 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+2]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_32 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|question|")
 def _g_cond_gv1_33 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5344,13 +5376,13 @@ def _g_cond_gv1_38 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":V0e.*:3p") and g_morph(lToken[nTokenOffset+2], ":[QA].*:s")
 def _g_sugg_gv1_21 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggPlur(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V0e.*:3s")
 def _g_cond_gv1_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_morphVC(lToken[nTokenOffset+1], ":V0e.*:3p")
 def _g_sugg_gv1_22 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":p")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":p")
 def _g_cond_gv1_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "_enum_") and g_morph(lToken[nTokenOffset+2], ":(?:3s|P)") and not g_morph(lToken[nTokenOffset], ":[RV]|>(?:et|ou)/") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_cond_gv1_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5386,7 +5418,7 @@ def _g_cond_gv1_57 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_58 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "_enum_") and not g_morph(lToken[nTokenOffset], ":[RV]|>(?:et|ou)/") and g_morph(lToken[nTokenOffset+2], ":(?:[123]s|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_sugg_gv1_23 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nLastToken-1+1]["sValue"])
+    return suggFemSing(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_59 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+1], "_enum_") and not g_morph(lToken[nTokenOffset], ":[RV]|>(?:et|ou)/") and g_morph(lToken[nTokenOffset+3], ":(?:[123]s|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_cond_gv1_60 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5396,9 +5428,9 @@ def _g_cond_gv1_61 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_62 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V.e.*:[123]s") and not g_value(lToken[nTokenOffset], "|se|s’|")
 def _g_sugg_gv1_24 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+2]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+2].sValue)
 def _g_sugg_gv1_25 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue, ":f:s")
 def _g_cond_gv1_63 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_tag(lToken[nTokenOffset+1], "_LVEID_") and g_morphVC(lToken[nTokenOffset+1], ":3s") and not g_value(lToken[nLastToken-1+1], "|néant|")
 def _g_cond_gv1_64 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5416,7 +5448,7 @@ def _g_cond_gv1_69 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_70 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|néant|") and g_morph(lToken[nTokenOffset+7], ":(?:[123]s|P)")
 def _g_sugg_gv1_26 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+2]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_71 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:sembler|rester|demeurer|para[îi]tre)/") and not g_morph(lToken[nLastToken-1+1], ":Y")
 def _g_cond_gv1_72 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5438,7 +5470,7 @@ def _g_cond_gv1_79 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_80 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|") and not g_morph(lToken[nTokenOffset], ":[RV]|>(?:ne|nous)/") and g_morph(lToken[nTokenOffset+2], ":(?:1p|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_sugg_gv1_27 (lToken, nTokenOffset, nLastToken):
-    return suggPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_81 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|") and not g_morph(lToken[nTokenOffset], ":[RV]|>(?:ne|nous)/") and g_morph(lToken[nTokenOffset+3], ":(?:1p|P)") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_cond_gv1_82 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5466,11 +5498,11 @@ def _g_cond_gv1_92 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv1_93 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|") and not g_tag(lToken[nTokenOffset], "_ceque_")
 def _g_sugg_gv1_28 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggMasPlur(lToken[nLastToken-1+1].sValue)
 def _g_cond_gv1_94 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ":V.e.*:3p") and not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|") and not g_value(lToken[nTokenOffset], "|se|s’|")
 def _g_sugg_gv1_29 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_95 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:être|devenir|redevenir)/.*:3p")
 def _g_cond_gv1_96 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5500,9 +5532,9 @@ def _g_cond_gv1_107 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_108 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R") and not g_value(lToken[nLastToken-1+1], "|légion|pléthore|néant|réalité|")
 def _g_sugg_gv1_30 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nLastToken-1+1]["sValue"])
+    return suggFemPlur(lToken[nLastToken-1+1].sValue)
 def _g_sugg_gv1_31 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+2]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+2].sValue)
 def _g_cond_gv1_109 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">(?:être|devenir|redevenir)/.*:3p") and not g_value(lToken[nTokenOffset], "|se|s’|")
 def _g_cond_gv1_110 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5516,9 +5548,9 @@ def _g_cond_gv1_113 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_114 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[123]s", ":[GNAQWY]")
 def _g_sugg_gv1_32 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+3]["sValue"])
+    return suggVerbPpas(lToken[nTokenOffset+3].sValue)
 def _g_cond_gv1_115 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "[çcCÇ]’$|[cC][eE] n’$|[çÇ][aA] (?:[nN]’|)$") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)^ *ne pas ") and not g_morph(lToken[nTokenOffset], ":Y")
+    return not look(sSentence[:lToken[1+nTokenOffset].nStart], "[çcCÇ]’$|[cC][eE] n’$|[çÇ][aA] (?:[nN]’|)$") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)^ *ne pas ") and not g_morph(lToken[nTokenOffset], ":Y")
 def _g_cond_gv1_116 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":Y", ":[AN]")
 def _g_cond_gv1_117 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5666,11 +5698,11 @@ def _g_cond_gv1_187 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_188 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[AQ].*:(?:[me]:p|f)", ":(?:G|Y|V0|P|[AQ].*:m:[si])") and not (g_morph(lToken[nTokenOffset+2], ":Y") and g_morph(lToken[nTokenOffset+3], ":3s"))
 def _g_sugg_gv1_33 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+3]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+3].sValue)
 def _g_cond_gv1_189 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[AQ].*:(?:[fe]:p|m)", ":(?:G|Y|V0|P|[AQ].*:f:[si])") and not (g_morph(lToken[nTokenOffset+2], ":Y") and g_morph(lToken[nTokenOffset+2], ":3s"))
 def _g_sugg_gv1_34 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+3]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+3].sValue)
 def _g_cond_gv1_190 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[AQ].*:s", ":(?:G|Y|V0|P|[AQ].*:[ip])") and not (g_morph(lToken[nTokenOffset+2], ":Y") and g_morph(lToken[nTokenOffset+3], ":3s"))
 def _g_cond_gv1_191 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5678,19 +5710,19 @@ def _g_cond_gv1_191 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_192 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":3s") and g_morph(lToken[nTokenOffset+4], ":[AQ].*:[fp]", ":(?:G|Y|V0|P|[AQ].*:m:[si])")
 def _g_sugg_gv1_35 (lToken, nTokenOffset, nLastToken):
-    return suggMasSing(lToken[nTokenOffset+4]["sValue"])
+    return suggMasSing(lToken[nTokenOffset+4].sValue)
 def _g_cond_gv1_193 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":3s") and g_morph(lToken[nTokenOffset+4], ":[AQ].*:[mp]", ":(?:G|Y|V0|P|[AQ].*:f:[si])") and not g_morph(lToken[nTokenOffset], ":R")
 def _g_sugg_gv1_36 (lToken, nTokenOffset, nLastToken):
-    return suggFemSing(lToken[nTokenOffset+4]["sValue"])
+    return suggFemSing(lToken[nTokenOffset+4].sValue)
 def _g_cond_gv1_194 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":3p") and g_morph(lToken[nTokenOffset+4], ":[AQ].*:[fs]", ":(?:G|Y|V0|P|[AQ].*:m:[pi])")
 def _g_sugg_gv1_37 (lToken, nTokenOffset, nLastToken):
-    return suggMasPlur(lToken[nTokenOffset+4]["sValue"])
+    return suggMasPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_gv1_195 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":3p") and g_morph(lToken[nTokenOffset+4], ":[AQ].*:[ms]", ":(?:G|Y|V0|P|[AQ].*:f:[pi])") and not g_morph(lToken[nTokenOffset], ":R")
 def _g_sugg_gv1_38 (lToken, nTokenOffset, nLastToken):
-    return suggFemPlur(lToken[nTokenOffset+4]["sValue"])
+    return suggFemPlur(lToken[nTokenOffset+4].sValue)
 def _g_cond_gv1_196 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":3s") and g_morph(lToken[nTokenOffset+3], ":[AQ].*:p", ":(?:G|Y|V0|P|[AQ].*:[si])")
 def _g_cond_gv1_197 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5750,19 +5782,19 @@ def _g_cond_gv1_222 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_223 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo
 def _g_sugg_gv1_40 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+3]["sValue"][:-1]
+    return lToken[nTokenOffset+3].sValue[:-1]
 def _g_cond_gv1_224 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and not g_value(lToken[nTokenOffset], "|m’|t’|l’|nous|vous|les|")
 def _g_cond_gv1_225 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1]["sValue"].islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])")
+    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1].sValue.islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])")
 def _g_cond_gv1_226 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1]["sValue"].islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|N|Q.*:m:[si])")
+    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1].sValue.islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|N|Q.*:m:[si])")
 def _g_cond_gv1_227 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1]["sValue"].islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp])", ":[GWQ]")
+    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|figure|garde|marre|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and lToken[nLastToken-1+1].sValue.islower() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp])", ":[GWQ]")
 def _g_cond_gv1_228 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+1], ":Os") and not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|garde|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and not lToken[nLastToken-1+1]["sValue"].isupper() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])")
+    return g_morph(lToken[nTokenOffset+1], ":Os") and not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|garde|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and not lToken[nLastToken-1+1].sValue.isupper() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])")
 def _g_cond_gv1_229 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|garde|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G") and not lToken[nLastToken-1+1]["sValue"].isupper() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Y|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])") and not (g_value(lToken[nLastToken-2+1], "|avions|") and g_morph(lToken[nLastToken-1+1], ":3[sp]"))
+    return not g_value(lToken[nLastToken-1+1], "|barre|confiance|charge|cours|envie|garde|peine|prise|crainte|cure|affaire|hâte|force|recours|") and (g_value(lToken[nTokenOffset], "|<start>|,|comme|comment|et|lorsque|lorsqu’|mais|où|ou|quand|qui|pourquoi|puisque|puisqu’|quoique|quoiqu’|si|s’|sinon|") or (g_value(lToken[nTokenOffset], "|que|qu’|") and g_morph(g_token(lToken, nTokenOffset+1-2), ":V|<start>", ":[NA]"))) and g_morph(lToken[nTokenOffset+2], ":[NA]", ":G") and not lToken[nLastToken-1+1].sValue.isupper() and g_morph(lToken[nLastToken-1+1], ":(?:[123][sp]|Y|Q.*:[fp])", ":(?:G|W|Q.*:m:[si])") and not (g_value(lToken[nLastToken-2+1], "|avions|") and g_morph(lToken[nLastToken-1+1], ":3[sp]"))
 def _g_cond_gv1_230 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":V0a")
 def _g_cond_gv1_231 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5780,7 +5812,7 @@ def _g_cond_gv1_236 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_237 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|A|avions|avoirs|") and g_morph(lToken[nTokenOffset+2], ":(?:Y|2p)")
 def _g_cond_gv1_238 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return bCondMemo and lToken[nTokenOffset+1]["sValue"] == "a" and lToken[nTokenOffset+2]["sValue"].endswith("r") and not g_value(lToken[nTokenOffset], "|n’|m’|t’|l’|il|on|elle|")
+    return bCondMemo and lToken[nTokenOffset+1].sValue == "a" and lToken[nTokenOffset+2].sValue.endswith("r") and not g_value(lToken[nTokenOffset], "|n’|m’|t’|l’|il|on|elle|")
 def _g_cond_gv1_239 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|A|avions|avoirs|") and g_morph(lToken[nTokenOffset+2], ":V(?:2.*:Ip.*:3s|3.*:Is.*:3s)", ":[NAQ]")
 def _g_cond_gv1_240 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5830,9 +5862,9 @@ def _g_cond_gv1_261 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_262 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":(?:Y|[123][sp])", ":[QMG]")
 def _g_sugg_gv1_41 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+3]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+3].sValue, ":m:s")
 def _g_cond_gv1_263 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and not g_value(lToken[nTokenOffset+1], "|les|l’|m’|t’|nous|vous|en|") and g_morph(lToken[nTokenOffset+3], ":Q.*:[fp]", ":m:[si]") and not g_morph(lToken[nTokenOffset+1], ":[NA].*:[fp]") and not look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:quel(?:le|)s?|combien) ")
+    return not bCondMemo and not g_value(lToken[nTokenOffset+1], "|les|l’|m’|t’|nous|vous|en|") and g_morph(lToken[nTokenOffset+3], ":Q.*:[fp]", ":m:[si]") and not g_morph(lToken[nTokenOffset+1], ":[NA].*:[fp]") and not look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:quel(?:le|)s?|combien) ")
 def _g_cond_gv1_264 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nLastToken-2+1], ":V0a") and not g_value(lToken[nLastToken-1+1], "|barre|charge|confiance|cours|envie|garde|peine|marre|prise|crainte|cure|affaire|hâte|force|recours|")
 def _g_cond_gv1_265 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5844,11 +5876,11 @@ def _g_cond_gv1_267 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_268 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+2], ":V0a") and g_morph(lToken[nTokenOffset+3], ":(?:Y|2p|Q.*:s|3[sp])", ":[GWpi]")
 def _g_sugg_gv1_42 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+3]["sValue"], ":p")
+    return suggVerbPpas(lToken[nTokenOffset+3].sValue, ":p")
 def _g_cond_gv1_269 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":A.*:p", ":[GEMWPsi]") and not g_tag(lToken[nTokenOffset+2], "_exctx_")
 def _g_cond_gv1_270 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nTokenOffset+2], "|bref|désolé|désolée|pire|")  and not g_tag(lToken[nTokenOffset+2], "_exctx_") and g_morph(lToken[nTokenOffset+2], ":A.*:[fp]", ":(?:G|E|M1|W|P|m:[si])") and not g_morph(lToken[nLastToken+1], ">falloir/") and not look(sSentence[lToken[nLastToken]["nEnd"]:], "^ +(?:y (?:a|aura|avait|eut)|d(?:ut|oit|evait|evra) y avoir|s’agi(?:ssait|t|ra))[, .]")
+    return not g_value(lToken[nTokenOffset+2], "|bref|désolé|désolée|pire|")  and not g_tag(lToken[nTokenOffset+2], "_exctx_") and g_morph(lToken[nTokenOffset+2], ":A.*:[fp]", ":(?:G|E|M1|W|P|m:[si])") and not g_morph(lToken[nLastToken+1], ">falloir/") and not look(sSentence[lToken[nLastToken].nEnd:], "^ +(?:y (?:a|aura|avait|eut)|d(?:ut|oit|evait|evra) y avoir|s’agi(?:ssait|t|ra))[, .]")
 def _g_cond_gv1_271 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+2], "|bref|désolé|désolée|pire|") and not g_tag(lToken[nTokenOffset+2], "_exctx_") and g_morph(lToken[nTokenOffset+2], ":A.*:[mp]", ":(?:G|E|M1|W|P|f:[si])")
 def _g_cond_gv1_272 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5860,7 +5892,7 @@ def _g_cond_gv1_274 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_275 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":(?:V1.*:[YQ]|Iq.*:[123]s)")
 def _g_sugg_gv1_43 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":E", ":2p") + "-" + lToken[nTokenOffset+3]["sValue"]
+    return suggVerbTense(lToken[nTokenOffset+2].sValue, ":E", ":2p") + "-" + lToken[nTokenOffset+3].sValue
 def _g_cond_gv1_276 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":(?:V1.*:[YQ]|Iq.*:[123]s)") and g_morph(lToken[nTokenOffset+4], ":[ORC]", ":[NA]|>plupart/")
 def _g_cond_gv1_277 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5868,7 +5900,7 @@ def _g_cond_gv1_277 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_278 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":(?:V1.*:[YQ]|Iq.*:[123]s)") and g_morph(lToken[nTokenOffset+4], ":[ORCD]", ":Y")
 def _g_cond_gv1_279 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not look(sSentence[lToken[nLastToken]["nEnd"]:], " soit ")
+    return not look(sSentence[lToken[nLastToken].nEnd:], " soit ")
 def _g_cond_gv1_280 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|je|")
 def _g_cond_gv1_281 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5878,15 +5910,15 @@ def _g_cond_gv1_282 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_283 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V[13].*:Ip.*:2s", ":G") and not g_value(lToken[nLastToken+1], "|tu|")
 def _g_sugg_gv1_44 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"][:-1]
+    return lToken[nLastToken-1+1].sValue[:-1]
 def _g_cond_gv1_284 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken-1+1], ":V[13].*:Ip.*:2s", ":[GNAM]") and not g_value(lToken[nLastToken+1], "|tu|")
 def _g_cond_gv1_285 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken+1], "|il|elle|on|ils|elles|iel|iels|") and not g_value(lToken[nLastToken-1+1], "|provient|") and not (g_value(lToken[nLastToken-1+1], "|vient|dit|surgit|survient|périt|") and g_morph(lToken[nLastToken+1], ":(?:[MD]|Oo)|>[A-Z]/")) and g_morph(lToken[nLastToken-1+1], ":V[23].*:Ip.*:3s", ":G|>(?:devoir|suffire|para[îi]tre)/") and analyse(lToken[nLastToken-1+1]["sValue"][:-1]+"s", ":E:2s")
+    return not g_value(lToken[nLastToken+1], "|il|elle|on|ils|elles|iel|iels|") and not g_value(lToken[nLastToken-1+1], "|provient|") and not (g_value(lToken[nLastToken-1+1], "|vient|dit|surgit|survient|périt|") and g_morph(lToken[nLastToken+1], ":(?:[MD]|Oo)|>[A-Z]/")) and g_morph(lToken[nLastToken-1+1], ":V[23].*:Ip.*:3s", ":G|>(?:devoir|suffire|para[îi]tre)/") and analyse(lToken[nLastToken-1+1].sValue[:-1]+"s", ":E:2s")
 def _g_sugg_gv1_45 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"][:-1]+"s"
+    return lToken[nLastToken-1+1].sValue[:-1]+"s"
 def _g_cond_gv1_286 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not g_value(lToken[nLastToken+1], "|il|elle|on|ils|elles|iel|iels|") and not g_value(lToken[nLastToken-1+1], "|provient|") and not (g_value(lToken[nLastToken-1+1], "|vient|dit|surgit|survient|périt|") and g_morph(lToken[nLastToken+1], ":(?:[MDR]|Oo)|>[A-Z]/")) and g_morph(lToken[nLastToken-1+1], ":V[23].*:Ip.*:3s", ":[GNA]|>(?:devoir|suffire|para[îi]tre)/") and analyse(lToken[nLastToken-1+1]["sValue"][:-1]+"s", ":E:2s")
+    return not g_value(lToken[nLastToken+1], "|il|elle|on|ils|elles|iel|iels|") and not g_value(lToken[nLastToken-1+1], "|provient|") and not (g_value(lToken[nLastToken-1+1], "|vient|dit|surgit|survient|périt|") and g_morph(lToken[nLastToken+1], ":(?:[MDR]|Oo)|>[A-Z]/")) and g_morph(lToken[nLastToken-1+1], ":V[23].*:Ip.*:3s", ":[GNA]|>(?:devoir|suffire|para[îi]tre)/") and analyse(lToken[nLastToken-1+1].sValue[:-1]+"s", ":E:2s")
 def _g_cond_gv1_287 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|il|elle|on|") and not ( g_value(lToken[nLastToken-1+1], "|répond|") and (g_morph(lToken[nLastToken+1], ":[MD]|>[A-Z]/") or g_value(lToken[nLastToken+1], "|l’|d’|")) ) and g_morph(lToken[nLastToken-1+1], ":V3.*:Ip.*:3s", ":G")
 def _g_cond_gv1_288 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5896,27 +5928,27 @@ def _g_cond_gv1_289 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_290 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V(?:1.*:Ip.*:2s|[23].*:Ip.*:3s)", ":[GM]|>(?:venir|aller|partir)/")
 def _g_sugg_gv1_46 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":E", ":2s")+"-moi"
+    return suggVerbTense(lToken[nTokenOffset+2].sValue, ":E", ":2s")+"-moi"
 def _g_cond_gv1_291 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+1], ":E:2s", ":[GM]|>(?:venir|aller|partir)/") and not g_value(lToken[nTokenOffset], "|de|d’|le|la|les|l’|me|m’|te|t’|se|s’|nous|vous|lui|leur|")
 def _g_sugg_gv1_47 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":E", ":2s")+"-toi"
+    return suggVerbTense(lToken[nTokenOffset+2].sValue, ":E", ":2s")+"-toi"
 def _g_cond_gv1_292 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+1], ":E", ":[GM]|>(?:venir|aller|partir)/") and g_morph(lToken[nLastToken+1], ":|<end>", ":(?:Y|3[sp]|Oo)|>(?:en|y)/") and g_morph(lToken[nTokenOffset], ":Cc|<start>|>[(,]")
 def _g_cond_gv1_293 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V(?:1.*:Ip.*:2s|[23].*:Ip.*:3s)", ":[GM]|>(?:venir|aller|partir)/") and not g_morph(lToken[nLastToken+1], ":Y")
 def _g_sugg_gv1_48 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":E", ":2s")+"-"+lToken[nTokenOffset+3]["sValue"]
+    return suggVerbTense(lToken[nTokenOffset+2].sValue, ":E", ":2s")+"-"+lToken[nTokenOffset+3].sValue
 def _g_cond_gv1_294 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+1], ":E", ":[GM]") and g_morph(lToken[nLastToken+1], ":|<end>", ":(?:Y|3[sp]|Oo)|>en/") and g_morph(lToken[nTokenOffset], ":Cc|<start>|>[(,]")
 def _g_cond_gv1_295 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+1]["sValue"].endswith("e") or lToken[nTokenOffset+1]["sValue"].endswith("E")
+    return lToken[nTokenOffset+1].sValue.endswith("e") or lToken[nTokenOffset+1].sValue.endswith("E")
 def _g_cond_gv1_296 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+1], ":E", ":[GM]|>(?:venir|aller|partir)") and g_morph(lToken[nLastToken+1], ":|<end>|>[(,]", ":(?:N|A|Y|B|3[sp])|>(?:pour|plus|moins|mieux|peu|trop|très|en|y)/") and g_morph(lToken[nTokenOffset], ":Cc|<start>|>[(,]")
 def _g_cond_gv1_297 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V(?:1.*:Ip.*:2s|[23].*:Ip.*:3s)", ":[GM]|>(?:venir|aller|partir)/") and g_morph(lToken[nLastToken+1], ":|<end>|>[(,]", ":(?:N|A|Y|B|3[sp])|>(?:pour|plus|moins|mieux|peu|trop|très|en|y)/")
 def _g_sugg_gv1_49 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+2]["sValue"], ":E", ":2s")+"-les"
+    return suggVerbTense(lToken[nTokenOffset+2].sValue, ":E", ":2s")+"-les"
 def _g_cond_gv1_298 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+1], ":E", ":[GM]|>(?:venir|aller|partir)/") and g_morph(lToken[nLastToken+1], ":|<end>|>[(,]", ":(?:N|A|Q|B|Y|MP|H|T)|>(?:pour|plus|moins|mieux|peu|plupart|trop|très|en|y|une?|leur|lui)/") and g_morph(lToken[nTokenOffset], ":Cc|<start>|>[(,]")
 def _g_cond_gv1_299 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5930,7 +5962,7 @@ def _g_cond_gv1_302 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_303 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and g_morph(lToken[nTokenOffset+3], ":(?:Y|Ov)", ":[NAB]") and not g_morph(lToken[nTokenOffset], ":O[sv]")
 def _g_sugg_gv1_50 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-3]+"’en"
+    return lToken[nTokenOffset+1].sValue[:-3]+"’en"
 def _g_cond_gv1_304 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nLastToken+1], "|guerre|")
 def _g_cond_gv1_305 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -5950,79 +5982,79 @@ def _g_cond_gv1_311 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv1_312 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 1) and not g_value(lToken[nLastToken+1], "|partie|")
 def _g_cond_gv1_313 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[me]:[si]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[me]:[si]")
 def _g_sugg_gv1_51 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[me]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[me]:[si]", True)
 def _g_cond_gv1_314 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[si]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[si]")
 def _g_sugg_gv1_52 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[si]", True)
 def _g_cond_gv1_315 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[si]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[si]")
 def _g_sugg_gv1_53 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[si]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[si]", True)
 def _g_cond_gv1_316 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[pi]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[pi]")
 def _g_sugg_gv1_54 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[pi]", True)
 def _g_cond_gv1_317 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[me]:[pi]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[me]:[pi]")
 def _g_sugg_gv1_55 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[me]:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[me]:[pi]", True)
 def _g_cond_gv1_318 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return hasSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[pi]")
+    return hasSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[pi]")
 def _g_sugg_gv1_56 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nTokenOffset+3]["sValue"], ":[NA].*:[fe]:[pi]", True)
+    return suggSimil(lToken[nTokenOffset+3].sValue, ":[NA].*:[fe]:[pi]", True)
 def _g_sugg_gv1_57 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[NA].*:[me]:[si]", True)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[NA].*:[me]:[si]", True)
 def _g_sugg_gv1_58 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[NA].*:[fe]:[si]", True)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[NA].*:[fe]:[si]", True)
 def _g_sugg_gv1_59 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[NA].*:[si]", True)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[NA].*:[si]", True)
 def _g_sugg_gv1_60 (lToken, nTokenOffset, nLastToken):
-    return suggSimil(lToken[nLastToken-1+1]["sValue"], ":[NA].*:[pi]", True)
+    return suggSimil(lToken[nLastToken-1+1].sValue, ":[NA].*:[pi]", True)
 def _g_cond_gv1_319 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_value(lToken[nTokenOffset+1], "|rendez-vous|entre-nous|entre-vous|entre-elles|") and not g_morphVC(lToken[nTokenOffset+1], ":V0")
 def _g_cond_gv1_320 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:m:[si]", ":G|>verbe/") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:m:[si]", ":G|>verbe/") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_61 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":m:s")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":m:s")
 def _g_cond_gv1_321 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:f:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:f:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_62 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":f:s")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":f:s")
 def _g_cond_gv1_322 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:e:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:e:[si]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_63 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":s")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":s")
 def _g_cond_gv1_323 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_64 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":p")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":p")
 def _g_cond_gv1_324 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[me]:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_65 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":m:p")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":m:p")
 def _g_cond_gv1_325 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+4]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
+    return lToken[nTokenOffset+4].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":[NA].*:[fe]:[pi]", ":G") and g_morph(lToken[nTokenOffset+4], ":V1.*:Y", ":M")
 def _g_sugg_gv1_66 (lToken, nTokenOffset, nLastToken):
-    return suggVerbPpas(lToken[nTokenOffset+4]["sValue"], ":f:p")
+    return suggVerbPpas(lToken[nTokenOffset+4].sValue, ":f:p")
 def _g_cond_gv1_326 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+2], ":[123][sp]")
 def _g_sugg_gv1_67 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"].replace("ut", "ût").replace("UT", "ÛT")
+    return lToken[nTokenOffset+2].sValue.replace("ut", "ût").replace("UT", "ÛT")
 def _g_cond_gv1_327 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morphVC(lToken[nTokenOffset+1], ">avoir/")
 def _g_sugg_gv1_68 (lToken, nTokenOffset, nLastToken):
-    return suggVerbFrom("être", lToken[nLastToken-2+1]["sValue"])
+    return suggVerbFrom("être", lToken[nLastToken-2+1].sValue)
 def _g_cond_gv1_328 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower()
+    return lToken[nTokenOffset+2].sValue.islower()
 def _g_cond_gv1_329 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not (g_value(lToken[nTokenOffset+2], "|attendant|admettant|") and g_value(lToken[nLastToken+1], "|que|qu’|"))
+    return lToken[nTokenOffset+2].sValue.islower() and not (g_value(lToken[nTokenOffset+2], "|attendant|admettant|") and g_value(lToken[nLastToken+1], "|que|qu’|"))
 def _g_cond_gv1_330 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not (g_morph(lToken[nTokenOffset], ":1p") and not g_value(lToken[nTokenOffset], "|sachons|veuillons|allons|venons|partons|") and g_value(g_token(lToken, nTokenOffset+1-2), "|<start>|,|"))
+    return lToken[nTokenOffset+2].sValue.islower() and not (g_morph(lToken[nTokenOffset], ":1p") and not g_value(lToken[nTokenOffset], "|sachons|veuillons|allons|venons|partons|") and g_value(g_token(lToken, nTokenOffset+1-2), "|<start>|,|"))
 def _g_cond_gv1_331 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+2]["sValue"].islower() and not (g_morph(lToken[nTokenOffset], ":2p") and not g_value(lToken[nTokenOffset], "|sachez|veuillez|allez|venez|partez|") and g_value(g_token(lToken, nTokenOffset+1-2), "|<start>|,|"))
+    return lToken[nTokenOffset+2].sValue.islower() and not (g_morph(lToken[nTokenOffset], ":2p") and not g_value(lToken[nTokenOffset], "|sachez|veuillez|allez|venez|partez|") and g_value(g_token(lToken, nTokenOffset+1-2), "|<start>|,|"))
 def _g_cond_gv1_332 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[123]s") or not g_morph(lToken[nTokenOffset+3], ":N.*:[me]:[si]")
 def _g_cond_gv1_333 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6118,7 +6150,7 @@ def _g_cond_gv1_377 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_da_gv1_1 (lToken, nTokenOffset, nLastToken):
     return g_select(lToken[nTokenOffset+2], ":V")
 def _g_cond_gv2_1 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nLastToken-1+1]["sValue"] != "A"
+    return lToken[nLastToken-1+1].sValue != "A"
 def _g_cond_gv2_2 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tagbefore(lToken[nTokenOffset+1], dTags, "_ceque_") and not g_value(lToken[nTokenOffset], "|tout|d’|l’|")
 def _g_cond_gv2_3 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6146,11 +6178,11 @@ def _g_cond_gv2_13 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_14 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":([123][sp]|P)") and g_morph(lToken[nTokenOffset+4], ":Q")
 def _g_cond_gv2_15 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset+2], ":M", ":G") and lToken[nTokenOffset+3]["sValue"].islower() and g_morph(lToken[nTokenOffset+3], ":3s", ":G")
+    return g_morph(lToken[nTokenOffset+2], ":M", ":G") and lToken[nTokenOffset+3].sValue.islower() and g_morph(lToken[nTokenOffset+3], ":3s", ":G")
 def _g_cond_gv2_16 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V.*:1[sŝś]", ":[GW]")
 def _g_sugg_gv2_1 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+2]["sValue"][:-1]+"é-je"
+    return lToken[nTokenOffset+2].sValue[:-1]+"é-je"
 def _g_cond_gv2_17 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 1, 1) and g_morph(lToken[nTokenOffset+2], ":V.*:1[sŝś]", ":[GNW]") and not g_value(lToken[nTokenOffset+1], "|je|j’|il|elle|")
 def _g_cond_gv2_18 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6188,35 +6220,35 @@ def _g_cond_gv2_33 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_34 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":N.*:m:[si]", ":[fe]:[si]")
 def _g_sugg_gv2_2 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("-elle", "-il").replace("-Elle", "-Il").replace("-ELLE", "-IL")
+    return lToken[nLastToken-1+1].sValue.replace("-elle", "-il").replace("-Elle", "-Il").replace("-ELLE", "-IL")
 def _g_cond_gv2_35 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":N.*:f:[si]", ":[me]:[si]")
 def _g_sugg_gv2_3 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("-il", "-elle").replace("-Il", "-Elle").replace("-IL", "-ELLE")
+    return lToken[nLastToken-1+1].sValue.replace("-il", "-elle").replace("-Il", "-Elle").replace("-IL", "-ELLE")
 def _g_cond_gv2_36 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":N.*:m:[pi]", ":[fe]:[pi]")
 def _g_sugg_gv2_4 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("-elles", "-ils").replace("-Elles", "-Ils").replace("-ELLES", "-ILS")
+    return lToken[nLastToken-1+1].sValue.replace("-elles", "-ils").replace("-Elles", "-Ils").replace("-ELLES", "-ILS")
 def _g_cond_gv2_37 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":N.*:f:[pi]", ":[me]:[pi]")
 def _g_sugg_gv2_5 (lToken, nTokenOffset, nLastToken):
-    return lToken[nLastToken-1+1]["sValue"].replace("-ils", "-elles").replace("-Ils", "-Elles").replace("-ILS", "-ELLES")
+    return lToken[nLastToken-1+1].sValue.replace("-ils", "-elles").replace("-Ils", "-Elles").replace("-ILS", "-ELLES")
 def _g_cond_gv2_38 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return lToken[nTokenOffset+3]["sValue"] == "est" or lToken[nTokenOffset+3]["sValue"] == "es"
+    return lToken[nTokenOffset+3].sValue == "est" or lToken[nTokenOffset+3].sValue == "es"
 def _g_sugg_gv2_6 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":1s")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":1s")
 def _g_sugg_gv2_7 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":2s")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":2s")
 def _g_cond_gv2_39 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R|>(?:et|ou)") and not (g_morph(lToken[nTokenOffset+2], ":Q") and g_morph(lToken[nTokenOffset], ":V0.*:3s"))
 def _g_sugg_gv2_8 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+2]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+2].sValue, ":3s")
 def _g_cond_gv2_40 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":3p")
 def _g_cond_gv2_41 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R|>(?:et|ou)")
 def _g_sugg_gv2_9 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s")
 def _g_cond_gv2_42 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+3], ":3p")
 def _g_cond_gv2_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6224,11 +6256,11 @@ def _g_cond_gv2_43 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_44 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[123]p")
 def _g_sugg_gv2_10 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("e-", "es-").replace("E-", "ES-")
+    return lToken[nTokenOffset+1].sValue.replace("e-", "es-").replace("E-", "ES-")
 def _g_cond_gv2_45 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":[123]p")
 def _g_sugg_gv2_11 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":3s")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":3s")
 def _g_cond_gv2_46 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[VRD]")
 def _g_cond_gv2_47 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6250,15 +6282,15 @@ def _g_cond_gv2_54 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_55 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nLastToken-1+1], "_ngn_") and (g_morph(lToken[nTokenOffset+3], ":A.*:p") or (g_morph(lToken[nTokenOffset+3], ":N.*:p") and g_morph(lToken[nTokenOffset+2], ":A")))
 def _g_sugg_gv2_12 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s", False, suggMasSing)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s", False, suggMasSing)
 def _g_sugg_gv2_13 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s", False, suggFemSing)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s", False, suggFemSing)
 def _g_sugg_gv2_14 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3s", False, suggSing)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3s", False, suggSing)
 def _g_cond_gv2_56 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+2], "_enum_") and g_morph(lToken[nTokenOffset], ":C|<start>|>[(,]", ":[YP]") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[si]", ":G") and not ( (g_value(lToken[nTokenOffset+2], "|dizaine|douzaine|quinzaine|vingtaine|trentaine|quarantaine|cinquantaine|soixantaine|centaine|majorité|minorité|millier|partie|poignée|tas|paquet|moitié|") or g_tagbefore(lToken[nTokenOffset+1], dTags, "_ni_") or g_value(lToken[nTokenOffset], "|et|ou|")) and g_morph(lToken[nTokenOffset+4], ":3p") )
 def _g_sugg_gv2_15 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+4]["sValue"], ":3s")
+    return suggVerb(lToken[nTokenOffset+4].sValue, ":3s")
 def _g_cond_gv2_57 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nTokenOffset+2], "_enum_") and g_morph(lToken[nTokenOffset], ":C|<start>|>[(,]", ":[YP]|>et/") and g_morph(lToken[nTokenOffset+2], ":[NA].*:[me]:[si]", ":G") and not ( (g_value(lToken[nTokenOffset+2], "|dizaine|douzaine|quinzaine|vingtaine|trentaine|quarantaine|cinquantaine|soixantaine|centaine|majorité|minorité|millier|partie|poignée|tas|paquet|moitié|nombre|") or g_tagbefore(lToken[nTokenOffset+1], dTags, "_ni_") or g_value(lToken[nTokenOffset], "|et|ou|")) and g_morph(lToken[nTokenOffset+3], ":3?p") ) and not g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3])
 def _g_cond_gv2_58 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6276,17 +6308,17 @@ def _g_cond_gv2_63 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_64 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not (g_morph(lToken[nTokenOffset], ":R") and g_morph(lToken[nLastToken-1+1], ":3p"))
 def _g_sugg_gv2_16 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":1p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":1p")
 def _g_sugg_gv2_17 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":2p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":2p")
 def _g_cond_gv2_65 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":R") and not (g_morph(lToken[nTokenOffset+2], ":Q") and g_morph(lToken[nTokenOffset], ":V0.*:3p"))
 def _g_sugg_gv2_18 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+2]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+2].sValue, ":3p")
 def _g_cond_gv2_66 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":3s")
 def _g_sugg_gv2_19 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p")
 def _g_cond_gv2_67 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+3], ":3s")
 def _g_cond_gv2_68 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6296,15 +6328,15 @@ def _g_cond_gv2_69 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_70 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and g_morph(lToken[nTokenOffset+2], ":[123]s")
 def _g_sugg_gv2_20 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"].replace("s", "").replace("S", "")
+    return lToken[nTokenOffset+1].sValue.replace("s", "").replace("S", "")
 def _g_cond_gv2_71 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_tag(lToken[nTokenOffset+1], "_bcp_plur_") and not g_morph(lToken[nTokenOffset+2], ":3p")
 def _g_cond_gv2_72 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and g_tag(lToken[nTokenOffset+1], "_bcp_sing_") and not g_morph(lToken[nTokenOffset+2], ":3s")
 def _g_cond_gv2_73 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return not bCondMemo and lToken[nTokenOffset+2]["sValue"] != "a" and not g_tag(lToken[nTokenOffset+1], "_bcp_sing_") and not g_morph(lToken[nTokenOffset+2], ":3p") and not (g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 2) and g_morph(lToken[nTokenOffset+2], ":V0"))
+    return not bCondMemo and lToken[nTokenOffset+2].sValue != "a" and not g_tag(lToken[nTokenOffset+1], "_bcp_sing_") and not g_morph(lToken[nTokenOffset+2], ":3p") and not (g_space(lToken[nTokenOffset+1], lToken[nTokenOffset+1+1], 1, 2) and g_morph(lToken[nTokenOffset+2], ":V0"))
 def _g_sugg_gv2_21 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nLastToken-1+1]["sValue"], ":3p")
+    return suggVerb(lToken[nLastToken-1+1].sValue, ":3p")
 def _g_cond_gv2_74 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[VR]") and not (g_tag(lToken[nTokenOffset+1], "_d_entre_nous_") and g_morph(lToken[nLastToken-1+1], ":1p")) and not (g_tag(lToken[nTokenOffset+1], "_d_entre_vous_") and g_morph(lToken[nLastToken-1+1], ":2p"))
 def _g_cond_gv2_75 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6314,25 +6346,25 @@ def _g_cond_gv2_76 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_77 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset], ":[VR]|>(?:et|ou)/")
 def _g_cond_gv2_78 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") )
+    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") )
 def _g_cond_gv2_79 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_tag(lToken[nLastToken-1+1], "_ngn_") and (g_morph(lToken[nTokenOffset+3], ":A.*:s") or (g_morph(lToken[nTokenOffset+3], ":N.*:s") and g_morph(lToken[nTokenOffset+2], ":A")))
 def _g_sugg_gv2_22 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p", False, suggAgree, lToken[nTokenOffset+3]["sValue"], lToken[nTokenOffset+2]["sValue"])
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p", False, suggAgree, lToken[nTokenOffset+3].sValue, lToken[nTokenOffset+2].sValue)
 def _g_cond_gv2_80 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+4], ":3s") and look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") )
+    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+4], ":3s") and look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") )
 def _g_sugg_gv2_23 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+4]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+4].sValue, ":3p")
 def _g_cond_gv2_81 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not ( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") ) and not g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3]) and not ( g_morph(lToken[nTokenOffset+2], "(?:[123][sp]|P)") and not g_value(lToken[nTokenOffset], "|<start>|,|") )
+    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not ( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") ) and not g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3]) and not ( g_morph(lToken[nTokenOffset+2], "(?:[123][sp]|P)") and not g_value(lToken[nTokenOffset], "|<start>|,|") )
 def _g_cond_gv2_82 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
-    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset]["nStart"]], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") ) and not g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3]) and not ( g_morph(lToken[nTokenOffset+2], "(?:[123][sp]|P)") and not g_value(lToken[nTokenOffset], "|<start>|,|") )
+    return g_morph(lToken[nTokenOffset], ":Cs|<start>|>[(,]") and not( g_morph(lToken[nTokenOffset+3], ":3s") and look(sSentence[:lToken[1+nTokenOffset].nStart], "(?i)\\b(?:l[ea] |l’|une? |ce(?:tte|t|) |[mts](?:on|a) |[nv]otre ).+ entre .+ et ") ) and not g_agreement(lToken[nTokenOffset+2], lToken[nTokenOffset+3]) and not ( g_morph(lToken[nTokenOffset+2], "(?:[123][sp]|P)") and not g_value(lToken[nTokenOffset], "|<start>|,|") )
 def _g_sugg_gv2_24 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p", False, suggMasPlur)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p", False, suggMasPlur)
 def _g_sugg_gv2_25 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p", False, suggFemPlur)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p", False, suggFemPlur)
 def _g_sugg_gv2_26 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+3]["sValue"], ":3p", False, suggPlur)
+    return suggVerb(lToken[nTokenOffset+3].sValue, ":3p", False, suggPlur)
 def _g_cond_gv2_83 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nLastToken+1], ":(?:R|D.*:p)|>au/|<end>|>[(,]")
 def _g_cond_gv2_84 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6340,9 +6372,9 @@ def _g_cond_gv2_84 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags
 def _g_cond_gv2_85 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not bCondMemo and not g_agreement(lToken[nTokenOffset+3], lToken[nTokenOffset+4])
 def _g_sugg_gv2_27 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+4]["sValue"], ":3p", False, suggPlur)
+    return suggVerb(lToken[nTokenOffset+4].sValue, ":3p", False, suggPlur)
 def _g_sugg_gv2_28 (lToken, nTokenOffset, nLastToken):
-    return suggVerb(lToken[nTokenOffset+5]["sValue"], ":3p")
+    return suggVerb(lToken[nTokenOffset+5].sValue, ":3p")
 def _g_cond_gv2_86 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":[VR]", ":[NA]")
 def _g_cond_gv2_87 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6376,57 +6408,57 @@ def _g_cond_gv2_100 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv2_101 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not ( g_morph(lToken[nTokenOffset+3], ":3p") and (g_value(lToken[nLastToken+1], "|et|") or g_tag(lToken[nTokenOffset+5], "_enum_")) )
 def _g_sugg_gv2_29 (lToken, nTokenOffset, nLastToken):
-    return lToken[nTokenOffset+1]["sValue"][:-1]
+    return lToken[nTokenOffset+1].sValue[:-1]
 def _g_cond_gv2_102 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo and not g_morph(lToken[nTokenOffset+3], ":3s")
 def _g_cond_gv2_103 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+3], ":V0e", ":3p")
 def _g_sugg_gv2_30 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":1s")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":1s")
 def _g_sugg_gv2_31 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":2s")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":2s")
 def _g_sugg_gv2_32 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":3s")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":3s")
 def _g_sugg_gv2_33 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":1p")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":1p")
 def _g_sugg_gv2_34 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":2p")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":2p")
 def _g_sugg_gv2_35 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nLastToken-1+1]["sValue"], ":Iq", ":3p")
+    return suggVerbTense(lToken[nLastToken-1+1].sValue, ":Iq", ":3p")
 def _g_sugg_gv2_36 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nLastToken-1+1]["sValue"], ":I", lToken[nLastToken-2+1]["sValue"])
+    return suggVerbMode(lToken[nLastToken-1+1].sValue, ":I", lToken[nLastToken-2+1].sValue)
 def _g_cond_gv2_104 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+4], ":K")
 def _g_sugg_gv2_37 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":1s")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":1s")
 def _g_sugg_gv2_38 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":2s")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":2s")
 def _g_sugg_gv2_39 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":3s")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":3s")
 def _g_sugg_gv2_40 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":1p")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":1p")
 def _g_sugg_gv2_41 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":2p")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":2p")
 def _g_sugg_gv2_42 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":Iq", ":3p")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":Iq", ":3p")
 def _g_cond_gv2_105 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+6], ":K")
 def _g_sugg_gv2_43 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+6]["sValue"], ":Iq", ":3p")
+    return suggVerbTense(lToken[nTokenOffset+6].sValue, ":Iq", ":3p")
 def _g_cond_gv2_106 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+5], ":K")
 def _g_sugg_gv2_44 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+5]["sValue"], ":Iq", ":3s")
+    return suggVerbTense(lToken[nTokenOffset+5].sValue, ":Iq", ":3s")
 def _g_sugg_gv2_45 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+5]["sValue"], ":Iq", ":3p")
+    return suggVerbTense(lToken[nTokenOffset+5].sValue, ":Iq", ":3p")
 def _g_sugg_gv2_46 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+4]["sValue"], ":I", lToken[nTokenOffset+3]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+4].sValue, ":I", lToken[nTokenOffset+3].sValue)
 def _g_sugg_gv2_47 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+5]["sValue"], ":I", lToken[nTokenOffset+4]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+5].sValue, ":I", lToken[nTokenOffset+4].sValue)
 def _g_cond_gv2_107 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+1], ":V", ":N") and not g_tag(lToken[nTokenOffset+1], "_VCOD_")
 def _g_sugg_gv2_48 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nLastToken-1+1]["sValue"], ":S", lToken[nLastToken-2+1]["sValue"])
+    return suggVerbMode(lToken[nLastToken-1+1].sValue, ":S", lToken[nLastToken-2+1].sValue)
 def _g_cond_gv2_108 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return not g_morph(lToken[nTokenOffset+1], ":Q")
 def _g_cond_gv2_109 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6440,13 +6472,13 @@ def _g_cond_gv2_112 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv2_113 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_tag(lToken[nTokenOffset+2], "_upron_")
 def _g_sugg_gv2_49 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+3]["sValue"], ":S", lToken[nTokenOffset+2]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+3].sValue, ":S", lToken[nTokenOffset+2].sValue)
 def _g_sugg_gv2_50 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+4]["sValue"], ":S", lToken[nTokenOffset+3]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+4].sValue, ":S", lToken[nTokenOffset+3].sValue)
 def _g_sugg_gv2_51 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+5]["sValue"], ":S", lToken[nTokenOffset+4]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+5].sValue, ":S", lToken[nTokenOffset+4].sValue)
 def _g_sugg_gv2_52 (lToken, nTokenOffset, nLastToken):
-    return suggVerbMode(lToken[nTokenOffset+6]["sValue"], ":S", lToken[nTokenOffset+5]["sValue"])
+    return suggVerbMode(lToken[nTokenOffset+6].sValue, ":S", lToken[nTokenOffset+5].sValue)
 def _g_cond_gv2_114 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_morph(lToken[nTokenOffset+5], ":I", ":S")
 def _g_cond_gv2_115 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
@@ -6454,13 +6486,13 @@ def _g_cond_gv2_115 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTag
 def _g_cond_gv2_116 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return bCondMemo
 def _g_sugg_gv2_53 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+4]["sValue"], ":E", ":2s")
+    return suggVerbTense(lToken[nTokenOffset+4].sValue, ":E", ":2s")
 def _g_cond_gv2_117 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+2], lToken[nTokenOffset+2+1], 0, 0) and g_morph(lToken[nTokenOffset+4], ">(?:être|devenir|redevenir|sembler|para[iî]tre)/")
 def _g_cond_gv2_118 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+3], lToken[nTokenOffset+3+1], 0, 0)
 def _g_sugg_gv2_54 (lToken, nTokenOffset, nLastToken):
-    return suggVerbTense(lToken[nTokenOffset+5]["sValue"], ":E", ":2s")
+    return suggVerbTense(lToken[nTokenOffset+5].sValue, ":E", ":2s")
 def _g_cond_gv2_119 (lToken, nTokenOffset, nLastToken, sCountry, bCondMemo, dTags, sSentence, sSentence0):
     return g_space(lToken[nTokenOffset+3], lToken[nTokenOffset+3+1], 0, 0) and g_morph(lToken[nTokenOffset+5], ">(?:être|devenir|redevenir|sembler|para[iî]tre)/")
 
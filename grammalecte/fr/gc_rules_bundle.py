@@ -0,0 +1,234 @@
+"""
+Grammar checker rules: bundle pruned for a fixed set of options
+
+A server always running with the same options doesn’t need the rules it will never execute.
+A bundle contains the rules of <gc_rules.py> and <gc_rules_graph.py> pruned according to a set of options and a list of ignored rules:
+- regex rule groups of disabled options and ignored regex rules are removed,
+- graphs of disabled options are removed,
+- graph rules of disabled options are removed from <dRule> and from the graphs
+  (ignored rules are kept: the engine ignores only regex rules, and a graph rule may read the result of the condition of the previous rule),
+- graph nodes leading to no rule anymore are removed,
+- the list of functions of <gc_functions.py> still called by the rules is recorded: the engine forgets the others.
+
+The bundle is stored in the snapshot format (see <gc_rules_snapshot.py>),
+with the checksum of <gc_rules.py>, <gc_rules_graph.py> and <gc_functions.py>: if one of them changes, the bundle is stale and ignored.
+With a bundle, options disabled when it was built can’t be switched on: their rules don’t exist anymore.
+
+Build command:
+    python3 -m grammalecte.fr.gc_rules_bundle <bundle file> [-c context] [-on options] [-off options] [-roff rules]
+"""
+
+import os
+import re
+import sys
+import hashlib
+import argparse
+import traceback
+
+from . import gc_rules_snapshot
+
+
+spHere = os.path.dirname(os.path.abspath(__file__))
+lSources = [ os.path.join(spHere, sFileName)  for sFileName in ("gc_rules.py", "gc_rules_graph.py", "gc_functions.py") ]
+
+# functions of <gc_functions.py> generated from the rules (conditions, suggestions, messages, text processors, disambiguators)
+_zGeneratedFunction = re.compile("_(?:c|s|p|m|g_cond|g_sugg|g_da|g_tp)_")
+
+
+def getChecksum ():
+    "return the SHA-256 checksum of the sources of the rules (bytes) or None if a file doesn’t exist"
+    xHash = hashlib.sha256()
+    for spf in lSources:
+        byChecksum = gc_rules_snapshot.getChecksum(spf)
+        if not byChecksum:
+            return None
+        xHash.update(byChecksum)
+    return xHash.digest()
+
+
+def isGeneratedFunction (sName):
+    "return True if <sName> is the name of a function generated from the rules"
+    return bool(_zGeneratedFunction.match(sName))
+
+
+class RulesBundle (gc_rules_snapshot.GraphRulesSnapshot):
+    "rules read from a bundle: regex rules and graph rules pruned for a set of options"
+
+    def __init__ (self, xData, dIndex, iGraphStart):
+        gc_rules_snapshot.GraphRulesSnapshot.__init__(self, xData, dIndex, iGraphStart)
+        self.lParagraphRules = dIndex["lParagraphRules"]
+        self.lSentenceRules = dIndex["lSentenceRules"]
+        self.dOptions = dIndex["dOptions"]
+        self.lIgnoredRules = dIndex["lIgnoredRules"]
+        self.lFunctions = dIndex["lFunctions"]
+
+
+def load (spf):
+    "return the rules bundle <spf> as a RulesBundle object or None if it’s missing, stale or unreadable"
+    tData = gc_rules_snapshot.read(spf, getChecksum())
+    if not tData or "lParagraphRules" not in tData[1]:
+        return None
+    return RulesBundle(*tData)
+
+
+def pruneFunctions (xModule, lFunctions):
+    "remove from <xModule> the generated functions not listed in <lFunctions>, return the number of functions removed"
+    aFunctions = set(lFunctions)
+    lUnused = [ sName  for sName in vars(xModule)  if isGeneratedFunction(sName) and sName not in aFunctions ]
+    for sName in lUnused:
+        delattr(xModule, sName)
+    return len(lUnused)
+
+
+def _pruneRegexRules (lRules, dOptions, aIgnoredRules, dAllGraph):
+    lNewRules = []
+    for sOption, lRuleGroup in lRules:
+        if sOption == "@@@@":
+            # the group is kept even if empty: the sentence is updated before graph rules
+            lNewRules.append([sOption, [ [sGraphName, sLineId]  for sGraphName, sLineId in lRuleGroup  if sGraphName in dAllGraph ]])
+        elif not sOption or dOptions.get(sOption, False):
+            # regexes may have been compiled by the engine
+            lNewRuleGroup = [ [getattr(aRule[0], "pattern", aRule[0])] + list(aRule[1:])  for aRule in lRuleGroup  if aRule[3] not in aIgnoredRules ]
+            if lNewRuleGroup:
+                lNewRules.append([sOption, lNewRuleGroup])
+    return lNewRules
+
+
+def _pruneGraph (dGraph, dRule):
+    "remove from <dGraph> the rules not in <dRule> and the nodes leading to no rule, return the pruned graph or None if there is no rule left"
+    dNewGraph = {}
+    dPrevious = {}      # reversed arcs: {node: list of previous nodes}
+    lRuleNodes = []
+    for iNode, xNode in dGraph.items():
+        if isinstance(xNode, list):
+            # list of rules
+            dNewGraph[iNode] = [ sRuleId  for sRuleId in xNode  if sRuleId in dRule ]
+            continue
+        dNewGraph[iNode] = dNewNode = {}
+        for sKey, xValue in xNode.items():
+            if sKey == "<rules>":
+                dRules = { sLineId: iRuleNode  for sLineId, iRuleNode in xValue.items()  if any( sRuleId in dRule  for sRuleId in dGraph[iRuleNode] ) }
+                if dRules:
+                    dNewNode[sKey] = dRules
+                    lRuleNodes.append(iNode)
+            else:
+                dNewNode[sKey] = xValue
+                for iNext in (xValue.values()  if isinstance(xValue, dict)  else (xValue,)):
+                    dPrevious.setdefault(iNext, []).append(iNode)
+    # nodes leading to rules
+    aUseful = set(lRuleNodes)
+    lStack = list(lRuleNodes)
+    while lStack:
+        for iPrevious in dPrevious.get(lStack.pop(), ()):
+            if iPrevious not in aUseful:
+                aUseful.add(iPrevious)
+                lStack.append(iPrevious)
+    if 0 not in aUseful:
+        return None
+    # remove arcs to useless nodes, then useless nodes
+    aRuleLists = set()
+    for iNode in aUseful:
+        dNode = dNewGraph[iNode]
+        for sKey, xValue in list(dNode.items()):
+            if sKey == "<rules>":
+                aRuleLists.update(xValue.values())
+            elif isinstance(xValue, dict):
+                dArcs = { sArc: iNext  for sArc, iNext in xValue.items()  if iNext in aUseful }
+                if dArcs:
+                    dNode[sKey] = dArcs
+                else:
+                    del dNode[sKey]
+            elif xValue not in aUseful:
+                del dNode[sKey]
+    return { iNode: xNode  for iNode, xNode in dNewGraph.items()  if iNode in aUseful or iNode in aRuleLists }
+
+
+def _getFunctionNames (xData, aFunctions):
+    "add to <aFunctions> the names of generated functions found in <xData> (strings, possibly prefixed with “=”, in nested lists and tuples)"
+    if isinstance(xData, str):
+        sName = xData[1:]  if xData.startswith("=")  else xData
+        if isGeneratedFunction(sName):
+            aFunctions.add(sName)
+    elif isinstance(xData, (list, tuple)):
+        for xItem in xData:
+            _getFunctionNames(xItem, aFunctions)
+
+
+def build (spf, dOptions=None, lIgnoredRules=None, sContext="Python"):
+    """build the rules bundle <spf> for the options of context <sContext> updated with <dOptions>, without rules <lIgnoredRules>.
+       return the options of the bundle"""
+    from . import gc_rules
+    from . import gc_options
+    byChecksum = getChecksum()
+    if not byChecksum:
+        raise OSError("# Error. Rules sources not found in: " + spHere)
+    dBundleOptions = gc_options.getDefaultOptions(sContext)
+    if dOptions:
+        dBundleOptions.update({ sOpt: bVal  for sOpt, bVal in dOptions.items()  if sOpt in dBundleOptions })
+    aIgnoredRules = set(lIgnoredRules or ())
+    # graph rules: from the snapshot if it’s up to date
+    oRulesGraph = gc_rules_snapshot.load()
+    if not oRulesGraph:
+        from . import gc_rules_graph
+        oRulesGraph = gc_rules_graph
+    dRule = {}
+    for sRuleId, lActions in oRulesGraph.dRule.items():
+        sOption = lActions[1]
+        if sOption and not dBundleOptions.get(sOption, False):
+            continue
+        dRule[sRuleId] = lActions
+    dAllGraph = {}
+    for sGraphName in (oRulesGraph.getGraphNames()  if hasattr(oRulesGraph, "getGraphNames")  else oRulesGraph.dAllGraph):
+        if sGraphName in dBundleOptions and not dBundleOptions[sGraphName]:
+            continue
+        dGraph = oRulesGraph.loadGraph(sGraphName)  if hasattr(oRulesGraph, "loadGraph")  else oRulesGraph.dAllGraph[sGraphName]
+        dGraph = _pruneGraph(dGraph, dRule)
+        if dGraph:
+            dAllGraph[sGraphName] = dGraph
+    # graph rules not reachable anymore
+    aRuleIds = { sRuleId  for dGraph in dAllGraph.values()  for xNode in dGraph.values()  if isinstance(xNode, list)  for sRuleId in xNode }
+    dRule = { sRuleId: lActions  for sRuleId, lActions in dRule.items()  if sRuleId in aRuleIds }
+    lParagraphRules = _pruneRegexRules(gc_rules.lParagraphRules, dBundleOptions, aIgnoredRules, dAllGraph)
+    lSentenceRules = _pruneRegexRules(gc_rules.lSentenceRules, dBundleOptions, aIgnoredRules, dAllGraph)
+    aFunctions = set()
+    _getFunctionNames([ lRuleGroup  for sOption, lRuleGroup in lParagraphRules + lSentenceRules  if sOption != "@@@@" ], aFunctions)
+    _getFunctionNames(list(dRule.values()), aFunctions)
+    aURLs = { lActions[-1]  for lActions in dRule.values()  if lActions[3] == "-" }
+    dIndex = {
+        "dRule": dRule,
+        "dURL": { iURL: sURL  for iURL, sURL in oRulesGraph.dURL.items()  if iURL in aURLs },
+        "lParagraphRules": lParagraphRules,
+        "lSentenceRules": lSentenceRules,
+        "dOptions": dBundleOptions,
+        "lIgnoredRules": sorted(aIgnoredRules),
+        "lFunctions": sorted(aFunctions)
+    }
+    gc_rules_snapshot.write(spf, byChecksum, dIndex, dAllGraph)
+    return dBundleOptions
+
+
+def main ():
+    "build a rules bundle"
+    xParser = argparse.ArgumentParser(description="Build a bundle of rules pruned for a set of options")
+    xParser.add_argument("bundle", help="bundle file to write", type=str)
+    xParser.add_argument("-c", "--context", help="context of default options (Python, Server, Writer)", type=str, default="Python")
+    xParser.add_argument("-on", "--opt_on", nargs="+", help="activate options")
+    xParser.add_argument("-off", "--opt_off", nargs="+", help="deactivate options")
+    xParser.add_argument("-roff", "--rule_off", nargs="+", help="deactivate rules")
+    xArgs = xParser.parse_args()
+    dOptions = {}
+    if xArgs.opt_on:
+        dOptions.update({ sOpt: True  for sOpt in xArgs.opt_on })
+    if xArgs.opt_off:
+        dOptions.update({ sOpt: False  for sOpt in xArgs.opt_off })
+    try:
+        dBundleOptions = build(xArgs.bundle, dOptions, xArgs.rule_off, xArgs.context)
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    print("Rules bundle written: " + xArgs.bundle)
+    print("Options: " + " ".join( sOpt  for sOpt, bVal in sorted(dBundleOptions.items())  if bVal ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""
+Grammar checker graph rules: precompiled snapshot
+
+Importing <gc_rules_graph.py> means compiling and executing a huge Python literal.
+The snapshot stores the same data (dAllGraph, dRule, dURL) serialized with <marshal>, which is much faster to load.
+The snapshot records a checksum of <gc_rules_graph.py>: if the module changes, the snapshot is stale and ignored.
+Each graph is serialized separately, so that a graph is materialized only when it’s needed.
+
+Build command:
+    python3 -m grammalecte.fr.gc_rules_snapshot
+
+File scheme:
+    [ header: 60 bytes ]
+        16 bytes    magic string <_MAGIC>
+         4 bytes    version of the snapshot format
+         4 bytes    version of the marshal format
+        32 bytes    SHA-256 checksum of sources (<gc_rules_graph.py> for the snapshot)
+         4 bytes    size of the marshalled index (in bytes)
+    [ marshalled index ]
+        dictionary { "dRule": ..., "dURL": ..., "dGraph": { graph name: (offset, size) } }
+        (rule bundles, see <gc_rules_bundle.py>, store more data in the index)
+        offsets of graphs are relative to the end of the index
+    [ marshalled graphs ]
+        one marshalled object per graph
+"""
+
+import os
+import sys
+import mmap
+import struct
+import marshal
+import hashlib
+import traceback
+
+
+_MAGIC = b"/grammalecte-rg/"
+_VERSION = 2
+_HEADER = struct.Struct("<16sII32sI")
+
+spHere = os.path.dirname(os.path.abspath(__file__))
+spfSource = os.path.join(spHere, "gc_rules_graph.py")
+spfSnapshot = os.path.join(spHere, "gc_rules_graph.snapshot")
+
+
+def getChecksum (spf=spfSource):
+    "return the SHA-256 checksum of the file <spf> (bytes) or None if the file doesn’t exist"
+    try:
+        with open(spf, "rb") as hSrc:
+            return hashlib.sha256(hSrc.read()).digest()
+    except OSError:
+        return None
+
+
+def _readHeader (hSrc):
+    "return the header of the snapshot as a tuple (nVersion, nMarshalVersion, byChecksum, nSize) or None if it’s not a snapshot"
+    byHeader = hSrc.read(_HEADER.size)
+    if len(byHeader) != _HEADER.size:
+        return None
+    sMagic, nVersion, nMarshalVersion, byChecksum, nSize = _HEADER.unpack(byHeader)
+    if sMagic != _MAGIC:
+        return None
+    return nVersion, nMarshalVersion, byChecksum, nSize
+
+
+def isUpToDate (spf=spfSnapshot):
+    "return True if the snapshot <spf> exists and has been built from the current <gc_rules_graph.py>"
+    try:
+        with open(spf, "rb") as hSrc:
+            tHeader = _readHeader(hSrc)
+    except OSError:
+        return False
+    if not tHeader:
+        return False
+    nVersion, nMarshalVersion, byChecksum, _ = tHeader
+    return nVersion == _VERSION and nMarshalVersion == marshal.version and byChecksum == getChecksum()
+
+
+class GraphRulesSnapshot:
+    "graph rules read from a snapshot: rules and URLs are loaded at once, graphs are loaded on demand"
+
+    def __init__ (self, xData, dIndex, iGraphStart):
+        self._xData = xData                 # snapshot mapped in memory
+        self._dGraphIndex = dIndex["dGraph"]
+        self._iGraphStart = iGraphStart
+        self.dRule = dIndex["dRule"]
+        self.dURL = dIndex["dURL"]
+
+    def getGraphNames (self):
+        "return the list of graph names"
+        return list(self._dGraphIndex)
+
+    def loadGraph (self, sGraphName):
+        "return the graph <sGraphName> (a new object at each call)"
+        iOffset, nSize = self._dGraphIndex[sGraphName]
+        iStart = self._iGraphStart + iOffset
+        return marshal.loads(self._xData[iStart:iStart+nSize])
+
+
+def read (spf, byChecksum):
+    """return a tuple (xData, dIndex, iGraphStart) from the snapshot <spf> mapped in memory
+       or None if the file is missing, unreadable or not built from sources with the checksum <byChecksum>"""
+    if not byChecksum:
+        return None
+    try:
+        with open(spf, "rb") as hSrc:
+            tHeader = _readHeader(hSrc)
+            if not tHeader:
+                return None
+            nVersion, nMarshalVersion, byChecksumSnapshot, nIndexSize = tHeader
+            if nVersion != _VERSION or nMarshalVersion != marshal.version or byChecksumSnapshot != byChecksum:
+                return None
+            # the snapshot is mapped in memory: if it’s rebuilt later, the mapping still refers to this version of the file
+            xData = mmap.mmap(hSrc.fileno(), 0, access=mmap.ACCESS_READ)
+        iGraphStart = _HEADER.size + nIndexSize
+        dIndex = marshal.loads(xData[_HEADER.size:iGraphStart])
+        if any( iGraphStart + iOffset + nSize > len(xData)  for iOffset, nSize in dIndex["dGraph"].values() ):
+            return None
+        return xData, dIndex, iGraphStart
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None
+
+
+def load (spf=spfSnapshot):
+    "return the graph rules as a GraphRulesSnapshot object or None if the snapshot is missing, stale or unreadable"
+    tData = read(spf, getChecksum())
+    if not tData:
+        return None
+    return GraphRulesSnapshot(*tData)
+
+
+def write (spf, byChecksum, dIndex, dAllGraph):
+    """write a snapshot in <spf>: <dIndex> is a dictionary of marshallable data (the index of graphs is added to it),
+       <dAllGraph> the dictionary of graphs, <byChecksum> the checksum of sources"""
+    lGraphData = []
+    dGraphIndex = {}
+    iOffset = 0
+    for sGraphName, dGraph in dAllGraph.items():
+        byGraph = marshal.dumps(dGraph)
+        dGraphIndex[sGraphName] = (iOffset, len(byGraph))
+        lGraphData.append(byGraph)
+        iOffset += len(byGraph)
+    byIndex = marshal.dumps(dict(dIndex, dGraph=dGraphIndex))
+    # write in a temporary file, then replace: processes loading the snapshot meanwhile never read a partial file
+    spfTemp = spf + ".tmp" + str(os.getpid())
+    try:
+        with open(spfTemp, "wb") as hDst:
+            hDst.write(_HEADER.pack(_MAGIC, _VERSION, marshal.version, byChecksum, len(byIndex)))
+            hDst.write(byIndex)
+            for byGraph in lGraphData:
+                hDst.write(byGraph)
+        os.replace(spfTemp, spf)
+    finally:
+        if os.path.exists(spfTemp):
+            os.remove(spfTemp)
+
+
+def build (spf=spfSnapshot):
+    "build the snapshot <spf> from <gc_rules_graph.py>"
+    from . import gc_rules_graph
+    byChecksum = getChecksum()
+    if not byChecksum:
+        raise OSError("# Error. File not found: " + spfSource)
+    write(spf, byChecksum, { "dRule": gc_rules_graph.dRule, "dURL": gc_rules_graph.dURL }, gc_rules_graph.dAllGraph)
+
+
+def main ():
+    "build the snapshot of graph rules"
+    try:
+        build()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    print("Snapshot written: " + spfSnapshot)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,19 +2,40 @@
 Masculins, féminins, singuliers et pluriels
 """
 
-from .mfsp_data import lTagMiscPlur as _lTagMiscPlur
-from .mfsp_data import lTagFemForm as _lTagFemForm
-from .mfsp_data import dMiscPlur as _dMiscPlur
-from .mfsp_data import dMasForm as _dMasForm
+from . import compact_data
+
+
+# data loaded on first use (see _loadData)
+_lTagMiscPlur = None
+_lTagFemForm = None
+_dMiscPlur = None
+_dMasForm = None
+
+
+def _loadData ():
+    "load data from <mfsp_data> and store it in compact tables"
+    global _lTagMiscPlur
+    global _lTagFemForm
+    global _dMiscPlur
+    global _dMasForm
+    dData = compact_data.loadDataModule("mfsp_data")
+    _lTagMiscPlur = tuple(dData["lTagMiscPlur"])
+    _lTagFemForm = tuple(dData["lTagFemForm"])
+    _dMiscPlur = compact_data.SortedMap(dData["dMiscPlur"], "H")
+    _dMasForm = compact_data.SortedMap(dData["dMasForm"], "H")
 
 
 def isMasForm (sWord):
     "returns True if sWord exists in _dMasForm"
+    if _dMasForm is None:
+        _loadData()
     return sWord in _dMasForm
 
 
 def getFemForm (sWord, bPlur):
     "returns feminine forms with masculine form"
+    if _dMasForm is None:
+        _loadData()
     if sWord in _dMasForm:
         return [ _modifyStringWithSuffixCode(sWord, sTag)  for sTag in _whatSuffixCodes(sWord, bPlur) ]
     return []
@@ -22,11 +43,15 @@ def getFemForm (sWord, bPlur):
 
 def hasMiscPlural (sWord):
     "returns True if sWord exists in dPlurMisc"
+    if _dMasForm is None:
+        _loadData()
     return sWord in _dMiscPlur
 
 
 def getMiscPlural (sWord):
     "returns plural form with singular form"
+    if _dMasForm is None:
+        _loadData()
     if sWord in _dMiscPlur:
         return [ _modifyStringWithSuffixCode(sWord, sTag)  for sTag in _lTagMiscPlur[_dMiscPlur[sWord]].split("|") ]
     return []
@@ -0,0 +1,243 @@
+"""
+Grammalecte - Morphologies as bit masks
+
+Each distinct morphology is decoded once into an integer: each bit is a feature (part of speech, gender, number,
+person, tense…), and its lemma is kept aside. A feature is defined by the substring or the regex which was searched
+in morphologies, so a bitwise test gives exactly the same result as the search it replaces.
+Patterns which can’t be expressed as a set of features (an order between tags, for example) are not translated:
+callers must keep their regex for them.
+"""
+
+import re
+
+
+__all__ = [ "getMask", "getMasks", "getUnion", "getLemma", "getFeature", "getMaskOfSubstring", "getMaskOfRegex", "getGenderNumber", "getStats" ]
+
+
+# substrings searched in morphologies
+_lSubstring = [
+    ":",
+    # nom, adjectif, noms propres, titres
+    ":N", ":A", ":M", ":M1", ":M2", ":MP", ":T",
+    # mots grammaticaux, adverbes, déterminants, prépositions, pronoms, conjonctions, interjections, négation, nombres
+    ":G", ":W", ":D", ":Dd", ":De", ":Di", ":Dn", ":Dp", ":R", ":Rv",
+    ":O", ":O1", ":O2", ":O3", ":Od", ":Oi", ":On", ":Oo", ":Or", ":Os", ":Ot", ":Ov", ":Ow",
+    ":C", ":Cc", ":Cs", ":J", ":X", ":B", ":Br", ":Z", ":Zp", ":U", ":ÉR",
+    # verbes: groupes, infinitif, participes
+    ":V", ":V0", ":V0a", ":V0e", ":V1", ":V2", ":V3", ":Y", ":P", ":Q",
+    # temps et modes
+    ":I", ":Ip", ":Iq", ":Is", ":If", ":K", ":S", ":Sp", ":Sq", ":E",
+    # personnes
+    ":1s", ":1ŝ", ":2s", ":3s", ":1p", ":2p", ":3p", ":3p!",
+    # genre et nombre
+    ":m", ":f", ":e", ":s", ":p", ":i",
+    ":m:s", ":m:p", ":m:i", ":f:s", ":f:p", ":f:i", ":e:s", ":e:p", ":e:i",
+    # étiquettes
+    "#G", "#C", "#P", "#L",
+]
+
+# regexes searched in morphologies (see cregex): they are searched only if one of the required features is present
+_lRegex = [
+    # (regex, substrings required)
+    (":[NA].*:s", (":N", ":A")),
+    (":[NA].*:p", (":N", ":A")),
+    (":[NA].*:i", (":N", ":A")),
+    (":[NA].*:[si]", (":N", ":A")),
+    (":[NA].*:[pi]", (":N", ":A")),
+    (":[NA].*:m", (":N", ":A")),
+    (":[NA].*:f", (":N", ":A")),
+    (":[NA].*:e", (":N", ":A")),
+    (":[NA].*:[me]", (":N", ":A")),
+    (":[NA].*:[fe]", (":N", ":A")),
+    (":[NA].*:m.*:s", (":N", ":A")),
+    (":[NA].*:f.*:s", (":N", ":A")),
+    (":[NA].*:e.*:s", (":N", ":A")),
+    (":[NA].*:[me].*:s", (":N", ":A")),
+    (":[NA].*:[fe].*:s", (":N", ":A")),
+    (":[NA].*:m.*:[si]", (":N", ":A")),
+    (":[NA].*:f.*:[si]", (":N", ":A")),
+    (":[NA].*:e.*:[si]", (":N", ":A")),
+    (":[NA].*:[me].*:[si]", (":N", ":A")),
+    (":[NA].*:[fe].*:[si]", (":N", ":A")),
+    (":[NA].*:m.*:p", (":N", ":A")),
+    (":[NA].*:f.*:p", (":N", ":A")),
+    (":[NA].*:e.*:p", (":N", ":A")),
+    (":[NA].*:[me].*:p", (":N", ":A")),
+    (":[NA].*:m.*:[pi]", (":N", ":A")),
+    (":[NA].*:f.*:[pi]", (":N", ":A")),
+    (":[NA].*:e.*:[pi]", (":N", ":A")),
+    (":[NA].*:[me].*:[pi]", (":N", ":A")),
+    (":[NA].*:[fe].*:[pi]", (":N", ":A")),
+    (":V[123].*:[123][sp]", (":V1", ":V2", ":V3")),
+    (":N(?!:A)", (":N",)),
+    (":(?:N(?!:A)|Q)", (":N", ":Q")),
+    (":(?:M[12P]|T):m", (":M", ":T")),
+    (":(?:M[12P]|T):f", (":M", ":T")),
+    (":(?:M[12P]|T):e", (":M", ":T")),
+]
+
+_zLemma = re.compile(r"^>(\w[\w-]*)")
+_zGenderNumber = re.compile(":[mfe]:[spi]")
+
+
+_dFeature = {}          # {substring or regex: bit}
+for _sFeature in _lSubstring:
+    _dFeature[_sFeature] = 1 << len(_dFeature)
+_lRegexFeature = []     # [(compiled regex, bit, mask of required features)]
+for _sFeature, _tRequired in _lRegex:
+    _dFeature[_sFeature] = 1 << len(_dFeature)
+    _lRegexFeature.append((re.compile(_sFeature), _dFeature[_sFeature], sum(_dFeature[s]  for s in _tRequired)))
+
+# gender and number of the first “:[mfe]:[spi]” in the morphology (see getGenderNumber)
+_dGenderNumberFeature = {}
+for _sFeature in ("m", "f", "e", "s", "p", "i"):
+    _dGenderNumberFeature[":"+_sFeature] = 1 << len(_dFeature) + len(_dGenderNumberFeature)
+_nGenderNumberMask = sum(_dGenderNumberFeature.values())
+
+_lSubstringFeature = [ (sSubstring, _dFeature[sSubstring])  for sSubstring in _lSubstring ]
+
+
+_dMask = {}             # {morphology: mask}
+_dLemma = {}            # {morphology: lemma}
+_dMaskOfRegex = {}      # {regex: mask or None}
+
+
+def _decode (sMorph):
+    nMask = 0
+    for sSubstring, nBit in _lSubstringFeature:
+        if sSubstring in sMorph:
+            nMask |= nBit
+    for zRegex, nBit, nRequired in _lRegexFeature:
+        if nMask & nRequired and zRegex.search(sMorph):
+            nMask |= nBit
+    m = _zGenderNumber.search(sMorph)
+    if m:
+        nMask |= _dGenderNumberFeature[m.group(0)[0:2]] | _dGenderNumberFeature[m.group(0)[2:4]]
+    m = _zLemma.search(sMorph)
+    _dLemma[sMorph] = m.group(1)  if m  else None
+    _dMask[sMorph] = nMask
+    return nMask
+
+
+def getMask (sMorph):
+    "return the mask of features of the morphology <sMorph>"
+    nMask = _dMask.get(sMorph)
+    return nMask  if nMask is not None  else _decode(sMorph)
+
+
+def getMasks (lMorph):
+    "return the list of masks of the morphologies of <lMorph>"
+    return [ _dMask[sMorph]  if sMorph in _dMask  else _decode(sMorph)  for sMorph in lMorph ]
+
+
+def getUnion (lMorph):
+    "return the union of the masks of the morphologies of <lMorph>: features of at least one morphology"
+    nUnion = 0
+    for sMorph in lMorph:
+        nMask = _dMask.get(sMorph)
+        nUnion |= nMask  if nMask is not None  else _decode(sMorph)
+    return nUnion
+
+
+def getLemma (sMorph):
+    "return the lemma of the morphology <sMorph> (None if there is no lemma)"
+    if sMorph not in _dLemma:
+        _decode(sMorph)
+    return _dLemma[sMorph]
+
+
+def getFeature (sFeature):
+    "return the bit of <sFeature> (a substring or a regex searched in morphologies), raise KeyError if it’s not a feature"
+    return _dFeature[sFeature]
+
+
+def getMaskOfSubstring (sSearch):
+    "return the mask of features equivalent to the search of the substring <sSearch>, or None if there is no such feature"
+    return _dFeature.get(sSearch)
+
+
+def getMaskOfRegex (sRegex):
+    """return the mask of features equivalent to the search of <sRegex> (a morphology matches if it has one of these features),
+       or None if <sRegex> can’t be expressed as a set of features"""
+    if sRegex not in _dMaskOfRegex:
+        nMask = _dFeature.get(sRegex)
+        if nMask is None:
+            lSubstring = _expandRegex(sRegex)
+            if lSubstring and all(sSubstring in _dFeature  for sSubstring in lSubstring):
+                nMask = 0
+                for sSubstring in lSubstring:
+                    nMask |= _dFeature[sSubstring]
+        _dMaskOfRegex[sRegex] = nMask
+    return _dMaskOfRegex[sRegex]
+
+
+def _expandRegex (sRegex, nMax=64):
+    """return the list of strings matched by <sRegex> if it is made only of characters, classes of characters [abc]
+       and groups of alternatives (?:a|b): searching <sRegex> is then searching one of these strings. Else, return None"""
+    try:
+        lString, i = _expandAlternatives(sRegex, 0, nMax)
+    except ValueError:
+        return None
+    return lString  if i == len(sRegex)  else None
+
+
+def _expandAlternatives (sRegex, i, nMax):
+    lString, i = _expandSequence(sRegex, i, nMax)
+    while i < len(sRegex) and sRegex[i] == "|":
+        lNext, i = _expandSequence(sRegex, i+1, nMax)
+        lString.extend(lNext)
+    if len(lString) > nMax:
+        raise ValueError
+    return lString, i
+
+
+def _expandSequence (sRegex, i, nMax):
+    lString = [""]
+    while i < len(sRegex):
+        c = sRegex[i]
+        if c == "[":
+            j = sRegex.find("]", i)
+            if j == -1 or j == i+1 or any(cChar in "^-\\["  for cChar in sRegex[i+1:j]):
+                raise ValueError
+            lChoice = list(sRegex[i+1:j])
+            i = j + 1
+        elif c == "(":
+            if not sRegex.startswith("(?:", i):
+                raise ValueError
+            lChoice, i = _expandAlternatives(sRegex, i+3, nMax)
+            if i >= len(sRegex) or sRegex[i] != ")":
+                raise ValueError
+            i += 1
+        elif c in "|)":
+            break
+        elif c in ".^$*+?{}]\\":
+            raise ValueError
+        else:
+            lChoice = [c]
+            i += 1
+        if i < len(sRegex) and sRegex[i] in "*+?{":
+            # quantifier
+            raise ValueError
+        lString = [ sString + sChoice  for sString in lString  for sChoice in lChoice ]
+        if len(lString) > nMax:
+            raise ValueError
+    return lString, i
+
+
+def getGenderNumber (nMask):
+    "return the gender and the number of the first “:[mfe]:[spi]” of the morphology of <nMask> (empty strings if there is none)"
+    sGender = ""
+    sNumber = ""
+    if nMask & _nGenderNumberMask:
+        for sFeature, nBit in _dGenderNumberFeature.items():
+            if nMask & nBit:
+                if sFeature in (":m", ":f", ":e"):
+                    sGender = sFeature
+                else:
+                    sNumber = sFeature
+    return sGender, sNumber
+
+
+def getStats ():
+    "return the number of features and of morphologies decoded"
+    return { "nFeatures": len(_dFeature) + len(_dGenderNumberFeature), "nMorphologies": len(_dMask) }
@@ -6,24 +6,42 @@ Grammalecte - Suggestion phonétique
 
 import re
 
-from .phonet_data import dWord as _dWord
-from .phonet_data import lSet as _lSet
-from .phonet_data import dMorph as _dMorph
+from . import compact_data
+
+
+# data loaded on first use (see _loadData)
+_dWord = None       # {word: set number}
+_lSet = None        # sets of words phonetically similar
+_dMorph = None      # {word: morphologies}
+
+
+def _loadData ():
+    "load phonetic data from <phonet_data> and store it in compact tables"
+    global _dWord
+    global _lSet
+    global _dMorph
+    dData = compact_data.loadDataModule("phonet_data")
+    dInterned = {}
+    _lSet = tuple( compact_data.intern(lSet, dInterned)  for lSet in dData["lSet"] )
+    _dMorph = compact_data.SortedMap(dData["dMorph"])
+    _dWord = compact_data.SortedMap(dData["dWord"], "H")
 
 
 def hasSimil (sWord, sPattern=None):
     "return True if there is list of words phonetically similar to <sWord>"
     if not sWord:
         return False
+    if _dWord is None:
+        _loadData()
     if sWord in _dWord:
         if sPattern:
-            return any(re.search(sPattern, sMorph)  for sSimil in getSimil(sWord)  for sMorph in _dMorph.get(sSimil, []))
+            return any(re.search(sPattern, sMorph)  for sSimil in getSimil(sWord)  for sMorph in _dMorph.get(sSimil, ()))
         return True
     if sWord[0:1].isupper():
         sWord = sWord.lower()
         if sWord in _dWord:
             if sPattern:
-                return any(re.search(sPattern, sMorph)  for sSimil in getSimil(sWord)  for sMorph in _dMorph.get(sSimil, []))
+                return any(re.search(sPattern, sMorph)  for sSimil in getSimil(sWord)  for sMorph in _dMorph.get(sSimil, ()))
             return True
     return False
 
@@ -32,12 +50,14 @@ def getSimil (sWord):
     "return list of words phonetically similar to <sWord>"
     if not sWord:
         return []
+    if _dWord is None:
+        _loadData()
     if sWord in _dWord:
-        return _lSet[_dWord[sWord]]
+        return list(_lSet[_dWord[sWord]])
     if sWord[0:1].isupper():
         sWord = sWord.lower()
         if sWord in _dWord:
-            return _lSet[_dWord[sWord]]
+            return list(_lSet[_dWord[sWord]])
     return []
 
 
@@ -47,7 +67,7 @@ def selectSimil (sWord, sPattern):
         return getSimil(sWord)
     aSelect = []
     for sSimil in getSimil(sWord):
-        for sMorph in _dMorph.get(sSimil, []):
+        for sMorph in _dMorph.get(sSimil, ()):
             if re.search(sPattern, sMorph):
                 aSelect.append(sSimil)
     return aSelect
@@ -55,6 +75,8 @@ def selectSimil (sWord, sPattern):
 
 def _getSetNumber (sWord):
     "return the set number where <sWord> belongs, else -1"
+    if _dWord is None:
+        _loadData()
     if sWord in _dWord:
         return _dWord[sWord]
     if sWord[0:1].isupper():
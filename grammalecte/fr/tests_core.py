@@ -5,14 +5,19 @@ Grammar checker tests for French language
 """
 
 import unittest
+import asyncio
+import json
 import os
 import re
 import time
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 
 from ..graphspell.echo import echo
 from . import gc_engine
+from ..grammar_checker import GrammarChecker
+from ..async_checker import AsyncGrammarChecker
 
 
 @contextmanager
@@ -32,7 +37,7 @@ def perf (sVersion, sResultFile=""):
     "performance tests"
     print("Performance tests")
     gc_engine.load()
-    gc_engine.parse("Text to compile rules before launching real tests.")
+    gc_engine.warmup()
 
     spHere, _ = os.path.split(__file__)
     spfPerfTest = os.path.join(spHere, "perf.txt")
@@ -117,6 +122,82 @@ class TestGrammarChecking (unittest.TestCase):
                 print("Unexpected errors:", nUnexpectedErrors)
             self._showUntestedRules()
 
+    def test_engine_instances (self):
+        sText = "Je suit sidéré.  Il y a des menteur partout."
+        lRuleIds = [ dErr["sRuleId"]  for dErr in gc_engine.parse(sText) ]
+        oEngine = gc_engine.GrammarEngine({ "conj": False }, ["esp_milieu_ligne"])
+        lEngineRuleIds = [ dErr["sRuleId"]  for dErr in oEngine.parse(sText) ]
+        self.assertIn("esp_milieu_ligne", lRuleIds)
+        self.assertTrue(any( sRuleId.startswith("g2__conj_")  for sRuleId in lRuleIds ))
+        self.assertNotIn("esp_milieu_ligne", lEngineRuleIds)
+        self.assertFalse(any( sRuleId.startswith("g2__conj_")  for sRuleId in lEngineRuleIds ))
+        # global configuration unchanged
+        self.assertTrue(gc_engine.getOptions()["conj"])
+        self.assertEqual(lRuleIds, [ dErr["sRuleId"]  for dErr in gc_engine.parse(sText) ])
+
+    def test_time_budget (self):
+        sText = "Je suit sidéré.  Il y a des menteur partout."
+        lRuleIds = [ dErr["sRuleId"]  for dErr in gc_engine.parse(sText) ]
+        aErrs, bTruncated = gc_engine.parseWithBudget(sText, 60)
+        self.assertFalse(bTruncated)
+        self.assertEqual(lRuleIds, [ dErr["sRuleId"]  for dErr in aErrs ])
+        aErrs, bTruncated = gc_engine.parseWithBudget(sText, 1e-9)
+        self.assertTrue(bTruncated)
+        self.assertLess(len(aErrs), len(lRuleIds))
+        for fTimeBudget in (-1, float("nan")):
+            with self.assertRaises(ValueError):
+                gc_engine.parseWithBudget(sText, fTimeBudget)
+
+    def test_text_errors (self):
+        sText = "Rien.\r\nJe suit sidéré.\r\n\r\nIl y a des menteur partout."
+        oGrammarChecker = GrammarChecker("fr")
+        lParagraph = [ json.loads(sParagraph)  for sParagraph in oGrammarChecker.getTextErrorsAsJSON(sText, bEmptyIfNoErrors=True) ]
+        self.assertEqual([ (dPara["iParagraph"], dPara["nOffset"])  for dPara in lParagraph ], [(2, 7), (4, 26)])
+        self.assertEqual([ sText[dErr["nStart"]:dErr["nEnd"]]  for dPara in lParagraph  for dErr in dPara["lGrammarErrors"] ], ["suit", "menteur"])
+        with ThreadPoolExecutor(2) as xExecutor:
+            self.assertEqual(list(oGrammarChecker.getTextErrorsAsJSON(sText, xExecutor=xExecutor)), list(oGrammarChecker.getTextErrorsAsJSON(sText)))
+
+    def test_async_checker (self):
+        sText = "Je suit sidéré.\nRien.\nIl y a des menteur partout."
+        oGrammarChecker = GrammarChecker("fr")
+
+        async def check ():
+            async with AsyncGrammarChecker(oGrammarChecker, nWorkers=2, nMaxInFlight=2) as oAsyncChecker:
+                lResult = await oAsyncChecker.checkText(sText, bEmptyIfNoErrors=True)
+                xPrevious = asyncio.ensure_future(oAsyncChecker.checkDocument("doc", sText * 20))
+                await asyncio.sleep(0)
+                lLast = await oAsyncChecker.checkDocument("doc", "Rien.")
+                with self.assertRaises(asyncio.CancelledError):
+                    await xPrevious
+                return lResult, lLast
+
+        lResult, lLast = asyncio.run(check())
+        self.assertEqual([ dPara["iParagraph"]  for dPara in lResult ], [1, 3])
+        self.assertEqual([ dErr["sRuleId"]  for dErr in lResult[0]["lGrammarErrors"] ], [ dErr["sRuleId"]  for dErr in gc_engine.parse("Je suit sidéré.") ])
+        self.assertEqual(lLast, [{ "iParagraph": 1, "lGrammarErrors": [], "lSpellingErrors": [] }])
+
+    def test_compiled_graph (self):
+        sRegex, zPattern, zNegPattern, bAll, iNext = gc_engine._compileRegexArc(":V¬:N", 7)
+        self.assertEqual((sRegex, zPattern.pattern, zNegPattern.pattern, bAll, iNext), (":V¬:N", ":V", ":N", False, 7))
+        self.assertEqual(gc_engine._compileRegexArc(":N¬*", 3)[1:], (re.compile(":N"), None, True, 3))
+        self.assertEqual(gc_engine._compileRegexArc("¬:N", 3)[1:3], (None, re.compile(":N")))
+        # morph arcs expressed as masks of features, or not
+        self.assertEqual(gc_engine._compileMorphArc(":[NA]¬*", 4, True)[1:6], (None, None, True, 4, gc_engine.morph_mask.getMaskOfRegex(":[NA]")))
+        self.assertEqual(gc_engine._compileMorphArc(":D¬:R", 4, False)[5:], (gc_engine.morph_mask.getFeature(":D"), gc_engine.morph_mask.getFeature(":R")))
+        self.assertEqual(gc_engine._compileMorphArc(":V.*:Q¬:G", 4, True)[1:], (re.compile(":V.*:Q"), re.compile(":G"), False, 4, None, None))
+        self.assertEqual(gc_engine._compileMorphArc(":A¬>content/", 4, False)[1:], (":A", ">content/", False, 4, None, None))
+        for sGraphName in gc_engine.getLoadedGraphs():
+            for xNode in gc_engine._getGraph(sGraphName).values():
+                if isinstance(xNode, dict):
+                    for sKey in ("<morph>", "<re_morph>"):
+                        if sKey in xNode:
+                            self.assertTrue(all( isinstance(tArc, tuple)  for tArc in xNode[sKey] ))
+
+    def test_values_to_match (self):
+        self.assertEqual(gc_engine._getValuesToMatch("chat"), ["chat"])
+        self.assertEqual(gc_engine._getValuesToMatch("Laissez-les"), ["Laissez-les", "laissez-les"])
+        self.assertEqual(gc_engine._getValuesToMatch("ONU"), ["ONU", "onu", "Onu"])
+
     def _showUntestedRules (self):
         aUntestedRules = set()
         for _, sOpt, sLineId, sRuleId in gc_engine.listRules():
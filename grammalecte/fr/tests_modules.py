@@ -4,14 +4,39 @@
 Grammar checker tests for French language
 """
 
+import os
+import re
+import ast
+import sys
+import json
 import unittest
 import time
+import tempfile
+import shutil
+import subprocess
+import threading
+import socket
+import urllib.request
+import urllib.parse
+import urllib.error
 from contextlib import contextmanager
 
 from ..graphspell.spellchecker import SpellChecker
+from ..graphspell.ibdawg import IBDAWG
+from ..graphspell.tokenizer import Tokenizer, Token
+from ..graphspell import patterns
+from ..graphspell import bdic
 from . import conj
 from . import phonet
 from . import mfsp
+from . import gc_rules_bundle
+from . import morph_mask
+from . import cregex
+from . import gc_functions
+from ..result_cache import ResultCache
+
+
+spRoot = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 @contextmanager
@@ -102,6 +127,65 @@ class TestDictionary (unittest.TestCase):
         ]:
             self.assertIn(sInfi, self.oSpellChecker.getLemma(sWord))
 
+    def test_binary_dictionary (self):
+        oJSONDic = IBDAWG("fr-allvars.json")
+        oBinaryDic = IBDAWG(oJSONDic.getBinary())
+        self.assertEqual(oJSONDic.getBinary(), oBinaryDic.getBinary())
+        for sWord in ["branche", "Émilie", "mangeait", "être", "BRANCHE", "xyzzy", ""]:
+            self.assertEqual(oJSONDic.getMorph(sWord), oBinaryDic.getMorph(sWord), sWord)
+            self.assertEqual(oJSONDic.isValidToken(sWord), self.oSpellChecker.isValidToken(sWord), sWord)
+
+    def test_stale_binary_dictionary (self):
+        spfJSON = os.path.join(spRoot, "grammalecte", "graphspell", "_dictionaries", "fr-allvars.json")
+        # the binary dictionary of the package is generated from the JSON dictionary
+        self.assertEqual(bdic.readSourceChecksum(spfJSON[:-5] + ".bdic"), bdic.getChecksum(spfJSON))
+        with tempfile.TemporaryDirectory() as spTemp:
+            spfDic = os.path.join(spTemp, "fr.bdic")
+            shutil.copy(spfJSON, os.path.join(spTemp, "fr.json"))
+            shutil.copy(spfJSON[:-5] + ".bdic", spfDic)
+            self.assertNotIsInstance(IBDAWG(spfDic).lByDic, list)
+            # JSON dictionary modified: the binary dictionary is stale, the JSON dictionary is loaded
+            with open(os.path.join(spTemp, "fr.json"), "a", encoding="utf-8") as hDst:
+                hDst.write("\n")
+            oDic = IBDAWG(spfDic)
+            self.assertIsInstance(oDic.lByDic, list)
+            self.assertEqual(oDic.getMorph("mangeait"), self.oSpellChecker.getMorph("mangeait"))
+            # rebuilt from the JSON dictionary: up to date
+            oDic.writeAsBinary(spfDic)
+            self.assertNotIsInstance(IBDAWG(spfDic).lByDic, list)
+            # missing binary dictionary
+            os.remove(spfDic)
+            self.assertIsInstance(IBDAWG(spfDic).lByDic, list)
+
+    def test_shared_dictionary (self):
+        oSharedMemory = self.oSpellChecker.shareMainDictionary()
+        try:
+            oSpellChecker = SpellChecker("fr", "shm:" + oSharedMemory.name)
+            for sWord in ["branche", "Émilie", "mangeait", "xyzzy"]:
+                self.assertEqual(oSpellChecker.getMorph(sWord), self.oSpellChecker.getMorph(sWord), sWord)
+        finally:
+            bdic.unshare(oSharedMemory)
+
+
+class TestTokenizer (unittest.TestCase):
+    "Tests du tokeniseur"
+
+    def test_tokens (self):
+        lToken = list(Tokenizer("fr").genTokens("Le chat, 3 fois.", True))
+        self.assertEqual([ (oToken.sType, oToken.sValue)  for oToken in lToken ], \
+                         [("INFO", "<start>"), ("WORD", "Le"), ("WORD", "chat"), ("PUNC", ","), ("NUM", "3"), ("WORD", "fois"), ("PUNC", "."), ("INFO", "<end>")])
+        oToken = lToken[2]
+        self.assertEqual(dict(oToken), { "i": 2, "sType": "WORD", "sValue": "chat", "nStart": 3, "nEnd": 7 })
+        self.assertNotIn("lMorph", oToken)
+        oToken.lMorph = []
+        oToken.aTags = { "_tag_" }
+        self.assertIn("lMorph", oToken)
+        self.assertEqual(oToken["aTags"], { "_tag_" })
+        self.assertEqual(oToken.get("sImmunity", "*"), "*")
+        self.assertEqual(oToken.toDict(), dict(oToken))
+        with self.assertRaises(AttributeError):
+            oToken.sFoo = ""
+
 
 class TestConjugation (unittest.TestCase):
     "Tests des conjugaisons"
@@ -179,6 +263,443 @@ class TestMasFemSingPlur (unittest.TestCase):
             self.assertListEqual(mfsp.getMiscPlural(sSing), lPlur)
 
 
+class TestRulesBundle (unittest.TestCase):
+    "Tests des règles élaguées pour un jeu d’options"
+
+    @classmethod
+    def setUpClass (cls):
+        cls.spfBundle = os.path.join(tempfile.mkdtemp(), "test.bundle")
+        # the graph rule is followed by a rule reading bCondMemo
+        cls.lIgnoredRules = ["esp_milieu_ligne", "g0__imp_verbes_composés_impératifs__b1_a1_1"]
+        gc_rules_bundle.build(cls.spfBundle, { "ocr": False, "conj": False }, cls.lIgnoredRules)
+        cls.oBundle = gc_rules_bundle.load(cls.spfBundle)
+
+    @classmethod
+    def tearDownClass (cls):
+        os.remove(cls.spfBundle)
+        os.rmdir(os.path.dirname(cls.spfBundle))
+
+    def test_options (self):
+        self.assertFalse(self.oBundle.dOptions["conj"])
+        self.assertTrue(self.oBundle.dOptions["gn"])
+        self.assertEqual(self.oBundle.lIgnoredRules, sorted(self.lIgnoredRules))
+
+    def test_pruned_rules (self):
+        self.assertNotIn("ocr", self.oBundle.getGraphNames())
+        for sOption, lRuleGroup in self.oBundle.lParagraphRules + self.oBundle.lSentenceRules:
+            self.assertNotEqual(sOption, "conj")
+            if sOption != "@@@@":
+                for aRule in lRuleGroup:
+                    self.assertNotEqual(aRule[3], "esp_milieu_ligne")
+        for sRuleId, lActions in self.oBundle.dRule.items():
+            self.assertNotEqual(lActions[1], "conj", sRuleId)
+
+    def test_graphs (self):
+        for sGraphName in self.oBundle.getGraphNames():
+            dGraph = self.oBundle.loadGraph(sGraphName)
+            for xNode in dGraph.values():
+                if isinstance(xNode, list):
+                    for sRuleId in xNode:
+                        self.assertIn(sRuleId, self.oBundle.dRule)
+                else:
+                    for xValue in xNode.values():
+                        for iNext in (xValue.values()  if isinstance(xValue, dict)  else (xValue,)):
+                            self.assertIn(iNext, dGraph)
+
+    def test_stale_bundle (self):
+        self.assertIsNone(gc_rules_bundle.load(self.spfBundle + ".missing"))
+
+    def _parse (self, sText, spfBundle=""):
+        # in another process: the engine forgets functions not used by the bundle
+        sCode = "import sys, json\n" \
+                "from grammalecte.fr import gc_engine\n" \
+                "gc_engine.load(spfBundle=sys.argv[1])\n" \
+                "if not sys.argv[1]:\n" \
+                "    gc_engine.setOptions({ 'ocr': False, 'conj': False })\n" \
+                "    for sRuleId in sys.argv[2:]:\n" \
+                "        gc_engine.ignoreRule(sRuleId)\n" \
+                "print(json.dumps([ (dErr['nStart'], dErr['nEnd'], dErr['sRuleId'])  for dErr in gc_engine.parse(sys.stdin.read()) ]))\n"
+        xProcess = subprocess.run([sys.executable, "-c", sCode, spfBundle] + self.lIgnoredRules, input=sText, capture_output=True, text=True, encoding="utf-8", cwd=spRoot, check=True)
+        return json.loads(xProcess.stdout)
+
+    def test_same_results (self):
+        sText = "Cela-m’en donne.  Il  y a des erreur. Je suit là. Les chats mange."
+        lErrors = self._parse(sText, self.spfBundle)
+        self.assertEqual(lErrors, self._parse(sText))
+        self.assertNotIn("esp_milieu_ligne", [ sRuleId  for _, _, sRuleId in lErrors ])
+
+
+class TestResultCache (unittest.TestCase):
+    "Tests du cache de résultats"
+
+    def setUp (self):
+        self.spfCache = os.path.join(tempfile.mkdtemp(), "results.db")
+        self.oCache = ResultCache(self.spfCache, 10)
+
+    def tearDown (self):
+        self.oCache.close()
+        spCache = os.path.dirname(self.spfCache)
+        for sFileName in os.listdir(spCache):
+            os.remove(os.path.join(spCache, sFileName))
+        os.rmdir(spCache)
+
+    def test_key (self):
+        self.assertEqual(ResultCache.getKey("Texte", "2.1.1", { "a": True, "b": False }), ResultCache.getKey("Texte", "2.1.1", { "b": False, "a": True }))
+        self.assertNotEqual(ResultCache.getKey("Texte", "2.1.1", { "a": True }), ResultCache.getKey("Texte", "2.1.1", { "a": False }))
+        self.assertNotEqual(ResultCache.getKey("Texte", "2.1.1"), ResultCache.getKey("Texte.", "2.1.1"))
+
+    def test_hits (self):
+        byKey = ResultCache.getKey("Je suit.")
+        self.assertIsNone(self.oCache.get(byKey))
+        self.oCache.set(byKey, [{ "nStart": 3, "nEnd": 7, "sRuleId": "conj" }], [])
+        self.assertEqual(self.oCache.get(byKey), ([{ "nStart": 3, "nEnd": 7, "sRuleId": "conj" }], []))
+        dStats = self.oCache.getStats()
+        self.assertEqual((dStats["nHits"], dStats["nMisses"], dStats["nEntries"]), (1, 1, 1))
+
+    def test_eviction (self):
+        for i in range(25):
+            self.oCache.set(ResultCache.getKey(str(i)), [], [])
+        self.assertLessEqual(self.oCache.getStats()["nEntries"], 10)
+        self.assertIsNotNone(self.oCache.get(ResultCache.getKey("24")))
+        self.assertIsNone(self.oCache.get(ResultCache.getKey("0")))
+
+
+class TestPatterns (unittest.TestCase):
+    "Tests du registre des expressions régulières"
+
+    def test_registry (self):
+        nMisses = patterns.getStats()["nMisses"]
+        zPattern = patterns.getPattern("^registry:V[0-9]$")
+        self.assertIs(patterns.getPattern("^registry:V[0-9]$"), zPattern)
+        self.assertEqual(patterns.getStats()["nMisses"], nMisses + 1)
+        self.assertEqual(patterns.preload(["^registry:V[0-9]$", "^registry:N.*:[fe]", "(?:"]), 1)
+        self.assertTrue(patterns.getPattern("^registry:N.*:[fe]").search("registry:N:f:s"))
+        self.assertEqual(patterns.getStats()["nMisses"], nMisses + 1)
+        with self.assertRaises(re.error):
+            patterns.getPattern("(?:")
+
+
+class TestMorphMask (unittest.TestCase):
+    "Tests des masques de morphologies"
+
+    def test_masks (self):
+        lMorph = [ ">être/:V0e_i____zz:Ip:3s", ">beau/:N:A:m:s", ">Paris/:MP:m:i", ">de/:R", ">vieux/:N:A:m:i" ]
+        for sRegex in (":[NA]", ":(?:N|A|[123][sp])", ":V0e", ":[NA].*:[pi]", ":(?:M[12P]|T):m", ":N(?!:A)"):
+            nMask = morph_mask.getMaskOfRegex(sRegex)
+            self.assertIsNotNone(nMask, sRegex)
+            for sMorph in lMorph:
+                self.assertEqual(bool(morph_mask.getMask(sMorph) & nMask), bool(re.search(sRegex, sMorph)), (sRegex, sMorph))
+        for sRegex in (":V.*:Q", ":[NA]¬:G", ":Z[0-9]", ":N?"):
+            self.assertIsNone(morph_mask.getMaskOfRegex(sRegex), sRegex)
+        self.assertEqual(morph_mask.getMaskOfSubstring(":D"), morph_mask.getFeature(":D"))
+        self.assertEqual(morph_mask.getLemma(">beau/:N:A:m:s"), "beau")
+        self.assertEqual(morph_mask.getGenderNumber(morph_mask.getMask(">beau/:N:A:m:s")), (":m", ":s"))
+        self.assertEqual(cregex.getGenderNumber(lMorph[1:]), (":m", ":i"))
+        self.assertTrue(cregex.mbNomNotAdj([">Paris/:MP:m:i", ">paris/:N:m:p"]))
+        self.assertFalse(cregex.mbNomNotAdj(lMorph))
+        self.assertTrue(cregex.isNomAdj(lMorph[1:2] + lMorph[4:]))
+
+
+class TestGeneratedFunctions (unittest.TestCase):
+    "Tests des fonctions générées (gc_functions.py) : accès aux jetons"
+
+    @classmethod
+    def setUpClass (cls):
+        with open(gc_functions.__file__, "r", encoding="utf-8") as hSrc:
+            cls.xTree = ast.parse(hSrc.read())
+        cls.aTokenAttributes = set(Token.__slots__) | { sName  for sName in dir(Token)  if not sName.startswith("_") }
+
+    @staticmethod
+    def _isToken (xNode):
+        # lToken[i] and dTokenPos[nPos] in generated functions, oToken, oToken1… in helpers
+        if isinstance(xNode, ast.Subscript):
+            return isinstance(xNode.value, ast.Name) and xNode.value.id in ("lToken", "dTokenPos")
+        return isinstance(xNode, ast.Name) and xNode.id.startswith("oToken")
+
+    def test_token_attributes (self):
+        nAttributes = 0
+        for xNode in ast.walk(self.xTree):
+            if isinstance(xNode, ast.Attribute) and self._isToken(xNode.value):
+                self.assertIn(xNode.attr, self.aTokenAttributes, "gc_functions.py, line {}".format(xNode.lineno))
+                nAttributes += 1
+        self.assertGreater(nAttributes, 1000)
+
+    def test_no_dictionary_access (self):
+        for xNode in ast.walk(self.xTree):
+            if isinstance(xNode, ast.Subscript) and self._isToken(xNode.value):
+                self.fail("gc_functions.py, line {}: token used as a dictionary".format(xNode.lineno))
+            if isinstance(xNode, ast.Compare) and any( isinstance(xOp, (ast.In, ast.NotIn))  for xOp in xNode.ops ) \
+                    and any( self._isToken(xComparator)  for xComparator in xNode.comparators ):
+                self.fail("gc_functions.py, line {}: token used as a dictionary".format(xNode.lineno))
+
+
+class TestDaemon (unittest.TestCase):
+    "Tests du mode démon de la ligne de commande"
+
+    def test_json_lines (self):
+        lRequest = [
+            { "sCommand": "check", "sText": "Je suit là.\nIl  y a des erreur.", "xId": 1 },
+            { "sCommand": "suggest", "sWord": "mnager" },
+            { "sCommand": "getOptions" },
+            { "sCommand": "quit" }
+        ]
+        sInput = "\n".join([ json.dumps(dRequest)  for dRequest in lRequest[:-1] ] + ["not JSON", json.dumps(lRequest[-1])]) + "\n"
+        # warnings (missing bundle, missing dictionary) must not be written with responses
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-cli.py"), "--daemon", "-rb", os.path.join(tempfile.gettempdir(), "missing.bundle"), "-pdi", "missing.json" ]
+        xProcess = subprocess.run(lCommand, input=sInput, capture_output=True, text=True, encoding="utf-8", cwd=spRoot, check=True)
+        lResponse = [ json.loads(sLine)  for sLine in xProcess.stdout.splitlines() ]
+        self.assertEqual(len(lResponse), len(lRequest) + 1)
+        self.assertEqual(lResponse[0]["xId"], 1)
+        self.assertIn("sError", lResponse[3])
+        self.assertIn("Rules bundle missing", xProcess.stderr)
+
+    def test_time_budget (self):
+        lBudget = [-1, 0, "1", True, 1e-9, 60]
+        sInput = "".join( json.dumps({ "sCommand": "check", "sText": "Je suit là.", "fTimeBudget": xBudget }) + "\n"  for xBudget in lBudget )
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-cli.py"), "--daemon" ]
+        xProcess = subprocess.run(lCommand, input=sInput, capture_output=True, text=True, encoding="utf-8", cwd=spRoot, check=True)
+        lResponse = [ json.loads(sLine)  for sLine in xProcess.stdout.splitlines() ]
+        self.assertEqual(len(lResponse), len(lBudget))
+        for dResponse in lResponse[:4]:
+            self.assertIn("sError", dResponse)
+        self.assertTrue(lResponse[4]["data"][0]["bTruncated"])
+        self.assertNotIn("bTruncated", lResponse[5]["data"][0])
+        self.assertEqual(len(lResponse[5]["data"][0]["lGrammarErrors"]), 1)
+
+    def test_options (self):
+        lRequest = [
+            { "sCommand": "setOptions", "dOptions": { "conj": "no" } },
+            { "sCommand": "setOptions", "dOptions": { "conjugaison": False } },
+            { "sCommand": "setOptions", "dOptions": ["conj"] },
+            { "sCommand": "check", "sText": "Je suit là.", "dOptions": { "conj": 0 } },
+            { "sCommand": "getOptions" },
+            { "sCommand": "setOptions", "dOptions": { "conj": False } },
+            { "sCommand": "check", "sText": "Je suit là." }
+        ]
+        sInput = "".join( json.dumps(dRequest) + "\n"  for dRequest in lRequest )
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-cli.py"), "--daemon" ]
+        xProcess = subprocess.run(lCommand, input=sInput, capture_output=True, text=True, encoding="utf-8", cwd=spRoot, check=True)
+        lResponse = [ json.loads(sLine)  for sLine in xProcess.stdout.splitlines() ]
+        self.assertEqual(len(lResponse), len(lRequest))
+        for dResponse in lResponse[:4]:
+            self.assertIn("sError", dResponse)
+        self.assertIs(lResponse[4]["dOptions"]["conj"], True)
+        self.assertIs(lResponse[5]["dOptions"]["conj"], False)
+        self.assertEqual(lResponse[6]["data"][0]["lGrammarErrors"], [])
+
+
+class TestCommandLine (unittest.TestCase):
+    "Tests des modes de la ligne de commande"
+
+    def _run (self, *lArgs):
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-cli.py") ] + list(lArgs)
+        return subprocess.run(lCommand, capture_output=True, text=True, encoding="utf-8", cwd=spRoot, check=True)
+
+    def test_corpus_bad_file (self):
+        with tempfile.TemporaryDirectory() as spTemp:
+            spCorpus = os.path.join(spTemp, "corpus")
+            spOutput = os.path.join(spTemp, "output")
+            os.makedirs(os.path.join(spCorpus, "sub"))
+            with open(os.path.join(spCorpus, "a.txt"), "w", encoding="utf-8") as hDst:
+                hDst.write("Les chats mange.\n")
+            with open(os.path.join(spCorpus, "sub", "b.txt"), "w", encoding="latin-1") as hDst:
+                hDst.write("Le café est froid.\n")
+            with open(os.path.join(spCorpus, "sub", "c.txt"), "w", encoding="utf-8") as hDst:
+                hDst.write("Je suit là.\n")
+            for sJobs in ("1", "2"):
+                xProcess = self._run("-cp", spCorpus, "-od", spOutput, "-j", "-jb", sJobs)
+                dSummary = json.loads(xProcess.stdout.splitlines()[-1])
+                self.assertEqual(dSummary["nFiles"], 3)
+                self.assertEqual(len(dSummary["lFiles"]), 2)
+                self.assertEqual([ dFailure["sFile"]  for dFailure in dSummary["lFailedFiles"] ], [os.path.join(spCorpus, "sub", "b.txt")])
+                self.assertIn("UnicodeDecodeError", dSummary["lFailedFiles"][0]["sError"])
+                lResultFile = sorted( sFileName  for _, _, lFileName in os.walk(spOutput)  for sFileName in lFileName )
+                self.assertEqual(lResultFile, ["a.res.txt", "c.res.txt"])
+
+    def _writeText (self, spf, lParagraph):
+        with open(spf, "w", encoding="utf-8") as hDst:
+            hDst.write("\n".join(lParagraph) + "\n")
+
+    def test_ndjson (self):
+        lParagraph = ["Les chats mange.", "Rien.", "", "Je suit là.  Il y a des erreur."]
+        with tempfile.TemporaryDirectory() as spTemp:
+            spf = os.path.join(spTemp, "text.txt")
+            self._writeText(spf, lParagraph)
+            xProcess = self._run("-f", spf, "-nd")
+        self.assertTrue(xProcess.stdout.endswith("\n"))
+        lObject = [ json.loads(sLine)  for sLine in xProcess.stdout.split("\n")[:-1] ]
+        self.assertEqual([ dPara["iParagraph"]  for dPara in lObject ], [1, 2, 3, 4])
+        self.assertEqual([ len(dPara["lGrammarErrors"])  for dPara in lObject ], [1, 0, 0, 3])
+
+    def test_jobs (self):
+        # more paragraphs than a batch (32) sent to workers, with empty paragraphs
+        lSentence = ["Les chats mange.", "Rien.", "", "Je suit là.  Il y a des erreur.", "Quelle salopard !"]
+        lParagraph = [ lSentence[i % len(lSentence)] + " " * (i // len(lSentence))  for i in range(150) ]
+        with tempfile.TemporaryDirectory() as spTemp:
+            spf = os.path.join(spTemp, "text.txt")
+            self._writeText(spf, lParagraph)
+            for lOption, lJobs in ((["-j"], ["2", "3"]), (["-owe"], ["3"])):
+                sOutput = self._run("-f", spf, *lOption).stdout
+                self.assertTrue(sOutput)
+                for sJobs in lJobs:
+                    self.assertEqual(self._run("-f", spf, "-jb", sJobs, *lOption).stdout, sOutput, lOption + [sJobs])
+
+    def test_profile_startup (self):
+        dProfile = json.loads(self._run("-ps", "-j").stdout)
+        self.assertEqual(len(dProfile["lPhases"]), 7)
+        for sKey in ("lTopModules", "lTopModulesByTime"):
+            lModule = [ dModule["sModule"]  for dModule in dProfile[sKey] ]
+            self.assertIn("fr/gc_engine.py", lModule)
+            # only source files of the package, relative to it
+            for sModule in lModule:
+                self.assertTrue(sModule.endswith(".py") and not sModule.startswith(("<", "/", "grammalecte")), sModule)
+                self.assertTrue(os.path.isfile(os.path.join(spRoot, "grammalecte", sModule)), sModule)
+
+    def _readUntilStatus (self, xProcess):
+        # JSON objects written by --watch --json, until the status line
+        lObject = []
+        while True:
+            sLine = xProcess.stdout.readline()
+            self.assertTrue(sLine, "no status line")
+            lObject.append(json.loads(sLine))
+            if "nParagraphs" in lObject[-1]:
+                return lObject
+
+    def test_watch (self):
+        with tempfile.TemporaryDirectory() as spTemp:
+            spf = os.path.join(spTemp, "watched.txt")
+            with open(spf, "w", encoding="utf-8") as hDst:
+                hDst.write("Les chats mange.\nJe suit là.\nIl y a des erreur.\n")
+            lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-cli.py"), "-wa", spf, "-j", "-pi", "0.1" ]
+            with subprocess.Popen(lCommand, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8", cwd=spRoot) as xProcess:
+                xTimer = threading.Timer(120, xProcess.kill)
+                xTimer.start()
+                try:
+                    lObject = self._readUntilStatus(xProcess)
+                    self.assertEqual([ dPara["iParagraph"]  for dPara in lObject[:-1] ], [1, 2, 3])
+                    self.assertEqual(lObject[-1]["nChecked"], 3)
+                    # paragraph 2 corrected, paragraph 3 removed (file replaced at once: never read half written)
+                    with open(spf + ".new", "w", encoding="utf-8") as hDst:
+                        hDst.write("Les chats mange.\nJe suis là.\n")
+                    os.replace(spf + ".new", spf)
+                    lObject = self._readUntilStatus(xProcess)
+                    self.assertEqual(lObject[0], { "iParagraph": 2, "lGrammarErrors": [], "lSpellingErrors": [] })
+                    self.assertEqual(lObject[1], { "iParagraph": 3, "bRemoved": True })
+                    self.assertEqual(len(lObject), 3)
+                    self.assertEqual(lObject[-1]["nParagraphs"], 2)
+                    self.assertEqual(lObject[-1]["nChecked"], 1)
+                finally:
+                    xTimer.cancel()
+                    xProcess.kill()
+
+
+class TestLanguageServer (unittest.TestCase):
+    "Tests du serveur LSP"
+
+    @staticmethod
+    def _encode (dMessage):
+        dMessage["jsonrpc"] = "2.0"
+        byBody = json.dumps(dMessage).encode("utf-8")
+        return b"Content-Length: " + str(len(byBody)).encode("ascii") + b"\r\n\r\n" + byBody
+
+    def _decode (self, byStream):
+        # the whole stream must be made of messages
+        lMessage = []
+        while byStream:
+            byHeader, _, byStream = byStream.partition(b"\r\n\r\n")
+            sName, _, sValue = byHeader.decode("ascii", "replace").partition(":")
+            self.assertEqual(sName, "Content-Length", byHeader)
+            nLength = int(sValue)
+            lMessage.append(json.loads(byStream[:nLength].decode("utf-8")))
+            byStream = byStream[nLength:]
+        return lMessage
+
+    def test_diagnostics (self):
+        sUri = "file:///test.txt"
+        # the emoji is 2 UTF-16 code units: positions after it are shifted by one
+        lRequest = [
+            { "id": 1, "method": "initialize", "params": {} },
+            { "method": "initialized", "params": {} },
+            { "method": "textDocument/didOpen", "params": { "textDocument": { "uri": sUri, "version": 1, "text": "😀 Je suit là.\nLes chats mange.\n" } } },
+            { "method": "textDocument/didChange", "params": { "textDocument": { "uri": sUri, "version": 2 }, \
+                                                              "contentChanges": [{ "range": { "start": { "line": 0, "character": 6 }, "end": { "line": 0, "character": 10 } }, "text": "suis" }] } },
+            { "id": 2, "method": "shutdown" },
+            { "method": "exit" }
+        ]
+        byInput = b"".join( self._encode(dRequest)  for dRequest in lRequest )
+        # the warning of the missing bundle must not be written in the protocol stream
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-lsp.py"), "-rb", os.path.join(tempfile.gettempdir(), "missing.bundle") ]
+        xProcess = subprocess.run(lCommand, input=byInput, capture_output=True, cwd=spRoot, timeout=120)
+        self.assertEqual(xProcess.returncode, 0)
+        lMessage = self._decode(xProcess.stdout)
+        self.assertEqual([ dMessage.get("id", dMessage.get("method"))  for dMessage in lMessage ], [1, "textDocument/publishDiagnostics", "textDocument/publishDiagnostics", 2])
+        self.assertIn("capabilities", lMessage[0]["result"])
+        lRanges = []
+        for dMessage in lMessage[1:3]:
+            lRanges.append(sorted( (dDiag["range"]["start"]["line"], dDiag["range"]["start"]["character"], dDiag["range"]["end"]["character"])  for dDiag in dMessage["params"]["diagnostics"] ))
+        self.assertEqual(lRanges[0], [(0, 6, 10), (1, 10, 15)])
+        self.assertEqual(lRanges[1], [(1, 10, 15)])
+        self.assertEqual(lMessage[2]["params"]["version"], 2)
+
+
+class TestServer (unittest.TestCase):
+    "Tests du serveur HTTP"
+
+    @classmethod
+    def setUpClass (cls):
+        with socket.socket() as xSocket:
+            xSocket.bind(("localhost", 0))
+            cls.nPort = xSocket.getsockname()[1]
+        lCommand = [ sys.executable, os.path.join(spRoot, "grammalecte-server.py"), "-p", str(cls.nPort), "-w", "2" ]
+        cls.xProcess = subprocess.Popen(lCommand, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=spRoot)
+        fDeadline = time.time() + 120
+        while True:
+            try:
+                cls._request("/health")
+                break
+            except OSError:
+                if time.time() > fDeadline or cls.xProcess.poll() is not None:
+                    cls.tearDownClass()
+                    raise
+                time.sleep(0.2)
+
+    @classmethod
+    def tearDownClass (cls):
+        cls.xProcess.terminate()
+        cls.xProcess.wait(30)
+
+    @classmethod
+    def _request (cls, sPath, dForm=None):
+        "return the decoded JSON response, raise urllib.error.HTTPError on error"
+        byData = urllib.parse.urlencode(dForm).encode("utf-8")  if dForm is not None  else None
+        with urllib.request.urlopen("http://localhost:{}{}".format(cls.nPort, sPath), byData, timeout=60) as hResponse:
+            return json.loads(hResponse.read().decode("utf-8"))
+
+    def _assertRejected (self, sPath, dForm):
+        with self.assertRaises(urllib.error.HTTPError) as xContext:
+            self._request(sPath, dForm)
+        self.assertEqual(xContext.exception.code, 400)
+        xContext.exception.close()
+
+    def test_gc_text (self):
+        sText = "Je suit là.\nRien.\nIl y a des erreur."
+        dResult = self._request("/gc_text", { "text": sText })
+        self.assertEqual([ dPara["iParagraph"]  for dPara in dResult["data"] ], [1, 3])
+        self.assertEqual(self._request("/gc_text", { "text": sText, "time_budget": "60" }), dResult)
+        dResult = self._request("/gc_text", { "text": sText, "time_budget": "1e-9" })
+        self.assertTrue(all( dPara["bTruncated"]  for dPara in dResult["data"] ))
+        for sBudget in ("-1", "0", "nan", "abc"):
+            self._assertRejected("/gc_text", { "text": sText, "time_budget": sBudget })
+
+    def test_options (self):
+        self.assertIs(self._request("/options", { "options": json.dumps({ "conj": False }) })["dOptions"]["conj"], False)
+        self.assertIs(self._request("/options", {})["dOptions"]["conj"], True)
+        for xValue in ("false", 0, None):
+            self._assertRejected("/options", { "options": json.dumps({ "conj": xValue }) })
+        dResult = self._request("/gc_text", { "text": "Je suit là.", "options": json.dumps({ "conj": False }) })
+        self.assertEqual(dResult["data"], [])
+
+
 def main():
     "start function"
     unittest.main()
@@ -4,24 +4,53 @@ Grammalecte, grammar checker
 
 import importlib
 import json
+import time
+import collections
+import concurrent.futures
 
 from . import text
 
 
+#### Worker processes
+
+_oWorkerGrammarChecker = None
+
+
+def initWorker (sLangCode, sContext, spfBundle, dOptions, lIgnoredRules):
+    "initialization of a worker process: grammar checker with the given options and ignored rules"
+    global _oWorkerGrammarChecker
+    _oWorkerGrammarChecker = GrammarChecker(sLangCode, sContext, spfBundle=spfBundle)
+    _oWorkerGrammarChecker.gce.setOptions(dOptions)
+    for sRuleId in lIgnoredRules:
+        _oWorkerGrammarChecker.gce.ignoreRule(sRuleId)
+
+
+def getParagraphErrorsInWorker (sText, dOptions=None, bContext=False, bSpellSugg=False, bDebug=False):
+    "returns a tuple: (list of grammar errors, list of spelling errors), computed by the grammar checker of the worker process"
+    aGrammErrs, aSpellErrs = _oWorkerGrammarChecker.getParagraphErrors(sText, dOptions, bContext, bSpellSugg, bDebug)
+    return list(aGrammErrs), aSpellErrs
+
+
+#### Grammar checker
+
 class GrammarChecker:
     "GrammarChecker: Wrapper for the grammar checker engine"
 
-    def __init__ (self, sLangCode, sContext="Python"):
+    def __init__ (self, sLangCode, sContext="Python", bWarmup=False, spfBundle=""):
         self.sLangCode = sLangCode
+        self.sContext = sContext
+        self.spfBundle = spfBundle
         # Grammar checker engine
         self.gce = importlib.import_module("."+sLangCode, "grammalecte")
-        self.gce.load(sContext)
+        self.gce.load(sContext, bWarmup=bWarmup, spfBundle=spfBundle)
         # Spell checker
         self.oSpellChecker = self.gce.getSpellChecker()
         # Lexicographer
         self.oLexicographer = None
         # Text formatter
         self.oTextFormatter = None
+        # Cache of results
+        self.oResultCache = None
 
     def getGCEngine (self):
         "return the grammar checker object"
@@ -45,16 +74,64 @@ class GrammarChecker:
             self.oLexicographer = lxg.Lexicographe(self.oSpellChecker)
         return self.oLexicographer
 
+    def useResultCache (self, spfCache, nMaxEntries=200000):
+        "store results of paragraphs in the cache <spfCache> (sqlite database, see result_cache.py), or stop using a cache if <spfCache> is empty"
+        if self.oResultCache:
+            self.oResultCache.close()
+            self.oResultCache = None
+        if spfCache:
+            from .result_cache import ResultCache
+            self.oResultCache = ResultCache(spfCache, nMaxEntries)
+        return self.oResultCache
+
+    def _getResultKey (self, sText, dOptions, bContext, bSpellSugg):
+        return self.oResultCache.getKey(sText, self.gce.version, dOptions or self.gce.getOptions(), self.gce.getIgnoredRules(), \
+                                        self.oSpellChecker.getDictionariesSignature(), bContext, bSpellSugg)
+
     def displayGCOptions (self):
         "display the grammar checker options"
         self.gce.displayOptions()
 
+    def createWorkerPool (self, nWorkers=None):
+        "return a pool of <nWorkers> processes, each one with a grammar checker set with the current options and ignored rules"
+        return concurrent.futures.ProcessPoolExecutor(nWorkers, initializer=initWorker, \
+                                                      initargs=(self.sLangCode, self.sContext, self.spfBundle, self.gce.getOptions(), self.gce.getIgnoredRules()))
+
     def getParagraphErrors (self, sText, dOptions=None, bContext=False, bSpellSugg=False, bDebug=False):
-        "returns a tuple: (grammar errors, spelling errors)"
-        aGrammErrs = self.gce.parse(sText, "FR", bDebug=bDebug, dOptions=dOptions, bContext=bContext)
-        aSpellErrs = self.oSpellChecker.parseParagraph(sText, bSpellSugg)
+        """returns a tuple: (grammar errors, spelling errors)
+           with a cache of results (see useResultCache), results of paragraphs already checked are read from the cache"""
+        aGrammErrs, aSpellErrs, _ = self._getParagraphErrors(sText, dOptions, bContext, bSpellSugg, bDebug, 0.0)
         return aGrammErrs, aSpellErrs
 
+    def getParagraphErrorsWithBudget (self, sText, fTimeBudget, dOptions=None, bContext=False, bSpellSugg=False, bDebug=False):
+        """returns a tuple (grammar errors, spelling errors, bTruncated), <sText> being checked in <fTimeBudget> seconds at most:
+           once the time is exhausted, grammar checking stops (see gc_engine.TextParser.parse) and spelling errors get no suggestions"""
+        if not 0 < fTimeBudget < float("inf"):
+            raise ValueError("# Error. Time budget: a positive number of seconds is expected.")
+        return self._getParagraphErrors(sText, dOptions, bContext, bSpellSugg, bDebug, fTimeBudget)
+
+    def _getParagraphErrors (self, sText, dOptions, bContext, bSpellSugg, bDebug, fTimeBudget):
+        byKey = None
+        if self.oResultCache and not bDebug:
+            byKey = self._getResultKey(sText, dOptions, bContext, bSpellSugg)
+            tResult = self.oResultCache.get(byKey)
+            if tResult:
+                return tResult + (False,)
+        if not fTimeBudget:
+            aGrammErrs = self.gce.parse(sText, "FR", bDebug=bDebug, dOptions=dOptions, bContext=bContext)
+            aSpellErrs = self.oSpellChecker.parseParagraph(sText, bSpellSugg)
+            if byKey:
+                self.oResultCache.set(byKey, aGrammErrs, aSpellErrs)
+            return aGrammErrs, aSpellErrs, False
+        fDeadline = time.perf_counter() + fTimeBudget
+        aGrammErrs, bTruncated = self.gce.parseWithBudget(sText, fTimeBudget, "FR", bDebug=bDebug, dOptions=dOptions, bContext=bContext)
+        aSpellErrs = self.oSpellChecker.parseParagraph(sText, bSpellSugg, fDeadline)
+        if bSpellSugg and not bTruncated:
+            bTruncated = any( "aSuggestions" not in dErr  for dErr in aSpellErrs )
+        if byKey and not bTruncated:
+            self.oResultCache.set(byKey, aGrammErrs, aSpellErrs)
+        return aGrammErrs, aSpellErrs, bTruncated
+
     def getParagraphWithErrors (self, sText, dOptions=None, bEmptyIfNoErrors=False, bSpellSugg=False, nWidth=100, bDebug=False):
         "parse text and return a readable text with underline errors"
         aGrammErrs, aSpellErrs = self.getParagraphErrors(sText, dOptions, False, bSpellSugg, bDebug)
@@ -62,21 +139,80 @@ class GrammarChecker:
             return ("", [])
         return text.generateParagraph(sText, aGrammErrs, aSpellErrs, nWidth)
 
-    def getTextWithErrors (self, sText, bEmptyIfNoErrors=False, bSpellSugg=False, nWidth=100, bDebug=False):
-        "[todo]"
+    def generateTextErrors (self, sText, dOptions=None, bContext=False, bSpellSugg=False, bEmptyIfNoErrors=False, xExecutor=None, nMaxInFlight=16, bDebug=False):
+        """generator: yields (iParagraph, nOffset, sParagraph, aGrammErrs, aSpellErrs) for each paragraph of <sText>, in order
+           <nOffset> is the position of the paragraph in <sText>, positions of errors are relative to the paragraph
+           <xExecutor>: executor (see createWorkerPool) checking up to <nMaxInFlight> paragraphs at the same time"""
+        if xExecutor is None:
+            for iParagraph, (nOffset, nEnd) in enumerate(text.getParagraphBoundaries(sText), 1):
+                sParagraph = sText[nOffset:nEnd]
+                aGrammErrs, aSpellErrs = self.getParagraphErrors(sParagraph, dOptions, bContext, bSpellSugg, bDebug)
+                aGrammErrs = list(aGrammErrs)
+                if not bEmptyIfNoErrors or aGrammErrs or aSpellErrs:
+                    yield iParagraph, nOffset, sParagraph, aGrammErrs, aSpellErrs
+            return
+        # paragraphs checked by the executor: a limited number of results waiting, yielded in order
+        fCheck = getParagraphErrorsInWorker  if isinstance(xExecutor, concurrent.futures.ProcessPoolExecutor)  else self.getParagraphErrors
+        lPending = collections.deque()
+        try:
+            for iParagraph, (nOffset, nEnd) in enumerate(text.getParagraphBoundaries(sText), 1):
+                sParagraph = sText[nOffset:nEnd]
+                lPending.append((iParagraph, nOffset, sParagraph, xExecutor.submit(fCheck, sParagraph, dOptions, bContext, bSpellSugg, bDebug)))
+                if len(lPending) >= nMaxInFlight:
+                    yield from self._getPendingResult(lPending, bEmptyIfNoErrors)
+            while lPending:
+                yield from self._getPendingResult(lPending, bEmptyIfNoErrors)
+        finally:
+            for *_, xFuture in lPending:
+                xFuture.cancel()
 
-    def getParagraphErrorsAsJSON (self, iIndex, sText, dOptions=None, bContext=False, bEmptyIfNoErrors=False, bSpellSugg=False, bReturnText=False, lLineSet=None, bDebug=False):
-        "parse text and return errors as a JSON string"
-        aGrammErrs, aSpellErrs = self.getParagraphErrors(sText, dOptions, bContext, bSpellSugg, bDebug)
+    def _getPendingResult (self, lPending, bEmptyIfNoErrors):
+        iParagraph, nOffset, sParagraph, xFuture = lPending.popleft()
+        aGrammErrs, aSpellErrs = xFuture.result()
         aGrammErrs = list(aGrammErrs)
-        if bEmptyIfNoErrors and not aGrammErrs and not aSpellErrs:
+        if not bEmptyIfNoErrors or aGrammErrs or aSpellErrs:
+            yield iParagraph, nOffset, sParagraph, aGrammErrs, aSpellErrs
+
+    def getTextWithErrors (self, sText, dOptions=None, bEmptyIfNoErrors=False, bSpellSugg=False, nWidth=100, xExecutor=None, bDebug=False):
+        "generator: parse text and yields, for each paragraph, a readable text with underline errors"
+        for _, _, sParagraph, aGrammErrs, aSpellErrs in self.generateTextErrors(sText, dOptions, False, bSpellSugg, bEmptyIfNoErrors, xExecutor, bDebug=bDebug):
+            yield text.generateParagraph(sParagraph, aGrammErrs, aSpellErrs, nWidth)[0]
+
+    def getParagraphErrorsAsJSON (self, iIndex, sText, dOptions=None, bContext=False, bEmptyIfNoErrors=False, bSpellSugg=False, bReturnText=False, lLineSet=None, bDebug=False, fTimeBudget=0.0):
+        "parse text and return errors as a JSON string (with <fTimeBudget>, key <bTruncated> is added if the analysis stopped before the end)"
+        bTruncated = False
+        if fTimeBudget:
+            aGrammErrs, aSpellErrs, bTruncated = self.getParagraphErrorsWithBudget(sText, fTimeBudget, dOptions, bContext, bSpellSugg, bDebug)
+        else:
+            aGrammErrs, aSpellErrs = self.getParagraphErrors(sText, dOptions, bContext, bSpellSugg, bDebug)
+        return self.formatParagraphErrorsAsJSON(iIndex, sText, aGrammErrs, aSpellErrs, bEmptyIfNoErrors, bReturnText, lLineSet, bTruncated)
+
+    def formatParagraphErrorsAsJSON (self, iIndex, sText, aGrammErrs, aSpellErrs, bEmptyIfNoErrors=False, bReturnText=False, lLineSet=None, bTruncated=False):
+        "return errors of the paragraph <sText> as a JSON string (see getParagraphErrorsAsJSON)"
+        aGrammErrs = list(aGrammErrs)
+        if bEmptyIfNoErrors and not aGrammErrs and not aSpellErrs and not bTruncated:
             return ""
         if lLineSet:
             aGrammErrs, aSpellErrs = text.convertToXY(aGrammErrs, aSpellErrs, lLineSet)
-            return json.dumps({ "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
-        if bReturnText:
-            return json.dumps({ "iParagraph": iIndex, "sText": sText, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
-        return json.dumps({ "iParagraph": iIndex, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
+            dResult = { "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }
+        elif bReturnText:
+            dResult = { "iParagraph": iIndex, "sText": sText, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }
+        else:
+            dResult = { "iParagraph": iIndex, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }
+        if bTruncated:
+            dResult["bTruncated"] = True
+        return json.dumps(dResult, ensure_ascii=False)
 
-    def getTextErrorsAsJSON (self, sText, bContext=False, bEmptyIfNoErrors=False, bSpellSugg=False, bReturnText=False, bDebug=False):
-        "[todo]"
+    def getTextErrorsAsJSON (self, sText, dOptions=None, bContext=False, bEmptyIfNoErrors=False, bSpellSugg=False, bReturnText=False, xExecutor=None, bDebug=False):
+        "generator: parse text and yields errors of each paragraph as a JSON string, with positions in <sText> (nStart, nEnd)"
+        for iParagraph, nOffset, sParagraph, aGrammErrs, aSpellErrs in self.generateTextErrors(sText, dOptions, bContext, bSpellSugg, bEmptyIfNoErrors, xExecutor, bDebug=bDebug):
+            for dErr in aGrammErrs:
+                dErr["nStart"] += nOffset
+                dErr["nEnd"] += nOffset
+            for dErr in aSpellErrs:
+                dErr["nStart"] += nOffset
+                dErr["nEnd"] += nOffset
+            if bReturnText:
+                yield json.dumps({ "iParagraph": iParagraph, "nOffset": nOffset, "sText": sParagraph, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
+            else:
+                yield json.dumps({ "iParagraph": iParagraph, "nOffset": nOffset, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
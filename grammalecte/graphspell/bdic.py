@@ -0,0 +1,172 @@
+"""
+Binary dictionary container (*.bdic)
+
+The JSON dictionary has to be decoded and the arc list rebuilt as Python integers at each start.
+This container stores the same data so that the arc array can be used directly from a file mapped in memory:
+the pages are loaded on demand and shared by every process reading the same file.
+A binary dictionary can also be copied in a block of shared memory, to which other processes attach (read only).
+The binary dictionary records a checksum of the JSON dictionary it’s generated from:
+if the JSON dictionary next to it changes, the binary dictionary is stale and the JSON dictionary is loaded instead (see ibdawg.py).
+
+Build command (JSON dictionaries in graphspell/_dictionaries):
+    python3 -m grammalecte.graphspell.bdic_build fr-allvars.json
+
+File scheme (all integers are unsigned and little-endian):
+
+    [ header: 64 bytes ]
+        16 bytes    magic string <_MAGIC>
+         4 bytes    version of the container
+         4 bytes    size of the information block (in bytes)
+         4 bytes    number of items in the arc array
+         4 bytes    size of an item of the arc array (in bytes)
+        32 bytes    SHA-256 checksum of the JSON dictionary (zeros if unknown)
+    [ information block ]
+        UTF-8 JSON string: all data of the dictionary except the arc array, padded with spaces to a multiple of 8 bytes
+    [ arc array ]
+        list of integers: [ arc, address, arc, address, arc, address, ... arc, address ]
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+from array import array
+
+
+_MAGIC = b"/grammalecte-bd/"
+_VERSION = 2
+_HEADER = struct.Struct("<16sIIII32s")
+_NO_CHECKSUM = bytes(32)
+_ITEMSIZE = 4
+_TYPECODE = "I"     # we check at import that it’s a 4 bytes integer
+
+
+if array(_TYPECODE).itemsize != _ITEMSIZE:
+    _TYPECODE = "L"
+
+
+def isBinaryDictionary (xData):
+    "returns True if <xData> (bytes-like object) starts as a binary dictionary"
+    return bytes(xData[0:len(_MAGIC)]) == _MAGIC
+
+
+def getChecksum (spf):
+    "returns the SHA-256 checksum of the file <spf> (bytes) or None if the file doesn’t exist"
+    try:
+        with open(spf, "rb") as hSrc:
+            return hashlib.sha256(hSrc.read()).digest()
+    except OSError:
+        return None
+
+
+def getSourceChecksum (xData):
+    "returns the checksum of the JSON dictionary stored in the binary dictionary <xData> (bytes-like object) or None if unknown"
+    if len(xData) < _HEADER.size or not isBinaryDictionary(xData):
+        return None
+    _, nVersion, _, _, _, byChecksum = _HEADER.unpack_from(xData, 0)
+    if nVersion != _VERSION or byChecksum == _NO_CHECKSUM:
+        return None
+    return byChecksum
+
+
+def readSourceChecksum (spf):
+    "returns the checksum of the JSON dictionary stored in the binary dictionary file <spf> or None if unknown or if the file doesn’t exist"
+    try:
+        with open(spf, "rb") as hSrc:
+            return getSourceChecksum(hSrc.read(_HEADER.size))
+    except OSError:
+        return None
+
+
+def pack (dInfo, lByDic, byChecksum=None):
+    """returns the binary dictionary as bytes. <dInfo>: dictionary data without the arc array, <lByDic>: arc array,
+       <byChecksum>: SHA-256 checksum of the JSON dictionary"""
+    if lByDic and max(lByDic) >= (1 << (_ITEMSIZE * 8)):
+        raise ValueError("# Error. Arc array values too big for the binary dictionary.")
+    byInfo = json.dumps(dInfo, ensure_ascii=False).encode("utf-8")
+    byInfo += b" " * (-len(byInfo) % 8)
+    aByDic = array(_TYPECODE, lByDic)
+    if sys.byteorder != "little":
+        aByDic.byteswap()
+    return _HEADER.pack(_MAGIC, _VERSION, len(byInfo), len(aByDic), _ITEMSIZE, byChecksum or _NO_CHECKSUM) + byInfo + aByDic.tobytes()
+
+
+def write (spfDst, dInfo, lByDic, byChecksum=None):
+    "write the binary dictionary in file <spfDst>"
+    with open(spfDst, "wb") as hDst:
+        hDst.write(pack(dInfo, lByDic, byChecksum))
+
+
+def unpack (xData):
+    """returns a tuple (dInfo, xByDic) from <xData> (bytes-like object: bytes, mmap, shared memory buffer…)
+       on little-endian platforms, <xByDic> is a view on <xData> (no copy)"""
+    if len(xData) < _HEADER.size:
+        raise TypeError("# Error. Binary dictionary: file too short.")
+    sMagic, nVersion, nInfoSize, nByDic, nItemSize, _ = _HEADER.unpack_from(xData, 0)
+    if sMagic != _MAGIC:
+        raise TypeError("# Error. Not a binary dictionary.")
+    if nVersion != _VERSION or nItemSize != _ITEMSIZE:
+        raise TypeError("# Error. Binary dictionary: unknown version <{}>.".format(nVersion))
+    iStart = _HEADER.size + nInfoSize
+    iEnd = iStart + nByDic * nItemSize
+    if len(xData) < iEnd:
+        raise TypeError("# Error. Binary dictionary: truncated file.")
+    dInfo = json.loads(bytes(xData[_HEADER.size:iStart]).decode("utf-8"))
+    if sys.byteorder == "little":
+        xByDic = memoryview(xData)[iStart:iEnd].cast(_TYPECODE)
+    else:
+        xByDic = array(_TYPECODE)
+        xByDic.frombytes(xData[iStart:iEnd])
+        xByDic.byteswap()
+    return dInfo, xByDic
+
+
+def load (spf):
+    "returns a tuple (dInfo, xByDic) from the file <spf> mapped in memory (read only)"
+    with open(spf, "rb") as hSrc:
+        if os.fstat(hSrc.fileno()).st_size == 0:
+            raise TypeError("# Error. Binary dictionary: empty file.")
+        xMap = mmap.mmap(hSrc.fileno(), 0, access=mmap.ACCESS_READ)
+    # the mapping remains open as long as <xByDic> (which is a view on it) is alive
+    return unpack(xMap)
+
+
+def share (xData, sName=None):
+    """copy the binary dictionary <xData> in a new block of shared memory named <sName> (or a random name)
+       returns the SharedMemory object: its creator must remove it with unshare() when other processes don’t need it anymore"""
+    from multiprocessing import shared_memory
+    if not isBinaryDictionary(xData):
+        raise TypeError("# Error. Not a binary dictionary.")
+    oSharedMemory = shared_memory.SharedMemory(name=sName, create=True, size=len(xData))
+    oSharedMemory.buf[:len(xData)] = xData
+    return oSharedMemory
+
+
+def unshare (oSharedMemory):
+    "close and remove the block of shared memory <oSharedMemory> created by share()"
+    from multiprocessing import resource_tracker
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # processes sharing the resource tracker of the creator may have unregistered the block when they attached to it (see attach):
+        # registering it again is harmless (the tracker keeps a set of names) and lets unlink() unregister it
+        resource_tracker.register("/" + oSharedMemory.name, "shared_memory")
+    oSharedMemory.close()
+    oSharedMemory.unlink()
+
+
+def attach (sName):
+    """returns a tuple (dInfo, xByDic, oSharedMemory) from the binary dictionary in the block of shared memory <sName> (read only)
+       <xByDic> is a view on the buffer of <oSharedMemory>: the caller must keep <oSharedMemory> alive as long as <xByDic>"""
+    from multiprocessing import shared_memory, resource_tracker
+    # the block belongs to its creator and must not be removed by the resource tracker when this process ends
+    if sys.version_info >= (3, 13):
+        oSharedMemory = shared_memory.SharedMemory(name=sName, track=False)
+    else:
+        oSharedMemory = shared_memory.SharedMemory(name=sName)
+        if os.name == "posix":
+            # the resource tracker knows the block by its POSIX name, with a leading slash
+            resource_tracker.unregister("/" + oSharedMemory.name, "shared_memory")
+    dInfo, xByDic = unpack(oSharedMemory.buf.toreadonly())
+    return dInfo, xByDic, oSharedMemory
+
@@ -0,0 +1,34 @@
+"""
+Build binary dictionaries (*.bdic) from JSON dictionaries (see bdic.py)
+
+Build command (JSON dictionaries in graphspell/_dictionaries):
+    python3 -m grammalecte.graphspell.bdic_build fr-allvars.json
+"""
+
+import os
+import sys
+import traceback
+
+from .ibdawg import IBDAWG
+
+
+def build (sfSource):
+    "write the binary dictionary of the JSON dictionary <sfSource> (file name in _dictionaries) next to it, returns its path"
+    oDic = IBDAWG(sfSource)
+    spfDst = os.path.join(os.path.dirname(__file__), "_dictionaries", sfSource[:-5] + ".bdic")
+    oDic.writeAsBinary(spfDst)
+    return spfDst
+
+
+def main ():
+    "build binary dictionaries of JSON dictionaries given as arguments"
+    try:
+        for sfSource in sys.argv[1:]:
+            print("Binary dictionary written: " + build(sfSource))
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,11 +14,13 @@ import sys
 import os
 import collections
 import json
+import hashlib
 import time
 import re
 import traceback
 
 from . import str_transform as st
+from . import bdic
 from .progressbar import ProgressBar
 
 
@@ -452,6 +454,16 @@ class DAWG:
         with open(spfDst, "w", encoding="utf-8", newline="\n") as hDst:
             hDst.write( json.dumps(self.getBinaryAsJSON(), ensure_ascii=False) )
 
+    def writeAsBinary (self, spfDst):
+        "write a binary dictionary (*.bdic) with all the necessary data (the arc array can be mapped in memory)"
+        if not spfDst.endswith(".bdic"):
+            spfDst += ".bdic"
+        dInfo = self.getBinaryAsJSON()
+        # checksum of the JSON dictionary written by writeAsJSObject()
+        byChecksum = hashlib.sha256(json.dumps(dInfo, ensure_ascii=False).encode("utf-8")).digest()
+        lByDic = dInfo.pop("lByDic")
+        bdic.write(spfDst, dInfo, lByDic, byChecksum)
+
     def _getDate (self):
         return time.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -6,6 +6,7 @@ Implementation of a spellchecker as a transducer (storing transformation code to
 and a spell suggestion mechanism
 """
 
+import os
 import traceback
 import pkgutil
 import re
@@ -13,6 +14,7 @@ from functools import wraps
 import time
 import json
 import binascii
+import hashlib
 import importlib
 from collections import OrderedDict
 from math import floor
@@ -22,6 +24,7 @@ from math import floor
 
 from . import str_transform as st
 from . import char_player as cp
+from . import bdic
 from .echo import echo
 
 
@@ -99,18 +102,51 @@ class SuggResult:
         return lRes[:self.nSuggLimit]
 
 
+# data stored in the information block of binary dictionaries (see bdic.py)
+_BINARY_INFO_KEYS = ( "sHeader", "sLangCode", "sLangName", "sDicName", "sDescription", "sFileName", "sDate", \
+                      "nEntry", "nChar", "nAff", "nTag", "cStemming", "dChar", "nNode", "nArc", "nArcVal", "lArcVal", \
+                      "nBytesArc", "nBytesNodeAddress", "nBytesOffset", "l2grams" )
+
+
 class IBDAWG:
     """INDEXABLE BINARY DIRECT ACYCLIC WORD GRAPH"""
 
     def __init__ (self, source):
-        if isinstance(source, str):
-            by = pkgutil.get_data(__package__, "_dictionaries/" + source)
-            if not by:
-                raise OSError("# Error. File not found or not loadable: "+source)
+        if isinstance(source, str) and source.startswith("shm:"):
+            # binary dictionary in a block of shared memory created by another process (see shareBinary)
+            oData, xByDic, oSharedMemory = bdic.attach(source[4:])
+            oData["lByDic"] = xByDic
+            # kept alive with <lByDic>, a view on its buffer (attributes are released in this order, <lByDic> first)
+            oData["oSharedMemory"] = oSharedMemory
+            self.sFileName = source
+            self.bySourceChecksum = bdic.getSourceChecksum(oSharedMemory.buf)
+        elif isinstance(source, str) and source.endswith(".bdic") and self._isStaleBinary(source):
+            # the binary dictionary isn’t generated from the JSON dictionary next to it: the JSON dictionary is loaded instead
+            oData = self._loadJSON(source[:-5] + ".json")
+        elif isinstance(source, str) and source.endswith(".bdic"):
+            # binary dictionary: the arc array is mapped in memory, not decoded
+            spfDic = os.path.join(os.path.dirname(__file__), "_dictionaries", source)
+            if os.path.isfile(spfDic):
+                oData, xByDic = bdic.load(spfDic)
+                self.bySourceChecksum = bdic.readSourceChecksum(spfDic)
+            else:
+                by = pkgutil.get_data(__package__, "_dictionaries/" + source)
+                if not by:
+                    raise OSError("# Error. File not found or not loadable: "+source)
+                oData, xByDic = bdic.unpack(by)
+                self.bySourceChecksum = bdic.getSourceChecksum(by)
+            oData["lByDic"] = xByDic
             self.sFileName = source
-            oData = json.loads(by.decode("utf-8"))     #json.loads(by)    # In Python 3.6, can read directly binary strings
+        elif isinstance(source, str):
+            oData = self._loadJSON(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self.sFileName = "[None]"
+            oData, xByDic = bdic.unpack(source)
+            oData["lByDic"] = xByDic
+            self.bySourceChecksum = bdic.getSourceChecksum(source)
         else:
             self.sFileName = "[None]"
+            self.bySourceChecksum = None
             oData = source
 
         self.__dict__.update(oData)
@@ -161,6 +197,45 @@ class IBDAWG:
         except ImportError:
             print("# No module <graphspell.lexgraph_"+self.sLangCode+".py>")
 
+    @staticmethod
+    def _isStaleBinary (sfDic):
+        "returns True if there is a JSON dictionary next to the binary dictionary <sfDic> and if <sfDic> is missing or not generated from it"
+        spfDic = os.path.join(os.path.dirname(__file__), "_dictionaries", sfDic)
+        byChecksum = bdic.getChecksum(spfDic[:-5] + ".json")
+        return bool(byChecksum) and bdic.readSourceChecksum(spfDic) != byChecksum
+
+    def _loadJSON (self, sfDic):
+        "returns data of the JSON dictionary <sfDic>"
+        spfDic = os.path.join(os.path.dirname(__file__), "_dictionaries", sfDic)
+        if os.path.isfile(spfDic):
+            with open(spfDic, "rb") as hSrc:
+                by = hSrc.read()
+        else:
+            by = pkgutil.get_data(__package__, "_dictionaries/" + sfDic)
+        if not by:
+            raise OSError("# Error. File not found or not loadable: "+sfDic)
+        self.sFileName = sfDic
+        self.bySourceChecksum = hashlib.sha256(by).digest()
+        return json.loads(by.decode("utf-8"))     #json.loads(by)    # In Python 3.6, can read directly binary strings
+
+    def getBinary (self):
+        "return the dictionary as a binary dictionary (bytes), with the checksum of its JSON dictionary if known"
+        dInfo = { sKey: getattr(self, sKey)  for sKey in _BINARY_INFO_KEYS  if hasattr(self, sKey) }
+        return bdic.pack(dInfo, self.lByDic, self.bySourceChecksum)
+
+    def shareBinary (self, sName=None):
+        """copy the dictionary as a binary dictionary in a new block of shared memory, returns the SharedMemory object
+           other processes load the dictionary with IBDAWG("shm:" + oSharedMemory.name)
+           the caller must remove the block with bdic.unshare(oSharedMemory) when other processes don’t need it anymore"""
+        return bdic.share(self.getBinary(), sName)
+
+    def writeAsBinary (self, spfDst):
+        "write the dictionary as a binary dictionary (*.bdic)"
+        if not spfDst.endswith(".bdic"):
+            spfDst += ".bdic"
+        with open(spfDst, "wb") as hDst:
+            hDst.write(self.getBinary())
+
     def getInfo (self):
         "return string about the IBDAWG"
         return  "  Language: {0.sLangName}   Lang code: {0.sLangCode}   Dictionary name: {0.sDicName}" \
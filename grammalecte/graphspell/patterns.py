@@ -0,0 +1,71 @@
+"""
+Registry of compiled regular expressions
+
+Morphologies are tested with patterns (strings) at each token, and the grammar rules use more patterns
+than the cache of the module <re> can hold: patterns would be compiled again and again.
+Here, patterns are compiled once and kept as long as the process lives (the registry is not bounded).
+Patterns known in advance (those of the grammar rules) are compiled at load with preload().
+"""
+
+import re
+import threading
+
+
+__all__ = [ "getPattern", "preload", "getStats", "clear" ]
+
+
+_dPattern = {}                  # {pattern: compiled pattern}
+_oLock = threading.Lock()       # patterns are compiled once, even if several threads ask for the same one
+_nPreloaded = 0                 # patterns compiled by preload()
+_nMisses = 0                    # patterns compiled on demand (not preloaded)
+
+
+def getPattern (sPattern):
+    "return <sPattern> compiled (raise re.error if it’s not a valid regex)"
+    zPattern = _dPattern.get(sPattern)
+    if zPattern is None:
+        zPattern = _compile(sPattern)
+    return zPattern
+
+
+def _compile (sPattern):
+    global _nMisses
+    with _oLock:
+        zPattern = _dPattern.get(sPattern)
+        if zPattern is None:
+            zPattern = re.compile(sPattern)
+            _dPattern[sPattern] = zPattern
+            _nMisses += 1
+        return zPattern
+
+
+def preload (iPatterns):
+    "compile patterns of the iterable <iPatterns> (strings which are not valid regexes are ignored), return the number of new patterns"
+    global _nPreloaded
+    nNew = 0
+    with _oLock:
+        for sPattern in iPatterns:
+            if sPattern in _dPattern:
+                continue
+            try:
+                _dPattern[sPattern] = re.compile(sPattern)
+                nNew += 1
+            except re.error:
+                pass
+        _nPreloaded += nNew
+    return nNew
+
+
+def getStats ():
+    "return the number of patterns, of patterns preloaded and of patterns compiled on demand (misses)"
+    return { "nPatterns": len(_dPattern), "nPreloaded": _nPreloaded, "nMisses": _nMisses }
+
+
+def clear ():
+    "forget all patterns and reset counters"
+    global _nPreloaded
+    global _nMisses
+    with _oLock:
+        _dPattern.clear()
+        _nPreloaded = 0
+        _nMisses = 0
@@ -8,16 +8,17 @@ To avoid iterating over a pile of dictionaries, it is assumed that 3 are enough:
 - the personal dictionary, created by the user for its own convenience
 """
 
-import re
+import time
 import importlib
 import traceback
 
 from . import ibdawg
 from . import tokenizer
+from .patterns import getPattern
 
 
 dDefaultDictionaries = {
-    "fr": "fr-allvars.json",
+    "fr": "fr-allvars.bdic",
     "en": "en.json"
 }
 
@@ -72,6 +73,12 @@ class SpellChecker ():
         self.oMainDic = self._loadDictionary(source, True)
         return bool(self.oMainDic)
 
+    def shareMainDictionary (self, sName=None):
+        """copy the main dictionary in a new block of shared memory, returns the SharedMemory object
+           worker processes attach to it with SpellChecker(sLangCode, "shm:" + oSharedMemory.name) or setMainDictionary("shm:" + oSharedMemory.name)
+           the caller must remove the block with graphspell.bdic.unshare(oSharedMemory) when workers don’t need it anymore"""
+        return self.oMainDic.shareBinary(sName)
+
     def setCommunityDictionary (self, source, bActivate=True):
         "returns True if the dictionary is loaded"
         self.oCommunityDic = self._loadDictionary(source)
@@ -84,6 +91,11 @@ class SpellChecker ():
         self.bPersonalDic = False  if not bActivate  else bool(self.oPersonalDic)
         return bool(self.oPersonalDic)
 
+    def getDictionariesSignature (self):
+        "return a string identifying the active dictionaries (results depend on them)"
+        lDic = [ self.oMainDic, self.oCommunityDic  if self.bCommunityDic  else None, self.oPersonalDic  if self.bPersonalDic  else None ]
+        return "|".join( "{0.sFileName}:{0.sDate}:{0.nEntry}:{0.nNode}:{0.nArc}".format(oDic)  if oDic  else ""  for oDic in lDic )
+
     def activateCommunityDictionary (self):
         "activate community dictionary (if available)"
         self.bCommunityDic = bool(self.oCommunityDic)
@@ -178,16 +190,20 @@ class SpellChecker ():
 
     # parse text functions
 
-    def parseParagraph (self, sText, bSpellSugg=False):
-        "return a list of tokens where token value doesn’t exist in the word graph"
+    def parseParagraph (self, sText, bSpellSugg=False, fDeadline=0.0):
+        """return a list of tokens where token value doesn’t exist in the word graph
+           with <fDeadline> (time.perf_counter), tokens found after this time get no suggestions (no key <aSuggestions>)"""
         if not self.oTokenizer:
             self._loadTokenizer()
         aSpellErrs = []
-        for dToken in self.oTokenizer.genTokens(sText):
-            if dToken['sType'] == "WORD" and not self.isValidToken(dToken['sValue']):
+        for oToken in self.oTokenizer.genTokens(sText):
+            if oToken.sType == "WORD" and not self.isValidToken(oToken.sValue):
+                if bSpellSugg and fDeadline and time.perf_counter() > fDeadline:
+                    bSpellSugg = False
+                dToken = oToken.toDict()
                 if bSpellSugg:
                     dToken['aSuggestions'] = []
-                    for lSugg in self.suggest(dToken['sValue']):
+                    for lSugg in self.suggest(oToken.sValue):
                         dToken['aSuggestions'].extend(lSugg)
                 aSpellErrs.append(dToken)
         return aSpellErrs
@@ -197,16 +213,16 @@ class SpellChecker ():
            <dWord> can be used to cumulate count from several texts."""
         if not self.oTokenizer:
             self._loadTokenizer()
-        for dToken in self.oTokenizer.genTokens(sText):
-            if dToken['sType'].startswith("WORD"):
+        for oToken in self.oTokenizer.genTokens(sText):
+            if oToken.sType.startswith("WORD"):
                 if bOnlyUnknownWords:
-                    if not self.isValidToken(dToken['sValue']):
-                        dWord[dToken['sValue']] = dWord.get(dToken['sValue'], 0) + 1
+                    if not self.isValidToken(oToken.sValue):
+                        dWord[oToken.sValue] = dWord.get(oToken.sValue, 0) + 1
                 else:
                     if not bByLemma:
-                        dWord[dToken['sValue']] = dWord.get(dToken['sValue'], 0) + 1
+                        dWord[oToken.sValue] = dWord.get(oToken.sValue, 0) + 1
                     else:
-                        for sLemma in self.getLemma(dToken['sValue']):
+                        for sLemma in self.getLemma(oToken.sValue):
                             dWord[sLemma] = dWord.get(sLemma, 0) + 1
         return dWord
 
@@ -266,13 +282,13 @@ class SpellChecker ():
         if sNegPattern:
             if sNegPattern == "*":
                 # all morph must match sPattern
-                zPattern = re.compile(sPattern)
+                zPattern = getPattern(sPattern)
                 return all(zPattern.search(sMorph)  for sMorph in lMorph)
-            zNegPattern = re.compile(sNegPattern)
+            zNegPattern = getPattern(sNegPattern)
             if any(zNegPattern.search(sMorph)  for sMorph in lMorph):
                 return False
         # search sPattern
-        zPattern = re.compile(sPattern)
+        zPattern = getPattern(sPattern)
         return any(zPattern.search(sMorph)  for sMorph in lMorph)
 
     def getLemma (self, sWord):
@@ -51,6 +51,57 @@ _PATTERNS = {
 }
 
 
+class Token:
+    """token of a text
+       fields not set are None (or False): lMorph (morphologies set by disambiguation), aTags, sImmunity,
+       and fields used by the grammar checker to rewrite the sentence: bToRemove, sNewValue, sRealValue, nMergeUntil, sMergedValue, bMerged
+       dict(oToken) or oToken.toDict() returns the token as a dictionary (fields not set are missing)"""
+
+    __slots__ = ("i", "sType", "sValue", "nStart", "nEnd", "lMorph", "aTags", "sImmunity", \
+                 "bToRemove", "sNewValue", "sRealValue", "nMergeUntil", "sMergedValue", "bMerged")
+
+    def __init__ (self, i, sType, sValue, nStart, nEnd, lMorph=None):
+        self.i = i
+        self.sType = sType
+        self.sValue = sValue
+        self.nStart = nStart
+        self.nEnd = nEnd
+        self.lMorph = lMorph
+        self.aTags = None
+        self.sImmunity = None
+        self.bToRemove = False
+        self.sNewValue = None
+        self.sRealValue = None
+        self.nMergeUntil = None
+        self.sMergedValue = None
+        self.bMerged = False
+
+    def __repr__ (self):
+        return "Token(" + repr(self.toDict()) + ")"
+
+    # dictionary view
+
+    def keys (self):
+        "fields set"
+        return [ sKey  for sKey in self.__slots__  if getattr(self, sKey) is not None and getattr(self, sKey) is not False ]
+
+    def __getitem__ (self, sKey):
+        if sKey not in self:
+            raise KeyError(sKey)
+        return getattr(self, sKey)
+
+    def __contains__ (self, sKey):
+        return sKey in self.__slots__ and getattr(self, sKey) is not None and getattr(self, sKey) is not False
+
+    def get (self, sKey, xDefault=None):
+        "value of the field <sKey> if set, else <xDefault>"
+        return getattr(self, sKey)  if sKey in self  else xDefault
+
+    def toDict (self):
+        "return the token as a dictionary (fields not set are missing)"
+        return { sKey: getattr(self, sKey)  for sKey in self.keys() }
+
+
 class Tokenizer:
     "Tokenizer: transforms a text in a list of tokens"
 
@@ -61,15 +112,15 @@ class Tokenizer:
         self.zToken = re.compile( "(?i)" + '|'.join(sRegex for sRegex in _PATTERNS[sLang]) )
 
     def genTokens (self, sText, bStartEndToken=False):
-        "generator: tokenize <sText>"
+        "generator: tokenize <sText> (Token objects)"
         i = 0
         if bStartEndToken:
-            yield { "i": 0, "sType": "INFO", "sValue": "<start>", "nStart": 0, "nEnd": 0, "lMorph": ["<start>"] }
+            yield Token(0, "INFO", "<start>", 0, 0, ["<start>"])
         for i, m in enumerate(self.zToken.finditer(sText), 1):
-            yield { "i": i, "sType": m.lastgroup, "sValue": normalize("NFC", m.group()), "nStart": m.start(), "nEnd": m.end() }
+            yield Token(i, m.lastgroup, normalize("NFC", m.group()), m.start(), m.end())
         if bStartEndToken:
             iEnd = len(sText)
-            yield { "i": i+1, "sType": "INFO", "sValue": "<end>", "nStart": iEnd, "nEnd": iEnd, "lMorph": ["<end>"] }
+            yield Token(i+1, "INFO", "<end>", iEnd, iEnd, ["<end>"])
 
     def getTokenTypes (self):
         "returns list of token types as tuple (token name, regex)"
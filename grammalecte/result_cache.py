@@ -0,0 +1,125 @@
+"""
+Grammalecte, grammar checker: persistent cache of results
+
+Results of paragraphs (grammar errors and spelling errors) are stored in a sqlite database,
+with the hash of everything they depend on as key: text, options, ignored rules, dictionaries, version of the engine…
+The number of entries is limited: the least recently used entries are removed first.
+"""
+
+import os
+import time
+import json
+import sqlite3
+import hashlib
+import threading
+
+
+__all__ = [ "ResultCache" ]
+
+
+class ResultCache:
+    "cache of results of paragraphs stored in the sqlite database <spfCache>, with <nMaxEntries> entries at most"
+
+    def __init__ (self, spfCache, nMaxEntries=200000):
+        self.spfCache = spfCache
+        self.nMaxEntries = max(nMaxEntries, 1)
+        self.nHits = 0
+        self.nMisses = 0
+        self.nEntries = 0               # number of entries (estimated between two evictions: other processes may write too)
+        self.aUsedKeys = set()          # keys of hits not recorded yet (last use time updated with the next write)
+        self.xLock = threading.Lock()
+        self.xConnection = None
+        self.nPid = 0
+        self._connect()
+        self._evict()
+
+    def _connect (self):
+        # a connection must not be shared by processes: a forked process opens its own connection
+        self.nPid = os.getpid()
+        self.xConnection = sqlite3.connect(self.spfCache, timeout=30, check_same_thread=False)
+        self.xConnection.execute("PRAGMA journal_mode=WAL")
+        self.xConnection.execute("PRAGMA synchronous=NORMAL")
+        self.xConnection.execute("CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, data TEXT NOT NULL, last_use REAL NOT NULL)")
+        self.xConnection.execute("CREATE INDEX IF NOT EXISTS results_last_use ON results (last_use)")
+        self.xConnection.commit()
+
+    def _getConnection (self):
+        if self.nPid != os.getpid():
+            self.aUsedKeys.clear()
+            self._connect()
+        return self.xConnection
+
+    @staticmethod
+    def getKey (sText, *args):
+        "return the key of the paragraph <sText> for the parameters <args> (values which can be serialized in JSON)"
+        xHash = hashlib.blake2b(digest_size=20)
+        xHash.update(json.dumps(args, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        xHash.update(b"\0")
+        xHash.update(sText.encode("utf-8"))
+        return xHash.digest()
+
+    def get (self, byKey):
+        "return results stored for <byKey> (tuple: list of grammar errors, list of spelling errors) or None"
+        with self.xLock:
+            xRow = self._getConnection().execute("SELECT data FROM results WHERE key = ?", (byKey,)).fetchone()
+            if not xRow:
+                self.nMisses += 1
+                return None
+            self.nHits += 1
+            self.aUsedKeys.add(byKey)
+        aGrammErrs, aSpellErrs = json.loads(xRow[0])
+        return aGrammErrs, aSpellErrs
+
+    def set (self, byKey, aGrammErrs, aSpellErrs):
+        "store results for <byKey>"
+        sData = json.dumps([list(aGrammErrs), aSpellErrs], ensure_ascii=False)
+        with self.xLock:
+            xConnection = self._getConnection()
+            fNow = time.time()
+            xConnection.execute("INSERT OR REPLACE INTO results (key, data, last_use) VALUES (?, ?, ?)", (byKey, sData, fNow))
+            if self.aUsedKeys:
+                xConnection.executemany("UPDATE results SET last_use = ? WHERE key = ?", [ (fNow, byUsedKey)  for byUsedKey in self.aUsedKeys ])
+                self.aUsedKeys.clear()
+            xConnection.commit()
+            self.nEntries += 1
+        if self.nEntries > self.nMaxEntries:
+            self._evict()
+
+    def _evict (self):
+        "remove the least recently used entries if there are more than <nMaxEntries> (down to 90 %)"
+        with self.xLock:
+            xConnection = self._getConnection()
+            self.nEntries = xConnection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if self.nEntries > self.nMaxEntries:
+                nRemove = self.nEntries - (self.nMaxEntries * 9 // 10)
+                xConnection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_use LIMIT ?)", (nRemove,))
+                xConnection.commit()
+                self.nEntries -= nRemove
+
+    def clear (self):
+        "remove all entries"
+        with self.xLock:
+            xConnection = self._getConnection()
+            xConnection.execute("DELETE FROM results")
+            xConnection.commit()
+            self.aUsedKeys.clear()
+            self.nEntries = 0
+
+    def getStats (self):
+        "return numbers of hits, misses and entries"
+        with self.xLock:
+            nEntries = self._getConnection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        nRequests = self.nHits + self.nMisses
+        return { "nHits": self.nHits, "nMisses": self.nMisses, "fHitRate": round(self.nHits / nRequests, 4)  if nRequests  else 0.0, "nEntries": nEntries }
+
+    def close (self):
+        "record last uses of entries and close the database"
+        with self.xLock:
+            if self.xConnection and self.nPid == os.getpid():
+                if self.aUsedKeys:
+                    fNow = time.time()
+                    self.xConnection.executemany("UPDATE results SET last_use = ? WHERE key = ?", [ (fNow, byUsedKey)  for byUsedKey in self.aUsedKeys ])
+                    self.aUsedKeys.clear()
+                    self.xConnection.commit()
+                self.xConnection.close()
+            self.xConnection = None
@@ -26,16 +26,21 @@ def getSentence (sText):
         yield sText[iStart:iEnd]
 
 
+_zEndOfParagraph = re.compile("\r\n|\r|\n")
+
+def getParagraphBoundaries (sText):
+    "generator: returns start and end of paragraphs found in <sText> (positions in <sText>, end of lines excluded)"
+    iStart = 0
+    for m in _zEndOfParagraph.finditer(sText):
+        yield (iStart, m.start())
+        iStart = m.end()
+    yield (iStart, len(sText))
+
+
 def getParagraph (sText):
     "generator: returns paragraphs of text"
-    iStart = 0
-    sText = sText.replace("\r\n", "\n").replace("\r", "\n")
-    iEnd = sText.find("\n", iStart)
-    while iEnd != -1:
+    for iStart, iEnd in getParagraphBoundaries(sText):
         yield sText[iStart:iEnd]
-        iStart = iEnd + 1
-        iEnd = sText.find("\n", iStart)
-    yield sText[iStart:]
 
 
 def wrap (sText, nWidth=80):